@@ -12,8 +12,13 @@ from app.api.exception_handlers import (
     RateLimitException,
     register_exception_handlers,
 )
+from app.api.etag import conditional_etag, data_version
 from app.api.rate_limiter import (
+    InMemoryRateLimitBackend,
     InMemoryRateLimiter,
+    PostgresRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
     RateLimitTier,
     check_rate_limit,
     rate_limit,
@@ -39,9 +44,16 @@ __all__ = [
     "CRMException",
     "register_exception_handlers",
     # Rate Limiter
+    "RateLimiter",
+    "RateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "PostgresRateLimitBackend",
     "InMemoryRateLimiter",
     "RateLimitTier",
     "rate_limit",
     "rate_limiter",
     "check_rate_limit",
+    # Bedingte Antworten
+    "conditional_etag",
+    "data_version",
 ]
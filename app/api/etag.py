@@ -0,0 +1,116 @@
+"""
+Bedingte Antworten (ETag / If-None-Match) fuer Listen-Partials und Status-APIs.
+
+HTMX-Listen und Status-Endpunkte werden regelmaessig gepollt, liefern aber
+meist unveraenderte Daten. Statt jedes Mal die volle Abfrage zu rechnen und
+das Template zu rendern, wird vorher ein billiger Datenstand ermittelt
+(count + max(updated_at) der beteiligten Tabellen, ein Query). Stimmt der
+daraus gebildete ETag mit If-None-Match ueberein, gibt es sofort 304.
+
+Der Browser revalidiert dank "Cache-Control: private, no-cache" bei jedem
+Poll und liefert bei 304 den gecachten Body an HTMX aus.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = "private, no-cache"
+
+
+async def data_version(db: AsyncSession, *models: type) -> str:
+    """Datenstand der Tabellen als String — ein Query, nur Aggregate.
+
+    Pro Tabelle count(*) (erkennt Inserts/Deletes) und max(updated_at)
+    (erkennt Updates, inkl. Soft-Delete). Tabellen ohne updated_at nur fuer
+    Daten, die ersetzt statt geaendert werden (max(created_at)).
+    """
+    columns = []
+    for model in models:
+        stamp = getattr(model, "updated_at", None)
+        if stamp is None:
+            stamp = model.created_at
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(stamp)).scalar_subquery())
+    row = (await db.execute(select(*columns))).one()
+    return "|".join(str(value) for value in row)
+
+
+def make_etag(request: Request, version: str) -> str:
+    """Schwacher ETag aus Pfad, Query-Parametern, Datenstand und Tagesdatum.
+
+    Das Datum deckt relative Zeitangaben ("laeuft in 3 Tagen ab") und
+    Zeitfenster-Filter (days=30) ab.
+    """
+    today = datetime.now(timezone.utc).date().isoformat()
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    raw = f"{request.url.path}?{query}|{version}|{today}"
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Vergleich nach RFC 9110 (schwach, Liste und "*" erlaubt)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_etag(*models: type) -> Callable:
+    """
+    Decorator: 304 ohne Endpunkt-Aufruf, wenn sich die Tabellen nicht geaendert haben.
+
+    Der Endpunkt braucht die Parameter `request` und `db`.
+
+    Beispiel:
+        @router.get("/partials/candidates-list")
+        @conditional_etag(Candidate, Match)
+        async def candidates_list_partial(request: Request, db: AsyncSession = Depends(get_db)):
+            ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request | None = kwargs.get("request")
+            db: AsyncSession | None = kwargs.get("db")
+            if request is None or db is None:
+                return await func(*args, **kwargs)
+
+            try:
+                etag = make_etag(request, await data_version(db, *models))
+            except Exception as e:
+                # Ohne Datenstand einfach normal antworten
+                logger.warning(f"ETag fuer {request.url.path} nicht ermittelbar: {e}")
+                await db.rollback()
+                return await func(*args, **kwargs)
+
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+
+            result: Any = await func(*args, **kwargs)
+            if not isinstance(result, Response):
+                result = JSONResponse(jsonable_encoder(result))
+            if 200 <= result.status_code < 300:
+                result.headers.update(headers)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,22 @@
-"""In-Memory Rate-Limiter für das Matching-Tool."""
+"""Rate-Limiter für das Matching-Tool (Sliding-Window, austauschbares Backend)."""
 
+import logging
+import math
 import time
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
 from typing import Callable
 
 from fastapi import Request
+from sqlalchemy import text
 
 from app.api.exception_handlers import RateLimitException
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 class RateLimitTier(str, Enum):
@@ -30,6 +37,9 @@ class RateLimitTier(str, Enum):
     # Admin-Trigger (manuell)
     ADMIN = "admin"  # 10 Requests/Minute
 
+    # Login-Versuche (pro IP)
+    LOGIN = "login"  # 5 Requests/Minute
+
 
 @dataclass
 class RateLimitConfig:
@@ -46,22 +56,216 @@ RATE_LIMITS: dict[RateLimitTier, RateLimitConfig] = {
     RateLimitTier.AI: RateLimitConfig(requests=10, window_seconds=60),
     RateLimitTier.IMPORT: RateLimitConfig(requests=5, window_seconds=60),
     RateLimitTier.ADMIN: RateLimitConfig(requests=10, window_seconds=60),
+    RateLimitTier.LOGIN: RateLimitConfig(requests=5, window_seconds=60),
 }
 
 
-class InMemoryRateLimiter:
+# ═══════════════════════════════════════════════════════════════
+# SLIDING-WINDOW-ZAEHLER
+# ═══════════════════════════════════════════════════════════════
+# Pro (Client, Tier) nur zwei Zaehler: aktuelles und vorheriges Fenster.
+# Schaetzung der Requests in den letzten window_seconds:
+#
+#     previous * (1 - anteil_vergangen_im_aktuellen_fenster) + current
+#
+# O(1) pro Check, konstanter Speicher pro Client — statt einer Liste aller
+# Timestamps, die bei jedem Request gefiltert werden muss.
+
+
+def sliding_window_decision(
+    previous: int,
+    current: int,
+    elapsed: float,
+    limit: int,
+    window_seconds: int,
+) -> tuple[bool, int]:
+    """Entscheidet anhand der zwei Fenster-Zaehler.
+
+    Args:
+        previous: Requests im vorherigen Fenster
+        current: Requests im aktuellen Fenster
+        elapsed: Anteil (0..1) des aktuellen Fensters, der schon vergangen ist
+        limit: Erlaubte Requests pro Fenster
+        window_seconds: Fensterlaenge
+
+    Returns:
+        (allowed, retry_after_seconds)
     """
-    Einfacher In-Memory Rate-Limiter.
+    if previous * (1.0 - elapsed) + current < limit:
+        return True, 0
+
+    if current < limit and previous > 0:
+        # Warten bis das alte Fenster genug an Gewicht verloren hat
+        needed = 1.0 - (limit - current) / previous
+        wait = (needed - elapsed) * window_seconds
+    else:
+        # Aktuelles Fenster voll: im naechsten Fenster wird current zu previous
+        needed = 1.0 - limit / current if current else 0.0
+        wait = (1.0 - elapsed + needed) * window_seconds
+    return False, max(1, math.ceil(wait))
+
+
+class RateLimitBackend(ABC):
+    """Speicher fuer Sliding-Window-Zaehler.
 
-    Für Einzelnutzer-Anwendung ausreichend.
-    Bei Skalierung auf Redis umstellen.
+    Implementierungen: InMemoryRateLimitBackend (pro Prozess, Tests) und
+    PostgresRateLimitBackend (geteilt ueber mehrere uvicorn-Worker).
     """
 
-    def __init__(self):
-        # {client_key: [(timestamp, tier), ...]}
-        self._requests: dict[str, list[tuple[float, RateLimitTier]]] = defaultdict(list)
-        self._last_cleanup = time.time()
-        self._cleanup_interval = 300  # 5 Minuten
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int]:
+        """Zaehlt einen Request, falls erlaubt. Returns (allowed, retry_after)."""
+
+    @abstractmethod
+    async def remaining(self, key: str, limit: int, window_seconds: int) -> int:
+        """Verbleibende Requests im gleitenden Fenster (ohne zu zaehlen)."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Zaehler im Prozess-Speicher, LRU-begrenzt auf max_keys Clients."""
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        # {key: [window_index, current, previous]}
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
+
+    def _counter(self, key: str, window_seconds: int, now: float) -> list[int]:
+        window_index = int(now // window_seconds)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = [window_index, 0, 0]
+            self._counters[key] = counter
+            if len(self._counters) > self.max_keys:
+                # Laengste Zeit inaktiver Client fliegt raus
+                self._counters.popitem(last=False)
+        else:
+            if counter[0] != window_index:
+                counter[2] = counter[1] if counter[0] == window_index - 1 else 0
+                counter[1] = 0
+                counter[0] = window_index
+            self._counters.move_to_end(key)
+        return counter
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int]:
+        now = time.time()
+        counter = self._counter(key, window_seconds, now)
+        elapsed = now / window_seconds - counter[0]
+        allowed, retry_after = sliding_window_decision(
+            counter[2], counter[1], elapsed, limit, window_seconds,
+        )
+        if allowed:
+            counter[1] += 1
+        return allowed, retry_after
+
+    async def remaining(self, key: str, limit: int, window_seconds: int) -> int:
+        now = time.time()
+        counter = self._counter(key, window_seconds, now)
+        elapsed = now / window_seconds - counter[0]
+        used = counter[2] * (1.0 - elapsed) + counter[1]
+        return max(0, int(limit - used))
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """Zaehler in der Tabelle rate_limit_counters (wird in init_db angelegt).
+
+    Ein Statement pro Check (Upsert nur wenn erlaubt). Bei gleichzeitigen
+    Requests mehrerer Worker kann das Limit minimal ueberschritten werden —
+    fuer Schutz vor Missbrauch ausreichend. DB-Fehler → Request erlaubt
+    (Rate-Limiting darf die App nicht lahmlegen).
+    """
+
+    CLEANUP_EVERY = 1000  # Hits pro Prozess zwischen zwei Aufraeum-Deletes
+
+    _HIT_SQL = text("""
+        WITH prev AS (
+            SELECT COALESCE(max(hits), 0) AS hits FROM rate_limit_counters
+            WHERE key = :key AND window_index = :win - 1
+        ), cur AS (
+            SELECT COALESCE(max(hits), 0) AS hits FROM rate_limit_counters
+            WHERE key = :key AND window_index = :win
+        ), ins AS (
+            INSERT INTO rate_limit_counters AS r (key, window_index, hits, expires_at)
+            SELECT :key, :win, 1, NOW() + make_interval(secs => CAST(:ttl AS DOUBLE PRECISION))
+            FROM prev, cur
+            WHERE prev.hits * CAST(:weight AS DOUBLE PRECISION) + cur.hits < :limit
+            ON CONFLICT (key, window_index) DO UPDATE SET hits = r.hits + 1
+            RETURNING r.hits
+        )
+        SELECT prev.hits, cur.hits, (SELECT count(*) FROM ins) FROM prev, cur
+    """)
+
+    _REMAINING_SQL = text("""
+        SELECT
+            COALESCE(max(hits) FILTER (WHERE window_index = :win - 1), 0),
+            COALESCE(max(hits) FILTER (WHERE window_index = :win), 0)
+        FROM rate_limit_counters
+        WHERE key = :key AND window_index IN (:win - 1, :win)
+    """)
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._hits_since_cleanup = 0
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from app.database import engine
+            self._engine = engine
+        return self._engine
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int]:
+        now = time.time()
+        window_index = int(now // window_seconds)
+        elapsed = now / window_seconds - window_index
+        try:
+            async with self.engine.begin() as conn:
+                row = (await conn.execute(self._HIT_SQL, {
+                    "key": key,
+                    "win": window_index,
+                    "weight": 1.0 - elapsed,
+                    "limit": limit,
+                    "ttl": 2 * window_seconds,
+                })).one()
+                await self._maybe_cleanup(conn)
+        except Exception as e:
+            logger.warning(f"Rate-Limit Backend nicht erreichbar, Request erlaubt: {e}")
+            return True, 0
+
+        previous, current, inserted = row
+        if inserted:
+            return True, 0
+        return sliding_window_decision(previous, current, elapsed, limit, window_seconds)
+
+    async def remaining(self, key: str, limit: int, window_seconds: int) -> int:
+        now = time.time()
+        window_index = int(now // window_seconds)
+        elapsed = now / window_seconds - window_index
+        try:
+            async with self.engine.connect() as conn:
+                previous, current = (await conn.execute(
+                    self._REMAINING_SQL, {"key": key, "win": window_index},
+                )).one()
+        except Exception as e:
+            logger.warning(f"Rate-Limit Backend nicht erreichbar: {e}")
+            return limit
+        return max(0, int(limit - (previous * (1.0 - elapsed) + current)))
+
+    async def _maybe_cleanup(self, conn) -> None:
+        self._hits_since_cleanup += 1
+        if self._hits_since_cleanup < self.CLEANUP_EVERY:
+            return
+        self._hits_since_cleanup = 0
+        await conn.execute(text("DELETE FROM rate_limit_counters WHERE expires_at < NOW()"))
+
+
+class RateLimiter:
+    """Rate-Limiter ueber einem austauschbaren Zaehler-Backend."""
+
+    def __init__(self, backend: RateLimitBackend | None = None):
+        self.backend = backend or InMemoryRateLimitBackend()
 
     def _get_client_key(self, request: Request) -> str:
         """
@@ -75,85 +279,57 @@ class InMemoryRateLimiter:
             return forwarded.split(",")[0].strip()
         return request.client.host if request.client else "unknown"
 
-    def _cleanup_old_entries(self) -> None:
-        """Entfernt abgelaufene Einträge aus dem Speicher."""
-        now = time.time()
-
-        # Nur alle 5 Minuten aufräumen
-        if now - self._last_cleanup < self._cleanup_interval:
-            return
-
-        max_window = max(config.window_seconds for config in RATE_LIMITS.values())
-
-        for client_key in list(self._requests.keys()):
-            self._requests[client_key] = [
-                (ts, tier)
-                for ts, tier in self._requests[client_key]
-                if now - ts < max_window
-            ]
-            # Leere Listen entfernen
-            if not self._requests[client_key]:
-                del self._requests[client_key]
-
-        self._last_cleanup = now
+    async def hit(self, client_key: str, tier: RateLimitTier) -> tuple[bool, int]:
+        """Zaehlt einen Request fuer (client_key, tier). Returns (allowed, retry_after)."""
+        config = RATE_LIMITS[tier]
+        return await self.backend.hit(
+            f"{client_key}:{tier.value}", config.requests, config.window_seconds,
+        )
 
-    def is_rate_limited(
+    async def is_rate_limited(
         self,
         request: Request,
         tier: RateLimitTier = RateLimitTier.STANDARD,
     ) -> tuple[bool, int]:
         """
-        Prüft, ob ein Request rate-limited ist.
+        Prüft, ob ein Request rate-limited ist (erlaubte Requests werden gezählt).
 
         Returns:
             (is_limited, retry_after_seconds)
         """
-        self._cleanup_old_entries()
+        allowed, retry_after = await self.hit(self._get_client_key(request), tier)
+        return not allowed, retry_after
 
-        client_key = self._get_client_key(request)
-        config = RATE_LIMITS[tier]
-        now = time.time()
-        window_start = now - config.window_seconds
-
-        # Zähle Requests im Zeitfenster für diese Tier
-        tier_requests = [
-            (ts, t)
-            for ts, t in self._requests[client_key]
-            if ts > window_start and t == tier
-        ]
-
-        if len(tier_requests) >= config.requests:
-            # Rate-Limit erreicht
-            oldest_request = min(ts for ts, _ in tier_requests)
-            retry_after = int(oldest_request + config.window_seconds - now) + 1
-            return True, max(retry_after, 1)
-
-        # Request erlaubt - hinzufügen
-        self._requests[client_key].append((now, tier))
-        return False, 0
-
-    def get_remaining(
+    async def get_remaining(
         self,
         request: Request,
         tier: RateLimitTier = RateLimitTier.STANDARD,
     ) -> int:
         """Gibt die verbleibenden Requests für einen Client zurück."""
-        client_key = self._get_client_key(request)
         config = RATE_LIMITS[tier]
-        now = time.time()
-        window_start = now - config.window_seconds
+        return await self.backend.remaining(
+            f"{self._get_client_key(request)}:{tier.value}",
+            config.requests,
+            config.window_seconds,
+        )
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Rate-Limiter mit Zaehlern im Prozess-Speicher (ein Worker, Tests)."""
+
+    def __init__(self, max_clients: int = 10_000):
+        super().__init__(InMemoryRateLimitBackend(max_keys=max_clients))
 
-        tier_requests = [
-            (ts, t)
-            for ts, t in self._requests[client_key]
-            if ts > window_start and t == tier
-        ]
 
-        return max(0, config.requests - len(tier_requests))
+def _create_rate_limiter() -> RateLimiter:
+    """Backend gemaess RATE_LIMIT_BACKEND ("memory" oder "postgres")."""
+    if settings.rate_limit_backend == "postgres":
+        return RateLimiter(PostgresRateLimitBackend())
+    return InMemoryRateLimiter()
 
 
 # Singleton-Instanz
-rate_limiter = InMemoryRateLimiter()
+rate_limiter = _create_rate_limiter()
 
 
 def rate_limit(tier: RateLimitTier = RateLimitTier.STANDARD) -> Callable:
@@ -179,7 +355,7 @@ def rate_limit(tier: RateLimitTier = RateLimitTier.STANDARD) -> Callable:
                         break
 
             if request:
-                is_limited, retry_after = rate_limiter.is_rate_limited(request, tier)
+                is_limited, retry_after = await rate_limiter.is_rate_limited(request, tier)
                 if is_limited:
                     raise RateLimitException(
                         f"Zu viele Anfragen. Bitte {retry_after} Sekunden warten."
@@ -207,7 +383,7 @@ async def check_rate_limit(
         ):
             ...
     """
-    is_limited, retry_after = rate_limiter.is_rate_limited(request, tier)
+    is_limited, retry_after = await rate_limiter.is_rate_limited(request, tier)
     if is_limited:
         raise RateLimitException(
             f"Zu viele Anfragen. Bitte {retry_after} Sekunden warten."
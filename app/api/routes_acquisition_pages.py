@@ -14,12 +14,12 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse, StreamingResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.templating import templates
 from app.models.acquisition_call import AcquisitionCall
 from app.models.acquisition_email import AcquisitionEmail
 from app.models.company import Company
@@ -27,7 +27,6 @@ from app.models.company_contact import CompanyContact
 from app.models.job import Job
 
 router = APIRouter(tags=["Akquise-Pages"])
-templates = Jinja2Templates(directory="app/templates")
 
 # Status-Gruppen fuer Tabs
 STATUS_GROUPS = {
@@ -559,11 +559,11 @@ async def _run_cv_parsing(batch_size: int, max_candidates: int):
     """Background Task für CV-Parsing. Verwendet eigene DB-Session."""
     from datetime import datetime, timezone
 
-    from sqlalchemy import select, func
+    from sqlalchemy import select
 
     from app.database import async_session_maker
     from app.models.candidate import Candidate
-    from app.services.cv_parser_service import CVParserService
+    from app.services.cv_ingestion_pipeline import CVIngestionPipeline, CVJob, CVJobResult
 
     global _cv_parsing_status
 
@@ -580,85 +580,60 @@ async def _run_cv_parsing(batch_size: int, max_candidates: int):
         "current_candidate": None,
     }
 
+    def _on_result(res: CVJobResult) -> None:
+        _cv_parsing_status["current_candidate"] = res.job.name
+        if res.success:
+            _cv_parsing_status["total_tokens"] += res.parse_result.tokens_used
+            _cv_parsing_status["parsed"] += 1
+            _cv_parsing_status["recently_parsed"].append(res.job.name)
+            _cv_parsing_status["recently_parsed"] = _cv_parsing_status["recently_parsed"][-10:]
+        else:
+            error = res.error or (res.parse_result.error if res.parse_result else None)
+            _cv_parsing_status["failed"] += 1
+            _cv_parsing_status["errors"].append(f"{res.job.name}: {error}")
+
     try:
+        # Nur schlanke Spalten laden — Session sofort wieder freigeben
         async with async_session_maker() as db:
-            parser = CVParserService(db)
-
-            offset = 0
-            while offset < max_candidates:
-                result = await db.execute(
-                    select(Candidate)
-                    .where(
-                        Candidate.cv_url.isnot(None),
-                        Candidate.cv_url != "",
-                        Candidate.cv_parsed_at.is_(None),
-                        Candidate.cv_parse_failed.is_(False),  # Überspringe fehlgeschlagene PDFs
-                    )
-                    .order_by(Candidate.id)
-                    .limit(batch_size)
+            result = await db.execute(
+                select(
+                    Candidate.id,
+                    Candidate.cv_url,
+                    Candidate.first_name,
+                    Candidate.last_name,
+                    Candidate.cv_pdf_hash,
+                    Candidate.cv_text,
                 )
-                candidates = result.scalars().all()
-
-                if not candidates:
-                    break
-
-                for candidate in candidates:
-                    # Stop-Mechanismus prüfen
-                    if _cv_parsing_status.get("stop_requested"):
-                        logger.info("CV-Parsing wurde manuell gestoppt.")
-                        _cv_parsing_status["running"] = False
-                        _cv_parsing_status["finished_at"] = datetime.now(timezone.utc).isoformat()
-                        _cv_parsing_status["current_candidate"] = None
-                        await db.commit()
-                        return
-
-                    _cv_parsing_status["current_candidate"] = (
-                        f"{candidate.first_name} {candidate.last_name}"
-                    )
-                    try:
-                        pdf_bytes = await parser.download_cv(candidate.cv_url)
-                        cv_text = parser.extract_text_from_pdf(pdf_bytes)
-                        parse_result = await parser.parse_cv_text(cv_text)
-
-                        if parse_result.success and parse_result.data:
-                            await parser._update_candidate_from_cv(
-                                candidate, parse_result.data, cv_text
-                            )
-                            _cv_parsing_status["total_tokens"] += parse_result.tokens_used
-                            _cv_parsing_status["parsed"] += 1
-                            _cv_parsing_status["recently_parsed"].append(
-                                f"{candidate.first_name} {candidate.last_name}"
-                            )
-                            _cv_parsing_status["recently_parsed"] = _cv_parsing_status["recently_parsed"][-10:]
-                        else:
-                            # Als fehlgeschlagen markieren - wird übersprungen bis neuer CV hochgeladen
-                            candidate.cv_parse_failed = True
-                            _cv_parsing_status["failed"] += 1
-                            _cv_parsing_status["errors"].append(
-                                f"{candidate.first_name} {candidate.last_name}: {parse_result.error}"
-                            )
-
-                    except Exception as e:
-                        # Als fehlgeschlagen markieren - wird übersprungen bis neuer CV hochgeladen
-                        candidate.cv_parse_failed = True
-                        _cv_parsing_status["failed"] += 1
-                        _cv_parsing_status["errors"].append(
-                            f"{candidate.first_name} {candidate.last_name}: {e}"
-                        )
-
-                    # Kurze Pause zwischen Kandidaten - gibt DB-Pool frei
-                    await asyncio.sleep(0.3)
-
-                await db.commit()
-                offset += batch_size
-                logger.info(
-                    f"CV-Parsing: {_cv_parsing_status['parsed']} geparst, "
-                    f"{_cv_parsing_status['failed']} fehlgeschlagen ({offset}/{max_candidates})"
+                .where(
+                    Candidate.cv_url.isnot(None),
+                    Candidate.cv_url != "",
+                    Candidate.cv_parsed_at.is_(None),
+                    Candidate.cv_parse_failed.is_(False),  # Überspringe fehlgeschlagene PDFs
+                )
+                .order_by(Candidate.id)
+                .limit(max_candidates)
+            )
+            jobs = [
+                CVJob(
+                    candidate_id=row.id,
+                    cv_url=row.cv_url,
+                    name=f"{row.first_name} {row.last_name}",
+                    cv_pdf_hash=row.cv_pdf_hash,
+                    cv_text=row.cv_text,
                 )
-                # Pause zwischen Batches damit DB-Pool für API-Requests frei bleibt
-                await asyncio.sleep(1.0)
+                for row in result.all()
+            ]
+
+        _cv_parsing_status["total_to_parse"] = len(jobs)
+        pipeline = CVIngestionPipeline(
+            write_batch_size=batch_size,
+            on_result=_on_result,
+            should_stop=lambda: bool(_cv_parsing_status.get("stop_requested")),
+        )
+        await pipeline.run(jobs)
 
-            await parser.close()
+        if _cv_parsing_status.get("stop_requested"):
+            logger.info("CV-Parsing wurde manuell gestoppt.")
 
     except Exception as e:
         logger.error(f"CV-Parsing Background Task fehlgeschlagen: {e}", exc_info=True)
@@ -5,10 +5,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.templating import templates
 from app.models.ats_pipeline import PIPELINE_STAGE_LABELS, PIPELINE_STAGE_ORDER, PipelineStage
 from app.services.ats_call_note_service import ATSCallNoteService
 from app.services.ats_job_service import ATSJobService
@@ -16,7 +16,6 @@ from app.services.ats_pipeline_service import ATSPipelineService
 from app.services.ats_todo_service import ATSTodoService
 
 router = APIRouter(tags=["ATS Pages"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("/ats", response_class=HTMLResponse)
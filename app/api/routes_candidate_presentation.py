@@ -279,7 +279,7 @@ async def send_presentation(req: SendPresentationRequest, db: AsyncSession = Dep
 
         # Domain-Kapazitaet pruefen
         _step = "import_domain_protection"
-        from app.services.domain_protection_service import check_domain_capacity, get_domain_for_company
+        from app.services.domain_protection_service import check_domain_capacity, get_domain_for_company, record_send
 
         _step = "check_domain_capacity"
         domain_check = await check_domain_capacity(db, req.email_from)
@@ -381,6 +381,7 @@ async def send_presentation(req: SendPresentationRequest, db: AsyncSession = Dep
 
         _step = "db_commit"
         await db.commit()
+        record_send(presentation_dict["email_from"])
 
         # n8n triggern (DB-Session ist bereits geschlossen — Railway 30s Timeout!)
         _step = "trigger_n8n"
@@ -618,13 +619,31 @@ async def bulk_start(
 @router.get("/bulk/{batch_id}/status")
 async def bulk_status(batch_id: str, db: AsyncSession = Depends(get_db)):
     """Batch-Fortschritt abfragen."""
-    from app.models.presentation_batch import PresentationBatch
+    from app.models.presentation_batch import PresentationBatch, PresentationBatchRow
+    from sqlalchemy import select
 
     bid = uuid.UUID(batch_id)
     batch = await db.get(PresentationBatch, bid)
     if not batch:
         raise HTTPException(status_code=404, detail="Batch nicht gefunden")
 
+    error_rows = await db.execute(
+        select(
+            PresentationBatchRow.row_index,
+            PresentationBatchRow.error,
+            PresentationBatchRow.company_name,
+        )
+        .where(
+            PresentationBatchRow.batch_id == bid,
+            PresentationBatchRow.status == "error",
+        )
+        .order_by(PresentationBatchRow.row_index)
+    )
+    error_details = [
+        {"row_index": r.row_index, "error": r.error, "company_name": r.company_name}
+        for r in error_rows.all()
+    ]
+
     return {
         "batch_id": str(batch.id),
         "status": batch.status,
@@ -633,7 +652,8 @@ async def bulk_status(batch_id: str, db: AsyncSession = Depends(get_db)):
         "skipped": batch.skipped,
         "errors": batch.errors,
         "mailbox_distribution": batch.mailbox_distribution,
-        "error_details": batch.error_details,
+        # Alte Batches (vor presentation_batch_rows) haben nur das JSONB-Feld
+        "error_details": error_details or batch.error_details,
     }
 
 
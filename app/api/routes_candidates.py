@@ -557,7 +557,7 @@ async def parse_cv_for_quickadd(
     async with CVParserService(db) as parser:
         cv_text = None
         try:
-            cv_text = parser.extract_text_from_pdf(pdf_bytes)
+            cv_text = await parser.extract_text_from_pdf_async(pdf_bytes)
         except ValueError:
             pass  # Kein Text → Vision-Fallback unten
 
@@ -569,7 +569,7 @@ async def parse_cv_for_quickadd(
             # Vision-Fallback (Bild-PDFs, Canva, Print-to-PDF etc.)
             logger.info(f"Quick-Add Vision-Fallback (kein extrahierbarer Text im PDF)")
             try:
-                pdf_images = parser.extract_images_from_pdf(pdf_bytes)
+                pdf_images = await parser.extract_images_from_pdf_async(pdf_bytes)
                 parse_result = await parser.parse_cv_with_vision(pdf_images)
                 cv_text = parse_result.raw_text or "[Vision-Parse]"
             except Exception as e:
@@ -1167,7 +1167,7 @@ async def _process_cv_after_upload(candidate_id: UUID, pdf_bytes: bytes):
             # Schritt 1: CV-Parsing (Text-Extraktion + OpenAI)
             logger.info(f"CV-Processing Schritt 1/4: Parsing fuer {candidate_id}")
             async with CVParserService(db) as parser:
-                cv_text = parser.extract_text_from_pdf(pdf_bytes)
+                cv_text = await parser.extract_text_from_pdf_async(pdf_bytes)
                 if cv_text:
                     parse_result = await parser.parse_cv_text(cv_text)
                     if parse_result.success and parse_result.data:
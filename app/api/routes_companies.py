@@ -431,7 +431,7 @@ async def extract_job_from_pdf(file: UploadFile = File(...), db: AsyncSession =
     try:
         from app.services.cv_parser_service import CVParserService
         parser = CVParserService(db)
-        raw_text = parser.extract_text_from_pdf(pdf_bytes)
+        raw_text = await parser.extract_text_from_pdf_async(pdf_bytes)
     except Exception as e:
         logger.error(f"PDF-Extraktion fehlgeschlagen: {e}")
         raise HTTPException(status_code=400, detail=f"PDF konnte nicht gelesen werden: {e}")
@@ -15,11 +15,11 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select, func, and_, or_, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db, async_session_maker
+from app.templating import templates
 from app.models.candidate import Candidate
 from app.models.job import Job
 from app.models.match import Match
@@ -60,7 +60,6 @@ _pipeline_status: dict = {
 }
 
 router = APIRouter(tags=["Hotlisten"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 # ════════════════════════════════════════════════════════════════
@@ -6,7 +6,6 @@ from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, UploadFile, File, status
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 import math
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +14,7 @@ from app.api.exception_handlers import NotFoundException, ConflictException
 from app.api.rate_limiter import RateLimitTier, rate_limit
 from app.config import Limits
 from app.database import get_db
+from app.templating import templates
 from app.schemas.filters import JobFilterParams, JobSortBy, SortOrder
 from app.schemas.job import JobListResponse, JobResponse, JobUpdate, ImportJobResponse
 from app.schemas.pagination import PaginatedResponse, PaginationParams
@@ -28,7 +28,6 @@ from app.services.job_service import JobService
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
-templates = Jinja2Templates(directory="app/templates")
 
 # ── Globaler Job-Klassifizierungs-Fortschritt (In-Memory) ──────────────
 _job_classification_progress: dict = {
@@ -427,8 +426,6 @@ async def import_jobs(
     # HTMX-Request: HTML zurueckgeben
     is_htmx = request.headers.get("HX-Request") == "true"
     if is_htmx:
-        from fastapi.templating import Jinja2Templates
-        templates = Jinja2Templates(directory="app/templates")
         # Pipeline-Daten als separate Variablen (nicht ueber detached object!)
         ed = import_job.errors_detail or {}
         return templates.TemplateResponse(
@@ -662,8 +659,6 @@ async def cancel_import(
     # HTMX-Request: HTML zurueckgeben
     is_htmx = request.headers.get("HX-Request") == "true"
     if is_htmx:
-        from fastapi.templating import Jinja2Templates
-        templates = Jinja2Templates(directory="app/templates")
         ed = import_job.errors_detail or {}
         # is_polling=True: Nur inneren Content liefern (fuer innerHTML-Swap in Wrapper).
         # Beim naechsten Poll-Cycle erkennt der Status-Endpoint "cancelled" → is_polling=False
@@ -1211,12 +1206,9 @@ async def get_candidates_for_job(
     Wird von HTMX auf der Job-Detail-Seite geladen.
     Enthält Distanz, Keyword-Score und ggf. KI-Bewertung.
     """
-    from fastapi.templating import Jinja2Templates
     from app.services.candidate_service import CandidateService
     from app.schemas.filters import CandidateFilterParams, CandidateSortBy
 
-    templates = Jinja2Templates(directory="app/templates")
-
     # Job prüfen
     job_service = JobService(db)
     job = await job_service.get_job(job_id)
@@ -1286,6 +1286,8 @@ async def sync_weights_to_v2(db: AsyncSession = Depends(get_db)):
             ))
             updated.append(f"{component} (neu)")
 
+    from app.services.matching_config import bump_matching_config_version
+    await bump_matching_config_version(db)
     await db.commit()
 
     # Verify
@@ -1331,6 +1333,9 @@ async def reset_all_matches(
 
     await db.commit()
 
+    from app.services.matching_learning_service import clear_separation_cache
+    clear_separation_cache()
+
     logger.info(f"ADMIN RESET: {m_count} Matches + {td_count} Training-Daten geloescht")
 
     return {
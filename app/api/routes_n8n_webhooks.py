@@ -1491,77 +1491,24 @@ async def _generate_profile_pdf_background(
 # ── Zwischenspeicher: Unzugeordnete Anrufe ──────────
 
 
-def _normalize_phone(phone: str) -> str:
-    """Entfernt alles ausser Ziffern, gibt letzte 8 Stellen zurueck.
-
-    Funktioniert mit +49, 0049, 0170, etc.
-    Vergleich ueber letzte 8 Stellen deckt laenderspezifische Praefixe ab.
-    """
-    if not phone:
-        return ""
-    digits = re.sub(r"\D", "", phone)
-    return digits[-8:] if len(digits) >= 8 else digits
-
-
 async def _phone_lookup(db: AsyncSession, phone: str):
     """Sucht Telefonnummer in candidates, company_contacts, companies.
 
     Gibt (entity_type, entity_id, entity_name, company_id) zurueck oder None.
-    Prioritaet: Kandidaten > Kontakte > Unternehmen.
+    Prioritaet: exakte Nummer, dann Kandidaten > Kontakte > Unternehmen.
     """
-    normalized = _normalize_phone(phone)
-    if not normalized or len(normalized) < 4:
-        return None
-
-    like_pattern = f"%{normalized}"
-
-    # 1. Kandidaten-Suche
-    result = await db.execute(
-        text("""
-            SELECT id, first_name, last_name
-            FROM candidates
-            WHERE REGEXP_REPLACE(COALESCE(phone, ''), '[^0-9]', '', 'g') LIKE :pattern
-              AND deleted_at IS NULL
-            LIMIT 1
-        """),
-        {"pattern": like_pattern},
-    )
-    row = result.fetchone()
-    if row:
-        name = f"{row[1] or ''} {row[2] or ''}".strip()
-        return {"entity_type": "candidate", "entity_id": str(row[0]), "entity_name": name, "company_id": None}
+    from app.services.phone_lookup_service import PhoneLookupService
 
-    # 2. Company-Contact-Suche (phone + mobile)
-    result = await db.execute(
-        text("""
-            SELECT cc.id, cc.first_name, cc.last_name, cc.company_id
-            FROM company_contacts cc
-            WHERE (REGEXP_REPLACE(COALESCE(cc.phone, ''), '[^0-9]', '', 'g') LIKE :pattern
-                OR REGEXP_REPLACE(COALESCE(cc.mobile, ''), '[^0-9]', '', 'g') LIKE :pattern)
-            LIMIT 1
-        """),
-        {"pattern": like_pattern},
-    )
-    row = result.fetchone()
-    if row:
-        name = f"{row[1] or ''} {row[2] or ''}".strip()
-        return {"entity_type": "contact", "entity_id": str(row[0]), "entity_name": name, "company_id": str(row[3]) if row[3] else None}
-
-    # 3. Company-Suche (Zentrale)
-    result = await db.execute(
-        text("""
-            SELECT id, name
-            FROM companies
-            WHERE REGEXP_REPLACE(COALESCE(phone, ''), '[^0-9]', '', 'g') LIKE :pattern
-            LIMIT 1
-        """),
-        {"pattern": like_pattern},
-    )
-    row = result.fetchone()
-    if row:
-        return {"entity_type": "company", "entity_id": str(row[0]), "entity_name": row[1] or "", "company_id": str(row[0])}
+    match = await PhoneLookupService(db).find_first(phone)
+    if not match:
+        return None
 
-    return None
+    return {
+        "entity_type": match.entity_type,
+        "entity_id": str(match.entity_id),
+        "entity_name": match.name,
+        "company_id": str(match.company_id) if match.company_id else None,
+    }
 
 
 async def _auto_assign_to_candidate(
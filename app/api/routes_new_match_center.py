@@ -17,14 +17,17 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.etag import conditional_etag
 from app.database import get_db
+from app.templating import templates
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.match import Match
 from app.services.new_match_center_service import NewMatchCenterService
 
 logger = logging.getLogger(__name__)
-templates = Jinja2Templates(directory="app/templates")
 
 # Jinja2-Filter: UTC → Europe/Berlin
 from zoneinfo import ZoneInfo
@@ -88,7 +91,9 @@ async def new_match_center_page(
 
 
 @router.get("/api/match-center/stats")
+@conditional_etag(Match)
 async def get_stats(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Dashboard-Statistiken."""
@@ -98,6 +103,7 @@ async def get_stats(
 
 
 @router.get("/api/match-center/matches", response_class=HTMLResponse)
+@conditional_etag(Match, Candidate, Job)
 async def get_matches(
     request: Request,
     empfehlung: str = Query(None),
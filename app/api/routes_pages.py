@@ -6,16 +6,22 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy import select
 
+from app.api.etag import conditional_etag
 from app.database import get_db
+from app.templating import fragment_cache, render_fragment, templates
 from app.models.job_run import JobSource, JobType
+from app.models.candidate import Candidate
+from app.models.company import Company
 from app.models.company_contact import CompanyContact
+from app.models.job import Job
+from app.models.match import Match
+from app.models.settings import PriorityCity
 from app.services.job_runner_service import JobRunnerService
 from app.schemas.filters import JobFilterParams
 from app.services.job_service import JobService
@@ -24,17 +30,11 @@ from app.services.company_service import CompanyService
 from app.services.filter_service import FilterService
 from app.services.statistics_service import StatisticsService
 from app.services.alert_service import AlertService
-from app.services.ats_call_note_service import ATSCallNoteService
-from app.services.ats_todo_service import ATSTodoService
-from app.services.email_service import EmailService
-from app.models.candidate_email import CandidateEmail
-from app.models.candidate_task import CandidateTask
 from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Pages"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 # Jinja2 Filter hinzufuegen
@@ -159,25 +159,15 @@ async def candidate_detail(
     db: AsyncSession = Depends(get_db)
 ):
     """Kandidaten-Detailseite."""
-    candidate_service = CandidateService(db)
-    candidate = await candidate_service.get_candidate(candidate_id)
+    from app.services.page_data_service import PageDataService
 
-    if not candidate:
+    page = await PageDataService(db).candidate_page(candidate_id)
+    if not page:
         raise HTTPException(status_code=404, detail="Kandidat nicht gefunden")
 
-    # CallNotes fuer Anrufprotokoll laden
-    call_note_service = ATSCallNoteService(db)
-    call_notes_result = await call_note_service.list_call_notes(
-        candidate_id=candidate_id, per_page=100
-    )
-    call_notes = call_notes_result["items"]
-
-    # Todos fuer Aufgaben-Tab laden
-    todo_service = ATSTodoService(db)
-    todos_result = await todo_service.list_todos(
-        candidate_id=candidate_id, per_page=100
-    )
-    todos = todos_result["items"]
+    candidate = page.candidate
+    call_notes = page.call_notes
+    todos = page.todos
 
     # Todos serialisieren fuer Alpine.js tojson im Template
     todos_serialized = []
@@ -204,11 +194,9 @@ async def candidate_detail(
             "contact_name": (t.contact.first_name or '') + ' ' + (t.contact.last_name or '') if getattr(t, 'contact', None) else None,
         })
 
-    # Email-Drafts fuer diesen Kandidaten laden
-    email_service = EmailService(db)
-    email_drafts = await email_service.list_drafts(candidate_id=candidate_id)
+    # Email-Drafts fuer diesen Kandidaten
     drafts_serialized = []
-    for d in email_drafts:
+    for d in page.email_drafts:
         drafts_serialized.append({
             "id": str(d.id),
             "email_type": d.email_type,
@@ -222,17 +210,9 @@ async def candidate_detail(
             "created_at": d.created_at.isoformat() if d.created_at else None,
         })
 
-    # E-Mail-Automatisierung: Sequenz-Emails laden (candidate_emails Tabelle)
-    seq_emails_query = (
-        select(CandidateEmail)
-        .where(CandidateEmail.candidate_id == candidate_id)
-        .order_by(CandidateEmail.created_at.desc())
-        .limit(50)
-    )
-    seq_emails_result = await db.execute(seq_emails_query)
-    seq_emails = seq_emails_result.scalars().all()
+    # E-Mail-Automatisierung: Sequenz-Emails (candidate_emails Tabelle)
     seq_emails_serialized = []
-    for e in seq_emails:
+    for e in page.seq_emails:
         seq_emails_serialized.append({
             "id": str(e.id),
             "subject": e.subject,
@@ -249,14 +229,7 @@ async def candidate_detail(
         })
 
     # Alte CandidateTasks in todos_serialized hineinmergen (Dual-Read)
-    seq_tasks_query = (
-        select(CandidateTask)
-        .where(CandidateTask.candidate_id == candidate_id)
-        .order_by(CandidateTask.created_at.desc())
-        .limit(50)
-    )
-    seq_tasks_result = await db.execute(seq_tasks_query)
-    seq_tasks = seq_tasks_result.scalars().all()
+    seq_tasks = page.seq_tasks
 
     # CandidateTasks → ATSTodo-kompatibles Format für den vereinheitlichten Aufgaben-Tab
     _ct_priority_map = {"low": "unwichtig", "normal": "mittelmaessig", "high": "wichtig", "urgent": "dringend"}
@@ -313,88 +286,24 @@ async def company_detail(
     db: AsyncSession = Depends(get_db),
 ):
     """Unternehmen-Detailseite."""
-    company_service = CompanyService(db)
-    company = await company_service.get_company(company_id)
+    from app.services.page_data_service import PageDataService
 
-    if not company:
+    page = await PageDataService(db).company_page(company_id)
+    if not page:
         raise HTTPException(status_code=404, detail="Unternehmen nicht gefunden")
 
-    # Job-Count laden (normale Jobs)
-    from app.models.job import Job
-    from app.models.ats_job import ATSJob
-    from sqlalchemy import func, select
-    job_count_result = await db.execute(
-        select(func.count(Job.id)).where(
-            Job.company_id == company_id,
-            Job.deleted_at.is_(None),
-        )
-    )
-    job_count = job_count_result.scalar() or 0
-
-    # ATS-Jobs Count laden (nur nicht-geloeschte)
-    ats_job_count_result = await db.execute(
-        select(func.count(ATSJob.id)).where(
-            ATSJob.company_id == company_id,
-            ATSJob.deleted_at.is_(None),
-        )
-    )
-    ats_job_count = ats_job_count_result.scalar() or 0
-
-    # Call Stats laden
-    from app.models.ats_call_note import ATSCallNote
-    call_count_result = await db.execute(
-        select(func.count(ATSCallNote.id)).where(
-            ATSCallNote.company_id == company_id,
-        )
-    )
-    call_count = call_count_result.scalar() or 0
-
-    call_duration_result = await db.execute(
-        select(func.coalesce(func.sum(ATSCallNote.duration_minutes), 0)).where(
-            ATSCallNote.company_id == company_id,
-        )
-    )
-    call_total_duration = call_duration_result.scalar() or 0
-
-    # Contact Count laden
-    contact_count_result = await db.execute(
-        select(func.count(CompanyContact.id)).where(
-            CompanyContact.company_id == company_id,
-        )
-    )
-    contact_count = contact_count_result.scalar() or 0
-
-    # Akquise-Jobs Count (Jobs mit acquisition_source != NULL)
-    akquise_count_result = await db.execute(
-        select(func.count(Job.id)).where(
-            Job.company_id == company_id,
-            Job.deleted_at.is_(None),
-            Job.acquisition_source.isnot(None),
-        )
-    )
-    akquise_count = akquise_count_result.scalar() or 0
-
-    # Kontakte fuer Call-Modal laden
-    from sqlalchemy.orm import selectinload
-    contacts_result = await db.execute(
-        select(CompanyContact)
-        .where(CompanyContact.company_id == company_id)
-        .order_by(CompanyContact.last_name.asc())
-    )
-    contacts = contacts_result.scalars().all()
-
     return templates.TemplateResponse(
         "company_detail.html",
         {
             "request": request,
-            "company": company,
-            "job_count": job_count,
-            "ats_job_count": ats_job_count,
-            "akquise_count": akquise_count,
-            "call_count": call_count,
-            "call_total_duration": call_total_duration,
-            "contact_count": contact_count,
-            "contacts": contacts,
+            "company": page.company,
+            "job_count": page.job_count,
+            "ats_job_count": page.ats_job_count,
+            "akquise_count": page.akquise_count,
+            "call_count": page.call_count,
+            "call_total_duration": page.call_total_duration,
+            "contact_count": page.contact_count,
+            "contacts": page.contacts,
         }
     )
 
@@ -436,6 +345,7 @@ async def users_page(request: Request):
 
 
 @router.get("/partials/job-list", response_class=HTMLResponse)
+@conditional_etag(Job, Match, PriorityCity)
 async def job_list_partial(
     request: Request,
     page: int = 1,
@@ -481,30 +391,21 @@ async def job_list_partial(
     )
 
 
-@router.get("/partials/jobs-list", response_class=HTMLResponse)
-async def jobs_list_partial(
-    request: Request,
-    page: int = 1,
-    per_page: int = 20,
-    search: Optional[str] = None,
-    cities: Optional[str] = None,
-    industry: Optional[str] = None,
-    company: Optional[str] = None,
-    company_id: Optional[str] = None,
-    sort_by: str = "imported_at",
-    sort_order: str = "desc",
-    postal_code_prefix: Optional[str] = None,
-    imported_days: Optional[str] = None,
-    updated_days: Optional[str] = None,
-    view: str = "cards",
-    db: AsyncSession = Depends(get_db),
-):
-    """Partial: Jobs-Liste fuer neue /jobs Seite (HTMX)."""
+def _jobs_list_filters(
+    search: Optional[str],
+    cities: Optional[str],
+    industry: Optional[str],
+    company: Optional[str],
+    company_id: Optional[str],
+    sort_by: str,
+    sort_order: str,
+    postal_code_prefix: Optional[str],
+    imported_days: Optional[str],
+    updated_days: Optional[str],
+) -> JobFilterParams:
+    """Filter der /jobs Seite aus den Query-Parametern (Liste und Export)."""
     from app.schemas.filters import JobSortBy, SortOrder as SortOrderEnum
 
-    job_service = JobService(db)
-    filter_service = FilterService(db)
-
     # Sort-Enum aufloesen
     try:
         sort_by_enum = JobSortBy(sort_by)
@@ -550,8 +451,7 @@ async def jobs_list_partial(
     if company_id and company_id.strip():
         safe_company_id = company_id.strip()
 
-    # Filter aufbauen
-    filters = JobFilterParams(
+    return JobFilterParams(
         search=safe_search,
         cities=safe_cities,
         industries=[industry] if industry else None,
@@ -564,6 +464,35 @@ async def jobs_list_partial(
         updated_days=safe_updated_days,
     )
 
+
+@router.get("/partials/jobs-list", response_class=HTMLResponse)
+@conditional_etag(Job, Match, PriorityCity)
+async def jobs_list_partial(
+    request: Request,
+    page: int = 1,
+    per_page: int = 20,
+    search: Optional[str] = None,
+    cities: Optional[str] = None,
+    industry: Optional[str] = None,
+    company: Optional[str] = None,
+    company_id: Optional[str] = None,
+    sort_by: str = "imported_at",
+    sort_order: str = "desc",
+    postal_code_prefix: Optional[str] = None,
+    imported_days: Optional[str] = None,
+    updated_days: Optional[str] = None,
+    view: str = "cards",
+    db: AsyncSession = Depends(get_db),
+):
+    """Partial: Jobs-Liste fuer neue /jobs Seite (HTMX)."""
+    job_service = JobService(db)
+    filter_service = FilterService(db)
+
+    filters = _jobs_list_filters(
+        search, cities, industry, company, company_id, sort_by, sort_order,
+        postal_code_prefix, imported_days, updated_days,
+    )
+
     # Jobs laden
     result = await job_service.list_jobs(
         filters=filters,
@@ -623,27 +552,30 @@ async def filter_panel_partial(
     db: AsyncSession = Depends(get_db)
 ):
     """Partial: Filter-Panel fuer HTMX."""
-    filter_service = FilterService(db)
+    async def _render() -> str:
+        filter_service = FilterService(db)
 
-    # Filter-Optionen laden
-    cities = await filter_service.get_available_cities()
-    skills = await filter_service.get_available_skills()
-    industries = await filter_service.get_available_industries()
+        # Filter-Optionen laden
+        cities = await filter_service.get_available_cities()
+        skills = await filter_service.get_available_skills()
+        industries = await filter_service.get_available_industries()
 
-    return templates.TemplateResponse(
-        "components/filter_panel.html",
-        {
-            "request": request,
-            "filters": {},
-            "options": {
-                "cities": cities,
-                "skills": skills,
-                "industries": industries
-            },
-            "filter_url": "/partials/job-list",
-            "target_id": "#job-list"
-        }
-    )
+        return render_fragment(
+            "components/filter_panel.html",
+            {
+                "request": request,
+                "filters": {},
+                "options": {
+                    "cities": cities,
+                    "skills": skills,
+                    "industries": industries
+                },
+                "filter_url": "/partials/job-list",
+                "target_id": "#job-list"
+            }
+        )
+
+    return HTMLResponse(await fragment_cache.get_or_render("filter_options", "job-list", _render))
 
 
 @router.get("/partials/statistics", response_class=HTMLResponse)
@@ -653,6 +585,12 @@ async def statistics_partial(
     db: AsyncSession = Depends(get_db)
 ):
     """Partial: Statistiken-Inhalt fuer HTMX."""
+    return HTMLResponse(await fragment_cache.get_or_render(
+        "statistics", days, lambda: _render_statistics(request, days, db),
+    ))
+
+
+async def _render_statistics(request: Request, days: int, db: AsyncSession) -> str:
     statistics_service = StatisticsService(db)
     dashboard_stats = await statistics_service.get_dashboard_stats(days=days)
 
@@ -678,7 +616,7 @@ async def statistics_partial(
         "candidates_without_address": dashboard_stats.candidates_without_address,
     }
 
-    return templates.TemplateResponse(
+    return render_fragment(
         "partials/statistics_content.html",
         {
             "request": request,
@@ -694,16 +632,17 @@ async def priority_cities_partial(
     db: AsyncSession = Depends(get_db)
 ):
     """Partial: Prioritaets-Staedte fuer HTMX."""
-    filter_service = FilterService(db)
-    cities = await filter_service.get_priority_cities()
+    async def _render() -> str:
+        cities = await FilterService(db).get_priority_cities()
+        return render_fragment(
+            "partials/priority_cities.html",
+            {
+                "request": request,
+                "cities": cities
+            }
+        )
 
-    return templates.TemplateResponse(
-        "partials/priority_cities.html",
-        {
-            "request": request,
-            "cities": cities
-        }
-    )
+    return HTMLResponse(await fragment_cache.get_or_render("priority_cities", "all", _render))
 
 
 @router.get("/partials/filter-presets", response_class=HTMLResponse)
@@ -712,19 +651,54 @@ async def filter_presets_partial(
     db: AsyncSession = Depends(get_db)
 ):
     """Partial: Filter-Presets fuer HTMX."""
-    filter_service = FilterService(db)
-    presets = await filter_service.get_filter_presets()
+    async def _render() -> str:
+        presets = await FilterService(db).get_filter_presets()
+        return render_fragment(
+            "partials/filter_presets.html",
+            {
+                "request": request,
+                "presets": presets
+            }
+        )
 
-    return templates.TemplateResponse(
-        "partials/filter_presets.html",
-        {
-            "request": request,
-            "presets": presets
-        }
+    return HTMLResponse(await fragment_cache.get_or_render("filter_presets", "all", _render))
+
+
+def _candidates_list_filters(
+    search: Optional[str],
+    position: Optional[str],
+    skills: Optional[str],
+    city: Optional[str],
+    category: Optional[str],
+    plz_prefix: Optional[str],
+    plz_from: Optional[str],
+    plz_to: Optional[str],
+):
+    """Filter der Kandidaten-Liste aus den Query-Parametern (Liste und Export)."""
+    from app.schemas.filters import CandidateFilterParams
+
+    # Skills-String in Liste splitten (kommagetrennt)
+    skills_list = None
+    if skills:
+        skills_list = [s.strip() for s in skills.split(',') if s.strip()]
+
+    # include_hidden=True damit ALLE Kandidaten findbar sind
+    return CandidateFilterParams(
+        name=search if search else None,
+        position=position if position else None,
+        skills=skills_list,
+        city_search=city if city else None,
+        hotlist_category=category if category else None,
+        plz_prefix=plz_prefix if plz_prefix else None,
+        plz_from=plz_from if plz_from else None,
+        plz_to=plz_to if plz_to else None,
+        include_hidden=True,
+        only_active=False,
     )
 
 
 @router.get("/partials/candidates-list", response_class=HTMLResponse)
+@conditional_etag(Candidate, Match)
 async def candidates_list_partial(
     request: Request,
     page: int = 1,
@@ -740,29 +714,10 @@ async def candidates_list_partial(
     db: AsyncSession = Depends(get_db)
 ):
     """Partial: Kandidaten-Liste fuer HTMX."""
-    from app.schemas.filters import CandidateFilterParams
     from app.schemas.pagination import PaginationParams
 
     candidate_service = CandidateService(db)
-
-    # Skills-String in Liste splitten (kommagetrennt)
-    skills_list = None
-    if skills:
-        skills_list = [s.strip() for s in skills.split(',') if s.strip()]
-
-    # Filter aufbauen - include_hidden=True damit ALLE Kandidaten findbar sind
-    filters = CandidateFilterParams(
-        name=search if search else None,
-        position=position if position else None,
-        skills=skills_list,
-        city_search=city if city else None,
-        hotlist_category=category if category else None,
-        plz_prefix=plz_prefix if plz_prefix else None,
-        plz_from=plz_from if plz_from else None,
-        plz_to=plz_to if plz_to else None,
-        include_hidden=True,
-        only_active=False,
-    )
+    filters = _candidates_list_filters(search, position, skills, city, category, plz_prefix, plz_from, plz_to)
 
     pagination = PaginationParams(page=page, per_page=per_page)
 
@@ -793,7 +748,95 @@ async def candidates_list_partial(
     )
 
 
+# ============================================================================
+# Exporte (CSV / XLSX, gestreamt)
+# ============================================================================
+
+
+CANDIDATE_EXPORT_FIELDS = [
+    ("first_name", "Vorname"),
+    ("last_name", "Nachname"),
+    ("email", "E-Mail"),
+    ("phone", "Telefon"),
+    ("current_position", "Position"),
+    ("city", "Stadt"),
+    ("postal_code", "PLZ"),
+    ("skills", "Skills"),
+    ("hotlist_category", "Kategorie"),
+    ("source", "Quelle"),
+    ("created_at", "Erstellt am"),
+]
+
+JOB_EXPORT_FIELDS = [
+    ("position", "Position"),
+    ("company_name", "Unternehmen"),
+    ("city", "Stadt"),
+    ("postal_code", "PLZ"),
+    ("industry", "Branche"),
+    ("employment_type", "Anstellungsart"),
+    ("job_url", "URL"),
+    ("imported_at", "Importiert am"),
+    ("expires_at", "Laeuft ab am"),
+]
+
+
+def _export_columns(model, fields) -> list:
+    """Nur die exportierten Spalten selektieren (keine CV-/Job-Texte laden)."""
+    return [getattr(model, key) for key, _ in fields]
+
+
+@router.get("/export/candidates")
+async def export_candidates(
+    search: Optional[str] = None,
+    position: Optional[str] = None,
+    skills: Optional[str] = None,
+    city: Optional[str] = None,
+    category: Optional[str] = None,
+    plz_prefix: Optional[str] = None,
+    plz_from: Optional[str] = None,
+    plz_to: Optional[str] = None,
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Export der Kandidaten-Liste mit denselben Filtern wie /partials/candidates-list."""
+    from app.services.export_service import streaming_export
+
+    filters = _candidates_list_filters(search, position, skills, city, category, plz_prefix, plz_from, plz_to)
+    query = CandidateService(db).build_list_query(filters)
+    query = query.with_only_columns(*_export_columns(Candidate, CANDIDATE_EXPORT_FIELDS))
+    return streaming_export(query, CANDIDATE_EXPORT_FIELDS, lambda row: row._asdict(), format, "kandidaten")
+
+
+@router.get("/export/jobs")
+async def export_jobs(
+    search: Optional[str] = None,
+    cities: Optional[str] = None,
+    industry: Optional[str] = None,
+    company: Optional[str] = None,
+    company_id: Optional[str] = None,
+    sort_by: str = "imported_at",
+    sort_order: str = "desc",
+    postal_code_prefix: Optional[str] = None,
+    imported_days: Optional[str] = None,
+    updated_days: Optional[str] = None,
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Export der Jobs-Liste mit denselben Filtern wie /partials/jobs-list."""
+    from app.services.export_service import streaming_export
+
+    filters = _jobs_list_filters(
+        search, cities, industry, company, company_id, sort_by, sort_order,
+        postal_code_prefix, imported_days, updated_days,
+    )
+    # Sortierung braucht die Prio-Staedte -> Query hier bauen, gestreamt wird separat
+    query = await JobService(db).build_list_query(filters)
+    query = query.with_only_columns(*_export_columns(Job, JOB_EXPORT_FIELDS))
+    return streaming_export(query, JOB_EXPORT_FIELDS, lambda row: row._asdict(), format, "jobs")
+
+
 @router.get("/partials/companies-list", response_class=HTMLResponse)
+@conditional_etag(Company, Job, CompanyContact)
 async def companies_list_partial(
     request: Request,
     page: int = 1,
@@ -1022,13 +1065,14 @@ async def candidate_pipeline_partial(
     from app.models.ats_pipeline import ATSPipelineEntry, PIPELINE_STAGE_LABELS
     from app.models.ats_job import ATSJob
     from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import joinedload
 
     # Hole alle Pipeline-Entries fuer diesen Kandidaten
     result = await db.execute(
         select(ATSPipelineEntry)
         .options(
-            selectinload(ATSPipelineEntry.ats_job).selectinload(ATSJob.company)
+            # Many-to-one: ein JOIN statt zwei Nachlade-Queries
+            joinedload(ATSPipelineEntry.ats_job).joinedload(ATSJob.company)
         )
         .where(ATSPipelineEntry.candidate_id == candidate_id)
         .order_by(ATSPipelineEntry.updated_at.desc())
@@ -1527,6 +1571,7 @@ async def contacts_page(request: Request):
 
 
 @router.get("/partials/contacts-list", response_class=HTMLResponse)
+@conditional_etag(CompanyContact, Company)
 async def contacts_list_partial(
     request: Request,
     page: int = 1,
@@ -81,6 +81,7 @@ class FollowupUpdateRequest(BaseModel):
 class SentConfirmRequest(BaseModel):
     """Request-Body fuer POST /api/presentations/{id}/sent (n8n Callback)."""
     n8n_execution_id: Optional[str] = None
+    message_id: Optional[str] = None  # Message-ID der gesendeten E-Mail (Reply-Matching)
 
 
 class FallbackResultRequest(BaseModel):
@@ -792,6 +793,7 @@ async def confirm_email_sent(
         success = await service.confirm_sent(
             presentation_id=presentation_id,
             n8n_execution_id=body.n8n_execution_id,
+            message_id=body.message_id,
         )
     except Exception as e:
         logger.error(f"confirm_sent fehlgeschlagen: {e}")
@@ -43,6 +43,9 @@ class ProcessReplyRequest(BaseModel):
     email_subject: str
     email_body: str
     message_id: Optional[str] = None
+    # Thread-Header der Antwort (Matching ueber message_id der Presentation)
+    in_reply_to: Optional[str] = None
+    references: Optional[str] = None
 
 
 class BlocklistCheckRequest(BaseModel):
@@ -67,12 +70,19 @@ async def process_reply(req: ProcessReplyRequest):
     (eigene DB-Sessions pro Schritt, Railway 30s Timeout beachtet).
     """
     try:
-        from app.services.presentation_reply_service import PresentationReplyService
+        from app.services.presentation_reply_service import (
+            PresentationReplyService,
+            extract_thread_ids,
+        )
 
         result = await PresentationReplyService.process_reply(
             email_from=req.email_from,
             email_subject=req.email_subject,
             email_body=req.email_body,
+            thread_ids=extract_thread_ids([
+                {"name": "In-Reply-To", "value": req.in_reply_to},
+                {"name": "References", "value": req.references},
+            ]),
         )
 
         # Reply-Log schreiben (eigene Session)
@@ -233,7 +243,10 @@ async def check_inbox(minutes: int = Query(default=15, ge=1, le=60)):
                     continue
 
                 # ── Phase 3: Reply verarbeiten ──
-                from app.services.presentation_reply_service import PresentationReplyService
+                from app.services.presentation_reply_service import (
+                    PresentationReplyService,
+                    extract_thread_ids,
+                )
 
                 # Body bereinigen (HTML → Plain Text, nur erste 3000 Zeichen)
                 plain_body = _strip_html(body_content)[:3000]
@@ -242,6 +255,7 @@ async def check_inbox(minutes: int = Query(default=15, ge=1, le=60)):
                     email_from=from_email,
                     email_subject=subject,
                     email_body=plain_body,
+                    thread_ids=extract_thread_ids(email.get("internetMessageHeaders")),
                 )
 
                 processed += 1
@@ -519,6 +533,12 @@ async def check_blocklist(req: BlocklistCheckRequest, db: AsyncSession = Depends
         domain = req.email.split("@", 1)[1].lower() if "@" in req.email else req.email.lower()
     domain = domain.lower().strip()
 
+    # Nicht blockiert (Normalfall) → direkt aus dem Cache, ohne Query
+    from app.services.presentation_reply_service import blocklist_cache
+    await blocklist_cache.ensure_fresh(db)
+    if not blocklist_cache.contains(domain):
+        return {"blocked": False, "reason": None, "blocked_at": None}
+
     result = await db.execute(
         select(EmailBlocklist).where(EmailBlocklist.domain == domain)
     )
@@ -589,6 +609,9 @@ async def add_to_blocklist(req: BlocklistAddRequest, db: AsyncSession = Depends(
     db.add(entry)
     await db.commit()
 
+    from app.services.presentation_reply_service import blocklist_cache
+    blocklist_cache.add(domain)
+
     return {"status": "added", "domain": domain}
 
 
@@ -610,6 +633,10 @@ async def remove_from_blocklist(domain: str, db: AsyncSession = Depends(get_db))
         raise HTTPException(status_code=404, detail=f"Domain '{domain}' nicht auf der Blockliste")
 
     await db.commit()
+
+    from app.services.presentation_reply_service import blocklist_cache
+    blocklist_cache.invalidate()
+
     return {"status": "removed", "domain": domain}
 
 
@@ -724,17 +751,18 @@ async def cleanup_stale_presentations():
 # ═══════════════════════════════════════════════════════════════
 
 async def is_domain_blocked(db: AsyncSession, email: str) -> bool:
-    """Prueft ob die Domain einer E-Mail blockiert ist."""
-    from app.models.email_blocklist import EmailBlocklist
+    """Prueft ob die Domain einer E-Mail blockiert ist (Versandpfad).
+
+    Blocklist-Cache, ein Miss wird per Index-Lookup in email_blocklist
+    bestaetigt — Blocks aus anderen Workern wirken sofort.
+    """
+    from app.services.presentation_reply_service import blocklist_cache
 
     if not email or "@" not in email:
         return False
     domain = email.split("@", 1)[1].lower().strip()
 
-    result = await db.execute(
-        select(EmailBlocklist.id).where(EmailBlocklist.domain == domain).limit(1)
-    )
-    return result.scalar_one_or_none() is not None
+    return await blocklist_cache.is_blocked(db, domain, confirm=True)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -238,7 +238,15 @@ async def update_system_setting(
 
     old_value = setting.value
     setting.value = data.value
+    if key == "drive_time_score_threshold":
+        # Matching-Engines cachen die Schwelle im Config-Snapshot
+        from app.services.matching_config import bump_matching_config_version
+        await bump_matching_config_version(db)
     await db.commit()
+    if key.startswith("domain_limit_"):
+        # Domain-Limits liegen im Tageszaehler (neu laden beim naechsten Check)
+        from app.services.domain_protection_service import domain_send_counter
+        domain_send_counter.invalidate()
 
     logger.info(f"System-Einstellung '{key}' geaendert: {old_value} → {data.value}")
 
@@ -4,11 +4,12 @@ import logging
 from datetime import date, datetime, timedelta, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy import case, cast, func, select, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.etag import conditional_etag
 from app.database import get_db
 from app.models.candidate import Candidate
 from app.models.job import Job
@@ -21,6 +22,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/status", tags=["Status"])
 
+EXPORT_FORMAT_PATTERN = "^(csv|xlsx)$"
+
+
+async def _count(db: AsyncSession, query) -> int:
+    """Gesamtzahl einer gefilterten Abfrage (ohne Sortierung)."""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar() or 0
+
 
 # ══════════════════════════════════════════════════════════════════
 # 1. GEODATEN
@@ -203,7 +212,8 @@ async def get_profiling_status(db: AsyncSession = Depends(get_db)):
 # ══════════════════════════════════════════════════════════════════
 
 @router.get("/matches")
-async def get_matches_status(db: AsyncSession = Depends(get_db)):
+@conditional_etag(Match)
+async def get_matches_status(request: Request, db: AsyncSession = Depends(get_db)):
     """Match-Statistiken — Score-Verteilung, Status, Distanz."""
     total = (await db.execute(select(func.count(Match.id)))).scalar() or 0
 
@@ -260,20 +270,16 @@ async def get_matches_status(db: AsyncSession = Depends(get_db)):
     }
 
 
-@router.get("/matches/query")
-async def query_matches(
-    candidate_id: UUID | None = Query(None, description="Filter auf Kandidat"),
-    job_id: UUID | None = Query(None, description="Filter auf Job"),
-    min_score: float = Query(0, description="Mindest-Score (0-100)"),
-    max_score: float = Query(100, description="Max-Score (0-100)"),
-    days: int = Query(365, description="Zeitraum in Tagen"),
-    status: str | None = Query(None, description="Match-Status (new, ai_checked, presented, rejected, placed)"),
-    sort_by: str = Query("score", description="Sortierung: score oder date"),
-    page: int = Query(1, ge=1),
-    per_page: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+def _matches_query(
+    candidate_id: UUID | None,
+    job_id: UUID | None,
+    min_score: float,
+    max_score: float,
+    days: int,
+    status: str | None,
+    sort_by: str,
 ):
-    """Flexible Match-Abfrage mit Filtern."""
+    """Gefilterte, sortierte Match-Abfrage (Liste und Export)."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
     # Base query mit JOINs fuer Namen
@@ -298,65 +304,69 @@ async def query_matches(
         .where(Match.v2_score.isnot(None))
     )
 
-    count_query = select(func.count(Match.id)).where(Match.v2_score.isnot(None))
-
     # Filter
     if candidate_id:
         query = query.where(Match.candidate_id == candidate_id)
-        count_query = count_query.where(Match.candidate_id == candidate_id)
     if job_id:
         query = query.where(Match.job_id == job_id)
-        count_query = count_query.where(Match.job_id == job_id)
     if min_score > 0:
         query = query.where(Match.v2_score >= min_score)
-        count_query = count_query.where(Match.v2_score >= min_score)
     if max_score < 100:
         query = query.where(Match.v2_score <= max_score)
-        count_query = count_query.where(Match.v2_score <= max_score)
     if status:
-        match_status = MatchStatus(status)
-        query = query.where(Match.status == match_status)
-        count_query = count_query.where(Match.status == match_status)
+        query = query.where(Match.status == MatchStatus(status))
 
     # Zeitraum: v2_matched_at oder created_at
     query = query.where(
         func.coalesce(Match.v2_matched_at, Match.created_at) >= cutoff
     )
-    count_query = count_query.where(
-        func.coalesce(Match.v2_matched_at, Match.created_at) >= cutoff
-    )
 
     # Sortierung
     if sort_by == "date":
-        query = query.order_by(func.coalesce(Match.v2_matched_at, Match.created_at).desc())
-    else:
-        query = query.order_by(Match.v2_score.desc())
+        return query.order_by(func.coalesce(Match.v2_matched_at, Match.created_at).desc())
+    return query.order_by(Match.v2_score.desc())
+
+
+def _match_item(row) -> dict:
+    candidate_name = " ".join(filter(None, [row.first_name, row.last_name])) or "Unbekannt"
+    return {
+        "match_id": str(row.id),
+        "job_title": row.job_title or "Unbekannt",
+        "company": row.company or "Unbekannt",
+        "candidate_name": candidate_name,
+        "candidate_id": str(row.candidate_id) if row.candidate_id else None,
+        "job_id": str(row.job_id) if row.job_id else None,
+        "v2_score": round(float(row.v2_score), 1) if row.v2_score else 0,
+        "v2_score_breakdown": row.v2_score_breakdown,
+        "distance_km": round(float(row.distance_km), 1) if row.distance_km else None,
+        "status": row.status.value if hasattr(row.status, 'value') else str(row.status),
+        "matched_at": row.v2_matched_at.isoformat() if row.v2_matched_at else (row.created_at.isoformat() if row.created_at else None),
+    }
 
-    # Total
-    total = (await db.execute(count_query)).scalar() or 0
+
+@router.get("/matches/query")
+@conditional_etag(Match, Job, Candidate)
+async def query_matches(
+    request: Request,
+    candidate_id: UUID | None = Query(None, description="Filter auf Kandidat"),
+    job_id: UUID | None = Query(None, description="Filter auf Job"),
+    min_score: float = Query(0, description="Mindest-Score (0-100)"),
+    max_score: float = Query(100, description="Max-Score (0-100)"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    status: str | None = Query(None, description="Match-Status (new, ai_checked, presented, rejected, placed)"),
+    sort_by: str = Query("score", description="Sortierung: score oder date"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Flexible Match-Abfrage mit Filtern."""
+    query = _matches_query(candidate_id, job_id, min_score, max_score, days, status, sort_by)
+    total = await _count(db, query)
 
     # Pagination
     offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
-
-    rows = (await db.execute(query)).all()
-
-    items = []
-    for row in rows:
-        candidate_name = " ".join(filter(None, [row.first_name, row.last_name])) or "Unbekannt"
-        items.append({
-            "match_id": str(row.id),
-            "job_title": row.job_title or "Unbekannt",
-            "company": row.company or "Unbekannt",
-            "candidate_name": candidate_name,
-            "candidate_id": str(row.candidate_id) if row.candidate_id else None,
-            "job_id": str(row.job_id) if row.job_id else None,
-            "v2_score": round(float(row.v2_score), 1) if row.v2_score else 0,
-            "v2_score_breakdown": row.v2_score_breakdown,
-            "distance_km": round(float(row.distance_km), 1) if row.distance_km else None,
-            "status": row.status.value if hasattr(row.status, 'value') else str(row.status),
-            "matched_at": row.v2_matched_at.isoformat() if row.v2_matched_at else (row.created_at.isoformat() if row.created_at else None),
-        })
+    rows = (await db.execute(query.offset(offset).limit(per_page))).all()
+    items = [_match_item(row) for row in rows]
 
     filters_applied = {}
     if candidate_id:
@@ -381,6 +391,38 @@ async def query_matches(
     }
 
 
+MATCH_EXPORT_FIELDS = [
+    ("match_id", "Match-ID"),
+    ("candidate_name", "Kandidat"),
+    ("job_title", "Position"),
+    ("company", "Unternehmen"),
+    ("v2_score", "Score"),
+    ("distance_km", "Distanz (km)"),
+    ("status", "Status"),
+    ("matched_at", "Gematcht am"),
+    ("candidate_id", "Kandidat-ID"),
+    ("job_id", "Job-ID"),
+]
+
+
+@router.get("/matches/export")
+async def export_matches(
+    candidate_id: UUID | None = Query(None, description="Filter auf Kandidat"),
+    job_id: UUID | None = Query(None, description="Filter auf Job"),
+    min_score: float = Query(0, description="Mindest-Score (0-100)"),
+    max_score: float = Query(100, description="Max-Score (0-100)"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    status: str | None = Query(None, description="Match-Status (new, ai_checked, presented, rejected, placed)"),
+    sort_by: str = Query("score", description="Sortierung: score oder date"),
+    format: str = Query("csv", pattern=EXPORT_FORMAT_PATTERN, description="csv oder xlsx"),
+):
+    """Alle Treffer von /matches/query als Datei (gestreamt, ohne Pagination)."""
+    from app.services.export_service import streaming_export
+
+    query = _matches_query(candidate_id, job_id, min_score, max_score, days, status, sort_by)
+    return streaming_export(query, MATCH_EXPORT_FIELDS, _match_item, format, "matches")
+
+
 # ══════════════════════════════════════════════════════════════════
 # 4. AUFGABEN (ATS Todos)
 # ══════════════════════════════════════════════════════════════════
@@ -436,20 +478,16 @@ async def get_aufgaben_status(db: AsyncSession = Depends(get_db)):
     }
 
 
-@router.get("/aufgaben/query")
-async def query_aufgaben(
-    candidate_id: UUID | None = Query(None),
-    contact_id: UUID | None = Query(None),
-    company_id: UUID | None = Query(None),
-    ats_job_id: UUID | None = Query(None),
-    status: str | None = Query(None, description="open, in_progress, done, cancelled"),
-    priority: str | None = Query(None, description="unwichtig, mittelmaessig, wichtig, dringend, sehr_dringend"),
-    days: int = Query(365, description="Zeitraum in Tagen"),
-    page: int = Query(1, ge=1),
-    per_page: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+def _aufgaben_query(
+    candidate_id: UUID | None,
+    contact_id: UUID | None,
+    company_id: UUID | None,
+    ats_job_id: UUID | None,
+    status: str | None,
+    priority: str | None,
+    days: int,
 ):
-    """Flexible Aufgaben-Abfrage mit Filtern nach Kandidat, Kontakt, Unternehmen, Job."""
+    """Gefilterte, sortierte Aufgaben-Abfrage (Liste und Export)."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
     query = (
@@ -469,59 +507,66 @@ async def query_aufgaben(
         )
         .where(ATSTodo.created_at >= cutoff)
     )
-    count_query = select(func.count(ATSTodo.id)).where(ATSTodo.created_at >= cutoff)
 
     # Filter
     if candidate_id:
         query = query.where(ATSTodo.candidate_id == candidate_id)
-        count_query = count_query.where(ATSTodo.candidate_id == candidate_id)
     if contact_id:
         query = query.where(ATSTodo.contact_id == contact_id)
-        count_query = count_query.where(ATSTodo.contact_id == contact_id)
     if company_id:
         query = query.where(ATSTodo.company_id == company_id)
-        count_query = count_query.where(ATSTodo.company_id == company_id)
     if ats_job_id:
         query = query.where(ATSTodo.ats_job_id == ats_job_id)
-        count_query = count_query.where(ATSTodo.ats_job_id == ats_job_id)
     if status:
-        todo_status = TodoStatus(status)
-        query = query.where(ATSTodo.status == todo_status)
-        count_query = count_query.where(ATSTodo.status == todo_status)
+        query = query.where(ATSTodo.status == TodoStatus(status))
     if priority:
-        todo_prio = TodoPriority(priority)
-        query = query.where(ATSTodo.priority == todo_prio)
-        count_query = count_query.where(ATSTodo.priority == todo_prio)
+        query = query.where(ATSTodo.priority == TodoPriority(priority))
 
     # Sortierung
-    query = query.order_by(ATSTodo.status.asc(), ATSTodo.priority.desc(), ATSTodo.due_date.asc().nullslast())
+    return query.order_by(ATSTodo.status.asc(), ATSTodo.priority.desc(), ATSTodo.due_date.asc().nullslast())
+
+
+def _todo_item(row) -> dict:
+    return {
+        "todo_id": str(row.id),
+        "title": row.title,
+        "description": row.description,
+        "status": row.status.value if hasattr(row.status, 'value') else str(row.status),
+        "priority": row.priority.value if hasattr(row.priority, 'value') else str(row.priority),
+        "due_date": row.due_date.isoformat() if row.due_date else None,
+        "completed_at": row.completed_at.isoformat() if row.completed_at else None,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "candidate_id": str(row.candidate_id) if row.candidate_id else None,
+        "company_id": str(row.company_id) if row.company_id else None,
+        "contact_id": str(row.contact_id) if row.contact_id else None,
+        "ats_job_id": str(row.ats_job_id) if row.ats_job_id else None,
+        "is_overdue": row.due_date < date.today() if row.due_date and row.status in (TodoStatus.OPEN, TodoStatus.IN_PROGRESS) else False,
+    }
 
-    # Total
-    total = (await db.execute(count_query)).scalar() or 0
+
+@router.get("/aufgaben/query")
+@conditional_etag(ATSTodo)
+async def query_aufgaben(
+    request: Request,
+    candidate_id: UUID | None = Query(None),
+    contact_id: UUID | None = Query(None),
+    company_id: UUID | None = Query(None),
+    ats_job_id: UUID | None = Query(None),
+    status: str | None = Query(None, description="open, in_progress, done, cancelled"),
+    priority: str | None = Query(None, description="unwichtig, mittelmaessig, wichtig, dringend, sehr_dringend"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Flexible Aufgaben-Abfrage mit Filtern nach Kandidat, Kontakt, Unternehmen, Job."""
+    query = _aufgaben_query(candidate_id, contact_id, company_id, ats_job_id, status, priority, days)
+    total = await _count(db, query)
 
     # Pagination
     offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
-
-    rows = (await db.execute(query)).all()
-
-    items = []
-    for row in rows:
-        items.append({
-            "todo_id": str(row.id),
-            "title": row.title,
-            "description": row.description,
-            "status": row.status.value if hasattr(row.status, 'value') else str(row.status),
-            "priority": row.priority.value if hasattr(row.priority, 'value') else str(row.priority),
-            "due_date": row.due_date.isoformat() if row.due_date else None,
-            "completed_at": row.completed_at.isoformat() if row.completed_at else None,
-            "created_at": row.created_at.isoformat() if row.created_at else None,
-            "candidate_id": str(row.candidate_id) if row.candidate_id else None,
-            "company_id": str(row.company_id) if row.company_id else None,
-            "contact_id": str(row.contact_id) if row.contact_id else None,
-            "ats_job_id": str(row.ats_job_id) if row.ats_job_id else None,
-            "is_overdue": row.due_date < date.today() if row.due_date and row.status in (TodoStatus.OPEN, TodoStatus.IN_PROGRESS) else False,
-        })
+    rows = (await db.execute(query.offset(offset).limit(per_page))).all()
+    items = [_todo_item(row) for row in rows]
 
     return {
         "items": items,
@@ -532,6 +577,41 @@ async def query_aufgaben(
     }
 
 
+TODO_EXPORT_FIELDS = [
+    ("todo_id", "Aufgaben-ID"),
+    ("title", "Titel"),
+    ("description", "Beschreibung"),
+    ("status", "Status"),
+    ("priority", "Prioritaet"),
+    ("due_date", "Faellig am"),
+    ("is_overdue", "Ueberfaellig"),
+    ("completed_at", "Erledigt am"),
+    ("created_at", "Erstellt am"),
+    ("candidate_id", "Kandidat-ID"),
+    ("company_id", "Unternehmen-ID"),
+    ("contact_id", "Kontakt-ID"),
+    ("ats_job_id", "ATS-Job-ID"),
+]
+
+
+@router.get("/aufgaben/export")
+async def export_aufgaben(
+    candidate_id: UUID | None = Query(None),
+    contact_id: UUID | None = Query(None),
+    company_id: UUID | None = Query(None),
+    ats_job_id: UUID | None = Query(None),
+    status: str | None = Query(None, description="open, in_progress, done, cancelled"),
+    priority: str | None = Query(None, description="unwichtig, mittelmaessig, wichtig, dringend, sehr_dringend"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    format: str = Query("csv", pattern=EXPORT_FORMAT_PATTERN, description="csv oder xlsx"),
+):
+    """Alle Treffer von /aufgaben/query als Datei (gestreamt, ohne Pagination)."""
+    from app.services.export_service import streaming_export
+
+    query = _aufgaben_query(candidate_id, contact_id, company_id, ats_job_id, status, priority, days)
+    return streaming_export(query, TODO_EXPORT_FIELDS, _todo_item, format, "aufgaben")
+
+
 # ══════════════════════════════════════════════════════════════════
 # 5. ANRUFPROTOKOLLE (ATS Call Notes)
 # ══════════════════════════════════════════════════════════════════
@@ -583,20 +663,16 @@ async def get_anrufe_status(db: AsyncSession = Depends(get_db)):
     }
 
 
-@router.get("/anrufe/query")
-async def query_anrufe(
-    candidate_id: UUID | None = Query(None),
-    contact_id: UUID | None = Query(None),
-    company_id: UUID | None = Query(None),
-    ats_job_id: UUID | None = Query(None),
-    call_type: str | None = Query(None, description="acquisition, qualification, followup, candidate_call"),
-    direction: str | None = Query(None, description="outbound, inbound"),
-    days: int = Query(365, description="Zeitraum in Tagen"),
-    page: int = Query(1, ge=1),
-    per_page: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+def _anrufe_query(
+    candidate_id: UUID | None,
+    contact_id: UUID | None,
+    company_id: UUID | None,
+    ats_job_id: UUID | None,
+    call_type: str | None,
+    direction: str | None,
+    days: int,
 ):
-    """Flexible Anruf-Abfrage mit Filtern nach Kandidat, Kontakt, Unternehmen, Job."""
+    """Gefilterte, sortierte Anruf-Abfrage (Liste und Export)."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
     query = (
@@ -616,58 +692,63 @@ async def query_anrufe(
         )
         .where(ATSCallNote.called_at >= cutoff)
     )
-    count_query = select(func.count(ATSCallNote.id)).where(ATSCallNote.called_at >= cutoff)
 
     # Filter
     if candidate_id:
         query = query.where(ATSCallNote.candidate_id == candidate_id)
-        count_query = count_query.where(ATSCallNote.candidate_id == candidate_id)
     if contact_id:
         query = query.where(ATSCallNote.contact_id == contact_id)
-        count_query = count_query.where(ATSCallNote.contact_id == contact_id)
     if company_id:
         query = query.where(ATSCallNote.company_id == company_id)
-        count_query = count_query.where(ATSCallNote.company_id == company_id)
     if ats_job_id:
         query = query.where(ATSCallNote.ats_job_id == ats_job_id)
-        count_query = count_query.where(ATSCallNote.ats_job_id == ats_job_id)
     if call_type:
-        ct = CallType(call_type)
-        query = query.where(ATSCallNote.call_type == ct)
-        count_query = count_query.where(ATSCallNote.call_type == ct)
+        query = query.where(ATSCallNote.call_type == CallType(call_type))
     if direction:
-        cd = CallDirection(direction)
-        query = query.where(ATSCallNote.direction == cd)
-        count_query = count_query.where(ATSCallNote.direction == cd)
+        query = query.where(ATSCallNote.direction == CallDirection(direction))
 
     # Sortierung
-    query = query.order_by(ATSCallNote.called_at.desc())
+    return query.order_by(ATSCallNote.called_at.desc())
+
 
-    # Total
-    total = (await db.execute(count_query)).scalar() or 0
+def _call_item(row) -> dict:
+    return {
+        "call_id": str(row.id),
+        "call_type": row.call_type.value if hasattr(row.call_type, 'value') else str(row.call_type),
+        "direction": row.direction.value if row.direction and hasattr(row.direction, 'value') else (str(row.direction) if row.direction else None),
+        "summary": row.summary,
+        "duration_minutes": row.duration_minutes,
+        "called_at": row.called_at.isoformat() if row.called_at else None,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "candidate_id": str(row.candidate_id) if row.candidate_id else None,
+        "company_id": str(row.company_id) if row.company_id else None,
+        "contact_id": str(row.contact_id) if row.contact_id else None,
+        "ats_job_id": str(row.ats_job_id) if row.ats_job_id else None,
+        "action_items": row.action_items,
+    }
+
+
+@router.get("/anrufe/query")
+async def query_anrufe(
+    candidate_id: UUID | None = Query(None),
+    contact_id: UUID | None = Query(None),
+    company_id: UUID | None = Query(None),
+    ats_job_id: UUID | None = Query(None),
+    call_type: str | None = Query(None, description="acquisition, qualification, followup, candidate_call"),
+    direction: str | None = Query(None, description="outbound, inbound"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Flexible Anruf-Abfrage mit Filtern nach Kandidat, Kontakt, Unternehmen, Job."""
+    query = _anrufe_query(candidate_id, contact_id, company_id, ats_job_id, call_type, direction, days)
+    total = await _count(db, query)
 
     # Pagination
     offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
-
-    rows = (await db.execute(query)).all()
-
-    items = []
-    for row in rows:
-        items.append({
-            "call_id": str(row.id),
-            "call_type": row.call_type.value if hasattr(row.call_type, 'value') else str(row.call_type),
-            "direction": row.direction.value if row.direction and hasattr(row.direction, 'value') else (str(row.direction) if row.direction else None),
-            "summary": row.summary,
-            "duration_minutes": row.duration_minutes,
-            "called_at": row.called_at.isoformat() if row.called_at else None,
-            "created_at": row.created_at.isoformat() if row.created_at else None,
-            "candidate_id": str(row.candidate_id) if row.candidate_id else None,
-            "company_id": str(row.company_id) if row.company_id else None,
-            "contact_id": str(row.contact_id) if row.contact_id else None,
-            "ats_job_id": str(row.ats_job_id) if row.ats_job_id else None,
-            "action_items": row.action_items,
-        })
+    rows = (await db.execute(query.offset(offset).limit(per_page))).all()
+    items = [_call_item(row) for row in rows]
 
     return {
         "items": items,
@@ -678,6 +759,39 @@ async def query_anrufe(
     }
 
 
+CALL_EXPORT_FIELDS = [
+    ("call_id", "Anruf-ID"),
+    ("called_at", "Angerufen am"),
+    ("call_type", "Typ"),
+    ("direction", "Richtung"),
+    ("duration_minutes", "Dauer (min)"),
+    ("summary", "Zusammenfassung"),
+    ("action_items", "Action Items"),
+    ("candidate_id", "Kandidat-ID"),
+    ("company_id", "Unternehmen-ID"),
+    ("contact_id", "Kontakt-ID"),
+    ("ats_job_id", "ATS-Job-ID"),
+]
+
+
+@router.get("/anrufe/export")
+async def export_anrufe(
+    candidate_id: UUID | None = Query(None),
+    contact_id: UUID | None = Query(None),
+    company_id: UUID | None = Query(None),
+    ats_job_id: UUID | None = Query(None),
+    call_type: str | None = Query(None, description="acquisition, qualification, followup, candidate_call"),
+    direction: str | None = Query(None, description="outbound, inbound"),
+    days: int = Query(365, description="Zeitraum in Tagen"),
+    format: str = Query("csv", pattern=EXPORT_FORMAT_PATTERN, description="csv oder xlsx"),
+):
+    """Alle Treffer von /anrufe/query als Datei (gestreamt, ohne Pagination)."""
+    from app.services.export_service import streaming_export
+
+    query = _anrufe_query(candidate_id, contact_id, company_id, ats_job_id, call_type, direction, days)
+    return streaming_export(query, CALL_EXPORT_FIELDS, _call_item, format, "anrufe")
+
+
 # ══════════════════════════════════════════════════════════════════
 # 6. GESAMTUEBERSICHT
 # ══════════════════════════════════════════════════════════════════
@@ -2,12 +2,12 @@
 
 Empfaengt Updates von Telegram via Webhook.
 Verifiziert den Secret-Token Header.
-Verarbeitet Updates im Background-Task (200 sofort zurueck).
+Verarbeitet Updates ueber den Telegram-Dispatcher (200 sofort zurueck).
 """
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Request
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 from app.config import settings
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/telegram", tags=["Telegram Bot"])
 
 
 @router.post("/webhook")
-async def telegram_webhook(request: Request, background_tasks: BackgroundTasks):
+async def telegram_webhook(request: Request):
     """Empfaengt Telegram Updates via Webhook.
 
     Telegram sendet den Secret-Token im Header X-Telegram-Bot-Api-Secret-Token.
@@ -35,8 +35,10 @@ async def telegram_webhook(request: Request, background_tasks: BackgroundTasks):
     except Exception:
         return JSONResponse(status_code=400, content={"error": "invalid json"})
 
-    # Update im Hintergrund verarbeiten (200 sofort zurueck an Telegram)
-    background_tasks.add_task(_process_update, update)
+    # Update an den Dispatcher uebergeben (200 sofort zurueck an Telegram).
+    # Wiederholte update_ids werden dort verworfen.
+    from app.services.telegram_dispatcher import telegram_dispatcher
+    telegram_dispatcher.submit(update)
 
     return {"ok": True}
 
@@ -93,15 +95,6 @@ async def send_calendar_reminders():
         return {"reminders_sent": 0, "events_total": 0, "errors": [str(e)]}
 
 
-async def _process_update(update: dict) -> None:
-    """Verarbeitet ein Telegram Update (laeuft als Background-Task)."""
-    try:
-        from app.services.telegram_bot_service import handle_update
-        await handle_update(update)
-    except Exception as e:
-        logger.error(f"Telegram Update Verarbeitung fehlgeschlagen: {e}", exc_info=True)
-
-
 async def register_webhook() -> bool:
     """Registriert den Telegram Webhook bei Bot-Start.
 
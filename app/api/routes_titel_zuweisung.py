@@ -14,11 +14,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import and_, func, or_, select, case, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.templating import templates
 from app.models.candidate import Candidate
 from app.models.match import Match
 from app.services.categorization_service import CategorizationService
@@ -27,7 +27,6 @@ from app.services.mt_learning_service import COMMON_JOB_TITLES, MTLearningServic
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Titel-Zuweisung"])
-templates = Jinja2Templates(directory="app/templates")
 
 
 # ════════════════════════════════════════════════════════════════
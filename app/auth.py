@@ -11,14 +11,15 @@ Schuetzt ALLE Endpoints ausser:
 import logging
 import secrets
 import time
-from collections import defaultdict
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.requests import HTTPConnection, Request
 from starlette.responses import RedirectResponse, JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 
@@ -35,12 +36,6 @@ JWT_COOKIE_NAME = "pp_session"
 CSRF_COOKIE_NAME = "pp_csrf"
 CSRF_HEADER_NAME = "x-csrf-token"
 
-# ── Login Rate Limiting ──
-# Max 5 Versuche pro IP pro Minute
-_login_attempts: dict[str, list[float]] = defaultdict(list)
-LOGIN_MAX_ATTEMPTS = 5
-LOGIN_WINDOW_SECONDS = 60
-
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Prueft Passwort gegen Hash."""
@@ -79,22 +74,16 @@ def generate_csrf_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-def check_login_rate_limit(client_ip: str) -> bool:
-    """Prueft ob Login-Versuche das Limit ueberschreiten. True = OK, False = geblockt."""
-    now = time.time()
-    # Alte Eintraege entfernen
-    _login_attempts[client_ip] = [
-        t for t in _login_attempts[client_ip]
-        if now - t < LOGIN_WINDOW_SECONDS
-    ]
-    if len(_login_attempts[client_ip]) >= LOGIN_MAX_ATTEMPTS:
-        return False
-    return True
+async def check_login_rate_limit(client_ip: str) -> bool:
+    """Zaehlt einen Login-Versuch. True = OK, False = geblockt.
 
+    Max 5 Versuche pro IP pro Minute (RateLimitTier.LOGIN) — ueber das
+    gemeinsame Rate-Limit-Backend, also auch ueber mehrere Worker hinweg.
+    """
+    from app.api.rate_limiter import RateLimitTier, rate_limiter
 
-def record_login_attempt(client_ip: str) -> None:
-    """Zeichnet einen Login-Versuch auf."""
-    _login_attempts[client_ip].append(time.time())
+    allowed, _ = await rate_limiter.hit(client_ip, RateLimitTier.LOGIN)
+    return allowed
 
 
 def _get_client_ip(request: Request) -> str:
@@ -122,8 +111,122 @@ PUBLIC_PREFIXES = (
 )
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware die JEDEN Request auf gueltige Authentifizierung prueft.
+class PathTrie:
+    """Segment-Trie fuer oeffentliche Pfade (einmal beim Import gebaut).
+
+    Semantik identisch zu ``path in PUBLIC_PATHS or path.startswith(prefix)``
+    fuer Praefixe mit abschliessendem "/": ein Pfad-Lookup ist ein
+    str.split plus ein Dict-Zugriff pro Segment, unabhaengig von der
+    Anzahl der Regeln.
+    """
+
+    _EXACT = "\0exact"
+    _PREFIX = "\0prefix"
+
+    def __init__(self, exact: frozenset[str] | set[str], prefixes: tuple[str, ...]):
+        self._root: dict = {}
+        for path in exact:
+            self._insert(path.split("/"))[self._EXACT] = True
+        for prefix in prefixes:
+            # "/static/" → Segmente ["", "static"] + mindestens ein weiteres
+            self._insert(prefix.rstrip("/").split("/"))[self._PREFIX] = True
+
+    def _insert(self, segments: list[str]) -> dict:
+        node = self._root
+        for seg in segments:
+            node = node.setdefault(seg, {})
+        return node
+
+    def matches(self, path: str) -> bool:
+        segments = path.split("/")
+        node = self._root
+        last = len(segments) - 1
+        for i, seg in enumerate(segments):
+            node = node.get(seg)
+            if node is None:
+                return False
+            if i < last and self._PREFIX in node:
+                return True
+        return self._EXACT in node
+
+
+PUBLIC_PATH_TRIE = PathTrie(PUBLIC_PATHS, PUBLIC_PREFIXES)
+
+
+# ── JWT-Claims-Cache ──
+# HTMX-Seiten feuern viele kleine Partial-Requests mit demselben Cookie.
+# Verifizierte Claims werden bis zum Token-Ablauf gecacht (bounded LRU),
+# statt bei jedem Request HS256 + Claims-Validierung erneut zu rechnen.
+JWT_CACHE_SIZE = 1024
+_claims_cache: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+
+
+def decode_token_cached(token: str) -> dict | None:
+    """Wie decode_token, aber mit LRU-Cache bis zum exp-Zeitpunkt."""
+    now = time.time()
+    hit = _claims_cache.get(token)
+    if hit is not None:
+        payload, expires_at = hit
+        if expires_at > now:
+            _claims_cache.move_to_end(token)
+            return payload
+        del _claims_cache[token]
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)) and expires_at > now:
+        _claims_cache[token] = (payload, float(expires_at))
+        if len(_claims_cache) > JWT_CACHE_SIZE:
+            _claims_cache.popitem(last=False)
+    return payload
+
+
+# ── Security-Headers (einmal beim Import als Raw-Header gebaut) ──
+_CSP = "; ".join([
+    "default-src 'self'",
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.tailwindcss.com https://unpkg.com https://cdn.jsdelivr.net",
+    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdn.tailwindcss.com",
+    "font-src 'self' https://fonts.gstatic.com",
+    "img-src 'self' data: blob:",
+    "connect-src 'self'",
+    "frame-src 'self' blob:",
+    "object-src 'none'",
+    "base-uri 'self'",
+    "frame-ancestors 'self'",
+])
+
+_SECURITY_HEADERS: list[tuple[str, str]] = [
+    # Anti-Clickjacking (SAMEORIGIN erlaubt eigene iframes, z.B. CV-Vorschau)
+    ("x-frame-options", "SAMEORIGIN"),
+    # Verhindert MIME-Type Sniffing
+    ("x-content-type-options", "nosniff"),
+    # XSS-Schutz (Legacy-Browser)
+    ("x-xss-protection", "1; mode=block"),
+    ("referrer-policy", "strict-origin-when-cross-origin"),
+    # Content-Security-Policy — Whitelist fuer erlaubte Quellen
+    ("content-security-policy", _CSP),
+    # Permissions-Policy — Browser-APIs deaktivieren die nicht gebraucht werden
+    ("permissions-policy", "camera=(), microphone=(), geolocation=(), payment=()"),
+]
+if settings.is_production:
+    # HSTS (nur HTTPS, 1 Jahr)
+    _SECURITY_HEADERS.append(("strict-transport-security", "max-age=31536000; includeSubDomains"))
+
+_RAW_SECURITY_HEADERS = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in _SECURITY_HEADERS]
+# Ersetzt bestehende Header gleichen Namens; "server" wird entfernt (keine Server-Info leaken)
+_STRIPPED_HEADERS = frozenset(k for k, _ in _RAW_SECURITY_HEADERS) | {b"server", b"x-request-id"}
+
+
+class SecurityMiddleware:
+    """Reine ASGI-Middleware: Auth, CSRF, Security-Headers und Request-ID.
+
+    Ersetzt AuthMiddleware + SecurityHeadersMiddleware (BaseHTTPMiddleware)
+    und die Request-ID-Middleware. Kein Response-Buffering, keine Extra-Tasks
+    pro Request — Header werden beim http.response.start ergaenzt, der Body
+    (SSE, Streaming-Exporte) wird unveraendert durchgereicht.
 
     Unterstuetzte Auth-Methoden (in dieser Reihenfolge):
     1. JWT Cookie (pp_session) — fuer Browser-Sessions
@@ -131,34 +234,62 @@ class AuthMiddleware(BaseHTTPMiddleware):
     3. Redirect zu /login (HTML) oder 401 (API)
     """
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-
-        # ── Oeffentliche Pfade durchlassen ──
-        if path in PUBLIC_PATHS or any(path.startswith(p) for p in PUBLIC_PREFIXES):
-            return await call_next(request)
-
-        # ── Auth pruefen ──
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = str(uuid.uuid4())
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        raw_request_id = request_id.encode("latin-1")
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (k, v) for k, v in message.get("headers", [])
+                    if k.lower() not in _STRIPPED_HEADERS
+                ]
+                headers.extend(_RAW_SECURITY_HEADERS)
+                headers.append((b"x-request-id", raw_request_id))
+                message["headers"] = headers
+            await send(message)
+
+        path = scope["path"]
+        if not PUBLIC_PATH_TRIE.matches(path):
+            rejection = self._authenticate(HTTPConnection(scope), state, path, scope["method"])
+            if rejection is not None:
+                await rejection(scope, receive, send_with_headers)
+                return
+
+        await self.app(scope, receive, send_with_headers)
+
+    @staticmethod
+    def _authenticate(conn: HTTPConnection, state: dict, path: str, method: str):
+        """Setzt user_* im Request-State. Gibt eine Response zurueck, wenn abgewiesen."""
         user_email = None
 
         # 1. JWT Cookie pruefen
-        token = request.cookies.get(JWT_COOKIE_NAME)
+        token = conn.cookies.get(JWT_COOKIE_NAME)
         if token:
-            payload = decode_token(token)
+            payload = decode_token_cached(token)
             if payload:
                 user_email = payload.get("sub")
-                request.state.user_email = user_email
-                request.state.user_role = payload.get("role", "user")
-                request.state.user_name = payload.get("name", "")
+                state["user_email"] = user_email
+                state["user_role"] = payload.get("role", "user")
+                state["user_name"] = payload.get("name", "")
 
         # 2. API-Key Header pruefen
         if not user_email and settings.api_access_key:
-            api_key = request.headers.get("x-api-key")
+            api_key = conn.headers.get("x-api-key")
             if api_key and api_key == settings.api_access_key:
                 user_email = "api-access"
-                request.state.user_email = user_email
-                request.state.user_role = "admin"
-                request.state.user_name = "API"
+                state["user_email"] = user_email
+                state["user_role"] = "admin"
+                state["user_name"] = "API"
 
         # 3. Nicht authentifiziert → abweisen
         if not user_email:
@@ -172,61 +303,15 @@ class AuthMiddleware(BaseHTTPMiddleware):
             return RedirectResponse(url="/login", status_code=302)
 
         # ── CSRF-Schutz fuer state-changing Requests ──
-        if request.method in ("POST", "PUT", "DELETE", "PATCH"):
-            # Login/Logout sind davon ausgenommen (Login hat noch keinen CSRF-Token)
-            if path not in ("/login", "/logout"):
-                csrf_cookie = request.cookies.get(CSRF_COOKIE_NAME)
-                csrf_header = request.headers.get(CSRF_HEADER_NAME)
-                # HTMX sendet CSRF via Header, Forms via Hidden-Field
-                if not csrf_header:
-                    # Versuche aus Form-Daten zu lesen (fuer nicht-HTMX Forms)
-                    # Aber HTMX-Requests sind 99% der Faelle
-                    pass
-                if csrf_cookie and csrf_header and csrf_cookie != csrf_header:
-                    return JSONResponse(
-                        status_code=403,
-                        content={"error": "csrf_invalid", "message": "CSRF-Token ungueltig"},
-                    )
-
-        response = await call_next(request)
-        return response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Fuegt Security-Headers zu jeder Response hinzu."""
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Anti-Clickjacking (SAMEORIGIN erlaubt eigene iframes, z.B. CV-Vorschau)
-        response.headers["X-Frame-Options"] = "SAMEORIGIN"
-        # Verhindert MIME-Type Sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        # XSS-Schutz (Legacy-Browser)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        # Referrer-Policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        # HSTS (nur HTTPS, 1 Jahr)
-        if settings.is_production:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        # Content-Security-Policy — Whitelist fuer erlaubte Quellen
-        csp_parts = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.tailwindcss.com https://unpkg.com https://cdn.jsdelivr.net",
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdn.tailwindcss.com",
-            "font-src 'self' https://fonts.gstatic.com",
-            "img-src 'self' data: blob:",
-            "connect-src 'self'",
-            "frame-src 'self' blob:",
-            "object-src 'none'",
-            "base-uri 'self'",
-            "frame-ancestors 'self'",
-        ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_parts)
-        # Permissions-Policy — Browser-APIs deaktivieren die nicht gebraucht werden
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=(), payment=()"
-        # Keine Server-Info leaken
-        if "server" in response.headers:
-            del response.headers["server"]
-
-        return response
+        # Login/Logout sind davon ausgenommen (Login hat noch keinen CSRF-Token).
+        # HTMX sendet CSRF via Header; ohne Header (klassische Forms) kein Abgleich.
+        if method in ("POST", "PUT", "DELETE", "PATCH") and path not in ("/login", "/logout"):
+            csrf_cookie = conn.cookies.get(CSRF_COOKIE_NAME)
+            csrf_header = conn.headers.get(CSRF_HEADER_NAME)
+            if csrf_cookie and csrf_header and csrf_cookie != csrf_header:
+                return JSONResponse(
+                    status_code=403,
+                    content={"error": "csrf_invalid", "message": "CSRF-Token ungueltig"},
+                )
+
+        return None
@@ -0,0 +1,187 @@
+"""Antwort-Kompression (Brotli / Gzip) als reine ASGI-Middleware.
+
+Aushandlung ueber Accept-Encoding: Brotli bevorzugt (kleiner bei HTML/JSON),
+sonst Gzip, sonst unkomprimiert. Kleine Antworten (< minimum_size) bleiben
+unkomprimiert, SSE (text/event-stream) und bereits kodierte Antworten werden
+unveraendert durchgereicht. Streaming-Antworten (CSV-Export) werden Chunk
+fuer Chunk komprimiert, nichts wird gepuffert.
+
+Brotli ist optional — ohne das Paket wird nur Gzip angeboten.
+"""
+
+import logging
+import zlib
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optionales Paket
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Unter ~1 KB lohnt sich Kompression nicht (Header-Overhead, CPU)
+COMPRESSION_MINIMUM_SIZE = 1000
+GZIP_LEVEL = 6
+# Brotli-Qualitaet 4: aehnlich schnell wie Gzip 6, deutlich kleiner
+BROTLI_QUALITY = 4
+# Nie komprimieren (SSE muss Event fuer Event ankommen)
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class GzipStream:
+    """Gzip-Kompressor fuer eine Antwort (zlib, gzip-Container)."""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int = GZIP_LEVEL):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        data = self._compressor.compress(body)
+        if more_body:
+            # Chunk sofort ausliefern (Streaming, z.B. CSV-Export)
+            return data + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return data + self._compressor.flush()
+
+
+class BrotliStream:
+    """Brotli-Kompressor fuer eine Antwort."""
+
+    encoding = "br"
+
+    def __init__(self, quality: int = BROTLI_QUALITY):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        data = self._compressor.process(body)
+        if more_body:
+            return data + self._compressor.flush()
+        return data + self._compressor.finish()
+
+
+class CompressionResponder:
+    """Wickelt `send` einer Anfrage ein und komprimiert den Body.
+
+    Eigene Implementierung statt Starlettes GZipResponder: dessen interne
+    Schnittstelle unterscheidet sich zwischen Starlette-Versionen.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, stream_factory):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.stream_factory = stream_factory
+        self.send: Send | None = None
+        self.start_message: Message | None = None
+        self.stream = None
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Header erst senden, wenn der erste Body-Chunk entschieden hat
+            self.start_message = message
+            return
+
+        if not self.started:
+            self.started = True
+            if message_type == "http.response.body" and self._should_compress(message):
+                self.stream = self.stream_factory()
+                await self._send_start_compressed(message)
+                return
+            await self.send(self.start_message)
+
+        if self.stream is not None and message_type == "http.response.body":
+            more_body = message.get("more_body", False)
+            body = self.stream.compress(message.get("body", b""), more_body)
+            if body or not more_body:
+                await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        await self.send(message)
+
+    def _should_compress(self, message: Message) -> bool:
+        headers = Headers(raw=self.start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        if headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES):
+            return False
+        more_body = message.get("more_body", False)
+        return more_body or len(message.get("body", b"")) >= self.minimum_size
+
+    async def _send_start_compressed(self, message: Message) -> None:
+        more_body = message.get("more_body", False)
+        body = self.stream.compress(message.get("body", b""), more_body)
+
+        raw = [
+            (name, value) for name, value in self.start_message["headers"]
+            if name.lower() not in (b"content-length", b"vary")
+        ]
+        vary = Headers(raw=self.start_message["headers"]).get("vary", "")
+        if "accept-encoding" not in vary.lower():
+            vary = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+        raw.append((b"vary", vary.encode("latin-1")))
+        raw.append((b"content-encoding", self.stream.encoding.encode("latin-1")))
+        if not more_body:
+            raw.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        await self.send({**self.start_message, "headers": raw})
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+def parse_accept_encoding(header: str) -> set[str]:
+    """Akzeptierte Kodierungen (q=0 gilt als abgelehnt)."""
+    accepted = set()
+    for part in header.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding)
+    return accepted
+
+
+class CompressionMiddleware:
+    """Komprimiert Antworten mit Brotli oder Gzip, je nach Accept-Encoding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = parse_accept_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            quality = self.brotli_quality
+            responder = CompressionResponder(self.app, self.minimum_size, lambda: BrotliStream(quality))
+        elif "gzip" in accepted:
+            level = self.gzip_level
+            responder = CompressionResponder(self.app, self.minimum_size, lambda: GzipStream(level))
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await responder(scope, receive, send)
@@ -207,6 +207,30 @@ class Settings(BaseSettings):
         """
         return self.telegram_sincirusbot_token or self.telegram_bot_token
 
+    # Rate-Limiting
+    rate_limit_backend: str = Field(
+        default="memory",
+        description="Zaehler-Backend: memory (pro Prozess) oder postgres (geteilt ueber alle Worker)",
+    )
+
+    # Event-Bus (SSE-Events + Pipeline-Fortschritt zwischen Workern)
+    event_bus_backend: str = Field(
+        default="memory",
+        description="Pub-Sub-Backend: memory (ein Worker) oder postgres (LISTEN/NOTIFY, mehrere Worker)",
+    )
+
+    # Templates
+    template_cache_dir: str = Field(
+        default="",
+        description="Verzeichnis fuer den Jinja2-Bytecode-Cache (leer = System-Temp)",
+    )
+
+    # Datenbank-Migrationen
+    force_schema_migration: bool = Field(
+        default=False,
+        description="init_db-DDL auch bei unveraendertem Schema-Fingerprint ausfuehren",
+    )
+
     # Umgebung
     environment: str = Field(
         default="development",
@@ -1,5 +1,6 @@
 """Datenbank-Konfiguration und Session-Management."""
 
+import hashlib
 import logging
 from collections.abc import AsyncGenerator
 
@@ -1053,8 +1054,154 @@ async def _ensure_client_presentation_tables() -> None:
         logger.info("client_presentations Tabelle erfolgreich erstellt.")
 
 
+# ═══════════════════════════════════════════════════════════════
+# SCHEMA-FINGERPRINT (schneller Start ohne DDL)
+# ═══════════════════════════════════════════════════════════════
+# init_db hat bei jedem Deploy alle _ensure_*-Routinen und ~150
+# ALTER-TABLE-Pruefungen ausgefuehrt — jede mit Locks unter lock_timeout,
+# parallel zum Live-Traffic. Jetzt wird ein Fingerprint des erwarteten
+# Schemas (= Quelltext dieses Moduls) zusammen mit der Alembic-Revision
+# gespeichert. Stimmen beide beim Start ueberein, entfaellt die DDL-Phase.
+# Erzwingen: FORCE_SCHEMA_MIGRATION=true.
+
+SCHEMA_STATE_TABLE = "app_schema_state"
+
+
+def _schema_fingerprint() -> str:
+    """SHA-256 ueber den Quelltext dieses Moduls (alle DDL-Routinen)."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+async def _schema_is_current(fingerprint: str) -> bool:
+    """Ein Query: gespeicherter Fingerprint + Alembic-Revision aktuell?"""
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text(f"""
+                SELECT s.fingerprint = :fp
+                   AND s.alembic_revision IS NOT DISTINCT FROM
+                       (SELECT max(version_num) FROM alembic_version)
+                FROM {SCHEMA_STATE_TABLE} s
+                WHERE s.id = 1
+            """), {"fp": fingerprint})
+            return bool(result.scalar())
+    except Exception as e:
+        # Tabelle fehlt (erster Start) o.ae. → volle DDL-Phase
+        logger.info(f"init_db: Kein gespeicherter Schema-Stand ({type(e).__name__})")
+        return False
+
+
+async def _store_schema_state(fingerprint: str) -> None:
+    """Speichert Fingerprint + aktuelle Alembic-Revision nach erfolgreicher DDL-Phase."""
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"""
+                CREATE TABLE IF NOT EXISTS {SCHEMA_STATE_TABLE} (
+                    id INTEGER PRIMARY KEY,
+                    fingerprint VARCHAR(64) NOT NULL,
+                    alembic_revision VARCHAR(64),
+                    applied_at TIMESTAMPTZ DEFAULT NOW()
+                )
+            """))
+            revision = None
+            if (await conn.execute(text("SELECT to_regclass('alembic_version')"))).scalar():
+                revision = (await conn.execute(
+                    text("SELECT max(version_num) FROM alembic_version")
+                )).scalar()
+            await conn.execute(text(f"""
+                INSERT INTO {SCHEMA_STATE_TABLE} (id, fingerprint, alembic_revision, applied_at)
+                VALUES (1, :fp, :rev, NOW())
+                ON CONFLICT (id) DO UPDATE
+                SET fingerprint = EXCLUDED.fingerprint,
+                    alembic_revision = EXCLUDED.alembic_revision,
+                    applied_at = EXCLUDED.applied_at
+            """), {"fp": fingerprint, "rev": revision})
+    except Exception as e:
+        logger.warning(f"init_db: Schema-Stand speichern uebersprungen: {e}")
+
+
+class _WarningCounter(logging.Handler):
+    """Zaehlt Warnungen waehrend der DDL-Phase (jede uebersprungene Migration loggt eine)."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
 async def init_db() -> None:
-    """Initialisiert die Datenbankverbindung und führt Migrationen aus."""
+    """Initialisiert die Datenbankverbindung und führt Migrationen aus.
+
+    Unveraendertes Schema (Fingerprint + Alembic-Revision) → keine DDL.
+    """
+    async with engine.begin() as conn:
+        # Verbindung testen
+        await conn.run_sync(lambda _: None)
+
+    fingerprint = _schema_fingerprint()
+    if not settings.force_schema_migration and await _schema_is_current(fingerprint):
+        logger.info(f"init_db: Schema unveraendert ({fingerprint[:12]}) — DDL-Phase uebersprungen.")
+        return
+
+    counter = _WarningCounter()
+    logger.addHandler(counter)
+    try:
+        await _apply_schema()
+    finally:
+        logger.removeHandler(counter)
+
+    # Nur bei fehlerfreiem Lauf speichern — sonst beim naechsten Start erneut versuchen
+    if counter.count == 0:
+        await _store_schema_state(fingerprint)
+        logger.info(f"init_db: Schema-Stand {fingerprint[:12]} gespeichert.")
+    else:
+        logger.warning(
+            f"init_db: {counter.count} Migrationen uebersprungen — "
+            f"Schema-Stand nicht gespeichert, naechster Start fuehrt DDL erneut aus."
+        )
+
+
+async def _ensure_columns(migrations: list[tuple[str, str, str]]) -> None:
+    """Legt fehlende Spalten an — ein information_schema-Query fuer alle.
+
+    Nur fuer tatsaechlich fehlende Spalten wird ein ALTER TABLE abgesetzt
+    (jeweils eigene Transaktion mit lock_timeout).
+    """
+    tables = sorted({t for t, _, _ in migrations})
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT table_name, column_name FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = ANY(:tables)"
+                ),
+                {"tables": tables},
+            )
+            existing = {(row[0], row[1]) for row in result.all()}
+    except Exception as e:
+        logger.warning(f"Spalten-Pruefung fehlgeschlagen: {e}")
+        return
+
+    for table_name, col_name, col_type in migrations:
+        if (table_name, col_name) in existing:
+            continue
+        try:
+            async with engine.begin() as conn:
+                # Lock-Timeout auf 5 Sekunden setzen
+                await conn.execute(text("SET lock_timeout = '5s'"))
+                logger.info(f"Migration: Füge '{table_name}.{col_name}' Spalte hinzu...")
+                await conn.execute(
+                    text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {col_name} {col_type}")
+                )
+                logger.info(f"Migration: '{table_name}.{col_name}' Spalte hinzugefügt.")
+        except Exception as e:
+            logger.warning(f"Migration für '{table_name}.{col_name}' übersprungen: {e}")
+
+
+async def _apply_schema() -> None:
+    """Volle DDL-Phase: Tabellen, Spalten, Indizes, Backfills."""
     # Schritt 0: Alle haengenden Transaktionen killen (von vorherigen Deployments)
     try:
         async with engine.begin() as conn:
@@ -1069,10 +1216,6 @@ async def init_db() -> None:
     except Exception as e:
         logger.warning(f"init_db: Konnte idle Transactions nicht killen: {e}")
 
-    async with engine.begin() as conn:
-        # Verbindung testen
-        await conn.run_sync(lambda _: None)
-
     # ── Tabellen-Erstellung (fuer neue Tabellen die nicht via Alembic laufen) ──
     # HINWEIS: _ensure_users_table() wird NICHT hier aufgerufen,
     # sondern synchron in main.py lifespan() VOR dem Health-Check
@@ -1098,6 +1241,7 @@ async def init_db() -> None:
         ("candidates", "it_skills", "VARCHAR[]"),
         ("candidates", "further_education", "JSONB"),
         ("candidates", "cv_parse_failed", "BOOLEAN DEFAULT FALSE"),
+        ("candidates", "cv_pdf_hash", "VARCHAR(64)"),
         ("candidates", "deleted_at", "TIMESTAMPTZ"),
         ("candidates", "manual_overrides", "JSONB"),
         # Candidates: Hotlist-Felder
@@ -1254,26 +1398,7 @@ async def init_db() -> None:
         ("candidates", "availability_status", "VARCHAR(30) DEFAULT 'available'"),
         ("candidates", "excluded_companies", "JSONB DEFAULT '[]'"),
     ]
-    for table_name, col_name, col_type in migrations:
-        try:
-            async with engine.begin() as conn:
-                # Lock-Timeout auf 5 Sekunden setzen
-                await conn.execute(text("SET lock_timeout = '5s'"))
-                result = await conn.execute(
-                    text(
-                        "SELECT column_name FROM information_schema.columns "
-                        "WHERE table_name = :table AND column_name = :col"
-                    ),
-                    {"table": table_name, "col": col_name},
-                )
-                if not result.fetchone():
-                    logger.info(f"Migration: Füge '{table_name}.{col_name}' Spalte hinzu...")
-                    await conn.execute(
-                        text(f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type}")
-                    )
-                    logger.info(f"Migration: '{table_name}.{col_name}' Spalte hinzugefügt.")
-        except Exception as e:
-            logger.warning(f"Migration für '{table_name}.{col_name}' übersprungen: {e}")
+    await _ensure_columns(migrations)
 
     # ── Learning System: UNIQUE Constraint auf scoring_weights anpassen ──
     # Alt: component UNIQUE | Neu: (component, job_category) Paar
@@ -1511,6 +1636,86 @@ async def init_db() -> None:
     except Exception as e:
         logger.warning(f"Email-Index uebersprungen: {e}")
 
+    # ── lower(name)-Index fuer Firmen-Lookup (Akquise-Import, get_or_create_by_name) ──
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_companies_name_lower ON companies (lower(name))"
+            ))
+    except Exception as e:
+        logger.warning(f"Firmenname-Index uebersprungen: {e}")
+
+    # ── Telefon-Suffix-Indizes (letzte 8 Ziffern) fuer PhoneLookupService ──
+    # Ausdruck muss zeichengleich zu phone_lookup_service.phone_suffix_sql() sein
+    phone_suffix_indexes = [
+        ("ix_candidates_phone_suffix", "candidates", "phone"),
+        ("ix_company_contacts_phone_suffix", "company_contacts", "phone"),
+        ("ix_company_contacts_mobile_suffix", "company_contacts", "mobile"),
+        ("ix_companies_phone_suffix", "companies", "phone"),
+    ]
+    for index_name, table, col in phone_suffix_indexes:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} "
+                    f"((right(regexp_replace(COALESCE({col}, ''), '[^0-9]', '', 'g'), 8)))"
+                ))
+        except Exception as e:
+            logger.warning(f"Telefon-Index {index_name} uebersprungen: {e}")
+
+    # ── GiST-Indizes fuer ST_DWithin (Umkreis-Suche, SpatialCandidateService) ──
+    # Nur anlegen wenn noch kein GiST-Index auf der Spalte existiert
+    # (GeoAlchemy legt bei create_all ggf. idx_<table>_<col> an).
+    gist_indexes = [
+        ("ix_candidates_address_coords_gist", "candidates", "address_coords"),
+        ("ix_jobs_location_coords_gist", "jobs", "location_coords"),
+        ("ix_companies_location_coords_gist", "companies", "location_coords"),
+    ]
+    for index_name, table, col in gist_indexes:
+        try:
+            async with engine.begin() as conn:
+                exists = await conn.execute(text("""
+                    SELECT 1 FROM pg_indexes
+                    WHERE tablename = :table
+                      AND indexdef ILIKE '%USING gist (' || :col || ')%'
+                """), {"table": table, "col": col})
+                if exists.first() is None:
+                    await conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING GIST ({col})"
+                    ))
+                    logger.info(f"Migration: GiST-Index {index_name} erstellt.")
+        except Exception as e:
+            logger.warning(f"GiST-Index {index_name} uebersprungen: {e}")
+
+    # ── Rate-Limit-Zaehler (PostgresRateLimitBackend, geteilt ueber Worker) ──
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS rate_limit_counters (
+                    key VARCHAR(255) NOT NULL,
+                    window_index BIGINT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    expires_at TIMESTAMPTZ NOT NULL,
+                    PRIMARY KEY (key, window_index)
+                )
+            """))
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_rate_limit_counters_expires "
+                "ON rate_limit_counters (expires_at)"
+            ))
+    except Exception as e:
+        logger.warning(f"rate_limit_counters Tabelle uebersprungen: {e}")
+
+    # ── updated_at-Indizes (ETag-Datenstand: max(updated_at) per Index-Lookup) ──
+    for table in ("candidates", "jobs", "matches", "companies", "company_contacts", "ats_todos"):
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table}_updated_at ON {table} (updated_at)"
+                ))
+        except Exception as e:
+            logger.warning(f"updated_at-Index fuer {table} uebersprungen: {e}")
+
     # ── MT Lern-Tabellen erstellen ──
     try:
         async with engine.begin() as conn:
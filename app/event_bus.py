@@ -0,0 +1,313 @@
+"""Prozessuebergreifender Event-Bus (Pub-Sub zwischen uvicorn-Workern).
+
+acquisition_event_bus (SSE) und app.state (Pipeline-Fortschritt, Abbruch)
+halten ihre Daten weiterhin lokal im Prozess — jede Aenderung wird aber
+zusaetzlich ueber diesen Bus an alle anderen Worker verteilt, die sie in
+ihren lokalen Spiegel uebernehmen. So erreicht ein Event aus Worker A die
+SSE-Clients in Worker B, und Polling funktioniert egal welcher Worker den
+Job ausfuehrt.
+
+Backends:
+- memory:   Single-Process (Default, Tests) — nichts zu verteilen
+- postgres: LISTEN/NOTIFY auf einer eigenen asyncpg-Verbindung
+
+Nachrichten: {"topic": str, "origin": worker_id, "payload": dict}.
+Eigene Nachrichten werden beim Empfang ignoriert (lokal schon angewendet).
+
+Reihenfolge: emit() stellt Nachrichten in eine Warteschlange, die ein
+einzelner Publisher-Task nacheinander ueber EINE Verbindung sendet —
+NOTIFYs einer Session kommen in Sende-Reihenfolge an (set → cleanup bleibt
+set → cleanup). Nachrichten ueber dem NOTIFY-Limit werden in Teile zerlegt
+und beim Empfaenger wieder zusammengesetzt; was auch dafuer zu gross ist,
+wird mit ValueError abgelehnt.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "pp_event_bus"
+# Postgres-Limit fuer NOTIFY-Payloads ist 8000 Bytes
+MAX_PAYLOAD_BYTES = 7900
+# Zeichen pro Teil einer zerlegten Nachricht (UTF-8 max. 4 Bytes/Zeichen
+# inkl. Escaping → bleibt mit Umschlag unter MAX_PAYLOAD_BYTES)
+CHUNK_CHARS = 1800
+# Groessere Nachrichten werden abgelehnt (ca. 115k Zeichen)
+MAX_CHUNKS = 64
+# Unvollstaendige Teil-Nachrichten werden danach verworfen
+CHUNK_TIMEOUT_SECONDS = 30.0
+# Puffer fuer noch nicht gesendete Nachrichten
+MAX_PENDING_MESSAGES = 10_000
+
+WORKER_ID = uuid.uuid4().hex
+
+Handler = Callable[[dict[str, Any]], None]
+
+
+class PubSubBackend(ABC):
+    """Transport fuer Bus-Nachrichten zwischen Prozessen."""
+
+    @abstractmethod
+    async def start(self, on_message: Callable[[str], None]) -> None:
+        """Startet den Empfang. on_message bekommt den rohen JSON-String."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Beendet den Empfang."""
+
+    @abstractmethod
+    async def publish(self, message: str) -> None:
+        """Verteilt eine Nachricht an alle (anderen) Prozesse."""
+
+
+class InMemoryPubSub(PubSubBackend):
+    """Ein Prozess — lokale Zustaende sind bereits aktuell, nichts zu senden."""
+
+    async def start(self, on_message: Callable[[str], None]) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def publish(self, message: str) -> None:
+        return None
+
+
+class PostgresPubSub(PubSubBackend):
+    """LISTEN/NOTIFY ueber dedizierte asyncpg-Verbindungen.
+
+    Senden und Empfangen laufen ueber je eine eigene Verbindung, die bei
+    Abbruch neu aufgebaut wird. Eine einzige Sende-Verbindung garantiert,
+    dass die NOTIFYs in Sende-Reihenfolge zugestellt werden.
+    """
+
+    RECONNECT_SECONDS = 5.0
+
+    def __init__(self, dsn: str | None = None):
+        self.dsn = (dsn or settings.database_url).replace("postgresql+asyncpg://", "postgresql://")
+        self._conn = None
+        self._publish_conn = None
+        self._task: asyncio.Task | None = None
+        self._on_message: Callable[[str], None] | None = None
+
+    async def start(self, on_message: Callable[[str], None]) -> None:
+        self._on_message = on_message
+        self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+        await self._close_publisher()
+
+    async def publish(self, message: str) -> None:
+        import asyncpg
+
+        for attempt in range(2):
+            try:
+                if self._publish_conn is None or self._publish_conn.is_closed():
+                    self._publish_conn = await asyncpg.connect(self.dsn)
+                await self._publish_conn.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, message)
+                return
+            except Exception:
+                # Verbindung verloren → einmal neu verbinden, dann aufgeben
+                await self._close_publisher()
+                if attempt:
+                    raise
+
+    async def _close_publisher(self) -> None:
+        if self._publish_conn is not None and not self._publish_conn.is_closed():
+            try:
+                await self._publish_conn.close()
+            except Exception:
+                pass
+        self._publish_conn = None
+
+    def _listener(self, connection, pid, channel, payload) -> None:
+        if self._on_message:
+            self._on_message(payload)
+
+    async def _listen_forever(self) -> None:
+        import asyncpg
+
+        while True:
+            try:
+                self._conn = await asyncpg.connect(self.dsn)
+                await self._conn.add_listener(NOTIFY_CHANNEL, self._listener)
+                logger.info(f"Event-Bus: LISTEN {NOTIFY_CHANNEL} aktiv (Worker {WORKER_ID[:8]})")
+                while not self._conn.is_closed():
+                    await asyncio.sleep(self.RECONNECT_SECONDS)
+                logger.warning("Event-Bus: LISTEN-Verbindung geschlossen, verbinde neu...")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event-Bus: LISTEN fehlgeschlagen ({e}), neuer Versuch in {self.RECONNECT_SECONDS}s")
+            await self._close()
+            await asyncio.sleep(self.RECONNECT_SECONDS)
+
+    async def _close(self) -> None:
+        if self._conn is not None and not self._conn.is_closed():
+            try:
+                await self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+
+class EventBus:
+    """Topic-basierter Bus: lokale Handler + Verteilung ueber das Backend."""
+
+    def __init__(self, backend: PubSubBackend | None = None):
+        self.backend = backend or InMemoryPubSub()
+        self._handlers: dict[str, list[Handler]] = {}
+        self._queue: asyncio.Queue[str] | None = None
+        self._publisher: asyncio.Task | None = None
+        # Teil-Nachrichten: message_id → (erster Empfang, Teile)
+        self._partials: dict[str, tuple[float, list[str | None]]] = {}
+
+    def on(self, topic: str, handler: Handler) -> None:
+        """Registriert einen Handler fuer Nachrichten ANDERER Worker."""
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def emit(self, topic: str, payload: dict[str, Any]) -> None:
+        """Verteilt eine lokal bereits angewendete Aenderung an andere Worker.
+
+        Synchron aufrufbar — die Nachricht wird in Reihenfolge gesendet.
+        Ohne laufenden Event-Loop oder mit Memory-Backend passiert nichts.
+
+        Raises:
+            ValueError: Nachricht auch zerlegt zu gross (> MAX_CHUNKS Teile)
+        """
+        if isinstance(self.backend, InMemoryPubSub):
+            return
+        message = json.dumps(
+            {"topic": topic, "origin": WORKER_ID, "payload": payload},
+            ensure_ascii=False, default=str,
+        )
+        parts = self._split(topic, message)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._ensure_publisher()
+        if self._queue.qsize() + len(parts) > MAX_PENDING_MESSAGES:
+            logger.error(f"Event-Bus: Warteschlange voll, Nachricht fuer '{topic}' verworfen")
+            return
+        for part in parts:
+            self._queue.put_nowait(part)
+
+    @staticmethod
+    def _split(topic: str, message: str) -> list[str]:
+        """Zerlegt Nachrichten ueber dem NOTIFY-Limit in Teile."""
+        if len(message.encode("utf-8")) <= MAX_PAYLOAD_BYTES:
+            return [message]
+        total = -(-len(message) // CHUNK_CHARS)
+        if total > MAX_CHUNKS:
+            raise ValueError(
+                f"Event-Bus: Nachricht fuer '{topic}' zu gross ({len(message)} Zeichen, max. "
+                f"{MAX_CHUNKS * CHUNK_CHARS}) — Payload verkleinern"
+            )
+        message_id = uuid.uuid4().hex
+        return [
+            json.dumps(
+                {"origin": WORKER_ID, "chunk": [message_id, i, total],
+                 "data": message[i * CHUNK_CHARS:(i + 1) * CHUNK_CHARS]},
+                ensure_ascii=False,
+            )
+            for i in range(total)
+        ]
+
+    def _ensure_publisher(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._publisher is None or self._publisher.done():
+            self._publisher = asyncio.get_running_loop().create_task(self._publish_loop())
+
+    async def _publish_loop(self) -> None:
+        """Einziger Sender: eine Nachricht nach der anderen."""
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.backend.publish(message)
+            except Exception as e:
+                logger.warning(f"Event-Bus: Verteilen fehlgeschlagen: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+        if message.get("origin") == WORKER_ID:
+            return
+        if "chunk" in message:
+            raw = self._reassemble(message)
+            if raw is None:
+                return
+            self._dispatch(raw)
+            return
+        for handler in self._handlers.get(message.get("topic"), []):
+            try:
+                handler(message.get("payload") or {})
+            except Exception as e:
+                logger.warning(f"Event-Bus: Handler fuer '{message.get('topic')}' fehlgeschlagen: {e}")
+
+    def _reassemble(self, message: dict) -> str | None:
+        """Sammelt Teile; liefert die vollstaendige Nachricht beim letzten Teil."""
+        now = time.monotonic()
+        for stale in [k for k, (t, _) in self._partials.items() if now - t > CHUNK_TIMEOUT_SECONDS]:
+            logger.warning("Event-Bus: unvollstaendige Teil-Nachricht verworfen")
+            del self._partials[stale]
+
+        message_id, index, total = message["chunk"]
+        _, parts = self._partials.setdefault(message_id, (now, [None] * total))
+        parts[index] = message.get("data", "")
+        if any(part is None for part in parts):
+            return None
+        del self._partials[message_id]
+        return "".join(parts)
+
+    async def start(self) -> None:
+        await self.backend.start(self._dispatch)
+        if not isinstance(self.backend, InMemoryPubSub):
+            self._ensure_publisher()
+
+    async def stop(self) -> None:
+        if self._publisher is not None:
+            # Ausstehende Nachrichten noch senden (z.B. Cleanup beim Shutdown)
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=2.0)
+            except asyncio.TimeoutError:
+                logger.warning(f"Event-Bus: {self._queue.qsize()} Nachrichten beim Stop nicht gesendet")
+            self._publisher.cancel()
+            try:
+                await self._publisher
+            except asyncio.CancelledError:
+                pass
+            self._publisher = None
+        await self.backend.stop()
+
+
+def _create_event_bus() -> EventBus:
+    """Backend gemaess EVENT_BUS_BACKEND ("memory" oder "postgres")."""
+    if settings.event_bus_backend == "postgres":
+        return EventBus(PostgresPubSub())
+    return EventBus()
+
+
+# Singleton-Instanz
+event_bus = _create_event_bus()
@@ -4,30 +4,28 @@
 
 import asyncio
 import logging
-import uuid
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import text
 
 from app.config import settings
 from app.database import engine, init_db
+from app.templating import templates
 from app.auth import (
-    AuthMiddleware,
-    SecurityHeadersMiddleware,
+    SecurityMiddleware,
     JWT_COOKIE_NAME,
     CSRF_COOKIE_NAME,
     check_login_rate_limit,
     create_access_token,
     generate_csrf_token,
-    record_login_attempt,
     verify_password,
     _get_client_ip,
 )
+from app.compression import CompressionMiddleware
 
 # Logging konfigurieren
 logging.basicConfig(
@@ -70,6 +68,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"KRITISCH: Users-Tabelle konnte nicht erstellt werden: {e}")
 
+    # Event-Bus starten (LISTEN/NOTIFY bei mehreren Workern)
+    try:
+        # Module importieren, damit ihre Bus-Handler registriert sind
+        from app import state  # noqa: F401  — registriert pipeline_state-Handler
+        from app.event_bus import event_bus
+        from app.services import acquisition_event_bus  # noqa: F401  — registriert SSE-Handler
+        from app.services import presentation_reply_service  # noqa: F401  — registriert Blocklist-Handler
+        await event_bus.start()
+    except Exception as e:
+        logger.warning(f"Event-Bus Start fehlgeschlagen (nur lokale Events): {e}")
+
+    # Templates vorkompilieren (alle Routen-Module sind importiert → Filter bekannt)
+    try:
+        from app.templating import precompile_templates
+        compiled = await asyncio.to_thread(precompile_templates)
+        logger.info(f"{compiled} Templates vorkompiliert.")
+    except Exception as e:
+        logger.warning(f"Template-Vorkompilierung uebersprungen: {e}")
+
     # Restliche Migrationen im Hintergrund starten
     _db_migration_task = asyncio.create_task(_run_migrations())
 
@@ -103,6 +120,20 @@ async def lifespan(app: FastAPI):
     # Shutdown: Migration-Task abbrechen falls noch laeuft
     if _db_migration_task and not _db_migration_task.done():
         _db_migration_task.cancel()
+
+    # Event-Bus stoppen
+    from app.event_bus import event_bus
+    await event_bus.stop()
+
+    # Telegram: laufende Updates abbrechen, Bot-API-Client schliessen
+    from app.services.telegram_dispatcher import telegram_dispatcher
+    from app.services.telegram_bot_service import close_http_client
+    await telegram_dispatcher.stop()
+    await close_http_client()
+
+    # PDF-Prozess-Pool beenden (CV-Parsing)
+    from app.services.cv_parser_service import shutdown_pdf_pool
+    shutdown_pdf_pool()
     logger.info("Beende Matching-Tool...")
 
 
@@ -126,32 +157,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 2. Auth-Middleware (prueft JWT Cookie oder API-Key)
-app.add_middleware(AuthMiddleware)
-
-# 3. Security Headers (X-Frame-Options, HSTS, etc.)
-app.add_middleware(SecurityHeadersMiddleware)
-
-
-# Request-ID Middleware
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """Fügt eine eindeutige Request-ID zu jedem Request hinzu."""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
+# 2. Auth + CSRF + Security-Headers + Request-ID (eine reine ASGI-Middleware,
+#    kein Response-Buffering — wichtig fuer SSE und HTMX-Partials)
+app.add_middleware(SecurityMiddleware)
 
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-
-    return response
+# 3. Brotli/Gzip-Kompression (ab 1 KB, SSE ausgenommen, Streaming chunkweise)
+app.add_middleware(CompressionMiddleware)
 
 
 # Static Files konfigurieren
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Templates konfigurieren
-templates = Jinja2Templates(directory="app/templates")
-
+# Templates: geteilte Jinja2-Environment aus app.templating
 # Jinja2-Filter: UTC → deutsche Zeit (Europe/Berlin)
 from zoneinfo import ZoneInfo
 
@@ -215,8 +232,8 @@ async def login_page(request: Request):
     # Bereits eingeloggt? → Dashboard
     token = request.cookies.get(JWT_COOKIE_NAME)
     if token:
-        from app.auth import decode_token
-        payload = decode_token(token)
+        from app.auth import decode_token_cached
+        payload = decode_token_cached(token)
         if payload:
             return RedirectResponse(url="/", status_code=302)
 
@@ -245,7 +262,7 @@ async def login_submit(
     client_ip = _get_client_ip(request)
 
     # Rate-Limit pruefen
-    if not check_login_rate_limit(client_ip):
+    if not await check_login_rate_limit(client_ip):
         logger.warning(f"Login Rate-Limit erreicht fuer IP {client_ip}")
         csrf_token = generate_csrf_token()
         response = templates.TemplateResponse("login.html", {
@@ -260,8 +277,6 @@ async def login_submit(
         )
         return response
 
-    record_login_attempt(client_ip)
-
     # User in DB suchen und Passwort pruefen
     user = None
     login_email = email.strip().lower()
@@ -26,7 +26,12 @@ from app.models.import_job import ImportJob
 from app.models.job import Job
 from app.models.job_run import JobRun
 from app.models.match import Match
-from app.models.match_v2_models import MatchV2LearnedRule, MatchV2ScoringWeight, MatchV2TrainingData
+from app.models.match_v2_models import (
+    MatchV2LearnedRule,
+    MatchV2ScoreMemo,
+    MatchV2ScoringWeight,
+    MatchV2TrainingData,
+)
 from app.models.mt_match_memory import MTMatchMemory
 from app.models.mt_training import MTTrainingData
 from app.models.settings import FilterPreset, PriorityCity
@@ -37,7 +42,7 @@ from app.models.client_presentation import (
     PresentationMode,
     PresentationStatus,
 )
-from app.models.presentation_batch import PresentationBatch
+from app.models.presentation_batch import PresentationBatch, PresentationBatchRow
 from app.models.email_blocklist import EmailBlocklist
 from app.models.unassigned_call import UnassignedCall
 
@@ -77,6 +82,7 @@ __all__ = [
     "MatchV2TrainingData",
     "MatchV2LearnedRule",
     "MatchV2ScoringWeight",
+    "MatchV2ScoreMemo",
     "UnassignedCall",
     "CandidateDocument",
     "CandidateNote",
@@ -91,6 +97,8 @@ __all__ = [
     "PresentationStatus",
     "PresentationMode",
     "ClientResponseCategory",
+    "PresentationBatch",
+    "PresentationBatchRow",
     "AcquisitionCall",
     "AcquisitionEmail",
     "EmailBlocklist",
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,6 +42,9 @@ class AcquisitionEmail(Base):
 
     # E-Mail-Daten
     from_email: Mapped[str | None] = mapped_column(String(500))  # Absender-Postfach
+    sender_domain: Mapped[str | None] = mapped_column(
+        String(255), Computed("lower(split_part(from_email, '@', 2))", persisted=True)
+    )  # Generiert, fuer Domain-Limits
     to_email: Mapped[str | None] = mapped_column(String(500))
     subject: Mapped[str | None] = mapped_column(String(500))
     body_html: Mapped[str | None] = mapped_column(Text)  # NUR fuer Signatur
@@ -86,4 +89,5 @@ class AcquisitionEmail(Base):
         Index("idx_acq_emails_job", "job_id", text("created_at DESC")),
         Index("idx_acq_emails_parent", "parent_email_id", postgresql_where=text("parent_email_id IS NOT NULL")),
         Index("idx_acq_emails_unsub", "unsubscribe_token"),
+        Index("idx_acq_emails_sender_domain", "sender_domain", "sent_at"),
     )
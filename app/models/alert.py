@@ -81,6 +81,9 @@ class Alert(Base):
         Index("ix_alerts_is_read", "is_read"),
         Index("ix_alerts_is_dismissed", "is_dismissed"),
         Index("ix_alerts_created_at", "created_at"),
+        # Anti-Join der Alert-Checks (bereits vorhandener Alert?)
+        Index("ix_alerts_type_match", "alert_type", "match_id"),
+        Index("ix_alerts_type_job", "alert_type", "job_id", "created_at"),
     )
 
     @property
@@ -67,6 +67,7 @@ class Candidate(Base):
     cv_stored_path: Mapped[str | None] = mapped_column(Text)  # R2 Object Key (z.B. 'cvs/{uuid}.pdf')
     cv_parsed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     cv_parse_failed: Mapped[bool] = mapped_column(Boolean, default=False)  # True wenn PDF nicht lesbar (z.B. Bild-PDF)
+    cv_pdf_hash: Mapped[str | None] = mapped_column(String(64))  # SHA-256 des zuletzt geparsten PDFs (Re-Parse ohne Extraktion)
 
     # Manuelle Overrides (Felder die manuell bearbeitet wurden und nicht per Sync/Parsing ueberschrieben werden)
     manual_overrides: Mapped[dict | None] = mapped_column(JSONB)
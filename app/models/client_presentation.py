@@ -14,6 +14,7 @@ from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -122,7 +123,28 @@ class ClientPresentation(Base):
     # E-Mail-Inhalte
     email_to: Mapped[str] = mapped_column(String(500), nullable=False)
     email_from: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Reply-Index (generiert): normalisierter Empfaenger + Domain + Betreff-Schluessel
+    recipient_email: Mapped[str | None] = mapped_column(
+        String(500), Computed("lower(btrim(email_to))", persisted=True)
+    )
+    recipient_domain: Mapped[str | None] = mapped_column(
+        String(255), Computed("lower(split_part(btrim(email_to), '@', 2))", persisted=True)
+    )
+    # Absender-Domain (generiert) fuer Domain-Limits ohne LIKE-Scan
+    sender_domain: Mapped[str | None] = mapped_column(
+        String(255), Computed("lower(split_part(email_from, '@', 2))", persisted=True)
+    )
     email_subject: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Betreff ohne Re:/AW:/Fwd:-Praefixe, lowercase (wie _subject_key im Reply-Service)
+    subject_key: Mapped[str | None] = mapped_column(
+        String(500),
+        Computed(
+            r"lower(regexp_replace(email_subject, '^\s*((re|aw|fwd|wg|fw):\s*)*|\s+$', '', 'gi'))",
+            persisted=True,
+        ),
+    )
+    # Message-ID der gesendeten E-Mail (n8n Sent-Callback) fuer In-Reply-To-Matching
+    message_id: Mapped[str | None] = mapped_column(String(500))
     email_body_text: Mapped[str | None] = mapped_column(Text)
     email_body_html: Mapped[str | None] = mapped_column(Text)
     email_signature_html: Mapped[str | None] = mapped_column(Text)
@@ -221,6 +243,10 @@ class ClientPresentation(Base):
         Index("ix_client_presentations_status", "status"),
         Index("ix_client_presentations_created_at", "created_at"),
         Index("ix_client_presentations_is_fallback", "is_fallback"),
+        Index("ix_client_presentations_sender_domain", "sender_domain", "created_at"),
+        Index("ix_client_presentations_recipient_email", "recipient_email", "created_at"),
+        Index("ix_client_presentations_subject_key", "subject_key"),
+        Index("ix_client_presentations_message_id", "message_id"),
     )
 
     @property
@@ -4,12 +4,13 @@ Tabellen:
 - match_v2_training_data: Feedback-Daten für ML-Training
 - match_v2_learned_rules: Entdeckte Muster (Association Rules, Decision Trees)
 - match_v2_scoring_weights: Lernbare Gewichte für Score-Komponenten
+- match_v2_score_memo: Ortsunabhängige V3-Scores pro (Job, Kandidat)-Paar
 """
 
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import CHAR, Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -123,3 +124,36 @@ class MatchV2ScoringWeight(Base):
         Index("ix_v2_weights_component", "component"),
         Index("ix_v2_weights_job_category", "job_category"),
     )
+
+
+class MatchV2ScoreMemo(Base):
+    """Score-Memo des V3-Scorings (siehe app/services/score_memo.py).
+
+    Eine Zeile pro (Job, Kandidat)-Paar — bei geänderten Versionen wird sie
+    überschrieben, die Tabelle wächst also nur mit der Zahl der Paare.
+    """
+
+    __tablename__ = "match_v2_score_memo"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    candidate_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Fingerprints der Eingaben (sha1 hex)
+    job_version: Mapped[str] = mapped_column(CHAR(40), nullable=False)
+    candidate_version: Mapped[str] = mapped_column(CHAR(40), nullable=False)
+    config_version: Mapped[str] = mapped_column(CHAR(40), nullable=False)
+
+    # PairScore ohne Default-Felder, z.B. {"reject_reason": "zero_fachkenntnisse"}
+    scores: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_v2_score_memo_candidate_id", "candidate_id"),
+    )
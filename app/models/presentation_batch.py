@@ -1,13 +1,14 @@
 """PresentationBatch Model — CSV-Bulk-Upload Tracking.
 
 Trackt den Fortschritt eines CSV-Bulk-Uploads fuer Kandidaten-Vorstellungen.
-Unterstuetzt Row-Level-Tracking fuer Absturz-Recovery.
+Zeilen-Ergebnisse stehen append-only in presentation_batch_rows, die
+Zaehler auf dem Batch werden atomar hochgezaehlt.
 """
 
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,10 +43,9 @@ class PresentationBatch(Base):
     # Mailbox-Verteilung: {"hamdard@sincirus.com": 5, "m.hamdard@...": 3}
     mailbox_distribution: Mapped[dict | None] = mapped_column(JSONB)
 
-    # Fehler-Details: [{"row_index": 3, "error": "...", "company_name": "..."}]
+    # Legacy (Batches vor presentation_batch_rows, wird nicht mehr geschrieben):
+    # [{"row_index": 3, "error": "...", "company_name": "..."}]
     error_details: Mapped[list | None] = mapped_column(JSONB)
-
-    # Row-Level-Tracking fuer Absturz-Recovery:
     # [{"row_index": 0, "presentation_id": "uuid", "status": "sent"}, ...]
     processed_rows: Mapped[list | None] = mapped_column(JSONB)
 
@@ -64,3 +64,39 @@ class PresentationBatch(Base):
     presentations: Mapped[list["ClientPresentation"]] = relationship(
         "ClientPresentation", foreign_keys="ClientPresentation.batch_id", back_populates="batch"
     )
+
+
+class PresentationBatchRow(Base):
+    """Ergebnis einer CSV-Zeile (append-only, eine Zeile pro Outcome)."""
+
+    __tablename__ = "presentation_batch_rows"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    batch_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("presentation_batches.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    row_index: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # created / error / skipped / skipped_csv_duplicate / skipped_already_presented /
+    # skipped_domain_blocked / skipped_domain_limit / skipped_blacklist
+    status: Mapped[str] = mapped_column(String(40), nullable=False)
+
+    presentation_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("client_presentations.id", ondelete="SET NULL"),
+    )
+    company_name: Mapped[str | None] = mapped_column(String(255))
+    mailbox: Mapped[str | None] = mapped_column(String(255))
+    error: Mapped[str | None] = mapped_column(Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_presentation_batch_rows_batch", "batch_id", "row_index"),
+    )
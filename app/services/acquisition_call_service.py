@@ -5,7 +5,6 @@ erstellt automatische Wiedervorlagen und Blacklist-Cascades.
 """
 
 import logging
-import re
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -17,6 +16,7 @@ from app.models.acquisition_call import AcquisitionCall
 from app.models.company import Company
 from app.models.company_contact import CompanyContact
 from app.models.job import Job
+from app.services.phone_lookup_service import PhoneLookupService, normalize_e164
 
 logger = logging.getLogger(__name__)
 
@@ -328,7 +328,7 @@ class AcquisitionCallService:
                     phone=extra_data.get("phone"),
                     source="manual",
                     contact_role="empfehlung",
-                    phone_normalized=_normalize_phone_simple(extra_data.get("phone")),
+                    phone_normalized=normalize_e164(extra_data.get("phone")),
                 )
                 self.db.add(new_contact)
                 actions.append(f"Neuer Contact: {new_contact.first_name} {new_contact.last_name}")
@@ -467,31 +467,17 @@ class AcquisitionCallService:
 
     async def lookup_phone(self, phone: str) -> dict | None:
         """Sucht Telefonnummer in der DB und gibt Company/Contact/Jobs zurueck."""
-        normalized = _normalize_phone_simple(phone)
-        if not normalized:
+        # Index-Lookup (E.164 oder letzte 8 Ziffern von phone/mobile)
+        match = await PhoneLookupService(self.db).find_first(phone, entity_types={"contact"})
+        if not match:
             return None
 
-        # Suche in company_contacts.phone_normalized
         result = await self.db.execute(
             select(CompanyContact)
-            .where(CompanyContact.phone_normalized == normalized)
+            .where(CompanyContact.id == match.entity_id)
             .options(selectinload(CompanyContact.company))
-            .limit(1)
         )
         contact = result.scalar_one_or_none()
-
-        if not contact:
-            # Fallback: Suche in rohen Telefonnummern
-            result = await self.db.execute(
-                select(CompanyContact)
-                .where(
-                    CompanyContact.phone.contains(phone[-8:])  # Letzte 8 Ziffern
-                )
-                .options(selectinload(CompanyContact.company))
-                .limit(1)
-            )
-            contact = result.scalar_one_or_none()
-
         if not contact:
             return None
 
@@ -530,19 +516,3 @@ class AcquisitionCallService:
                 for j in jobs
             ],
         }
-
-
-def _normalize_phone_simple(raw: str | None) -> str | None:
-    """Einfache Telefonnummer-Normalisierung fuer Lookup."""
-    if not raw or not raw.strip():
-        return None
-    phone = re.sub(r"[^0-9+]", "", raw.strip())
-    if not phone:
-        return None
-    if phone.startswith("0") and not phone.startswith("00"):
-        phone = "+49" + phone[1:]
-    elif phone.startswith("00"):
-        phone = "+" + phone[2:]
-    elif not phone.startswith("+"):
-        phone = "+49" + phone
-    return phone[:20]
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.acquisition_email import AcquisitionEmail
 from app.models.company_contact import CompanyContact
 from app.models.job import Job
+from app.services.domain_protection_service import record_send
 
 logger = logging.getLogger(__name__)
 
@@ -435,6 +436,7 @@ class AcquisitionEmailService:
                 # Job-Status automatisch auf "email_gesendet" setzen
                 await self._update_job_status_on_email(email.job_id)
                 await self.db.commit()
+                record_send(email.from_email or "")
                 return {
                     "success": True,
                     "message": f"E-Mail an {email.to_email} gesendet",
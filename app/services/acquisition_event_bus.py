@@ -1,16 +1,21 @@
-"""In-Memory Event-Bus fuer Akquise-Events (SSE Pub-Sub).
+"""Event-Bus fuer Akquise-Events (SSE Pub-Sub).
 
 Einfacher Broadcast: Webhook schreibt Event → alle SSE-Clients bekommen es.
-Kein Redis noetig — Single-Process (Railway hat 1 Instanz).
+Lokale Clients werden direkt beliefert; ueber app.event_bus erreicht das
+Event auch die SSE-Clients in den anderen uvicorn-Workern.
 """
 
 import asyncio
 import logging
 from typing import Any
 
+from app.event_bus import event_bus
+
 logger = logging.getLogger(__name__)
 
-# Alle aktiven SSE-Subscriber (asyncio.Queue pro Client)
+TOPIC = "akquise_events"
+
+# Alle aktiven SSE-Subscriber dieses Prozesses (asyncio.Queue pro Client)
 _subscribers: list[asyncio.Queue] = []
 
 
@@ -31,14 +36,14 @@ def unsubscribe(q: asyncio.Queue) -> None:
     logger.info("SSE-Client disconnected (total: %d)", len(_subscribers))
 
 
-async def publish(event_type: str, data: dict[str, Any]) -> int:
-    """Event an alle SSE-Clients senden. Gibt Anzahl erreichter Clients zurueck."""
+def _deliver_local(event: dict[str, Any]) -> int:
+    """Event an alle SSE-Clients dieses Prozesses. Gibt Anzahl zurueck."""
     delivered = 0
     dead: list[asyncio.Queue] = []
 
     for q in _subscribers:
         try:
-            q.put_nowait({"event": event_type, "data": data})
+            q.put_nowait(event)
             delivered += 1
         except asyncio.QueueFull:
             dead.append(q)
@@ -50,7 +55,23 @@ async def publish(event_type: str, data: dict[str, Any]) -> int:
         except ValueError:
             pass
 
+    return delivered
+
+
+async def publish(event_type: str, data: dict[str, Any]) -> int:
+    """Event an alle SSE-Clients senden (alle Worker).
+
+    Gibt Anzahl erreichter Clients in diesem Prozess zurueck.
+    """
+    event = {"event": event_type, "data": data}
+    delivered = _deliver_local(event)
+    event_bus.emit(TOPIC, event)
+
     if delivered > 0:
         logger.info("Event '%s' an %d Client(s) gesendet", event_type, delivered)
 
     return delivered
+
+
+# Events aus anderen Workern an die lokalen SSE-Clients weiterreichen
+event_bus.on(TOPIC, _deliver_local)
@@ -10,22 +10,22 @@ import io
 import logging
 import re
 import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from urllib.parse import parse_qs, urlparse
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.company import Company
+from app.models.company import Company, CompanyStatus
 from app.models.company_contact import CompanyContact
 from app.models.job import Job
 from app.services.company_service import CompanyService
 
 logger = logging.getLogger(__name__)
 
-# Batch-Size fuer Railway (30s idle-in-transaction Timeout)
-BATCH_SIZE = 50
-
 # Re-Import-Schutz: Diese Status werden bei Duplikat NICHT zurueckgesetzt
 PROTECTED_STATUSES = {
     "blacklist_hart",   # Nie wieder → absolut geschuetzt
@@ -318,6 +318,223 @@ def _trunc(value: str | None, field: str) -> str | None:
     return value[:limit] if len(value) > limit else value
 
 
+# Chunk-Groesse fuer den Set-basierten Import (ein Commit pro Chunk)
+IMPORT_CHUNK_SIZE = 500
+
+
+def _count_data_rows(text_content: str) -> int:
+    """Zaehlt Datenzeilen (ohne Header, ohne Leerzeilen) wie csv.DictReader."""
+    rows = sum(1 for r in csv.reader(io.StringIO(text_content), delimiter="\t") if r)
+    return max(rows - 1, 0)
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Teilt ein Iterable in Listen der Laenge size (letzte ggf. kuerzer)."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _tally(stats: dict, row_num: int, outcome: str | Exception) -> None:
+    """Verbucht das Ergebnis einer Zeile in den Import-Statistiken."""
+    if isinstance(outcome, Exception):
+        stats["errors"] += 1
+        if len(stats["error_details"]) < 50:
+            stats["error_details"].append(f"Zeile {row_num}: {str(outcome)[:200]}")
+        logger.warning(f"Import-Fehler Zeile {row_num}: {outcome}")
+        return
+
+    key = {
+        "imported": "imported",
+        "refreshed": "duplicates_refreshed",
+        "blacklisted": "blacklisted_skipped",
+        "protected": "protected_skipped",
+    }.get(outcome)
+    if key:
+        stats[key] += 1
+
+
+def _company_key(company_name: str, city: str | None) -> tuple[str, str]:
+    """Cache-Key fuer (Firma, Stadt) — entspricht dem Lookup in get_or_create_by_name."""
+    name = _trunc(company_name, "company_name") or ""
+    return (name.strip().lower(), (_trunc(city, "city") or "").strip().lower())
+
+
+@dataclass
+class _ParsedRow:
+    """Validierte Kernfelder einer CSV-Zeile."""
+
+    row_num: int
+    row: dict[str, str]
+    company_name: str
+    position: str
+    city: str | None
+    job_url: str | None
+    anzeigen_id: str | None
+    position_id: str | None
+
+    @property
+    def company_key(self) -> tuple[str, str]:
+        return _company_key(self.company_name, self.city)
+
+
+def _parse_row(row: dict[str, str], row_num: int) -> _ParsedRow:
+    """Liest die Pflichtfelder einer Zeile. Wirft ValueError bei fehlenden Daten."""
+    company_name = _get_field(row, COL_MAPPING["company_name"])
+    if not company_name:
+        raise ValueError("Kein Firmenname")
+
+    # Position: Erst aus "Position"-Spalte, dann aus Anzeigen-Text extrahieren
+    position = _get_field(row, COL_MAPPING["position"])
+    if not position:
+        job_text_raw = _get_field(row, COL_MAPPING["job_text"])
+        position = _extract_position_from_text(job_text_raw)
+    if not position:
+        raise ValueError("Keine Position")
+
+    # Anzeigen-ID: direkt aus Spalte oder aus URL extrahieren
+    job_url = _get_field(row, COL_MAPPING["job_url"])
+    anzeigen_id = (
+        _get_field(row, COL_MAPPING.get("anzeigen_id_col", ""))
+        or _extract_anzeigen_id(job_url)
+    )
+
+    return _ParsedRow(
+        row_num=row_num,
+        row=row,
+        company_name=company_name,
+        position=position,
+        city=_get_field(row, COL_MAPPING["city"]),
+        job_url=job_url,
+        anzeigen_id=anzeigen_id,
+        position_id=_get_field(row, COL_MAPPING.get("position_id_col", "")),
+    )
+
+
+def _company_fields(row: dict[str, str], city: str | None) -> dict:
+    """Company-Felder einer Zeile (gleiche Felder wie get_or_create_by_name)."""
+    return {
+        "address": _trunc(_get_field(row, COL_MAPPING["street"]), "street_address"),
+        "postal_code": _trunc(_get_field(row, COL_MAPPING["plz"]), "postal_code"),
+        "city": _trunc(city, "city"),
+        "phone": _trunc(_get_mapped_field(row, "company_phone"), "phone"),
+        "domain": _trunc(_get_field(row, COL_MAPPING["domain"]), "domain"),
+        "employee_count": _trunc(_get_field(row, COL_MAPPING["company_size"]), "company_size"),
+        "industry": _trunc(_get_field(row, COL_MAPPING["industry"]), "industry"),
+    }
+
+
+def _contact_specs(row: dict[str, str]) -> list[dict]:
+    """AP Firma + AP Anzeige einer Zeile (nur wenn ein Name vorhanden ist)."""
+    specs = []
+    for prefix, role in (("ap_firma", "firma"), ("ap_anzeige", "anzeige")):
+        first = _get_field(row, COL_MAPPING.get(f"{prefix}_first_name", ""))
+        last = _get_field(row, COL_MAPPING.get(f"{prefix}_last_name", ""))
+        if not (first or last):
+            continue
+        specs.append({
+            "role": role,
+            "first_name": first,
+            "last_name": last,
+            "salutation": _get_field(row, COL_MAPPING.get(f"{prefix}_salutation", "")),
+            "position": _get_field(row, COL_MAPPING.get(f"{prefix}_function", "")),
+            "phone": _get_field(row, COL_MAPPING.get(f"{prefix}_phone", "")),
+            "email": _get_field(row, COL_MAPPING.get(f"{prefix}_email", "")),
+        })
+    return specs
+
+
+def _job_values(
+    parsed: _ParsedRow,
+    company_id: uuid.UUID,
+    anzeigen_id: str | None,
+    priority: int,
+    batch_id: uuid.UUID,
+    now: datetime,
+) -> dict:
+    """Spaltenwerte fuer einen neuen Akquise-Job."""
+    row = parsed.row
+    einsatzort = _get_field(row, COL_MAPPING["einsatzort"])
+    # Einsatzort aufteilen: "18055 Rostock Mecklenburg-Vorpommern" → PLZ + Stadt
+    einsatz_plz = None
+    einsatz_city = einsatzort
+    if einsatzort:
+        plz_match = re.match(r"^(\d{5})\s+(.+?)(?:\s+\w+-\w+)?$", einsatzort)
+        if plz_match:
+            einsatz_plz = plz_match.group(1)
+            einsatz_city = plz_match.group(2).strip()
+
+    return {
+        "id": uuid.uuid4(),
+        "company_name": _trunc(parsed.company_name, "company_name"),
+        "company_id": company_id,
+        "position": _trunc(parsed.position, "position"),
+        "street_address": _trunc(_get_field(row, COL_MAPPING["street"]), "street_address"),
+        "postal_code": _trunc(einsatz_plz or _get_field(row, COL_MAPPING["plz"]), "postal_code"),
+        "city": _trunc(einsatz_city or parsed.city, "city"),
+        "work_location_city": _trunc(einsatz_city, "city"),
+        "job_url": _trunc(parsed.job_url, "job_url"),
+        "job_text": _get_field(row, COL_MAPPING["job_text"]),
+        "employment_type": _trunc(
+            _get_field(row, COL_MAPPING["employment_type"]), "employment_type",
+        ),
+        "industry": _trunc(_get_field(row, COL_MAPPING["industry"]), "industry"),
+        "company_size": _trunc(_get_field(row, COL_MAPPING["company_size"]), "company_size"),
+        # Akquise-Felder
+        "acquisition_source": "advertsdata",
+        "position_id": _trunc(parsed.position_id, "position_id"),
+        "anzeigen_id": _trunc(anzeigen_id, "anzeigen_id"),
+        "akquise_status": "neu",
+        "akquise_status_changed_at": now,
+        "akquise_priority": priority,
+        "first_seen_at": now,
+        "last_seen_at": now,
+        "import_batch_id": batch_id,
+        # Lifecycle
+        "expires_at": now + timedelta(days=30),
+    }
+
+
+class _ContactIndex:
+    """Kontakte einer Firmen-Menge im Speicher — ersetzt get_or_create_contact pro Zeile.
+
+    Gleiche Duplikat-Erkennung wie CompanyService.get_or_create_contact:
+    1. E-Mail bei gleicher Company  2. Name bei gleicher Company.
+    """
+
+    def __init__(self, contacts: list[CompanyContact]):
+        self._by_company: dict[uuid.UUID, list[CompanyContact]] = {}
+        for c in contacts:
+            self._by_company.setdefault(c.company_id, []).append(c)
+
+    def add(self, contact: CompanyContact) -> None:
+        self._by_company.setdefault(contact.company_id, []).append(contact)
+
+    def find(
+        self,
+        company_id: uuid.UUID,
+        first_name: str | None,
+        last_name: str | None,
+        email: str | None,
+    ) -> tuple[CompanyContact | None, bool]:
+        """Gibt (Kontakt, per_email) zurueck."""
+        contacts = self._by_company.get(company_id, [])
+        if email and email.strip():
+            email_l = email.strip().lower()
+            for c in contacts:
+                if c.email and c.email.lower() == email_l:
+                    return c, True
+        first_l = first_name.strip().lower() if first_name else None
+        last_l = last_name.strip().lower() if last_name else None
+        for c in contacts:
+            if first_l and (c.first_name or "").lower() != first_l:
+                continue
+            if last_l and (c.last_name or "").lower() != last_l:
+                continue
+            return c, False
+        return None, False
+
+
 class AcquisitionImportService:
     """Importiert Akquise-CSVs von advertsdata.com."""
 
@@ -343,6 +560,12 @@ class AcquisitionImportService:
     ) -> dict:
         """Importiert CSV und gibt Statistiken zurueck.
 
+        Die Datei wird in Chunks von IMPORT_CHUNK_SIZE Zeilen verarbeitet:
+        Anzeigen-IDs, Firmen (inkl. Blacklist) und Kontakte werden pro Chunk
+        mit je einer Abfrage aufgeloest, neue Jobs mit einem Multi-Row-INSERT
+        angelegt. Jeder Chunk laeuft in einem Savepoint; schlaegt er fehl,
+        wird er zeilenweise (ein Savepoint pro Zeile) wiederholt.
+
         Returns:
             {
                 "batch_id": UUID,
@@ -359,19 +582,15 @@ class AcquisitionImportService:
 
         # Encoding-Detection
         text_content = self._decode_csv(content)
-        reader = csv.DictReader(io.StringIO(text_content), delimiter="\t")
 
-        # Zeilen vorab zaehlen fuer Fortschrittsanzeige
-        all_rows = list(reader)
-        total_rows = len(all_rows)
+        # Zeilen vorab zaehlen fuer Fortschrittsanzeige (ohne sie zu materialisieren)
+        total_rows = _count_data_rows(text_content)
         if self._progress is not None:
             self._progress["total_rows"] = total_rows
 
-        # Bestehende anzeigen_ids laden (fuer Duplikat-Check)
-        existing_jobs = await self._load_existing_anzeigen_ids()
-
-        # Company-Cache fuer Performance
-        company_cache: dict[str, Company | None] = {}
+        # Firmen-Cache (ueber Chunks hinweg) und in dieser Datei angelegte Jobs
+        company_cache: dict[tuple[str, str], Company | None] = {}
+        seen_jobs: dict[str, dict] = {}
 
         stats = {
             "batch_id": str(batch_id),
@@ -384,41 +603,31 @@ class AcquisitionImportService:
             "error_details": [],
         }
 
-        for row_num, row in enumerate(all_rows, start=2):
-            self._report(stats, current_row=row_num - 1)
-
+        reader = csv.DictReader(io.StringIO(text_content), delimiter="\t")
+        for chunk in _chunked(enumerate(reader, start=2), IMPORT_CHUNK_SIZE):
             try:
-                result = await self._process_row(
-                    row, row_num, batch_id, now, existing_jobs, company_cache,
+                async with self.db.begin_nested():
+                    outcomes, new_companies, new_jobs = await self._process_chunk(
+                        chunk, batch_id, now, company_cache, seen_jobs,
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Import-Chunk ab Zeile {chunk[0][0]} fehlgeschlagen, "
+                    f"verarbeite zeilenweise: {e}"
                 )
+                # Objekte aus dem zurueckgerollten Savepoint sind ungueltig
+                company_cache.clear()
+                await self._process_rows_isolated(
+                    chunk, batch_id, now, company_cache, seen_jobs, stats,
+                )
+            else:
+                company_cache.update(new_companies)
+                seen_jobs.update(new_jobs)
+                for row_num, outcome in outcomes:
+                    _tally(stats, row_num, outcome)
 
-                if result == "imported":
-                    stats["imported"] += 1
-                elif result == "refreshed":
-                    stats["duplicates_refreshed"] += 1
-                elif result == "blacklisted":
-                    stats["blacklisted_skipped"] += 1
-                elif result == "protected":
-                    stats["protected_skipped"] += 1
-
-            except Exception as e:
-                stats["errors"] += 1
-                if len(stats["error_details"]) < 50:
-                    stats["error_details"].append(f"Zeile {row_num}: {str(e)[:200]}")
-                logger.warning(f"Import-Fehler Zeile {row_num}: {e}")
-                # Session-Rollback nach DB-Fehler (z.B. Truncation)
-                # damit die naechsten Zeilen nicht auch scheitern
-                try:
-                    await self.db.rollback()
-                except Exception:
-                    pass
-
-            # Batch-Commit alle BATCH_SIZE Zeilen
-            if stats["imported"] > 0 and stats["imported"] % BATCH_SIZE == 0:
-                await self.db.commit()
-
-        # Letzter Batch
-        await self.db.commit()
+            await self.db.commit()
+            self._report(stats, current_row=chunk[-1][0] - 1)
 
         # Finaler Fortschritt
         self._report(stats, current_row=total_rows)
@@ -432,6 +641,374 @@ class AcquisitionImportService:
 
         return stats
 
+    # ── Set-basierter Chunk ─────────────────────────────
+
+    async def _process_chunk(
+        self,
+        chunk: list[tuple[int, dict[str, str]]],
+        batch_id: uuid.UUID,
+        now: datetime,
+        company_cache: dict[tuple[str, str], Company | None],
+        seen_jobs: dict[str, dict],
+    ) -> tuple[list[tuple[int, str | Exception]], dict, dict]:
+        """Verarbeitet einen Chunk mit konstant vielen Abfragen.
+
+        Veraendert company_cache/seen_jobs nicht selbst — gibt die neuen
+        Eintraege zurueck, damit ein fehlgeschlagener Savepoint keine
+        ungueltigen Objekte hinterlaesst.
+
+        Returns:
+            (outcomes, new_company_cache_entries, new_seen_jobs)
+        """
+        outcomes: list[tuple[int, str | Exception]] = []
+        parsed_rows: list[_ParsedRow] = []
+        for row_num, row in chunk:
+            try:
+                parsed_rows.append(_parse_row(row, row_num))
+            except ValueError as e:
+                outcomes.append((row_num, e))
+
+        # ── Duplikat-Check via anzeigen_id (eine Abfrage pro Chunk) ──
+        lookup_ids = {
+            p.anzeigen_id for p in parsed_rows
+            if p.anzeigen_id and p.anzeigen_id not in seen_jobs
+        }
+        existing_jobs = await self._load_existing_anzeigen_ids(lookup_ids)
+        new_jobs: dict[str, dict] = {}
+
+        protected_ids: list[uuid.UUID] = []
+        refresh_ids: list[uuid.UUID] = []
+        reset_ids: list[uuid.UUID] = []
+        to_insert: list[tuple[_ParsedRow, str | None]] = []
+
+        for p in parsed_rows:
+            anzeigen_id = p.anzeigen_id
+            existing = None
+            if anzeigen_id:
+                existing = (
+                    new_jobs.get(anzeigen_id)
+                    or seen_jobs.get(anzeigen_id)
+                    or existing_jobs.get(anzeigen_id)
+                )
+
+            if existing:
+                status = existing.get("akquise_status")
+
+                # Blacklist-hart: komplett skippen
+                if status == "blacklist_hart":
+                    outcomes.append((p.row_num, "blacklisted"))
+                    continue
+
+                # Geschuetzte Status: nur last_seen_at auffrischen
+                if status in PROTECTED_STATUSES:
+                    protected_ids.append(existing["id"])
+                    outcomes.append((p.row_num, "protected"))
+                    continue
+
+                # Stale-Check: >90 Tage nicht gesehen → neuer Import
+                last_seen = existing.get("last_seen_at")
+                if last_seen and (now - last_seen).days > STALE_DAYS:
+                    # Als neuen Job importieren (anzeigen_id wird neu vergeben)
+                    anzeigen_id = f"{anzeigen_id}_reimport_{now.strftime('%Y%m%d')}"
+                else:
+                    # Duplikat auffrischen (in dieser Datei angelegte Jobs sind schon frisch)
+                    if not existing.get("imported_now"):
+                        if status in RESETTABLE_STATUSES:
+                            reset_ids.append(existing["id"])
+                        else:
+                            refresh_ids.append(existing["id"])
+                    outcomes.append((p.row_num, "refreshed"))
+                    continue
+
+            to_insert.append((p, anzeigen_id))
+            # Platzhalter, damit CSV-interne Duplikate im selben Chunk erkannt werden
+            if anzeigen_id:
+                new_jobs[anzeigen_id] = {
+                    "id": None,
+                    "akquise_status": "neu",
+                    "last_seen_at": now,
+                    "imported_now": True,
+                }
+
+        # ── Duplikate: ein UPDATE pro Kategorie ──
+        await self._bulk_touch_jobs(protected_ids, {"last_seen_at": now})
+        await self._bulk_touch_jobs(
+            refresh_ids, {"last_seen_at": now, "expires_at": now + timedelta(days=30)},
+        )
+        await self._bulk_touch_jobs(
+            reset_ids,
+            {
+                "last_seen_at": now,
+                "expires_at": now + timedelta(days=30),
+                "akquise_status": "neu",
+                "akquise_status_changed_at": now,
+            },
+        )
+
+        # ── Firmen (inkl. Blacklist) fuer den ganzen Chunk aufloesen ──
+        new_companies, company_existed = await self._resolve_companies(
+            [p for p, _ in to_insert], company_cache,
+        )
+
+        def _company(key: tuple[str, str]) -> Company | None:
+            return new_companies[key] if key in new_companies else company_cache.get(key)
+
+        # ── Kontakte fuer alle betroffenen Firmen in einer Abfrage ──
+        contact_company_ids = {
+            company.id
+            for p, _ in to_insert
+            if (company := _company(p.company_key)) is not None
+            and _contact_specs(p.row)
+        }
+        contact_index = _ContactIndex(
+            await self._load_contacts(contact_company_ids) if contact_company_ids else []
+        )
+
+        job_rows: list[dict] = []
+        seen_company_keys: set[tuple[str, str]] = set()
+        for p, anzeigen_id in to_insert:
+            company = _company(p.company_key)
+            if company is None or company.acquisition_status == "blacklist":
+                outcomes.append((p.row_num, "blacklisted"))
+                if anzeigen_id:
+                    new_jobs.pop(anzeigen_id, None)
+                continue
+
+            # Bekannte Firma: war schon in der DB oder kam weiter oben in der Datei vor
+            company_exists = company_existed.get(p.company_key, True) or (
+                p.company_key in seen_company_keys
+            )
+            seen_company_keys.add(p.company_key)
+
+            specs = _contact_specs(p.row)
+            for spec in specs:
+                self._upsert_contact(contact_index, company.id, spec)
+
+            priority = _calculate_priority(
+                p.row,
+                company_exists=company_exists,
+                ap_has_phone=bool(_get_field(p.row, COL_MAPPING["ap_firma_phone"])),
+                ap_has_name=any(s["role"] == "firma" for s in specs),
+            )
+
+            values = _job_values(p, company.id, anzeigen_id, priority, batch_id, now)
+            job_rows.append(values)
+            outcomes.append((p.row_num, "imported"))
+            if anzeigen_id:
+                new_jobs[anzeigen_id]["id"] = values["id"]
+
+        # Firmen + Kontakte schreiben, dann alle Jobs in einem Multi-Row-INSERT
+        await self.db.flush()
+        if job_rows:
+            await self.db.execute(insert(Job), job_rows)
+
+        outcomes.sort(key=lambda o: o[0])
+        return outcomes, new_companies, new_jobs
+
+    async def _bulk_touch_jobs(self, job_ids: list[uuid.UUID], values: dict) -> None:
+        """Setzt dieselben Werte fuer mehrere Jobs in einem UPDATE."""
+        if not job_ids:
+            return
+        await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(set(job_ids)))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _resolve_companies(
+        self,
+        parsed_rows: list[_ParsedRow],
+        company_cache: dict[tuple[str, str], Company | None],
+    ) -> tuple[dict[tuple[str, str], Company | None], dict[tuple[str, str], bool]]:
+        """Loest alle (Firma, Stadt)-Paare eines Chunks mit einer Abfrage auf.
+
+        Gleiche Regeln wie CompanyService.get_or_create_by_name:
+        Match auf (Name, Stadt), sonst Fallback auf (Name, ohne Stadt) mit
+        Stadt-Nachfuellen; Blacklist → None; fehlende Felder werden ergaenzt.
+
+        Returns:
+            (neue Cache-Eintraege, {key: Firma existierte bereits in der DB})
+        """
+        first_row: dict[tuple[str, str], _ParsedRow] = {}
+        for p in parsed_rows:
+            if p.company_key not in company_cache and p.company_key not in first_row:
+                first_row[p.company_key] = p
+
+        if not first_row:
+            return {}, {}
+
+        names = {name for name, _ in first_row}
+        result = await self.db.execute(
+            select(Company)
+            .where(func.lower(Company.name).in_(names))
+            .order_by(Company.created_at)
+        )
+        by_name_city: dict[tuple[str, str], Company] = {}
+        without_city: dict[str, list[Company]] = {}
+        for company in result.scalars().all():
+            name_l = company.name.lower()
+            if company.city is not None:
+                by_name_city.setdefault((name_l, company.city.lower()), company)
+            else:
+                without_city.setdefault(name_l, []).append(company)
+
+        resolved: dict[tuple[str, str], Company | None] = {}
+        existed: dict[tuple[str, str], bool] = {}
+        for key, p in first_row.items():
+            name_l, city_l = key
+            fields = _company_fields(p.row, p.city)
+
+            if city_l:
+                company = by_name_city.get(key)
+                if company is None and without_city.get(name_l):
+                    # Bestehende Firma ohne Stadt → Stadt nachfuellen
+                    company = without_city[name_l].pop(0)
+                    company.city = fields["city"].strip()
+                    by_name_city[key] = company
+            else:
+                pool = without_city.get(name_l)
+                company = pool[0] if pool else None
+
+            if company is not None:
+                existed[key] = True
+                if company.status == CompanyStatus.BLACKLIST:
+                    resolved[key] = None
+                    continue
+                # Fehlende Felder nachfuellen (nicht ueberschreiben!)
+                for attr, value in fields.items():
+                    if value and str(value).strip() and not (getattr(company, attr) or "").strip():
+                        setattr(company, attr, value)
+                resolved[key] = company
+                continue
+
+            # Neue Company — nur nicht-leere Felder uebernehmen
+            existed[key] = False
+            clean_fields = {k: v for k, v in fields.items() if v and str(v).strip()}
+            company = Company(
+                name=_trunc(p.company_name, "company_name").strip(),
+                acquisition_status="prospect",
+                **clean_fields,
+            )
+            self.db.add(company)
+            if city_l:
+                by_name_city[key] = company
+            else:
+                without_city.setdefault(name_l, []).append(company)
+            resolved[key] = company
+
+        created = sum(1 for k in resolved if not existed.get(k))
+        if created:
+            # IDs vergeben, bevor Kontakte und Jobs darauf verweisen
+            await self.db.flush()
+            logger.info(f"Akquise-Import: {created} Firmen neu angelegt")
+
+        return resolved, existed
+
+    async def _load_contacts(self, company_ids: set[uuid.UUID]) -> list[CompanyContact]:
+        """Laedt alle Kontakte der angegebenen Firmen."""
+        result = await self.db.execute(
+            select(CompanyContact).where(CompanyContact.company_id.in_(company_ids))
+        )
+        return list(result.scalars().all())
+
+    def _upsert_contact(
+        self, index: _ContactIndex, company_id: uuid.UUID, spec: dict,
+    ) -> CompanyContact:
+        """Sucht/erstellt einen Ansprechpartner im Chunk-Index (ohne eigene Abfrage)."""
+        first_name = spec["first_name"]
+        last_name = spec["last_name"]
+        contact, by_email = index.find(company_id, first_name, last_name, spec["email"])
+
+        if contact is not None:
+            # Fehlende Felder nachfuellen
+            if by_email:
+                if first_name and not contact.first_name:
+                    contact.first_name = first_name.strip()
+                if last_name and not contact.last_name:
+                    contact.last_name = last_name.strip()
+                fill_fields = ("phone", "salutation")
+            else:
+                fill_fields = ("email", "phone", "salutation")
+            for attr in fill_fields:
+                val = spec.get(attr)
+                if val and str(val).strip() and not getattr(contact, attr, None):
+                    setattr(contact, attr, val)
+        else:
+            # Auto-Gender: Anrede aus Vorname ableiten wenn nicht gesetzt
+            from app.utils.gender_inference import apply_salutation_if_missing
+
+            fields = {
+                "salutation": apply_salutation_if_missing(spec["salutation"], first_name),
+                "position": spec["position"],
+                "phone": spec["phone"],
+                "email": spec["email"],
+            }
+            contact = CompanyContact(
+                company_id=company_id,
+                first_name=first_name.strip() if first_name else None,
+                last_name=last_name.strip() if last_name else None,
+                **{k: v for k, v in fields.items() if v and str(v).strip()},
+            )
+            self.db.add(contact)
+            index.add(contact)
+
+        # Phone normalisieren und auf Contact speichern
+        if spec["phone"]:
+            normalized = _normalize_phone(spec["phone"])
+            if normalized and not contact.phone_normalized:
+                contact.phone_normalized = normalized
+                contact.source = "advertsdata"
+                contact.contact_role = spec["role"]
+
+        return contact
+
+    # ── Fallback: zeilenweise mit Savepoint pro Zeile ───
+
+    async def _process_rows_isolated(
+        self,
+        chunk: list[tuple[int, dict[str, str]]],
+        batch_id: uuid.UUID,
+        now: datetime,
+        company_cache: dict[tuple[str, str], Company | None],
+        seen_jobs: dict[str, dict],
+        stats: dict,
+    ) -> None:
+        """Verarbeitet einen Chunk zeilenweise; Fehler betreffen nur die eigene Zeile."""
+        lookup_ids = set()
+        for _, row in chunk:
+            try:
+                anzeigen_id = _parse_row(row, 0).anzeigen_id
+            except ValueError:
+                continue
+            if anzeigen_id and anzeigen_id not in seen_jobs:
+                lookup_ids.add(anzeigen_id)
+        existing_jobs = {**await self._load_existing_anzeigen_ids(lookup_ids), **seen_jobs}
+
+        for row_num, row in chunk:
+            cache_before = set(company_cache)
+            jobs_before = dict(existing_jobs)
+            try:
+                async with self.db.begin_nested():
+                    result = await self._process_row(
+                        row, row_num, batch_id, now, existing_jobs, company_cache,
+                    )
+                    await self.db.flush()
+                _tally(stats, row_num, result)
+            except Exception as e:
+                # Eintraege aus dem zurueckgerollten Savepoint verwerfen
+                for key in set(company_cache) - cache_before:
+                    del company_cache[key]
+                existing_jobs.clear()
+                existing_jobs.update(jobs_before)
+                _tally(stats, row_num, e)
+
+            self._report(stats, current_row=row_num - 1)
+
+        for anzeigen_id, info in existing_jobs.items():
+            if info.get("imported_now"):
+                seen_jobs[anzeigen_id] = info
+
     async def _process_row(
         self,
         row: dict[str, str],
@@ -439,25 +1016,11 @@ class AcquisitionImportService:
         batch_id: uuid.UUID,
         now: datetime,
         existing_jobs: dict[str, dict],
-        company_cache: dict[str, Company | None],
+        company_cache: dict[tuple[str, str], Company | None],
     ) -> str:
         """Verarbeitet eine CSV-Zeile. Gibt Status zurueck."""
-        company_name = _get_field(row, COL_MAPPING["company_name"])
-        if not company_name:
-            raise ValueError("Kein Firmenname")
-
-        # Position: Erst aus "Position"-Spalte, dann aus Anzeigen-Text extrahieren
-        position = _get_field(row, COL_MAPPING["position"])
-        if not position:
-            job_text_raw = _get_field(row, COL_MAPPING["job_text"])
-            position = _extract_position_from_text(job_text_raw)
-        if not position:
-            raise ValueError("Keine Position")
-
-        # Anzeigen-ID: direkt aus Spalte oder aus URL extrahieren
-        job_url = _get_field(row, COL_MAPPING["job_url"])
-        anzeigen_id = _get_field(row, COL_MAPPING.get("anzeigen_id_col", "")) or _extract_anzeigen_id(job_url)
-        position_id = _get_field(row, COL_MAPPING.get("position_id_col", ""))
+        parsed = _parse_row(row, row_num)
+        anzeigen_id = parsed.anzeigen_id
 
         # ── Duplikat-Check via anzeigen_id ──
         if anzeigen_id and anzeigen_id in existing_jobs:
@@ -501,19 +1064,14 @@ class AcquisitionImportService:
                 return "refreshed"
 
         # ── Company get_or_create ──
-        city = _get_field(row, COL_MAPPING["city"])
-        cache_key = f"{company_name.lower()}_{(city or '').lower()}"
+        cache_key = parsed.company_key
+        # Bekannte Firma (fuer Priority): schon frueher in diesem Import aufgeloest
+        company_exists = cache_key in company_cache
 
-        if cache_key not in company_cache:
+        if not company_exists:
+            fields = _company_fields(row, parsed.city)
             company = await self.company_service.get_or_create_by_name(
-                name=_trunc(company_name, "company_name"),
-                address=_trunc(_get_field(row, COL_MAPPING["street"]), "street_address"),
-                postal_code=_trunc(_get_field(row, COL_MAPPING["plz"]), "postal_code"),
-                city=_trunc(city, "city"),
-                phone=_trunc(_get_mapped_field(row, "company_phone"), "phone"),
-                domain=_trunc(_get_field(row, COL_MAPPING["domain"]), "domain"),
-                employee_count=_trunc(_get_field(row, COL_MAPPING["company_size"]), "company_size"),
-                industry=_trunc(_get_field(row, COL_MAPPING["industry"]), "industry"),
+                name=_trunc(parsed.company_name, "company_name"), **fields,
             )
             company_cache[cache_key] = company
         else:
@@ -526,127 +1084,73 @@ class AcquisitionImportService:
         if company.acquisition_status == "blacklist":
             return "blacklisted"
 
-        # Pruefen ob Company vorher schon Jobs hatte (fuer Priority)
-        # Nicht company.jobs nutzen (Lazy-Load crasht im Async-Kontext)
-        # Stattdessen: Firma war schon in DB wenn sie im Cache war
-        company_has_jobs = cache_key in company_cache
-
-        # ── Contact AP Firma ──
-        ap_firma_first = _get_field(row, COL_MAPPING["ap_firma_first_name"])
-        ap_firma_last = _get_field(row, COL_MAPPING["ap_firma_last_name"])
-        ap_firma_phone = _get_field(row, COL_MAPPING["ap_firma_phone"])
-        ap_firma_contact = None
-
-        if ap_firma_first or ap_firma_last:
-            ap_firma_contact = await self.company_service.get_or_create_contact(
+        # ── Contacts (AP Firma + optional AP Anzeige) ──
+        specs = _contact_specs(row)
+        for spec in specs:
+            contact = await self.company_service.get_or_create_contact(
                 company_id=company.id,
-                first_name=ap_firma_first,
-                last_name=ap_firma_last,
-                salutation=_get_field(row, COL_MAPPING["ap_firma_salutation"]),
-                position=_get_field(row, COL_MAPPING["ap_firma_function"]),
-                phone=ap_firma_phone,
-                email=_get_field(row, COL_MAPPING["ap_firma_email"]),
+                first_name=spec["first_name"],
+                last_name=spec["last_name"],
+                salutation=spec["salutation"],
+                position=spec["position"],
+                phone=spec["phone"],
+                email=spec["email"],
             )
             # Phone normalisieren und auf Contact speichern
-            if ap_firma_contact and ap_firma_phone:
-                normalized = _normalize_phone(ap_firma_phone)
-                if normalized and not ap_firma_contact.phone_normalized:
-                    ap_firma_contact.phone_normalized = normalized
-                    ap_firma_contact.source = "advertsdata"
-                    ap_firma_contact.contact_role = "firma"
-
-        # ── Contact AP Anzeige (optional) ──
-        ap_anzeige_first = _get_field(row, COL_MAPPING.get("ap_anzeige_first_name", ""))
-        ap_anzeige_last = _get_field(row, COL_MAPPING.get("ap_anzeige_last_name", ""))
-        ap_anzeige_phone = _get_field(row, COL_MAPPING.get("ap_anzeige_phone", ""))
-
-        if ap_anzeige_first or ap_anzeige_last:
-            ap_anzeige_contact = await self.company_service.get_or_create_contact(
-                company_id=company.id,
-                first_name=ap_anzeige_first,
-                last_name=ap_anzeige_last,
-                salutation=_get_field(row, COL_MAPPING.get("ap_anzeige_salutation", "")),
-                position=_get_field(row, COL_MAPPING.get("ap_anzeige_function", "")),
-                phone=ap_anzeige_phone,
-                email=_get_field(row, COL_MAPPING.get("ap_anzeige_email", "")),
-            )
-            if ap_anzeige_contact and ap_anzeige_phone:
-                normalized = _normalize_phone(ap_anzeige_phone)
-                if normalized and not ap_anzeige_contact.phone_normalized:
-                    ap_anzeige_contact.phone_normalized = normalized
-                    ap_anzeige_contact.source = "advertsdata"
-                    ap_anzeige_contact.contact_role = "anzeige"
+            if contact and spec["phone"]:
+                normalized = _normalize_phone(spec["phone"])
+                if normalized and not contact.phone_normalized:
+                    contact.phone_normalized = normalized
+                    contact.source = "advertsdata"
+                    contact.contact_role = spec["role"]
 
         # ── Priority berechnen ──
         priority = _calculate_priority(
             row,
-            company_exists=company_has_jobs,
-            ap_has_phone=bool(ap_firma_phone),
-            ap_has_name=bool(ap_firma_first or ap_firma_last),
+            company_exists=company_exists,
+            ap_has_phone=bool(_get_field(row, COL_MAPPING["ap_firma_phone"])),
+            ap_has_name=any(s["role"] == "firma" for s in specs),
         )
 
         # ── Job erstellen ──
-        einsatzort = _get_field(row, COL_MAPPING["einsatzort"])
-        # Einsatzort aufteilen: "18055 Rostock Mecklenburg-Vorpommern" → PLZ + Stadt
-        einsatz_plz = None
-        einsatz_city = einsatzort
-        if einsatzort:
-            plz_match = re.match(r"^(\d{5})\s+(.+?)(?:\s+\w+-\w+)?$", einsatzort)
-            if plz_match:
-                einsatz_plz = plz_match.group(1)
-                einsatz_city = plz_match.group(2).strip()
-
-        job = Job(
-            company_name=_trunc(company_name, "company_name"),
-            company_id=company.id,
-            position=_trunc(position, "position"),
-            street_address=_trunc(_get_field(row, COL_MAPPING["street"]), "street_address"),
-            postal_code=_trunc(einsatz_plz or _get_field(row, COL_MAPPING["plz"]), "postal_code"),
-            city=_trunc(einsatz_city or city, "city"),
-            work_location_city=_trunc(einsatz_city, "city"),
-            job_url=_trunc(job_url, "job_url"),
-            job_text=_get_field(row, COL_MAPPING["job_text"]),
-            employment_type=_trunc(_get_field(row, COL_MAPPING["employment_type"]), "employment_type"),
-            industry=_trunc(_get_field(row, COL_MAPPING["industry"]), "industry"),
-            company_size=_trunc(_get_field(row, COL_MAPPING["company_size"]), "company_size"),
-            # Akquise-Felder
-            acquisition_source="advertsdata",
-            position_id=_trunc(position_id, "position_id"),
-            anzeigen_id=_trunc(anzeigen_id, "anzeigen_id"),
-            akquise_status="neu",
-            akquise_status_changed_at=now,
-            akquise_priority=priority,
-            first_seen_at=now,
-            last_seen_at=now,
-            import_batch_id=batch_id,
-            # Lifecycle
-            expires_at=now + timedelta(days=30),
-        )
-        self.db.add(job)
+        values = _job_values(parsed, company.id, anzeigen_id, priority, batch_id, now)
+        self.db.add(Job(**values))
 
         # existing_jobs aktualisieren damit CSV-interne Duplikate erkannt werden
         if anzeigen_id:
             existing_jobs[anzeigen_id] = {
-                "id": job.id,
+                "id": values["id"],
                 "akquise_status": "neu",
                 "last_seen_at": now,
+                "imported_now": True,
             }
 
         return "imported"
 
-    async def _load_existing_anzeigen_ids(self) -> dict[str, dict]:
-        """Laedt alle bestehenden Akquise-Jobs mit anzeigen_id."""
-        result = await self.db.execute(
-            select(
-                Job.id,
-                Job.anzeigen_id,
-                Job.akquise_status,
-                Job.last_seen_at,
-            ).where(
-                Job.acquisition_source.isnot(None),
-                Job.anzeigen_id.isnot(None),
-            )
+    async def _load_existing_anzeigen_ids(
+        self, anzeigen_ids: set[str] | None = None,
+    ) -> dict[str, dict]:
+        """Laedt bestehende Akquise-Jobs mit anzeigen_id.
+
+        Args:
+            anzeigen_ids: Nur diese IDs laden (Chunk-Import). None = alle.
+        """
+        if anzeigen_ids is not None and not anzeigen_ids:
+            return {}
+
+        query = select(
+            Job.id,
+            Job.anzeigen_id,
+            Job.akquise_status,
+            Job.last_seen_at,
+        ).where(
+            Job.acquisition_source.isnot(None),
+            Job.anzeigen_id.isnot(None),
         )
+        if anzeigen_ids is not None:
+            query = query.where(Job.anzeigen_id.in_(anzeigen_ids))
+
+        result = await self.db.execute(query)
         return {
             row.anzeigen_id: {
                 "id": row.id,
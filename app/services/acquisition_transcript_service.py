@@ -10,21 +10,12 @@ Flow:
 """
 
 import logging
-import re
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
 
-def _normalize_phone(phone: str) -> str:
-    """Letzte 8 Ziffern fuer Vergleich (identisch zu routes_n8n_webhooks)."""
-    if not phone:
-        return ""
-    digits = re.sub(r"\D", "", phone)
-    return digits[-8:] if len(digits) >= 8 else digits
-
-
 async def process_transcript(
     phone_number: str,
     transcript: str,
@@ -39,16 +30,15 @@ async def process_transcript(
     try:
         from app.database import async_session_maker
         from app.models.acquisition_call import AcquisitionCall
-        from app.models.company_contact import CompanyContact
         from app.models.job import Job
-        from sqlalchemy import select, text
+        from app.services.phone_lookup_service import PhoneLookupService, phone_suffix_key
+        from sqlalchemy import select
     except ImportError as e:
         logger.exception(f"Import-Fehler: {e}")
         return {"success": False, "error": f"Import-Fehler: {e}"}
 
     now = datetime.now(timezone.utc)
-    normalized = _normalize_phone(phone_number)
-    if not normalized or len(normalized) < 4:
+    if len(phone_suffix_key(phone_number)) < 4:
         return {"success": False, "error": "Ungueltige Telefonnummer"}
 
     # ── Schritt 1: Phone-Lookup → Contact + Company finden ──
@@ -58,27 +48,17 @@ async def process_transcript(
     company_name = "Unbekannt"
 
     async with async_session_maker() as db:
-        like_pattern = f"%{normalized}"
-        result = await db.execute(
-            text("""
-                SELECT cc.id, cc.first_name, cc.last_name, cc.company_id, c.name
-                FROM company_contacts cc
-                LEFT JOIN companies c ON c.id = cc.company_id
-                WHERE (REGEXP_REPLACE(COALESCE(cc.phone, ''), '[^0-9]', '', 'g') LIKE :pattern
-                    OR REGEXP_REPLACE(COALESCE(cc.mobile, ''), '[^0-9]', '', 'g') LIKE :pattern)
-                LIMIT 1
-            """),
-            {"pattern": like_pattern},
+        match = await PhoneLookupService(db).find_first(
+            phone_number, entity_types={"contact"},
         )
-        row = result.fetchone()
-        if not row:
+        if not match:
             logger.info(f"Kein Contact fuer Telefon {phone_number} gefunden")
             return {"success": False, "error": "Kein Contact gefunden", "phone": phone_number}
 
-        contact_id = row[0]
-        contact_name = f"{row[1] or ''} {row[2] or ''}".strip()
-        company_id = row[3]
-        company_name = row[4] or "Unbekannt"
+        contact_id = match.entity_id
+        contact_name = match.name
+        company_id = match.company_id
+        company_name = match.company_name or "Unbekannt"
     # Session geschlossen
 
     logger.info(f"Phone-Match: {phone_number} → {contact_name} ({company_name})")
@@ -11,16 +11,88 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import and_, delete, func, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.alert import Alert, AlertPriority, AlertType
-from app.models.candidate import Candidate
-from app.models.job import Job
-from app.models.match import Match, MatchStatus
+from app.models.match import MatchStatus
 
 logger = logging.getLogger(__name__)
 
+# Exzellente Matches → Alerts (Text entspricht Candidate.full_name,
+# f"{distance_km:.1f}" und matched_keywords[:5]). Anti-Join nutzt
+# ix_alerts_type_match.
+_EXCELLENT_MATCH_ALERTS_SQL = """
+    INSERT INTO alerts (
+        id, alert_type, priority, title, message,
+        job_id, candidate_id, match_id, is_read, is_dismissed
+    )
+    SELECT
+        gen_random_uuid(),
+        CAST(:alert_type AS alerttype),
+        CAST(:priority AS alertpriority),
+        'Exzellenter Match gefunden!',
+        COALESCE(
+            NULLIF(concat_ws(' ', NULLIF(c.first_name, ''), NULLIF(c.last_name, '')), ''),
+            'Unbekannt'
+        )
+        || ' passt hervorragend zu ' || j.position || ' bei ' || j.company_name || '. '
+        || 'Distanz: ' || to_char(m.distance_km, 'FM999990.0') || ' km, '
+        || 'Keywords: ' || array_to_string(m.matched_keywords[1:5], ', '),
+        m.job_id,
+        m.candidate_id,
+        m.id,
+        FALSE,
+        FALSE
+    FROM matches m
+    JOIN jobs j ON j.id = m.job_id
+    JOIN candidates c ON c.id = m.candidate_id
+    WHERE m.distance_km IS NOT NULL
+      AND m.distance_km <= 5
+      AND array_length(m.matched_keywords, 1) >= 3
+      AND m.status = CAST(:match_status AS matchstatus)
+      AND NOT EXISTS (
+          SELECT 1 FROM alerts a
+          WHERE a.alert_type = CAST(:alert_type AS alerttype)
+            AND a.match_id = m.id
+      )
+"""
+
+# Ablaufende Jobs mit Matches → Alerts (ein Alert pro Job und Zeitraum).
+# Anti-Join nutzt ix_alerts_type_job.
+_EXPIRING_JOB_ALERTS_SQL = """
+    INSERT INTO alerts (
+        id, alert_type, priority, title, message,
+        job_id, is_read, is_dismissed
+    )
+    SELECT
+        gen_random_uuid(),
+        CAST(:alert_type AS alerttype),
+        CAST(:priority AS alertpriority),
+        'Job läuft bald ab',
+        'Der Job ''' || j.position || ''' bei ' || j.company_name || ' '
+        || 'läuft in ' || date_part('day', j.expires_at - CAST(:now AS timestamptz))::int || ' Tagen ab. '
+        || 'Es gibt ' || mc.match_count || ' potenzielle Kandidaten.',
+        j.id,
+        FALSE,
+        FALSE
+    FROM jobs j
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS match_count FROM matches m WHERE m.job_id = j.id
+    ) mc
+    WHERE j.deleted_at IS NULL
+      AND j.expires_at IS NOT NULL
+      AND j.expires_at <= :expiry_threshold
+      AND j.expires_at > :now
+      AND mc.match_count > 0
+      AND NOT EXISTS (
+          SELECT 1 FROM alerts a
+          WHERE a.alert_type = CAST(:alert_type AS alerttype)
+            AND a.job_id = j.id
+            AND a.created_at > :duplicate_since
+      )
+"""
+
 
 class AlertService:
     """Service für System-Benachrichtigungen."""
@@ -243,68 +315,23 @@ class AlertService:
         - Status: NEW (noch nicht bearbeitet)
         - Noch kein Alert vorhanden
 
+        Ein INSERT ... SELECT für alle Matches (Text wird in SQL gebaut,
+        bestehende Alerts per Anti-Join auf (alert_type, match_id)).
+
         Returns:
             Anzahl der erstellten Alerts
         """
-        # Subquery für bereits existierende Alerts
-        existing_alerts = (
-            select(Alert.match_id)
-            .where(
-                and_(
-                    Alert.alert_type == AlertType.EXCELLENT_MATCH,
-                    Alert.match_id.is_not(None),
-                )
-            )
-            .distinct()
+        result = await self.db.execute(
+            text(_EXCELLENT_MATCH_ALERTS_SQL),
+            {
+                "alert_type": AlertType.EXCELLENT_MATCH.value,
+                "priority": AlertPriority.HIGH.value,
+                "match_status": MatchStatus.NEW.value,
+            },
         )
+        await self.db.commit()
 
-        # Exzellente Matches ohne Alert finden
-        query = (
-            select(Match)
-            .options()
-            .where(
-                and_(
-                    Match.distance_km.is_not(None),
-                    Match.distance_km <= 5,
-                    Match.matched_keywords.is_not(None),
-                    func.array_length(Match.matched_keywords, 1) >= 3,
-                    Match.status == MatchStatus.NEW,
-                    Match.id.not_in(existing_alerts),
-                )
-            )
-            .limit(20)  # Max. 20 Alerts auf einmal
-        )
-
-        result = await self.db.execute(query)
-        matches = result.scalars().all()
-
-        created_count = 0
-        for match in matches:
-            # Job und Kandidat laden für Alert-Text
-            job = await self.db.get(Job, match.job_id)
-            candidate = await self.db.get(Candidate, match.candidate_id)
-
-            if not job or not candidate:
-                continue
-
-            keywords_str = ", ".join(match.matched_keywords[:5])
-
-            await self.create_alert(
-                alert_type=AlertType.EXCELLENT_MATCH,
-                title=f"Exzellenter Match gefunden!",
-                message=(
-                    f"{candidate.full_name} passt hervorragend zu "
-                    f"{job.position} bei {job.company_name}. "
-                    f"Distanz: {match.distance_km:.1f} km, "
-                    f"Keywords: {keywords_str}"
-                ),
-                priority=AlertPriority.HIGH,
-                job_id=match.job_id,
-                candidate_id=match.candidate_id,
-                match_id=match.id,
-            )
-            created_count += 1
-
+        created_count = result.rowcount or 0
         if created_count > 0:
             logger.info(f"{created_count} Alerts für exzellente Matches erstellt")
 
@@ -313,6 +340,9 @@ class AlertService:
     async def check_for_expiring_jobs(self, days: int = 7) -> int:
         """Prüft auf ablaufende Jobs und erstellt Alerts.
 
+        Nur Jobs mit mindestens einem Match; pro Job höchstens ein Alert
+        innerhalb von `days` Tagen. Ein INSERT ... SELECT für alle Jobs.
+
         Args:
             days: Tage bis zum Ablauf (Standard: 7)
 
@@ -320,66 +350,20 @@ class AlertService:
             Anzahl der erstellten Alerts
         """
         now = datetime.now(timezone.utc)
-        expiry_threshold = now + timedelta(days=days)
-
-        # Subquery für bereits existierende Alerts
-        existing_alerts = (
-            select(Alert.job_id)
-            .where(
-                and_(
-                    Alert.alert_type == AlertType.EXPIRING_JOB,
-                    Alert.job_id.is_not(None),
-                    Alert.created_at > now - timedelta(days=days),  # Kein Duplikat
-                )
-            )
-            .distinct()
-        )
 
-        # Ablaufende Jobs mit Matches finden
-        query = (
-            select(Job)
-            .where(
-                and_(
-                    Job.deleted_at.is_(None),
-                    Job.expires_at.is_not(None),
-                    Job.expires_at <= expiry_threshold,
-                    Job.expires_at > now,
-                    Job.id.not_in(existing_alerts),
-                )
-            )
-            .limit(20)
+        result = await self.db.execute(
+            text(_EXPIRING_JOB_ALERTS_SQL),
+            {
+                "alert_type": AlertType.EXPIRING_JOB.value,
+                "priority": AlertPriority.MEDIUM.value,
+                "now": now,
+                "expiry_threshold": now + timedelta(days=days),
+                "duplicate_since": now - timedelta(days=days),
+            },
         )
+        await self.db.commit()
 
-        result = await self.db.execute(query)
-        jobs = result.scalars().all()
-
-        created_count = 0
-        for job in jobs:
-            # Prüfen ob der Job Matches hat
-            match_count_query = select(func.count(Match.id)).where(
-                Match.job_id == job.id
-            )
-            match_count_result = await self.db.execute(match_count_query)
-            match_count = match_count_result.scalar() or 0
-
-            if match_count == 0:
-                continue  # Kein Alert für Jobs ohne Matches
-
-            days_until_expiry = (job.expires_at - now).days
-
-            await self.create_alert(
-                alert_type=AlertType.EXPIRING_JOB,
-                title=f"Job läuft bald ab",
-                message=(
-                    f"Der Job '{job.position}' bei {job.company_name} "
-                    f"läuft in {days_until_expiry} Tagen ab. "
-                    f"Es gibt {match_count} potenzielle Kandidaten."
-                ),
-                priority=AlertPriority.MEDIUM,
-                job_id=job.id,
-            )
-            created_count += 1
-
+        created_count = result.rowcount or 0
         if created_count > 0:
             logger.info(f"{created_count} Alerts für ablaufende Jobs erstellt")
 
@@ -453,35 +437,29 @@ class AlertService:
         """
         threshold = datetime.now(timezone.utc) - timedelta(days=days)
 
-        query = (
-            select(Alert)
-            .where(
+        result = await self.db.execute(
+            delete(Alert).where(
                 and_(
                     Alert.is_dismissed.is_(True),
                     Alert.created_at < threshold,
                 )
             )
         )
-
-        result = await self.db.execute(query)
-        alerts = result.scalars().all()
-
-        for alert in alerts:
-            await self.db.delete(alert)
-
         await self.db.commit()
 
-        if alerts:
-            logger.info(f"{len(alerts)} alte Alerts gelöscht")
+        deleted_count = result.rowcount or 0
+        if deleted_count:
+            logger.info(f"{deleted_count} alte Alerts gelöscht")
 
-        return len(alerts)
+        return deleted_count
 
     # ==================== Cron-Job Hilfsfunktion ====================
 
     async def run_all_checks(self) -> dict[str, int]:
         """Führt alle automatischen Alert-Checks aus.
 
-        Wird vom nächtlichen Cron-Job aufgerufen.
+        Wird vom nächtlichen Cron-Job aufgerufen. Konstante Anzahl an
+        Statements, unabhängig von der Anzahl neuer Matches.
 
         Returns:
             Dict mit Anzahl der erstellten Alerts pro Typ
@@ -7,16 +7,19 @@ fuer jede Zeile eine individuelle Presentation mit:
 - Drive-Time Berechnung
 - Skills-Match per GPT-4o
 - E-Mail-Generierung per GPT-4o
-- Row-Level-Tracking fuer Absturz-Recovery
+- Append-only Zeilen-Log (presentation_batch_rows)
+
+Vorpruefungen laufen set-basiert fuer den ganzen Upload, die KI-Texte werden
+parallel erzeugt, der Versand wird pro Postfach getaktet (MailboxScheduler).
 """
 
 import asyncio
 import csv
 import io
 import logging
-import uuid
-from datetime import datetime, timezone
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 from uuid import UUID
 
 from app.services.presentation_service import MAILBOXES
@@ -65,6 +68,15 @@ COL_MAPPING = {
 }
 
 
+# ── Bulk-Engine ──
+# Gleichzeitige Zeilen in der Aufbereitung (Firma, Fahrzeit, KI-Texte)
+ROW_CONCURRENCY = 6
+# Gleichzeitige OpenAI-Calls (Skills-Match + E-Mail) ueber alle Zeilen
+AI_CONCURRENCY = 4
+# Mindestabstand zwischen zwei Sends aus demselben Postfach (SMTP-Sicherheit)
+MAILBOX_SEND_INTERVAL_SECONDS = 6.0
+
+
 def _detect_delimiter(text: str) -> str:
     """Erkennt den Delimiter automatisch: Tab, Semikolon oder Komma."""
     first_line = text.split("\n", 1)[0]
@@ -184,6 +196,196 @@ def parse_csv(file_bytes: bytes) -> list[dict]:
     return rows
 
 
+def _company_key(row: dict) -> tuple[str, str]:
+    return (
+        row.get("company_name", "").strip().lower(),
+        row.get("city", "").strip().lower(),
+    )
+
+
+def _email_domain(email: str) -> str:
+    """Domain wie in PresentationReplyService.is_domain_blocked."""
+    if "@" in email:
+        return email.split("@", 1)[1].strip().lower()
+    return email.strip().lower()
+
+
+@dataclass
+class RowChecks:
+    """Set-basiert vorgeladene Pruefdaten fuer alle Zeilen eines Uploads.
+
+    Ersetzt die frueheren Einzel-Queries pro Zeile (Spam-Check, bereits
+    vorgestellt, Blocklist, Domain-Konsistenz) durch vier Queries pro Batch.
+    """
+
+    # lower(name) -> [(company_id, lower(city) | None, status)]
+    companies_by_name: dict[str, list[tuple]] = field(default_factory=dict)
+    # company_id -> letzte nicht-stornierte Vorstellung (created_at, status, response_type, email_from)
+    last_by_company: dict = field(default_factory=dict)
+    # company_id -> letzte Vorstellung DIESES Kandidaten bei der Firma
+    presented_at_by_company: dict = field(default_factory=dict)
+    blocked_domains: set[str] = field(default_factory=set)
+
+    def company_ids(self, row: dict) -> list:
+        """Firmen wie in check_spam_block: Name, Stadt nur wenn angegeben."""
+        name, city = _company_key(row)
+        return [
+            cid for cid, c_city, _ in self.companies_by_name.get(name, [])
+            if not city or c_city == city
+        ]
+
+    def is_blacklisted(self, row: dict) -> bool:
+        """Gleiche Suche wie CompanyService.get_or_create_by_name."""
+        name, city = _company_key(row)
+        companies = self.companies_by_name.get(name, [])
+        match = None
+        if city:
+            match = next((c for c in companies if c[1] == city), None)
+        if match is None:
+            match = next((c for c in companies if c[1] is None), None)
+        return match is not None and match[2] == "blacklist"
+
+    def preferred_domain(self, row: dict) -> str | None:
+        """Domain-Konsistenz wie get_domain_for_company (nur Firmenname)."""
+        from app.services.domain_protection_service import get_domain_from_email
+
+        name, _ = _company_key(row)
+        previous = [
+            self.last_by_company[cid]
+            for cid, _, _ in self.companies_by_name.get(name, [])
+            if cid in self.last_by_company
+        ]
+        previous = [p for p in previous if p.email_from]
+        if not previous:
+            return None
+        return get_domain_from_email(max(previous, key=lambda p: p.created_at).email_from)
+
+
+async def load_row_checks(db, candidate_id: UUID, rows: list[dict]) -> RowChecks:
+    """Laedt alle Pruefdaten fuer einen Upload in vier Queries."""
+    from sqlalchemy import and_, func, select
+    from app.models.client_presentation import ClientPresentation
+    from app.models.company import Company
+    from app.models.email_blocklist import EmailBlocklist
+
+    checks = RowChecks()
+    names = {_company_key(r)[0] for r in rows if r.get("company_name", "").strip()}
+    domains = {_email_domain(r["contact_email"]) for r in rows if r.get("contact_email")}
+    domains.discard("")
+
+    if domains:
+        result = await db.execute(
+            select(EmailBlocklist.domain).where(EmailBlocklist.domain.in_(domains))
+        )
+        checks.blocked_domains = {d for (d,) in result.all()}
+
+    if not names:
+        return checks
+
+    result = await db.execute(
+        select(
+            Company.id,
+            func.lower(Company.name).label("lname"),
+            func.lower(Company.city).label("lcity"),
+            Company.status,
+        ).where(func.lower(Company.name).in_(names))
+    )
+    for row in result.all():
+        status = getattr(row.status, "value", row.status)
+        checks.companies_by_name.setdefault(row.lname, []).append((row.id, row.lcity, status))
+
+    company_ids = [c[0] for companies in checks.companies_by_name.values() for c in companies]
+    if not company_ids:
+        return checks
+
+    # Letzte Vorstellung pro Firma (DISTINCT ON statt LIMIT 1 pro Zeile)
+    result = await db.execute(
+        select(
+            ClientPresentation.company_id,
+            ClientPresentation.created_at,
+            ClientPresentation.status,
+            ClientPresentation.response_type,
+            ClientPresentation.email_from,
+        )
+        .where(
+            and_(
+                ClientPresentation.company_id.in_(company_ids),
+                ClientPresentation.status != "cancelled",
+            )
+        )
+        .distinct(ClientPresentation.company_id)
+        .order_by(ClientPresentation.company_id, ClientPresentation.created_at.desc())
+    )
+    checks.last_by_company = {row.company_id: row for row in result.all()}
+
+    result = await db.execute(
+        select(ClientPresentation.company_id, func.max(ClientPresentation.created_at))
+        .where(
+            and_(
+                ClientPresentation.candidate_id == candidate_id,
+                ClientPresentation.company_id.in_(company_ids),
+                ClientPresentation.status != "cancelled",
+            )
+        )
+        .group_by(ClientPresentation.company_id)
+    )
+    checks.presented_at_by_company = dict(result.all())
+    return checks
+
+
+def evaluate_rows(rows: list[dict], checks: RowChecks) -> list[dict]:
+    """Bewertet alle Zeilen gegen die vorgeladenen Pruefdaten (ohne DB).
+
+    Returns:
+        Pro Zeile {"status": None | "skipped_...", "reason": str | None, "level": str}
+        — status None heisst: Zeile wird versendet.
+    """
+    from app.services.candidate_presentation_service import CandidatePresentationService
+
+    verdicts = []
+    seen_companies: set[tuple[str, str]] = set()
+    for row in rows:
+        company_key = _company_key(row)
+        # CSV-internes Duplikat?
+        if company_key in seen_companies:
+            verdicts.append({"status": "skipped_csv_duplicate", "reason": "Duplikat in CSV (gleiche Firma)", "level": "red"})
+            continue
+        seen_companies.add(company_key)
+
+        # Blocklist-Check (Empfaenger-Domain gesperrt?)
+        contact_email = row.get("contact_email", "")
+        if contact_email and _email_domain(contact_email) in checks.blocked_domains:
+            verdicts.append({"status": "skipped_domain_blocked", "reason": "Empfänger-Domain gesperrt", "level": "blocked"})
+            continue
+
+        company_ids = checks.company_ids(row)
+        last = max(
+            (checks.last_by_company[cid] for cid in company_ids if cid in checks.last_by_company),
+            key=lambda p: p.created_at,
+            default=None,
+        )
+        spam = CandidatePresentationService.spam_verdict(bool(company_ids), last)
+        if spam["blocked"]:
+            verdicts.append({"status": "skipped", "reason": spam["reason"], "level": spam["level"]})
+            continue
+
+        # Bereits vorgestellt?
+        presented = [checks.presented_at_by_company[cid] for cid in company_ids if cid in checks.presented_at_by_company]
+        already = CandidatePresentationService.already_presented_verdict(
+            bool(presented), max(presented) if presented else None
+        )
+        if already["already_presented"]:
+            verdicts.append({"status": "skipped_already_presented", "reason": already["reason"], "level": "red"})
+            continue
+
+        if checks.is_blacklisted(row):
+            verdicts.append({"status": "skipped_blacklist", "reason": "Firma steht auf der Blacklist", "level": "red"})
+            continue
+
+        verdicts.append({"status": None, "reason": None, "level": spam["level"]})
+    return verdicts
+
+
 async def preview_bulk(
     db_session_maker,
     candidate_id: UUID,
@@ -198,70 +400,19 @@ async def preview_bulk(
     """
     try:
         from app.database import async_session_maker
-        from app.services.candidate_presentation_service import CandidatePresentationService
-        from app.services.presentation_reply_service import PresentationReplyService
 
-        annotated = []
-        seen_companies: set[tuple[str, str]] = set()
         async with async_session_maker() as db:
-            for row in rows:
-                company_key = (
-                    row.get("company_name", "").strip().lower(),
-                    row.get("city", "").strip().lower(),
-                )
-                # CSV-internes Duplikat?
-                if company_key in seen_companies:
-                    annotated.append({
-                        **row,
-                        "can_send": False,
-                        "skip_reason": "Duplikat in CSV (gleiche Firma)",
-                        "level": "red",
-                    })
-                    continue
-                seen_companies.add(company_key)
-
-                # Blocklist-Check (Empfaenger-Domain gesperrt?)
-                contact_email = row.get("contact_email", "")
-                if contact_email:
-                    domain_blocked = await PresentationReplyService.is_domain_blocked(db, contact_email)
-                    if domain_blocked:
-                        annotated.append({
-                            **row,
-                            "can_send": False,
-                            "skip_reason": "Empfänger-Domain gesperrt",
-                            "level": "blocked",
-                        })
-                        continue
-
-                spam = await CandidatePresentationService.check_spam_block(
-                    db,
-                    company_name=row.get("company_name", ""),
-                    city=row.get("city", ""),
-                )
-
-                # Bereits vorgestellt?
-                if not spam["blocked"]:
-                    already = await CandidatePresentationService.check_already_presented(
-                        db,
-                        candidate_id=candidate_id,
-                        company_name=row.get("company_name", ""),
-                        city=row.get("city", ""),
-                    )
-                    if already["already_presented"]:
-                        annotated.append({
-                            **row,
-                            "can_send": False,
-                            "skip_reason": already["reason"],
-                            "level": "red",
-                        })
-                        continue
-
-                annotated.append({
-                    **row,
-                    "can_send": not spam["blocked"],
-                    "skip_reason": spam["reason"] if spam["blocked"] else None,
-                    "level": spam["level"],
-                })
+            checks = await load_row_checks(db, candidate_id, rows)
+
+        annotated = [
+            {
+                **row,
+                "can_send": verdict["status"] is None,
+                "skip_reason": verdict["reason"],
+                "level": verdict["level"],
+            }
+            for row, verdict in zip(rows, evaluate_rows(rows, checks))
+        ]
 
         # Kosten-Schaetzung
         estimated_cost_per_row = 0.12  # ~$0.12 pro Zeile (2x Claude Opus Calls)
@@ -274,6 +425,84 @@ async def preview_bulk(
         return [{"error": str(e)}], 0.0
 
 
+class MailboxScheduler:
+    """Verteilt Zeilen auf Postfaecher und taktet den Versand pro Postfach.
+
+    Ersetzt die globale Pause von 6s nach jeder E-Mail: Die Domain-Kapazitaet
+    wird einmal pro Batch geladen und lokal heruntergezaehlt, jedes Postfach
+    sendet hoechstens alle `interval` Sekunden — verschiedene Postfaecher
+    senden parallel.
+    """
+
+    def __init__(
+        self,
+        mailboxes: list[dict],
+        remaining_by_domain: dict[str, int],
+        interval: float = MAILBOX_SEND_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.mailboxes = mailboxes
+        self.remaining = dict(remaining_by_domain)
+        self.counts = {mb["email"]: 0 for mb in mailboxes}
+        self.interval = interval
+        self._clock = clock
+        self._next_slot: dict[str, float] = {}
+
+    def assign(self, preferred_domain: str | None = None) -> dict | None:
+        """Reserviert ein Postfach (Domain-Konsistenz + Round-Robin) oder None."""
+        from app.services.domain_protection_service import get_domain_from_email, select_best_mailbox
+
+        exhausted = [d for d, remaining in self.remaining.items() if remaining <= 0]
+        mailbox = select_best_mailbox(
+            self.mailboxes,
+            preferred_domain=preferred_domain,
+            exclude_domains=exhausted,
+            mailbox_counts=self.counts,
+        )
+        if mailbox:
+            domain = get_domain_from_email(mailbox["email"])
+            self.remaining[domain] = self.remaining.get(domain, 0) - 1
+            self.counts[mailbox["email"]] = self.counts.get(mailbox["email"], 0) + 1
+        return mailbox
+
+    def release(self, mailbox: dict) -> None:
+        """Gibt eine Reservierung zurueck (Zeile ist vor dem Versand gescheitert)."""
+        from app.services.domain_protection_service import get_domain_from_email
+
+        domain = get_domain_from_email(mailbox["email"])
+        self.remaining[domain] = self.remaining.get(domain, 0) + 1
+        self.counts[mailbox["email"]] = max(0, self.counts.get(mailbox["email"], 0) - 1)
+
+    def next_delay(self, email: str) -> float:
+        """Reserviert den naechsten Sende-Slot des Postfachs, gibt die Wartezeit zurueck."""
+        now = self._clock()
+        slot = max(now, self._next_slot.get(email, now))
+        self._next_slot[email] = slot + self.interval
+        return slot - now
+
+    async def wait_turn(self, email: str) -> None:
+        delay = self.next_delay(email)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class _BulkContext:
+    """Gemeinsamer Zustand aller Zeilen-Tasks eines Batches."""
+
+    session_maker: Callable
+    candidate_id: UUID
+    batch_id: UUID
+    candidate_data: dict
+    cand_coords: object
+    scheduler: MailboxScheduler
+    row_slots: asyncio.Semaphore
+    ai_slots: asyncio.Semaphore
+    pdf_base64: Optional[str] = None
+    pdf_filename: Optional[str] = None
+    sent_counts: dict[str, int] = field(default_factory=dict)
+
+
 async def process_bulk(
     candidate_id: UUID,
     rows: list[dict],
@@ -281,26 +510,30 @@ async def process_bulk(
 ) -> None:
     """Background-Task: Verarbeitet alle CSV-Zeilen.
 
+    Ablauf:
+    1. Kandidaten-Daten + Profil-PDF einmal pro Batch laden
+    2. Set-basierte Vorpruefung aller Zeilen (Duplikat, Blocklist, Spam,
+       bereits vorgestellt, Blacklist) + Postfach-Zuteilung gegen die
+       Domain-Kapazitaet — Skips werden in einem Schritt geschrieben
+    3. Versendbare Zeilen parallel aufbereiten (KI-Calls begrenzt durch
+       AI_CONCURRENCY), Versand pro Postfach getaktet (MailboxScheduler)
+    4. Jedes Zeilen-Ergebnis append-only in presentation_batch_rows,
+       Zaehler auf dem Batch atomar hochzaehlen
+
     Pattern:
     - try/except/finally mit Imports im try-Block
-    - Eigene DB-Session pro Zeile
-    - OpenAI-Call OHNE offene DB-Session (Railway 30s)
-    - Row-Level-Tracking fuer Absturz-Recovery
+    - Kurze eigene DB-Sessions, OpenAI-Calls OHNE offene DB-Session (Railway 30s)
     """
-    batch_status = {"running": True, "processed": 0, "errors": 0}
-
     try:
         # Imports IM try-Block (Railway-Pattern)
         from app.database import async_session_maker
         from app.services.candidate_presentation_service import CandidatePresentationService
-        from app.services.company_service import CompanyService
-        from app.services.distance_matrix_service import DistanceMatrixService
+        from app.services.domain_protection_service import check_domain_capacity, get_domain_from_email
         from app.models.candidate import Candidate
         from app.models.presentation_batch import PresentationBatch
         from sqlalchemy import select, update, func
-        from geoalchemy2.functions import ST_Y, ST_X, ST_GeomFromWKB
 
-        # Kandidaten-Daten laden (eigene Session)
+        # 1. Kandidaten-Daten laden (eigene Session)
         async with async_session_maker() as db:
             candidate_data = await CandidatePresentationService.extract_candidate_data(db, candidate_id)
             # Koordinaten fuer Drive-Time
@@ -318,308 +551,71 @@ async def process_bulk(
             logger.error(f"process_bulk: Kandidat {candidate_id} nicht gefunden")
             return
 
-        # Mailbox-Rotation (Round-Robin) + Domain-Schutz
-        from app.services.domain_protection_service import (
-            check_domain_capacity, get_domain_for_company, select_best_mailbox, get_domain_from_email,
-        )
-        mailbox_index = 0
-        mailbox_counts = {mb["email"]: 0 for mb in MAILBOXES}
-        exhausted_domains = set()
-        seen_companies: set[tuple[str, str]] = set()
+        # 2. Vorpruefung + Domain-Kapazitaet (eine Session fuer alle Zeilen)
+        async with async_session_maker() as db:
+            checks = await load_row_checks(db, candidate_id, rows)
+            remaining_by_domain = {}
+            for mb in MAILBOXES:
+                domain = get_domain_from_email(mb["email"])
+                if domain not in remaining_by_domain:
+                    capacity = await check_domain_capacity(db, mb["email"])
+                    remaining_by_domain[domain] = capacity.get("remaining", 0)
+        # Session geschlossen!
 
-        for row in rows:
+        scheduler = MailboxScheduler(MAILBOXES, remaining_by_domain)
+        skipped_outcomes = []
+        work = []
+        for row, verdict in zip(rows, evaluate_rows(rows, checks)):
             row_index = row.get("_row_index", 0)
-            try:
-                # CSV-internes Duplikat pruefen
-                company_key = (
-                    row.get("company_name", "").strip().lower(),
-                    row.get("city", "").strip().lower(),
-                )
-                if company_key in seen_companies:
-                    logger.info(f"Zeile {row_index}: CSV-Duplikat uebersprungen ({company_key[0]}, {company_key[1]})")
-                    await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_csv_duplicate", None)
-                    continue
-                seen_companies.add(company_key)
-
-                # 0. Domain-Kapazitaet pruefen (eigene Session)
-                async with async_session_maker() as db:
-                    # Domain-Konsistenz: gleiche Domain wie zuvor fuer diese Firma
-                    preferred_domain = await get_domain_for_company(db, row.get("company_name", ""))
-                # Session geschlossen!
-
-                # Mailbox waehlen (Domain-Konsistenz + Round-Robin)
-                mailbox = select_best_mailbox(
-                    MAILBOXES,
-                    preferred_domain=preferred_domain,
-                    exclude_domains=list(exhausted_domains),
-                    mailbox_counts=mailbox_counts,
-                )
+            status = verdict["status"]
+            mailbox = None
+            if not status:
+                mailbox = scheduler.assign(checks.preferred_domain(row))
                 if not mailbox:
-                    logger.warning(f"Zeile {row_index}: Keine Mailbox verfuegbar (alle Domains erschoepft)")
-                    await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_domain_limit", None)
-                    continue
-
-                # Domain-Kapazitaet live pruefen
-                async with async_session_maker() as db:
-                    capacity = await check_domain_capacity(db, mailbox["email"])
-                if not capacity["allowed"]:
-                    exhausted_domains.add(get_domain_from_email(mailbox["email"]))
-                    # Retry mit anderer Domain
-                    mailbox = select_best_mailbox(MAILBOXES, exclude_domains=list(exhausted_domains), mailbox_counts=mailbox_counts)
-                    if not mailbox:
-                        await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_domain_limit", None)
-                        continue
-
-                # 1. Spam-Check (eigene Session)
-                async with async_session_maker() as db:
-                    spam = await CandidatePresentationService.check_spam_block(
-                        db, row.get("company_name", ""), row.get("city", "")
-                    )
-                if spam["blocked"]:
-                    await _update_batch_row(async_session_maker, batch_id, row_index, "skipped", None)
-                    continue
-
-                # 1b. Already-presented Check (eigene Session)
-                async with async_session_maker() as db:
-                    already = await CandidatePresentationService.check_already_presented(
-                        db,
-                        candidate_id=candidate_id,
-                        company_name=row.get("company_name", ""),
-                        city=row.get("city", ""),
-                    )
-                if already["already_presented"]:
-                    logger.info(f"Zeile {row_index}: Kandidat bereits vorgestellt bei {row.get('company_name', '')}")
-                    await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_already_presented", None)
-                    continue
-
-                # 1c. Blocklist-Check (Empfaenger-Domain gesperrt?)
-                contact_email = row.get("contact_email", "")
-                if contact_email:
-                    async with async_session_maker() as db:
-                        from app.services.presentation_reply_service import PresentationReplyService
-                        domain_blocked = await PresentationReplyService.is_domain_blocked(db, contact_email)
-                    if domain_blocked:
-                        logger.info(f"Zeile {row_index}: Empfaenger-Domain gesperrt ({contact_email})")
-                        await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_domain_blocked", None)
-                        continue
-
-                # 2. Company erstellen/finden (eigene Session)
-                async with async_session_maker() as db:
-                    company_svc = CompanyService(db)
-
-                    # Adresse zusammenbauen (PLZ + Strasse + Ort)
-                    address_parts = [p for p in [
-                        row.get("address", ""),
-                        row.get("plz", ""),
-                        row.get("city", ""),
-                    ] if p and p.strip()]
-                    full_address = ", ".join(address_parts) if address_parts else ""
-
-                    company = await company_svc.get_or_create_by_name(
-                        row.get("company_name", ""),
-                        city=row.get("city", ""),
-                        domain=row.get("domain", ""),
-                        address=full_address,
-                    )
-                    if not company:
-                        await _update_batch_row(async_session_maker, batch_id, row_index, "skipped_blacklist", None)
-                        continue
-                    company_id = company.id
-
-                    # Contact erstellen/finden (mit Duplikat-Erkennung + Auto-Anrede)
-                    contact_id = None
-                    contact_email = row.get("contact_email", "")
-                    first_name = row.get("contact_firstname", "").strip()
-                    last_name = row.get("contact_lastname", "").strip()
-                    if contact_email or first_name or last_name:
-                        contact = await company_svc.get_or_create_contact(
-                            company_id=company_id,
-                            first_name=first_name or None,
-                            last_name=last_name or None,
-                            email=contact_email or None,
-                            phone=row.get("contact_phone", "") or None,
-                            salutation=row.get("contact_salutation", "") or None,
-                            source="csv_bulk",
-                        )
-                        contact_id = contact.id
-                    await db.commit()
-                # Session geschlossen!
-
-                # 3. Drive-Time (DB-Session schliessen BEVOR Google Maps API-Call!)
-                drive_time = None
-                if cand_coords and cand_coords.lat and cand_coords.lng:
-                    try:
-                        # Firma-Koordinaten aus DB laden (eigene Session)
-                        comp_lat = None
-                        comp_lng = None
-                        comp_plz = None
-                        async with async_session_maker() as db:
-                            from app.models.company import Company
-                            comp_result = await db.execute(
-                                select(
-                                    func.ST_Y(func.ST_GeomFromWKB(Company.location_coords)).label("lat"),
-                                    func.ST_X(func.ST_GeomFromWKB(Company.location_coords)).label("lng"),
-                                    Company.postal_code,
-                                ).where(Company.id == company_id)
-                            )
-                            comp_row = comp_result.first()
-                            if comp_row and comp_row.lat and comp_row.lng:
-                                comp_lat = comp_row.lat
-                                comp_lng = comp_row.lng
-                                comp_plz = comp_row.postal_code
-                        # Session geschlossen BEVOR API-Call!
-
-                        if comp_lat and comp_lng:
-                            dm_service = DistanceMatrixService()
-                            dt_result = await dm_service.get_drive_time(
-                                origin_lat=cand_coords.lat,
-                                origin_lng=cand_coords.lng,
-                                origin_plz=cand_coords.postal_code or "",
-                                dest_lat=comp_lat,
-                                dest_lng=comp_lng,
-                                dest_plz=comp_plz or "",
-                            )
-                            if dt_result.status == "ok" or dt_result.status == "same_plz":
-                                drive_time = {
-                                    "car_min": dt_result.car_min,
-                                    "transit_min": dt_result.transit_min,
-                                    "car_km": dt_result.car_km,
-                                }
-                                logger.info(f"Zeile {row_index}: Fahrzeit berechnet — Auto: {dt_result.car_min}min, OEPNV: {dt_result.transit_min}min")
-                            else:
-                                logger.info(f"Zeile {row_index}: Fahrzeit-Status: {dt_result.status} — uebersprungen")
-                        else:
-                            logger.info(f"Zeile {row_index}: Firma hat keine Koordinaten — Fahrzeit uebersprungen")
-                    except Exception as dt_err:
-                        logger.warning(f"Zeile {row_index}: Fahrzeit-Berechnung fehlgeschlagen: {dt_err}")
-
-                # 4. Skills-Match (OpenAI, KEINE DB-Session offen!)
-                extracted_data = {
-                    "company_name": row.get("company_name", ""),
-                    "city": row.get("city", ""),
-                    "job_title": row.get("position", ""),
-                    "requirements": [],
-                    "description_summary": row.get("job_text", "")[:500],
-                }
-                skills = await CandidatePresentationService.calculate_skills_match(
-                    candidate_data, extracted_data
-                )
+                    status = "skipped_domain_limit"
+            if status:
+                skipped_outcomes.append({
+                    "row_index": row_index,
+                    "status": status,
+                    "company_name": row.get("company_name", "")[:255],
+                })
+                continue
+            work.append((row, mailbox))
 
-                # 5. E-Mail generieren (OpenAI, KEINE DB-Session offen!)
-                email_data = await CandidatePresentationService.generate_presentation_email(
-                    candidate_data=candidate_data,
-                    extracted_job_data={**extracted_data, "contact_name": row.get("contact_name", ""), "contact_salutation": row.get("contact_salutation", "")},
-                    skills_comparison=skills.model_dump(),
-                    drive_time=drive_time,
-                    step=1,
-                )
+        await _record_rows(async_session_maker, batch_id, skipped_outcomes)
+        logger.info(
+            f"process_bulk {batch_id}: {len(work)} Zeilen zu versenden, "
+            f"{len(skipped_outcomes)} uebersprungen"
+        )
 
-                # 6. Mailbox bereits oben gewaehlt (Domain-Konsistenz + Kapazitaet)
-                mailbox_counts[mailbox["email"]] = mailbox_counts.get(mailbox["email"], 0) + 1
-
-                # 6b. Profil-PDF generieren (eigene Session, BEVOR n8n-Trigger)
-                pdf_base64 = None
-                pdf_filename = None
-                try:
-                    import base64
-                    from app.services.profile_pdf_service import ProfilePdfService
-                    async with async_session_maker() as pdf_db:
-                        pdf_service = ProfilePdfService(pdf_db)
-                        pdf_bytes = await pdf_service.generate_profile_pdf(candidate_id)
-                        pdf_base64 = base64.b64encode(pdf_bytes).decode("utf-8")
-                        pdf_filename = "Kandidatenprofil.pdf"
-                        logger.info(f"Zeile {row_index}: PDF generiert ({len(pdf_bytes)} bytes)")
-                    # Session geschlossen!
-                except Exception as pdf_err:
-                    logger.warning(f"Zeile {row_index}: PDF-Generierung fehlgeschlagen: {pdf_err} — E-Mail ohne Anhang")
-
-                # 7. Presentation erstellen (neue Session)
-                email_body_html = email_data.get("body_html", "")
-                async with async_session_maker() as db:
-                    presentation = await CandidatePresentationService.create_direct_presentation(
-                        db=db,
-                        candidate_id=candidate_id,
-                        company_id=company_id,
-                        contact_id=contact_id,
-                        email_to=contact_email or f"info@{row.get('domain', 'unbekannt.de')}",
-                        email_from=mailbox["email"],
-                        email_subject=email_data["subject"],
-                        email_body_text=email_data["body_text"],
-                        email_body_html=email_body_html,
-                        mailbox_used=mailbox["email"],
-                        source="csv_bulk",
-                        extracted_job_data=extracted_data,
-                        skills_comparison=skills.model_dump(),
-                        batch_id=batch_id,
-                    )
-                    await db.commit()
-                    presentation_id = presentation.id
-                # Session geschlossen!
-
-                # 8. n8n triggern fuer E-Mail-Versand (KEINE DB-Session offen!)
-                n8n_ok = await _trigger_n8n_for_bulk(
-                    presentation_id=str(presentation_id),
-                    candidate_id=str(candidate_id),
-                    company_id=str(company_id),
-                    contact_id=str(contact_id) if contact_id else None,
-                    email_to=contact_email or f"info@{row.get('domain', 'unbekannt.de')}",
-                    email_from=mailbox["email"],
-                    email_subject=email_data["subject"],
-                    email_body_text=email_data["body_text"],
-                    email_body_html=email_body_html,
-                    contact_name=row.get("contact_name", ""),
-                    source="csv_bulk",
-                    pdf_base64=pdf_base64,
-                    pdf_filename=pdf_filename,
-                )
+        # Profil-PDF ist fuer alle Zeilen gleich — einmal generieren
+        pdf_base64, pdf_filename = (None, None)
+        if work:
+            pdf_base64, pdf_filename = await _generate_profile_pdf(async_session_maker, candidate_id)
+
+        # 3. Zeilen parallel verarbeiten
+        ctx = _BulkContext(
+            session_maker=async_session_maker,
+            candidate_id=candidate_id,
+            batch_id=batch_id,
+            candidate_data=candidate_data,
+            cand_coords=cand_coords,
+            scheduler=scheduler,
+            row_slots=asyncio.Semaphore(ROW_CONCURRENCY),
+            ai_slots=asyncio.Semaphore(AI_CONCURRENCY),
+            pdf_base64=pdf_base64,
+            pdf_filename=pdf_filename,
+        )
+        await asyncio.gather(*(_process_row(ctx, row, mailbox) for row, mailbox in work))
 
-                # Bei Erfolg: Status auf "sending" setzen (eigene Session!)
-                if n8n_ok:
-                    async with async_session_maker() as db:
-                        from app.models.client_presentation import ClientPresentation
-                        await db.execute(
-                            update(ClientPresentation)
-                            .where(ClientPresentation.id == presentation_id)
-                            .values(status="sending")
-                        )
-                        await db.commit()
-                    # Session geschlossen!
-
-                await _update_batch_row(async_session_maker, batch_id, row_index, "created", str(presentation_id))
-                batch_status["processed"] += 1
-
-                # Live-Fortschritt in DB schreiben (fuer Frontend-Polling)
-                async with async_session_maker() as db:
-                    await db.execute(
-                        update(PresentationBatch)
-                        .where(PresentationBatch.id == batch_id)
-                        .values(
-                            processed=batch_status["processed"],
-                            errors=batch_status["errors"],
-                            skipped=batch_status["skipped"],
-                            updated_at=func.now(),
-                        )
-                    )
-                    await db.commit()
-
-                # 9. Pause zwischen E-Mails (max 10/min fuer SMTP-Sicherheit)
-                await asyncio.sleep(6)
-
-            except Exception as e:
-                logger.error(f"process_bulk Zeile {row_index}: {e}")
-                batch_status["errors"] += 1
-                await _update_batch_error(async_session_maker, batch_id, row_index, str(e), row.get("company_name", ""))
-
-        # Batch abschliessen
+        # Batch abschliessen (Zaehler stehen bereits durch _record_rows)
         async with async_session_maker() as db:
             await db.execute(
                 update(PresentationBatch)
                 .where(PresentationBatch.id == batch_id)
                 .values(
                     status="completed",
-                    processed=batch_status["processed"],
-                    errors=batch_status["errors"],
-                    mailbox_distribution=mailbox_counts,
+                    mailbox_distribution=ctx.sent_counts,
                     updated_at=func.now(),
                 )
             )
@@ -640,8 +636,249 @@ async def process_bulk(
                 await db.commit()
         except Exception:
             pass
-    finally:
-        batch_status["running"] = False
+
+
+async def _process_row(ctx: _BulkContext, row: dict, mailbox: dict) -> None:
+    """Eine versendbare Zeile: Firma/Kontakt, Fahrzeit, KI-Texte, Presentation, n8n."""
+    row_index = row.get("_row_index", 0)
+    sent = False
+    try:
+        from app.services.candidate_presentation_service import CandidatePresentationService
+        from app.services.domain_protection_service import record_send
+        from app.models.client_presentation import ClientPresentation
+        from sqlalchemy import update
+
+        # 1-3. Firma/Kontakt, Fahrzeit, KI-Texte (begrenzte Parallelitaet)
+        async with ctx.row_slots:
+            prepared = await _prepare_row(ctx, row, row_index)
+        if prepared is None:
+            ctx.scheduler.release(mailbox)
+            await _record_rows(ctx.session_maker, ctx.batch_id, [{
+                "row_index": row_index,
+                "status": "skipped_blacklist",
+                "company_name": row.get("company_name", "")[:255],
+            }])
+            return
+        company_id, contact_id, extracted_data, skills, email_data = prepared
+
+        # 4. Auf den Sende-Slot des Postfachs warten (statt globaler Pause)
+        await ctx.scheduler.wait_turn(mailbox["email"])
+
+        # 5. Presentation erstellen (neue Session)
+        contact_email = row.get("contact_email", "")
+        email_to = contact_email or f"info@{row.get('domain', 'unbekannt.de')}"
+        email_body_html = email_data.get("body_html", "")
+        async with ctx.session_maker() as db:
+            presentation = await CandidatePresentationService.create_direct_presentation(
+                db=db,
+                candidate_id=ctx.candidate_id,
+                company_id=company_id,
+                contact_id=contact_id,
+                email_to=email_to,
+                email_from=mailbox["email"],
+                email_subject=email_data["subject"],
+                email_body_text=email_data["body_text"],
+                email_body_html=email_body_html,
+                mailbox_used=mailbox["email"],
+                source="csv_bulk",
+                extracted_job_data=extracted_data,
+                skills_comparison=skills.model_dump(),
+                batch_id=ctx.batch_id,
+            )
+            await db.commit()
+            presentation_id = presentation.id
+        # Session geschlossen!
+        sent = True
+        record_send(mailbox["email"])
+        ctx.sent_counts[mailbox["email"]] = ctx.sent_counts.get(mailbox["email"], 0) + 1
+
+        # 6. n8n triggern fuer E-Mail-Versand (KEINE DB-Session offen!)
+        n8n_ok = await _trigger_n8n_for_bulk(
+            presentation_id=str(presentation_id),
+            candidate_id=str(ctx.candidate_id),
+            company_id=str(company_id),
+            contact_id=str(contact_id) if contact_id else None,
+            email_to=email_to,
+            email_from=mailbox["email"],
+            email_subject=email_data["subject"],
+            email_body_text=email_data["body_text"],
+            email_body_html=email_body_html,
+            contact_name=row.get("contact_name", ""),
+            source="csv_bulk",
+            pdf_base64=ctx.pdf_base64,
+            pdf_filename=ctx.pdf_filename,
+        )
+
+        # Bei Erfolg: Status auf "sending" setzen (eigene Session!)
+        if n8n_ok:
+            async with ctx.session_maker() as db:
+                await db.execute(
+                    update(ClientPresentation)
+                    .where(ClientPresentation.id == presentation_id)
+                    .values(status="sending")
+                )
+                await db.commit()
+
+        await _record_rows(ctx.session_maker, ctx.batch_id, [{
+            "row_index": row_index,
+            "status": "created",
+            "presentation_id": presentation_id,
+            "company_name": row.get("company_name", "")[:255],
+            "mailbox": mailbox["email"],
+        }])
+
+    except Exception as e:
+        logger.error(f"process_bulk Zeile {row_index}: {e}")
+        if not sent:
+            ctx.scheduler.release(mailbox)
+        await _record_rows(ctx.session_maker, ctx.batch_id, [{
+            "row_index": row_index,
+            "status": "error",
+            "company_name": row.get("company_name", "")[:255],
+            "mailbox": mailbox["email"],
+            "error": str(e)[:500],
+        }])
+
+
+async def _prepare_row(ctx: _BulkContext, row: dict, row_index: int) -> tuple | None:
+    """Firma/Kontakt anlegen, Fahrzeit + KI-Texte erzeugen. None bei Blacklist."""
+    from app.services.candidate_presentation_service import CandidatePresentationService
+
+    # 1. Company + Contact erstellen/finden (eigene Session)
+    company_id, contact_id = await _get_or_create_company_contact(ctx.session_maker, row)
+    if not company_id:
+        return None
+
+    # 2. Drive-Time (DB-Session schliessen BEVOR Google Maps API-Call!)
+    drive_time = await _calculate_drive_time(ctx, company_id, row_index)
+
+    # 3. Skills-Match + E-Mail (OpenAI, KEINE DB-Session offen!)
+    extracted_data = {
+        "company_name": row.get("company_name", ""),
+        "city": row.get("city", ""),
+        "job_title": row.get("position", ""),
+        "requirements": [],
+        "description_summary": row.get("job_text", "")[:500],
+    }
+    async with ctx.ai_slots:
+        skills = await CandidatePresentationService.calculate_skills_match(
+            ctx.candidate_data, extracted_data
+        )
+        email_data = await CandidatePresentationService.generate_presentation_email(
+            candidate_data=ctx.candidate_data,
+            extracted_job_data={**extracted_data, "contact_name": row.get("contact_name", ""), "contact_salutation": row.get("contact_salutation", "")},
+            skills_comparison=skills.model_dump(),
+            drive_time=drive_time,
+            step=1,
+        )
+    return company_id, contact_id, extracted_data, skills, email_data
+
+
+async def _get_or_create_company_contact(session_maker, row: dict) -> tuple:
+    """Company + Contact erstellen/finden. (None, None) bei Blacklist."""
+    from app.services.company_service import CompanyService
+
+    async with session_maker() as db:
+        company_svc = CompanyService(db)
+
+        # Adresse zusammenbauen (PLZ + Strasse + Ort)
+        address_parts = [p for p in [
+            row.get("address", ""),
+            row.get("plz", ""),
+            row.get("city", ""),
+        ] if p and p.strip()]
+        full_address = ", ".join(address_parts) if address_parts else ""
+
+        company = await company_svc.get_or_create_by_name(
+            row.get("company_name", ""),
+            city=row.get("city", ""),
+            domain=row.get("domain", ""),
+            address=full_address,
+        )
+        if not company:
+            return None, None
+        company_id = company.id
+
+        # Contact erstellen/finden (mit Duplikat-Erkennung + Auto-Anrede)
+        contact_id = None
+        contact_email = row.get("contact_email", "")
+        first_name = row.get("contact_firstname", "").strip()
+        last_name = row.get("contact_lastname", "").strip()
+        if contact_email or first_name or last_name:
+            contact = await company_svc.get_or_create_contact(
+                company_id=company_id,
+                first_name=first_name or None,
+                last_name=last_name or None,
+                email=contact_email or None,
+                phone=row.get("contact_phone", "") or None,
+                salutation=row.get("contact_salutation", "") or None,
+                source="csv_bulk",
+            )
+            contact_id = contact.id
+        await db.commit()
+    # Session geschlossen!
+    return company_id, contact_id
+
+
+async def _calculate_drive_time(ctx: _BulkContext, company_id: UUID, row_index: int) -> dict | None:
+    """Fahrzeit Kandidat → Firma (None wenn Koordinaten fehlen oder API-Fehler)."""
+    cand_coords = ctx.cand_coords
+    if not (cand_coords and cand_coords.lat and cand_coords.lng):
+        return None
+    try:
+        from app.models.company import Company
+        from app.services.distance_matrix_service import DistanceMatrixService
+        from sqlalchemy import select, func
+
+        # Firma-Koordinaten aus DB laden (eigene Session)
+        async with ctx.session_maker() as db:
+            comp_result = await db.execute(
+                select(
+                    func.ST_Y(func.ST_GeomFromWKB(Company.location_coords)).label("lat"),
+                    func.ST_X(func.ST_GeomFromWKB(Company.location_coords)).label("lng"),
+                    Company.postal_code,
+                ).where(Company.id == company_id)
+            )
+            comp_row = comp_result.first()
+        # Session geschlossen BEVOR API-Call!
+
+        if not (comp_row and comp_row.lat and comp_row.lng):
+            logger.info(f"Zeile {row_index}: Firma hat keine Koordinaten — Fahrzeit uebersprungen")
+            return None
+
+        dt_result = await DistanceMatrixService().get_drive_time(
+            origin_lat=cand_coords.lat,
+            origin_lng=cand_coords.lng,
+            origin_plz=cand_coords.postal_code or "",
+            dest_lat=comp_row.lat,
+            dest_lng=comp_row.lng,
+            dest_plz=comp_row.postal_code or "",
+        )
+        if dt_result.status == "ok" or dt_result.status == "same_plz":
+            logger.info(f"Zeile {row_index}: Fahrzeit berechnet — Auto: {dt_result.car_min}min, OEPNV: {dt_result.transit_min}min")
+            return {
+                "car_min": dt_result.car_min,
+                "transit_min": dt_result.transit_min,
+                "car_km": dt_result.car_km,
+            }
+        logger.info(f"Zeile {row_index}: Fahrzeit-Status: {dt_result.status} — uebersprungen")
+    except Exception as dt_err:
+        logger.warning(f"Zeile {row_index}: Fahrzeit-Berechnung fehlgeschlagen: {dt_err}")
+    return None
+
+
+async def _generate_profile_pdf(session_maker, candidate_id: UUID) -> tuple[Optional[str], Optional[str]]:
+    """Profil-PDF als Base64 (None, None bei Fehler → E-Mails ohne Anhang)."""
+    try:
+        import base64
+        from app.services.profile_pdf_service import ProfilePdfService
+        async with session_maker() as pdf_db:
+            pdf_bytes = await ProfilePdfService(pdf_db).generate_profile_pdf(candidate_id)
+        logger.info(f"process_bulk: Profil-PDF generiert ({len(pdf_bytes)} bytes)")
+        return base64.b64encode(pdf_bytes).decode("utf-8"), "Kandidatenprofil.pdf"
+    except Exception as pdf_err:
+        logger.warning(f"process_bulk: PDF-Generierung fehlgeschlagen: {pdf_err} — E-Mails ohne Anhang")
+        return None, None
 
 
 async def _trigger_n8n_for_bulk(
@@ -717,38 +954,36 @@ async def _trigger_n8n_for_bulk(
         return False
 
 
-async def _update_batch_row(session_maker, batch_id: UUID, row_index: int, status: str, presentation_id: Optional[str]):
-    """Row-Level-Tracking updaten (fuer Absturz-Recovery)."""
+async def _record_rows(session_maker, batch_id: UUID, outcomes: list[dict]) -> None:
+    """Zeilen-Ergebnisse anhaengen + Batch-Zaehler atomar hochzaehlen.
+
+    Append-only: kein Neuladen/Neuschreiben eines JSONB-Arrays pro Zeile.
+    """
+    if not outcomes:
+        return
     try:
-        from app.models.presentation_batch import PresentationBatch
-        from sqlalchemy import select, func
-        async with session_maker() as db:
-            batch = await db.get(PresentationBatch, batch_id)
-            if batch:
-                rows = batch.processed_rows or []
-                rows.append({"row_index": row_index, "presentation_id": presentation_id, "status": status})
-                batch.processed_rows = rows
-                batch.processed = len([r for r in rows if r["status"] == "created"])
-                batch.skipped = len([r for r in rows if r["status"].startswith("skipped")])
-                await db.commit()
-    except Exception as e:
-        logger.warning(f"_update_batch_row fehlgeschlagen: {e}")
+        from app.models.presentation_batch import PresentationBatch, PresentationBatchRow
+        from sqlalchemy import update, func
 
+        created = sum(1 for o in outcomes if o["status"] == "created")
+        errors = sum(1 for o in outcomes if o["status"] == "error")
+        skipped = sum(1 for o in outcomes if o["status"].startswith("skipped"))
 
-async def _update_batch_error(session_maker, batch_id: UUID, row_index: int, error: str, company_name: str):
-    """Fehler-Details zum Batch hinzufuegen."""
-    try:
-        from app.models.presentation_batch import PresentationBatch
         async with session_maker() as db:
-            batch = await db.get(PresentationBatch, batch_id)
-            if batch:
-                errors = batch.error_details or []
-                errors.append({"row_index": row_index, "error": error[:500], "company_name": company_name})
-                batch.error_details = errors
-                batch.errors = len(errors)
-                await db.commit()
+            db.add_all([PresentationBatchRow(batch_id=batch_id, **o) for o in outcomes])
+            await db.execute(
+                update(PresentationBatch)
+                .where(PresentationBatch.id == batch_id)
+                .values(
+                    processed=PresentationBatch.processed + created,
+                    errors=PresentationBatch.errors + errors,
+                    skipped=PresentationBatch.skipped + skipped,
+                    updated_at=func.now(),
+                )
+            )
+            await db.commit()
     except Exception as e:
-        logger.warning(f"_update_batch_error fehlgeschlagen: {e}")
+        logger.warning(f"_record_rows fehlgeschlagen ({len(outcomes)} Zeilen): {e}")
 
 
 def _pick_best_email(raw_row: dict, current_email: str) -> str:
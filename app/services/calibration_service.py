@@ -30,16 +30,22 @@ und vom Pre-Scoring-Service beim naechsten Lauf geladen.
 
 import json
 import logging
-from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 
+import numpy as np
 from sqlalchemy import and_, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.candidate import Candidate
 from app.models.job import Job
 from app.models.match import Match
+from app.services.feedback_analytics import (
+    GroupStats,
+    Vocabulary,
+    role_pair_stats,
+    term_counts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +194,35 @@ class CalibrationResult:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
+@dataclass
+class AIMatchColumns:
+    """AI-bewertete Matches spaltenweise (einmal pro Kalibrierung aufgebaut)."""
+
+    ai_score: np.ndarray
+    job_role: list[str]
+    candidate_role: list[str]
+    matched_keywords: list[list[str]]
+    ai_strengths: list[list[str]]
+    ai_weaknesses: list[list[str]]
+
+    def __len__(self) -> int:
+        return len(self.ai_score)
+
+    @property
+    def is_good(self) -> np.ndarray:
+        return self.ai_score >= GOOD_MATCH_THRESHOLD
+
+    @property
+    def is_bad(self) -> np.ndarray:
+        return self.ai_score <= BAD_MATCH_THRESHOLD
+
+    def has_roles(self) -> np.ndarray:
+        return np.array(
+            [bool(j and c) for j, c in zip(self.job_role, self.candidate_role)],
+            dtype=bool,
+        )
+
+
 # Minimum-Samples damit wir eine Rollen-Kombination kalibrieren
 MIN_SAMPLES_FOR_CALIBRATION = 3
 
@@ -256,10 +291,10 @@ class CalibrationService:
         )
 
         # ── Schritt 1: Daten laden ──
-        matches_data = await self._load_ai_matches(category)
-        result.total_ai_matches = len(matches_data)
+        columns = await self._load_ai_matches(category)
+        result.total_ai_matches = len(columns)
 
-        if not matches_data:
+        if not len(columns):
             result.warnings.append(
                 "Keine AI-bewerteten Matches gefunden. "
                 "Fuehre zuerst einen Bulk-DeepMatch aus."
@@ -267,46 +302,37 @@ class CalibrationService:
             return result
 
         logger.info(
-            f"Kalibrierung: {len(matches_data)} AI-Matches geladen "
+            f"Kalibrierung: {len(columns)} AI-Matches geladen "
             f"fuer Kategorie {category}"
         )
 
-        # Filtere Matches mit Rollen-Info
-        matches_with_roles = [
-            m for m in matches_data if m["job_role"] and m["candidate_role"]
-        ]
-        result.total_with_roles = len(matches_with_roles)
+        # Matches mit Rollen-Info
+        result.total_with_roles = int(columns.has_roles().sum())
 
-        if len(matches_with_roles) < MIN_SAMPLES_FOR_CALIBRATION:
+        if result.total_with_roles < MIN_SAMPLES_FOR_CALIBRATION:
             result.warnings.append(
-                f"Nur {len(matches_with_roles)} Matches mit Rollen-Info. "
+                f"Nur {result.total_with_roles} Matches mit Rollen-Info. "
                 f"Mindestens {MIN_SAMPLES_FOR_CALIBRATION} benoetigt."
             )
 
-        # ── Schritt 2: Rollen-Kalibrierung ──
-        if matches_with_roles:
-            self._analyze_role_pairs(matches_with_roles, result)
+        # ── Schritt 2 + 4: Rollen-Kalibrierung und Ausschluss-Paare ──
+        # Eine gemeinsame Gruppierung fuer beide Analysen
+        if result.total_with_roles:
+            pair_stats = role_pair_stats(
+                columns.job_role, columns.candidate_role, columns.ai_score,
+            )
+            self._analyze_role_pairs(pair_stats, result)
+            self._find_exclusion_pairs(pair_stats, result)
 
         # ── Schritt 3: Keyword-Analyse ──
-        matches_with_keywords = [
-            m for m in matches_data if m["matched_keywords"]
-        ]
-        if matches_with_keywords:
-            self._analyze_keywords(matches_with_keywords, result)
+        if any(columns.matched_keywords):
+            self._analyze_keywords(columns, result)
         else:
             result.warnings.append("Keine Matches mit Keywords gefunden.")
 
-        # ── Schritt 4: Ausschluss-Paare ──
-        if matches_with_roles:
-            self._find_exclusion_pairs(matches_with_roles, result)
-
         # ── Schritt 5: Staerken/Schwaechen-Tiefenanalyse (NEU) ──
-        matches_with_sw = [
-            m for m in matches_data
-            if m["ai_strengths"] or m["ai_weaknesses"]
-        ]
-        if matches_with_sw:
-            self._analyze_strength_weakness_patterns(matches_with_sw, result)
+        if any(columns.ai_strengths) or any(columns.ai_weaknesses):
+            self._analyze_strength_weakness_patterns(columns, result)
         else:
             result.warnings.append(
                 "Keine Matches mit Staerken/Schwaechen-Daten gefunden."
@@ -327,33 +353,25 @@ class CalibrationService:
     # Daten laden
     # ──────────────────────────────────────────────────
 
-    async def _load_ai_matches(self, category: str) -> list[dict]:
+    async def _load_ai_matches(self, category: str) -> AIMatchColumns:
         """
-        Laedt alle AI-bewerteten Matches mit relevanten Informationen.
+        Laedt alle AI-bewerteten Matches spaltenweise.
 
         Returns:
-            Liste von Dicts mit:
-            - match_id, ai_score, matched_keywords
-            - ai_strengths, ai_weaknesses, ai_explanation (NEU — fuer Tiefenanalyse)
+            AIMatchColumns mit:
+            - ai_score (float64-Array), matched_keywords
+            - ai_strengths, ai_weaknesses (fuer Tiefenanalyse)
             - job_role (Job.hotlist_job_title)
             - candidate_role (Candidate.hotlist_job_title)
-            - candidate_roles (Candidate.hotlist_job_titles)
         """
         query = (
             select(
-                Match.id,                      # 0
-                Match.ai_score,                # 1
-                Match.matched_keywords,        # 2
-                Match.pre_score,               # 3
-                Match.distance_km,             # 4
-                Job.hotlist_job_title,          # 5
-                Job.hotlist_city,              # 6
-                Candidate.hotlist_job_title,    # 7
-                Candidate.hotlist_job_titles,   # 8
-                Candidate.hotlist_city,         # 9
-                Match.ai_strengths,            # 10 — NEU
-                Match.ai_weaknesses,           # 11 — NEU
-                Match.ai_explanation,          # 12 — NEU
+                Match.ai_score,
+                Match.matched_keywords,
+                Job.hotlist_job_title,
+                Candidate.hotlist_job_title,
+                Match.ai_strengths,
+                Match.ai_weaknesses,
             )
             .join(Job, Match.job_id == Job.id)
             .join(Candidate, Match.candidate_id == Candidate.id)
@@ -370,25 +388,17 @@ class CalibrationService:
         result = await self.db.execute(query)
         rows = result.all()
 
-        matches_data = []
-        for row in rows:
-            matches_data.append({
-                "match_id": row[0],
-                "ai_score": float(row[1]) if row[1] is not None else 0.0,
-                "matched_keywords": row[2] or [],
-                "pre_score": float(row[3]) if row[3] is not None else None,
-                "distance_km": float(row[4]) if row[4] is not None else None,
-                "job_role": (row[5] or "").strip(),
-                "job_city": (row[6] or "").strip(),
-                "candidate_role": (row[7] or "").strip(),
-                "candidate_roles": row[8] or [],
-                "candidate_city": (row[9] or "").strip(),
-                "ai_strengths": row[10] or [],
-                "ai_weaknesses": row[11] or [],
-                "ai_explanation": (row[12] or "").strip(),
-            })
-
-        return matches_data
+        return AIMatchColumns(
+            ai_score=np.array(
+                [float(r[0]) if r[0] is not None else 0.0 for r in rows],
+                dtype=np.float64,
+            ),
+            matched_keywords=[r[1] or [] for r in rows],
+            job_role=[(r[2] or "").strip() for r in rows],
+            candidate_role=[(r[3] or "").strip() for r in rows],
+            ai_strengths=[r[4] or [] for r in rows],
+            ai_weaknesses=[r[5] or [] for r in rows],
+        )
 
     # ──────────────────────────────────────────────────
     # Analyse 1: Rollen-Kalibrierung
@@ -396,34 +406,24 @@ class CalibrationService:
 
     def _analyze_role_pairs(
         self,
-        matches: list[dict],
+        pair_stats: list[GroupStats],
         result: CalibrationResult,
     ) -> None:
         """
-        Analysiert AI-Scores pro Rollen-Paar und vergleicht mit Matrix.
+        Vergleicht AI-Scores pro Rollen-Paar mit der Matrix.
 
-        Gruppiert nach (job_role, candidate_role), berechnet Durchschnitt,
-        und schlaegt neue Werte vor wenn Abweichung > 0.1.
+        pair_stats kommt aus feedback_analytics.role_pair_stats (gruppiert nach
+        (job_role, candidate_role), sortiert). Schlaegt neue Werte vor wenn
+        Abweichung > 0.1.
         """
         from app.services.pre_scoring_service import FINANCE_ROLE_SIMILARITY
 
-        # Gruppiere nach (job_role, candidate_role)
-        pair_scores: dict[tuple[str, str], list[float]] = defaultdict(list)
-
-        for m in matches:
-            job_role = m["job_role"]
-            cand_role = m["candidate_role"]
-            if job_role and cand_role:
-                pair_scores[(job_role, cand_role)].append(m["ai_score"])
-
-        # Analysiere jedes Paar
-        for (job_role, cand_role), scores in sorted(pair_scores.items()):
-            if len(scores) < MIN_SAMPLES_FOR_CALIBRATION:
+        for stats in pair_stats:
+            if stats.count < MIN_SAMPLES_FOR_CALIBRATION:
                 continue
 
-            avg_score = sum(scores) / len(scores)
-            min_score = min(scores)
-            max_score = max(scores)
+            job_role, cand_role = stats.key
+            avg_score = stats.mean
 
             # Aktueller Matrix-Wert
             current_value = FINANCE_ROLE_SIMILARITY.get((job_role, cand_role))
@@ -439,10 +439,10 @@ class CalibrationService:
             stat = RolePairStats(
                 job_role=job_role,
                 candidate_role=cand_role,
-                sample_count=len(scores),
+                sample_count=stats.count,
                 avg_ai_score=avg_score,
-                min_ai_score=min_score,
-                max_ai_score=max_score,
+                min_ai_score=stats.min,
+                max_ai_score=stats.max,
                 current_matrix_value=current_value,
                 suggested_value=suggested,
                 deviation=deviation,
@@ -458,7 +458,7 @@ class CalibrationService:
                 logger.info(
                     f"Rollen-Kalibrierung: {job_role} x {cand_role}: "
                     f"Matrix={current_value:.2f}, AI-Avg={avg_score:.2f}, "
-                    f"Neu={suggested:.2f} (n={len(scores)})"
+                    f"Neu={suggested:.2f} (n={stats.count})"
                 )
 
     # ──────────────────────────────────────────────────
@@ -467,7 +467,7 @@ class CalibrationService:
 
     def _analyze_keywords(
         self,
-        matches: list[dict],
+        columns: AIMatchColumns,
         result: CalibrationResult,
     ) -> None:
         """
@@ -477,46 +477,38 @@ class CalibrationService:
         Power-Keywords: Kommen in > 60% der guten Matches vor
         Penalty-Keywords: Kommen in > 75% der schlechten Matches vor
         """
-        # Zaehle Keywords in guten, schlechten und allen Matches
-        keyword_good: dict[str, int] = defaultdict(int)
-        keyword_bad: dict[str, int] = defaultdict(int)
-        keyword_total: dict[str, int] = defaultdict(int)
-
-        good_matches_count = 0
-        bad_matches_count = 0
-
-        for m in matches:
-            score = m["ai_score"]
-            keywords = m["matched_keywords"]
-
-            is_good = score >= GOOD_MATCH_THRESHOLD
-            is_bad = score <= BAD_MATCH_THRESHOLD
-
-            if is_good:
-                good_matches_count += 1
-            if is_bad:
-                bad_matches_count += 1
-
-            for kw in keywords:
-                kw_lower = kw.strip().lower()
-                if not kw_lower:
-                    continue
-                keyword_total[kw_lower] += 1
-                if is_good:
-                    keyword_good[kw_lower] += 1
-                if is_bad:
-                    keyword_bad[kw_lower] += 1
-
-        # Analysiere jedes Keyword
-        for kw, total in sorted(keyword_total.items(), key=lambda x: -x[1]):
+        is_good = columns.is_good
+        is_bad = columns.is_bad
+
+        # Zaehle Keywords in guten, schlechten und allen Matches (vektorisiert)
+        counts = term_counts(
+            [
+                [kw_lower for kw in keywords if (kw_lower := kw.strip().lower())]
+                for keywords in columns.matched_keywords
+            ],
+            is_good,
+            is_bad,
+        )
+
+        with_keywords = np.array([bool(k) for k in columns.matched_keywords], dtype=bool)
+        good_matches_count = int((is_good & with_keywords).sum())
+        bad_matches_count = int((is_bad & with_keywords).sum())
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            power_ratios = np.where(counts.total > 0, counts.good / counts.total, 0.0)
+
+        # Analysiere jedes Keyword (haeufigste zuerst)
+        for idx in counts.order_by_total():
+            total = int(counts.total[idx])
             if total < MIN_KEYWORD_OCCURRENCES:
                 continue
 
-            good_count = keyword_good.get(kw, 0)
-            bad_count = keyword_bad.get(kw, 0)
+            kw = counts.terms[idx]
+            good_count = int(counts.good[idx])
+            bad_count = int(counts.bad[idx])
 
             # Power-Ratio: Anteil guter Matches an allen Vorkommen
-            power_ratio = good_count / total if total > 0 else 0.0
+            power_ratio = float(power_ratios[idx])
 
             # Bestimme Gewicht
             if power_ratio >= MIN_POWER_RATIO and good_count >= 2:
@@ -552,7 +544,7 @@ class CalibrationService:
 
     def _find_exclusion_pairs(
         self,
-        matches: list[dict],
+        pair_stats: list[GroupStats],
         result: CalibrationResult,
     ) -> None:
         """
@@ -563,27 +555,17 @@ class CalibrationService:
         - ALLE ai_scores < EXCLUSION_THRESHOLD (0.2)
         - Oder: Durchschnitt < 0.15 und kein einzelner > 0.3
         """
-        pair_scores: dict[tuple[str, str], list[float]] = defaultdict(list)
-
-        for m in matches:
-            job_role = m["job_role"]
-            cand_role = m["candidate_role"]
-            if job_role and cand_role:
-                pair_scores[(job_role, cand_role)].append(m["ai_score"])
-
-        for (job_role, cand_role), scores in sorted(pair_scores.items()):
-            if len(scores) < MIN_SAMPLES_FOR_EXCLUSION:
+        for stats in pair_stats:
+            if stats.count < MIN_SAMPLES_FOR_EXCLUSION:
                 continue
 
-            avg_score = sum(scores) / len(scores)
-            max_score = max(scores)
-
             # Strenge Kriterien: Durchschnitt < 0.15 UND kein Ausreisser > 0.3
-            if avg_score < 0.15 and max_score < 0.3:
+            if stats.mean < 0.15 and stats.max < 0.3:
+                job_role, cand_role = stats.key
                 result.exclusion_pairs.append([job_role, cand_role])
                 logger.info(
                     f"Ausschluss-Paar: {job_role} x {cand_role}: "
-                    f"Avg={avg_score:.2f}, Max={max_score:.2f} (n={len(scores)})"
+                    f"Avg={stats.mean:.2f}, Max={stats.max:.2f} (n={stats.count})"
                 )
 
     # ──────────────────────────────────────────────────
@@ -592,7 +574,7 @@ class CalibrationService:
 
     def _analyze_strength_weakness_patterns(
         self,
-        matches: list[dict],
+        columns: AIMatchColumns,
         result: CalibrationResult,
     ) -> None:
         """
@@ -609,113 +591,85 @@ class CalibrationService:
         # Schluesselwoerter extrahieren aus Staerken/Schwaechen-Texten
         # z.B. "5 Jahre DATEV-Erfahrung" → "datev"
         # z.B. "Keine SAP-Kenntnisse" → "sap"
+        is_good = columns.is_good
+        is_bad = columns.is_bad
 
-        # Zaehler pro extrahiertem Begriff
-        strengths_in_good: dict[str, int] = defaultdict(int)
-        strengths_in_bad: dict[str, int] = defaultdict(int)
-        weaknesses_in_good: dict[str, int] = defaultdict(int)
-        weaknesses_in_bad: dict[str, int] = defaultdict(int)
-
-        # Auch die rohen Texte sammeln fuer Top-Listen
-        raw_strengths_good: dict[str, int] = defaultdict(int)
-        raw_weaknesses_bad: dict[str, int] = defaultdict(int)
-
-        good_count = 0
-        bad_count = 0
-
-        for m in matches:
-            score = m["ai_score"]
-            is_good = score >= GOOD_MATCH_THRESHOLD
-            is_bad = score <= BAD_MATCH_THRESHOLD
-
-            if is_good:
-                good_count += 1
-            if is_bad:
-                bad_count += 1
-
-            # Staerken analysieren
-            for s in m["ai_strengths"]:
-                s_clean = s.strip()
-                if not s_clean:
-                    continue
-
-                # Rohen Text fuer Top-Listen
-                if is_good:
-                    raw_strengths_good[s_clean] += 1
-
-                # Schluesselwoerter extrahieren
-                terms = _extract_skill_terms(s_clean)
-                for term in terms:
-                    if is_good:
-                        strengths_in_good[term] += 1
-                    if is_bad:
-                        strengths_in_bad[term] += 1
-
-            # Schwaechen analysieren
-            for w in m["ai_weaknesses"]:
-                w_clean = w.strip()
-                if not w_clean:
-                    continue
-
-                # Rohen Text fuer Top-Listen
-                if is_bad:
-                    raw_weaknesses_bad[w_clean] += 1
-
-                # Schluesselwoerter extrahieren
-                terms = _extract_skill_terms(w_clean)
-                for term in terms:
-                    if is_good:
-                        weaknesses_in_good[term] += 1
-                    if is_bad:
-                        weaknesses_in_bad[term] += 1
-
-        # ── Top-Staerken in guten Matches (rohe Texte, sortiert) ──
-        result.top_strengths_good_matches = [
-            text for text, count in sorted(
-                raw_strengths_good.items(), key=lambda x: -x[1]
-            )[:15]
+        strengths_clean = [
+            [c for s in items if (c := s.strip())] for items in columns.ai_strengths
         ]
-
-        # ── Top-Schwaechen in schlechten Matches (rohe Texte, sortiert) ──
-        result.top_weaknesses_bad_matches = [
-            text for text, count in sorted(
-                raw_weaknesses_bad.items(), key=lambda x: -x[1]
-            )[:15]
+        weaknesses_clean = [
+            [c for w in items if (c := w.strip())] for items in columns.ai_weaknesses
         ]
 
-        # ── Alle Begriffe zusammenfuehren und Impact berechnen ──
-        all_terms = set(strengths_in_good) | set(strengths_in_bad) | \
-                    set(weaknesses_in_good) | set(weaknesses_in_bad)
+        # Term-Extraktion mit Cache: identische Texte wiederholen sich oft
+        term_cache: dict[str, list[str]] = {}
+
+        def _terms(texts: list[str]) -> list[str]:
+            out = []
+            for t in texts:
+                terms = term_cache.get(t)
+                if terms is None:
+                    terms = term_cache[t] = _extract_skill_terms(t)
+                out.extend(terms)
+            return out
+
+        # Gemeinsames Vokabular, damit Staerken/Schwaechen dieselben Term-IDs nutzen
+        term_vocab = Vocabulary()
+        strength_counts = term_counts(
+            [_terms(t) for t in strengths_clean], is_good, is_bad, vocab=term_vocab,
+        )
+        weakness_counts = term_counts(
+            [_terms(t) for t in weaknesses_clean], is_good, is_bad, vocab=term_vocab,
+        )
 
-        for term in all_terms:
-            sg = strengths_in_good.get(term, 0)
-            sb = strengths_in_bad.get(term, 0)
-            wg = weaknesses_in_good.get(term, 0)
-            wb = weaknesses_in_bad.get(term, 0)
-            total = sg + sb + wg + wb
+        # Rohe Texte fuer Top-Listen (Staerken aus guten, Schwaechen aus schlechten)
+        raw_vocab_s = Vocabulary()
+        raw_strengths = term_counts(strengths_clean, is_good, is_bad, vocab=raw_vocab_s)
+        raw_vocab_w = Vocabulary()
+        raw_weaknesses = term_counts(weaknesses_clean, is_good, is_bad, vocab=raw_vocab_w)
 
-            if total < 2:
-                continue  # Zu wenig Daten
+        with_sw = np.array(
+            [bool(s or w) for s, w in zip(columns.ai_strengths, columns.ai_weaknesses)],
+            dtype=bool,
+        )
+        good_count = int((is_good & with_sw).sum())
+        bad_count = int((is_bad & with_sw).sum())
 
-            # Impact Score berechnen:
-            # Positiv = als Staerke in guten + als Schwaeche in schlechten (fehlt = schlecht)
-            # Negativ = als Schwaeche in guten + als Staerke in schlechten (vorhanden = schlecht)
-            positive_signal = sg + wb  # Staerke+gut ODER Schwaeche+schlecht = Skill ist wichtig
-            negative_signal = sb + wg  # Staerke+schlecht ODER Schwaeche+gut = Skill irrelevant/schaedlich
+        # ── Top-Staerken in guten Matches (rohe Texte, sortiert) ──
+        result.top_strengths_good_matches = _top_terms(raw_strengths.terms, raw_strengths.good, 15)
 
-            if (positive_signal + negative_signal) > 0:
-                impact = (positive_signal - negative_signal) / (positive_signal + negative_signal)
-            else:
-                impact = 0.0
+        # ── Top-Schwaechen in schlechten Matches (rohe Texte, sortiert) ──
+        result.top_weaknesses_bad_matches = _top_terms(raw_weaknesses.terms, raw_weaknesses.bad, 15)
+
+        # ── Alle Begriffe zusammenfuehren und Impact berechnen (vektorisiert) ──
+        n_terms = len(term_vocab)
+        sg = _pad(strength_counts.good, n_terms)
+        sb = _pad(strength_counts.bad, n_terms)
+        wg = _pad(weakness_counts.good, n_terms)
+        wb = _pad(weakness_counts.bad, n_terms)
+        total = sg + sb + wg + wb
+
+        # Impact Score berechnen:
+        # Positiv = als Staerke in guten + als Schwaeche in schlechten (fehlt = schlecht)
+        # Negativ = als Schwaeche in guten + als Staerke in schlechten (vorhanden = schlecht)
+        positive_signal = sg + wb  # Staerke+gut ODER Schwaeche+schlecht = Skill ist wichtig
+        negative_signal = sb + wg  # Staerke+schlecht ODER Schwaeche+gut = Skill irrelevant/schaedlich
+        signal = positive_signal + negative_signal
+        with np.errstate(invalid="ignore", divide="ignore"):
+            impact = np.where(signal > 0, (positive_signal - negative_signal) / signal, 0.0)
+
+        for idx in np.flatnonzero(total >= 2):
+            term = term_vocab.items[idx]
+            term_impact = float(impact[idx])
 
             # Kategorie bestimmen
-            if impact >= 0.5 and sg >= 2 and wb >= 1:
+            if term_impact >= 0.5 and sg[idx] >= 2 and wb[idx] >= 1:
                 category = "must_have"
                 result.must_have_skills.append(term)
-            elif impact <= -0.5 and wb >= 2:
+            elif term_impact <= -0.5 and wb[idx] >= 2:
                 category = "deal_breaker"
                 result.deal_breaker_gaps.append(term)
-            elif impact > 0:
+            elif term_impact > 0:
                 category = "nice_to_have"
             else:
                 category = "minor_issue"
@@ -723,12 +677,12 @@ class CalibrationService:
             pattern = StrengthWeaknessPattern(
                 pattern=term,
                 category=category,
-                in_strengths_good=sg,
-                in_strengths_bad=sb,
-                in_weaknesses_good=wg,
-                in_weaknesses_bad=wb,
-                total_mentions=total,
-                impact_score=impact,
+                in_strengths_good=int(sg[idx]),
+                in_strengths_bad=int(sb[idx]),
+                in_weaknesses_good=int(wg[idx]),
+                in_weaknesses_bad=int(wb[idx]),
+                total_mentions=int(total[idx]),
+                impact_score=term_impact,
             )
             result.strength_weakness_patterns.append(pattern)
 
@@ -937,6 +891,19 @@ _STOP_WORDS = {
 }
 
 
+def _pad(counts: np.ndarray, size: int) -> np.ndarray:
+    """Fuellt ein Zaehl-Array mit Nullen auf die Vokabular-Groesse auf."""
+    if len(counts) >= size:
+        return counts
+    return np.concatenate([counts, np.zeros(size - len(counts), dtype=counts.dtype)])
+
+
+def _top_terms(terms: list[str], counts: np.ndarray, limit: int) -> list[str]:
+    """Die haeufigsten Terms (count > 0), bei Gleichstand in Auftritts-Reihenfolge."""
+    order = np.argsort(-counts, kind="stable")
+    return [terms[i] for i in order[:limit] if counts[i] > 0]
+
+
 def _extract_skill_terms(text: str) -> list[str]:
     """
     Extrahiert Fachbegriffe aus einem Staerken/Schwaechen-Text.
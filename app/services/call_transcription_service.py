@@ -5,14 +5,23 @@ Zwei-Stufen-Klassifizierung:
 2. GPT-4o-mini Stufe 1: Gesprächstyp erkennen (qualifizierung/kurz/kunde/sonstig)
 3. GPT-4o-mini Stufe 2: Strukturierte Felder extrahieren je nach Typ
 
+Lange Aufnahmen werden als Temp-Datei gestreamt, an MP3-Frame-Grenzen in
+Chunks geteilt und parallel transkribiert. Bei langen Transkripten läuft die
+Qualifizierungs-Extraktion parallel zur Klassifizierung (spekulativ).
+
 Kosten:
 - Whisper: $0.006/Min (~27 Cent für 45-Min-Gespräch)
 - GPT-4o-mini: ~$0.001-0.003 pro Analyse
 """
 
+import asyncio
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
 from uuid import UUID
 
 import httpx
@@ -28,6 +37,14 @@ WHISPER_PRICE_PER_MIN = 0.006
 GPT_INPUT_PER_1M = 0.15
 GPT_OUTPUT_PER_1M = 0.60
 
+# Streaming-Download + Chunking (Whisper-Limit: 25 MB pro Request)
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+AUDIO_CHUNK_BYTES = 8 * 1024 * 1024  # ~8 Min bei 128 kbit/s
+WHISPER_CONCURRENCY = 4
+# Ab dieser Transkript-Länge ist fast immer ein Qualifizierungsgespräch →
+# Extraktion startet parallel zur Klassifizierung
+SPECULATIVE_EXTRACT_MIN_CHARS = 6000
+
 
 # ── Stufe 1: Gesprächstyp erkennen ──
 CLASSIFY_SYSTEM_PROMPT = """Du bist ein Recruiting-Assistent. Du analysierst Transkriptionen von Telefonaten und bestimmst den Gesprächstyp.
@@ -246,6 +263,59 @@ _VALID_17Q_KEYS = {
 }
 
 
+def _is_mp3_frame_header(header: bytes) -> bool:
+    """Prüft, ob 4 Bytes ein gültiger MPEG-Audio-Frame-Header sind."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return False
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate = header[2] >> 4
+    sample_rate = (header[2] >> 2) & 0x03
+    return version != 1 and layer != 0 and bitrate not in (0, 15) and sample_rate != 3
+
+
+def _mp3_chunk_ranges(path: Path, chunk_bytes: int = AUDIO_CHUNK_BYTES) -> list[tuple[int, int]]:
+    """Teilt eine MP3-Datei in Byte-Bereiche, die an Frame-Grenzen beginnen.
+
+    Jeder Bereich ist für sich eine abspielbare MP3-Datei (kein Re-Encoding
+    nötig). Andere Formate oder kleine Dateien bleiben ein einziger Bereich.
+    """
+    size = path.stat().st_size
+    if size <= chunk_bytes:
+        return [(0, size)]
+
+    with path.open("rb") as f:
+        head = f.read(10)
+        if not (head[:3] == b"ID3" or _is_mp3_frame_header(head[:4])):
+            return [(0, size)]
+
+        starts = [0]
+        pos = chunk_bytes
+        while pos < size:
+            f.seek(pos)
+            window = f.read(64 * 1024)
+            offset = next(
+                (
+                    i for i in range(len(window) - 3)
+                    if window[i] == 0xFF and _is_mp3_frame_header(window[i:i + 4])
+                ),
+                None,
+            )
+            if offset is None:
+                break
+            starts.append(pos + offset)
+            pos += offset + chunk_bytes
+
+    ends = starts[1:] + [size]
+    return list(zip(starts, ends))
+
+
+def _read_range(path: Path, start: int, end: int) -> bytes:
+    with path.open("rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
 class CallTranscriptionService:
     """Transkribiert Audio-Dateien und extrahiert strukturierte Daten."""
 
@@ -304,33 +374,39 @@ class CallTranscriptionService:
         if transcript_text:
             transcript = transcript_text
             logger.info(f"Transkript direkt übergeben ({len(transcript)} Zeichen)")
-        else:
-            # Audio beschaffen
-            audio_data = audio_bytes
-            if audio_url and not audio_data:
-                audio_data = await self._download_audio(audio_url)
-                if not audio_data:
-                    return {"success": False, "error": f"Audio-Download fehlgeschlagen: {audio_url}"}
-
-            if not audio_data:
-                return {"success": False, "error": "Weder audio_url, audio_bytes noch transcript_text übergeben"}
-
-            transcript, whisper_cost = await self._transcribe_audio(audio_data, audio_filename)
+        elif audio_bytes:
+            if len(audio_bytes) <= AUDIO_CHUNK_BYTES:
+                transcript, whisper_cost = await self._transcribe_audio(audio_bytes, audio_filename)
+            else:
+                audio_path = await asyncio.to_thread(self._write_temp_audio, audio_bytes, audio_filename)
+                try:
+                    transcript, whisper_cost = await self._transcribe_file(audio_path, audio_filename)
+                finally:
+                    audio_path.unlink(missing_ok=True)
+            total_cost += whisper_cost
+            if not transcript:
+                return {"success": False, "error": "Whisper-Transkription fehlgeschlagen"}
+        elif audio_url:
+            audio_path = await self._download_audio(audio_url)
+            if not audio_path:
+                return {"success": False, "error": f"Audio-Download fehlgeschlagen: {audio_url}"}
+            try:
+                transcript, whisper_cost = await self._transcribe_file(audio_path, audio_filename)
+            finally:
+                audio_path.unlink(missing_ok=True)
             total_cost += whisper_cost
             if not transcript:
                 return {"success": False, "error": "Whisper-Transkription fehlgeschlagen"}
+        else:
+            return {"success": False, "error": "Weder audio_url, audio_bytes noch transcript_text übergeben"}
 
         logger.info(f"Transkript: {len(transcript)} Zeichen für Kandidat {candidate.full_name}")
 
-        # ── Schritt 2: Gesprächstyp klassifizieren ──
-        call_type, classify_cost = await self._classify_call(transcript)
-        total_cost += classify_cost
+        # ── Schritt 2+3: Gesprächstyp klassifizieren + Felder extrahieren ──
+        call_type, extracted, analysis_cost = await self._analyze_transcript(transcript, candidate)
+        total_cost += analysis_cost
         logger.info(f"Gesprächstyp: {call_type} für Kandidat {candidate.full_name}")
 
-        # ── Schritt 3: Felder extrahieren (je nach Typ) ──
-        extracted, extract_cost = await self._extract_fields(transcript, call_type, candidate)
-        total_cost += extract_cost
-
         # ── Schritt 4: DB-Update ──
         fields_updated = await self._apply_to_candidate(candidate, transcript, call_type, extracted)
 
@@ -357,18 +433,35 @@ class CallTranscriptionService:
     # Audio-Download
     # ────────────────────────────────────────────────────
 
-    async def _download_audio(self, url: str) -> bytes | None:
-        """Lädt Audio-Datei von URL herunter."""
+    async def _download_audio(self, url: str) -> Path | None:
+        """Streamt eine Audio-Datei in eine Temp-Datei (Aufrufer löscht sie)."""
+        suffix = Path(urlparse(url).path).suffix or ".mp3"
+        fd, tmp_name = tempfile.mkstemp(prefix="call-", suffix=suffix)
+        path = Path(tmp_name)
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(120.0)) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                logger.info(f"Audio heruntergeladen: {len(response.content)} Bytes von {url}")
-                return response.content
+            size = 0
+            with os.fdopen(fd, "wb") as f:
+                async with httpx.AsyncClient(timeout=httpx.Timeout(120.0)) as client:
+                    async with client.stream("GET", url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                            f.write(chunk)
+                            size += len(chunk)
+            logger.info(f"Audio heruntergeladen: {size} Bytes von {url}")
+            return path
         except Exception as e:
             logger.error(f"Audio-Download fehlgeschlagen: {e}")
+            path.unlink(missing_ok=True)
             return None
 
+    @staticmethod
+    def _write_temp_audio(audio_data: bytes, filename: str) -> Path:
+        """Schreibt Audio-Bytes in eine Temp-Datei (für das Chunking)."""
+        fd, tmp_name = tempfile.mkstemp(prefix="call-", suffix=Path(filename).suffix or ".mp3")
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio_data)
+        return Path(tmp_name)
+
     # ────────────────────────────────────────────────────
     # Whisper Transkription
     # ────────────────────────────────────────────────────
@@ -410,6 +503,59 @@ class CallTranscriptionService:
             logger.exception(f"Whisper-Fehler: {e}")
             return None, 0.0
 
+    async def _transcribe_file(self, path: Path, filename: str) -> tuple[str | None, float]:
+        """Transkribiert eine Audio-Datei chunkweise und parallel. Returns (transcript, cost).
+
+        Pro Chunk liegt nur dieser im Speicher; die Teil-Transkripte werden in
+        Aufnahme-Reihenfolge zusammengesetzt.
+        """
+        ranges = await asyncio.to_thread(_mp3_chunk_ranges, path)
+        stem, suffix = Path(filename).stem, Path(filename).suffix or ".mp3"
+        slots = asyncio.Semaphore(WHISPER_CONCURRENCY)
+
+        async def transcribe_chunk(index: int, start: int, end: int) -> tuple[str | None, float]:
+            async with slots:
+                data = await asyncio.to_thread(_read_range, path, start, end)
+                name = filename if len(ranges) == 1 else f"{stem}-{index + 1}{suffix}"
+                return await self._transcribe_audio(data, name)
+
+        results = await asyncio.gather(
+            *(transcribe_chunk(i, start, end) for i, (start, end) in enumerate(ranges))
+        )
+        if any(text is None for text, _ in results):
+            return None, sum(cost for _, cost in results)
+
+        if len(ranges) > 1:
+            logger.info(f"Whisper: {len(ranges)} Chunks parallel transkribiert")
+        transcript = " ".join(text for text, _ in results if text)
+        return transcript, sum(cost for _, cost in results)
+
+    # ────────────────────────────────────────────────────
+    # GPT-4o-mini: Klassifizierung + Extraktion
+    # ────────────────────────────────────────────────────
+
+    async def _analyze_transcript(self, transcript: str, candidate: Candidate) -> tuple[str, dict, float]:
+        """Klassifiziert und extrahiert. Returns (call_type, extracted_data, cost).
+
+        Lange Transkripte sind praktisch immer Qualifizierungsgespräche: dort
+        laufen Klassifizierung und Qualifizierungs-Extraktion parallel. Passt
+        der Typ nicht, wird die typgerechte Extraktion nachgeholt.
+        """
+        if len(transcript) < SPECULATIVE_EXTRACT_MIN_CHARS:
+            call_type, classify_cost = await self._classify_call(transcript)
+            extracted, extract_cost = await self._extract_fields(transcript, call_type, candidate)
+            return call_type, extracted, classify_cost + extract_cost
+
+        (call_type, classify_cost), (extracted, extract_cost) = await asyncio.gather(
+            self._classify_call(transcript),
+            self._extract_fields(transcript, "qualifizierung", candidate),
+        )
+        total_cost = classify_cost + extract_cost
+        if call_type != "qualifizierung":
+            extracted, extract_cost = await self._extract_fields(transcript, call_type, candidate)
+            total_cost += extract_cost
+        return call_type, extracted, total_cost
+
     # ────────────────────────────────────────────────────
     # GPT-4o-mini: Gesprächstyp klassifizieren
     # ────────────────────────────────────────────────────
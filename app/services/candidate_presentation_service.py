@@ -860,8 +860,6 @@ ORIGINAL-TEXT:
                 "has_genuine_reply": bool,
             }
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=cooldown_days)
-
         # Suche Firma (case-insensitive)
         company_result = await db.execute(
             select(Company.id)
@@ -874,7 +872,7 @@ ORIGINAL-TEXT:
         company_ids = [row[0] for row in company_result.all()]
 
         if not company_ids:
-            return {"blocked": False, "level": "green", "reason": "Neue Firma", "last_contacted_at": None, "has_genuine_reply": False}
+            return CandidatePresentationService.spam_verdict(False, None, cooldown_days)
 
         # Letzte Vorstellung finden
         last_presentation = await db.execute(
@@ -892,11 +890,29 @@ ORIGINAL-TEXT:
             .order_by(ClientPresentation.created_at.desc())
             .limit(1)
         )
-        last = last_presentation.first()
+        return CandidatePresentationService.spam_verdict(
+            True, last_presentation.first(), cooldown_days
+        )
+
+    @staticmethod
+    def spam_verdict(company_found: bool, last, cooldown_days: int = 7) -> dict:
+        """Bewertet die letzte Vorstellung einer Firma (ohne DB-Zugriff).
+
+        Args:
+            company_found: Ob die Firma in der DB existiert
+            last: Letzte nicht-stornierte Vorstellung (created_at, status,
+                  response_type) oder None
+
+        Wird von check_spam_block und vom Bulk-Upload (Set-basierte
+        Vorpruefung) gemeinsam genutzt.
+        """
+        if not company_found:
+            return {"blocked": False, "level": "green", "reason": "Neue Firma", "last_contacted_at": None, "has_genuine_reply": False}
 
         if not last:
             return {"blocked": False, "level": "green", "reason": "Noch nie kontaktiert", "last_contacted_at": None, "has_genuine_reply": False}
 
+        cutoff = datetime.now(timezone.utc) - timedelta(days=cooldown_days)
         last_contacted = last.created_at
         has_genuine_reply = last.response_type == "genuine_reply"
 
@@ -971,9 +987,14 @@ ORIGINAL-TEXT:
             .limit(1)
         )
         existing = presentation_result.first()
+        return CandidatePresentationService.already_presented_verdict(
+            existing is not None, existing.created_at if existing else None
+        )
 
-        if existing:
-            presented_at = existing.created_at
+    @staticmethod
+    def already_presented_verdict(found: bool, presented_at: datetime | None = None) -> dict:
+        """Ergebnis-Dict fuer check_already_presented (ohne DB-Zugriff)."""
+        if found:
             date_str = presented_at.strftime("%d.%m.%Y") if presented_at else "unbekannt"
             return {
                 "already_presented": True,
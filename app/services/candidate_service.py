@@ -200,6 +200,19 @@ class CandidateService:
             logger.info(f"Stale markiert: {result.rowcount} Matches fuer Kandidat {candidate_id} ({reason})")
         return result.rowcount
 
+    def build_list_query(self, filters: CandidateFilterParams):
+        """Gefilterte, sortierte Kandidaten-Abfrage ohne Pagination.
+
+        Gemeinsame Basis fuer die Kandidaten-Liste und den Streaming-Export.
+        """
+        query = self._apply_filters(select(Candidate), filters)
+
+        # Sortierung
+        sort_column = getattr(Candidate, filters.sort_by, Candidate.created_at)
+        if filters.sort_order == "asc":
+            return query.order_by(sort_column.asc().nullslast())
+        return query.order_by(sort_column.desc().nullslast())
+
     async def list_candidates(
         self,
         filters: CandidateFilterParams | None = None,
@@ -217,18 +230,7 @@ class CandidateService:
         filters = filters or CandidateFilterParams()
         pagination = pagination or PaginationParams()
 
-        # Basis-Query
-        query = select(Candidate)
-
-        # Filter anwenden
-        query = self._apply_filters(query, filters)
-
-        # Sortierung
-        sort_column = getattr(Candidate, filters.sort_by, Candidate.created_at)
-        if filters.sort_order == "asc":
-            query = query.order_by(sort_column.asc().nullslast())
-        else:
-            query = query.order_by(sort_column.desc().nullslast())
+        query = self.build_list_query(filters)
 
         # Total zählen
         count_query = select(func.count()).select_from(query.subquery())
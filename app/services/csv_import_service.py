@@ -21,6 +21,7 @@ from app.services.csv_validator import (
     ValidationResult,
     calculate_content_hash,
 )
+from app.templating import fragment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -432,6 +433,8 @@ class CSVImportService:
                 import_job.errors_detail["blacklisted_skipped"] = blacklisted
 
             await self.db.commit()
+            # Neue Staedte/Branchen im Filter-Panel anzeigen
+            fragment_cache.invalidate("filter_options")
 
             logger.info(
                 f"Import abgeschlossen: {import_job.id}, "
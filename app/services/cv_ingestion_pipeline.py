@@ -0,0 +1,239 @@
+"""CVIngestionPipeline — Massen-CV-Parsing in getrennten Stufen.
+
+Der alte Admin-Lauf hat jeden Kandidaten strikt nacheinander verarbeitet
+(Download → PyMuPDF im Event-Loop → OpenAI → naechster Kandidat). Hier
+laufen die Stufen ueberlappend, jede mit eigener Parallelitaet:
+
+1. Download     — bis download_concurrency gleichzeitige HTTP-Requests
+2. Extraktion   — PyMuPDF im Prozess-Pool (ein Worker pro Kern), per
+                  cv_pdf_hash wird unveraenderter Text wiederverwendet
+3. KI-Parsing   — bis llm_concurrency gleichzeitige OpenAI-Calls
+4. DB-Update    — ein Writer sammelt Ergebnisse und committet blockweise
+                  (kurze Transaktionen, Railway killt idle-in-transaction)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session_maker
+from app.models.candidate import Candidate
+from app.services.cv_parser_service import CVParserService, ParseResult
+from app.utils.pdf_extract import pdf_hash
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CONCURRENCY = 8
+LLM_CONCURRENCY = 5
+WRITE_BATCH_SIZE = 20
+# Teilbloecke spaetestens nach so vielen Sekunden schreiben (Fortschritt sichtbar)
+WRITE_FLUSH_SECONDS = 5.0
+
+
+@dataclass
+class CVJob:
+    """Ein zu parsender Kandidat (nur die Felder, die die Pipeline braucht)."""
+
+    candidate_id: UUID
+    cv_url: str
+    name: str
+    cv_pdf_hash: str | None = None
+    cv_text: str | None = None
+
+
+@dataclass
+class CVJobResult:
+    """Ergebnis einer Pipeline-Runde fuer einen Kandidaten."""
+
+    job: CVJob
+    parse_result: ParseResult | None = None
+    cv_text: str | None = None
+    digest: str | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return bool(self.parse_result and self.parse_result.success and self.parse_result.data)
+
+
+@dataclass
+class IngestionStats:
+    """Zaehler eines Pipeline-Laufs."""
+
+    total: int = 0
+    parsed: int = 0
+    failed: int = 0
+    total_tokens: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class CVIngestionPipeline:
+    """Parst viele CVs mit ueberlappenden Download-, Extraktions- und LLM-Stufen."""
+
+    def __init__(
+        self,
+        download_concurrency: int = DOWNLOAD_CONCURRENCY,
+        llm_concurrency: int = LLM_CONCURRENCY,
+        write_batch_size: int = WRITE_BATCH_SIZE,
+        vision_fallback: bool = False,
+        on_result: Callable[[CVJobResult], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ):
+        """
+        Args:
+            download_concurrency: Gleichzeitige CV-Downloads
+            llm_concurrency: Gleichzeitige OpenAI-Calls
+            write_batch_size: Ergebnisse pro DB-Commit
+            vision_fallback: Bild-PDFs per GPT-4o Vision parsen (teurer)
+            on_result: Callback nach dem Schreiben jedes Ergebnisses
+            should_stop: Abbruch-Pruefung (keine neuen Kandidaten mehr starten)
+        """
+        self.download_concurrency = download_concurrency
+        self.llm_concurrency = llm_concurrency
+        self.write_batch_size = write_batch_size
+        self.vision_fallback = vision_fallback
+        self.on_result = on_result
+        self.should_stop = should_stop or (lambda: False)
+        self.stats = IngestionStats()
+
+    async def run(self, jobs: list[CVJob]) -> IngestionStats:
+        """Verarbeitet alle Jobs und gibt die Statistik zurueck."""
+        self.stats = IngestionStats(total=len(jobs))
+        if not jobs:
+            return self.stats
+
+        download_sem = asyncio.Semaphore(self.download_concurrency)
+        llm_sem = asyncio.Semaphore(self.llm_concurrency)
+        # Begrenzt gleichzeitig gehaltene PDFs im Speicher
+        in_flight = asyncio.Semaphore(self.download_concurrency + 2 * self.llm_concurrency)
+        results: asyncio.Queue[CVJobResult | None] = asyncio.Queue()
+
+        async with async_session_maker() as db:
+            async with CVParserService(db) as parser:
+                writer = asyncio.create_task(self._writer(db, parser, results))
+
+                async def _run_one(job: CVJob) -> None:
+                    try:
+                        await results.put(await self._process(parser, job, download_sem, llm_sem))
+                    finally:
+                        in_flight.release()
+
+                tasks = []
+                for job in jobs:
+                    await in_flight.acquire()
+                    if self.should_stop():
+                        in_flight.release()
+                        logger.info("CV-Pipeline: Stop angefordert, keine neuen Kandidaten")
+                        break
+                    tasks.append(asyncio.create_task(_run_one(job)))
+
+                await asyncio.gather(*tasks)
+                await results.put(None)
+                await writer
+
+        return self.stats
+
+    # ── Stufen 1-3: Download, Extraktion, KI-Parsing ──
+
+    async def _process(
+        self,
+        parser: CVParserService,
+        job: CVJob,
+        download_sem: asyncio.Semaphore,
+        llm_sem: asyncio.Semaphore,
+    ) -> CVJobResult:
+        try:
+            async with download_sem:
+                pdf_bytes = await parser.download_cv(job.cv_url)
+
+            digest = pdf_hash(pdf_bytes)
+            cv_text = await parser.extract_cv_text(
+                pdf_bytes, digest, job.cv_pdf_hash, job.cv_text,
+            )
+
+            if cv_text and len(cv_text.strip()) >= 50:
+                async with llm_sem:
+                    parse_result = await parser.parse_cv_text(cv_text)
+            elif self.vision_fallback:
+                pdf_images = await parser.extract_images_from_pdf_async(pdf_bytes)
+                async with llm_sem:
+                    parse_result = await parser.parse_cv_with_vision(pdf_images)
+                cv_text = parse_result.raw_text or "[Vision-Parse]"
+            else:
+                return CVJobResult(job=job, digest=digest, error="PDF enthält keinen extrahierbaren Text")
+
+            return CVJobResult(job=job, parse_result=parse_result, cv_text=cv_text, digest=digest)
+
+        except Exception as e:
+            return CVJobResult(job=job, error=str(e))
+
+    # ── Stufe 4: DB-Update ──
+
+    async def _writer(
+        self,
+        db: AsyncSession,
+        parser: CVParserService,
+        results: "asyncio.Queue[CVJobResult | None]",
+    ) -> None:
+        batch: list[CVJobResult] = []
+        while True:
+            try:
+                item = await asyncio.wait_for(results.get(), timeout=WRITE_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                # Pipeline haengt an Downloads/LLM — Teilblock schon schreiben
+                if batch:
+                    await self._flush(db, parser, batch)
+                    batch = []
+                continue
+
+            if item is None:
+                break
+            batch.append(item)
+            if len(batch) >= self.write_batch_size:
+                await self._flush(db, parser, batch)
+                batch = []
+
+        if batch:
+            await self._flush(db, parser, batch)
+
+    async def _flush(self, db: AsyncSession, parser: CVParserService, batch: list[CVJobResult]) -> None:
+        """Schreibt einen Block Ergebnisse in einer kurzen Transaktion."""
+        ids = [r.job.candidate_id for r in batch]
+        try:
+            rows = await db.execute(select(Candidate).where(Candidate.id.in_(ids)))
+            candidates = {c.id: c for c in rows.scalars().all()}
+
+            for res in batch:
+                candidate = candidates.get(res.job.candidate_id)
+                if candidate is None:
+                    continue
+                if res.success:
+                    await parser._update_candidate_from_cv(candidate, res.parse_result.data, res.cv_text)
+                    candidate.cv_pdf_hash = res.digest
+                else:
+                    # Als fehlgeschlagen markieren - wird übersprungen bis neuer CV hochgeladen
+                    candidate.cv_parse_failed = True
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"CV-Pipeline: DB-Update fuer {len(batch)} Kandidaten fehlgeschlagen: {e}")
+            for res in batch:
+                res.parse_result = None
+                res.error = res.error or f"DB-Update fehlgeschlagen: {e}"
+
+        for res in batch:
+            if res.success:
+                self.stats.parsed += 1
+                self.stats.total_tokens += res.parse_result.tokens_used
+            else:
+                self.stats.failed += 1
+                error = res.error or (res.parse_result.error if res.parse_result else None)
+                self.stats.errors.append(f"{res.job.name}: {error}")
+            if self.on_result:
+                self.on_result(res)
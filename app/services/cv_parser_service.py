@@ -10,7 +10,11 @@ Dieser Service:
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from uuid import UUID
@@ -23,10 +27,52 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import limits, settings
 from app.models.candidate import Candidate
 from app.schemas.candidate import CVParseResult, EducationEntry, LanguageEntry, WorkHistoryEntry
+from app.utils.pdf_extract import extract_pdf_text, pdf_hash, render_pdf_pages
 
 logger = logging.getLogger(__name__)
 
 
+# ═══════════════════════════════════════════════════════════════
+# PDF-EXTRAKTION IM PROZESS-POOL
+# ═══════════════════════════════════════════════════════════════
+# PyMuPDF ist CPU-gebunden und haelt den GIL — direkt im Event-Loop
+# blockiert es den Webserver. Deshalb laeuft die Extraktion in einem
+# Prozess-Pool (ein Worker pro Kern). Extrahierter Text wird pro
+# PDF-Hash gecacht, damit Re-Parses die Extraktion ueberspringen.
+
+_PDF_TEXT_CACHE_SIZE = 256
+
+_pdf_pool: ProcessPoolExecutor | None = None
+_pdf_text_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Gibt den (lazy erstellten) Prozess-Pool fuer PDF-Extraktion zurueck."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn statt fork: kein Kopieren von Event-Loop/DB-Pool in die Worker
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 2,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Beendet den Prozess-Pool (App-Shutdown)."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+
+def _cache_pdf_text(key: str, text: str) -> None:
+    _pdf_text_cache[key] = text
+    _pdf_text_cache.move_to_end(key)
+    while len(_pdf_text_cache) > _PDF_TEXT_CACHE_SIZE:
+        _pdf_text_cache.popitem(last=False)
+
+
 # System-Prompt für CV-Parsing (optimiert für Geschwindigkeit)
 CV_PARSING_SYSTEM_PROMPT = """Extrahiere strukturierte Daten aus dem CV. Texte 1:1 uebernehmen, nicht umformulieren!
 
@@ -200,7 +246,9 @@ class CVParserService:
             raise ValueError(f"CV-Download fehlgeschlagen: {e}")
 
     def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
-        """Extrahiert Text aus einem PDF.
+        """Extrahiert Text aus einem PDF (synchron, blockiert den Aufrufer).
+
+        In async-Code extract_text_from_pdf_async() verwenden.
 
         Args:
             pdf_bytes: PDF als Bytes
@@ -211,37 +259,7 @@ class CVParserService:
         Raises:
             ValueError: Bei Extraktions-Fehler
         """
-        try:
-            import fitz  # PyMuPDF
-        except ImportError:
-            raise ValueError("PyMuPDF (fitz) nicht installiert")
-
-        try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text_parts = []
-
-            for page in doc:
-                text = page.get_text(sort=True)  # sort=True: Textbloecke visuell sortieren (oben→unten, links→rechts) — verhindert falsche Zuordnung von Bullets zu Firmen
-                if text:
-                    text_parts.append(text)
-
-            doc.close()
-
-            full_text = "\n\n".join(text_parts)
-
-            # Null-Bytes und andere Kontrollzeichen entfernen (PostgreSQL-kompatibel)
-            import re
-            full_text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", full_text)
-
-            if not full_text.strip():
-                raise ValueError("PDF enthält keinen extrahierbaren Text")
-
-            return full_text
-
-        except Exception as e:
-            if "PDF" in str(e) or "fitz" in str(e):
-                raise ValueError(f"PDF-Verarbeitung fehlgeschlagen: {e}")
-            raise
+        return extract_pdf_text(pdf_bytes)
 
     def extract_images_from_pdf(self, pdf_bytes: bytes, max_pages: int = 3) -> list[bytes]:
         """Rendert PDF-Seiten als PNG-Bilder (für Vision-Fallback).
@@ -253,23 +271,39 @@ class CVParserService:
         Returns:
             Liste von PNG-Bytes
         """
-        try:
-            import fitz  # PyMuPDF
-        except ImportError:
-            raise ValueError("PyMuPDF (fitz) nicht installiert")
+        return render_pdf_pages(pdf_bytes, max_pages)
 
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        images = []
+    async def extract_text_from_pdf_async(
+        self, pdf_bytes: bytes, digest: str | None = None,
+    ) -> str:
+        """Wie extract_text_from_pdf, aber im Prozess-Pool und mit Hash-Cache.
 
-        for i, page in enumerate(doc):
-            if i >= max_pages:
-                break
-            # Seite als Bild rendern (150 DPI für gute Qualität bei kleiner Größe)
-            pix = page.get_pixmap(dpi=150)
-            images.append(pix.tobytes("png"))
+        Args:
+            pdf_bytes: PDF als Bytes
+            digest: Optional bereits berechneter pdf_hash()
 
-        doc.close()
-        return images
+        Raises:
+            ValueError: Bei Extraktions-Fehler
+        """
+        key = digest or pdf_hash(pdf_bytes)
+        cached = _pdf_text_cache.get(key)
+        if cached is not None:
+            _pdf_text_cache.move_to_end(key)
+            return cached
+
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(get_pdf_pool(), extract_pdf_text, pdf_bytes)
+        _cache_pdf_text(key, text)
+        return text
+
+    async def extract_images_from_pdf_async(
+        self, pdf_bytes: bytes, max_pages: int = 3,
+    ) -> list[bytes]:
+        """Wie extract_images_from_pdf, aber im Prozess-Pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_pdf_pool(), render_pdf_pages, pdf_bytes, max_pages,
+        )
 
     async def parse_cv_with_vision(self, pdf_images: list[bytes]) -> ParseResult:
         """Parst CV-Bilder mit OpenAI Vision (GPT-4o).
@@ -672,12 +706,10 @@ class CVParserService:
         except ValueError as e:
             return candidate, ParseResult(success=False, error=str(e))
 
-        # Text extrahieren
-        cv_text = None
-        try:
-            cv_text = self.extract_text_from_pdf(pdf_bytes)
-        except ValueError:
-            pass  # Kein Text → Vision-Fallback
+        digest = pdf_hash(pdf_bytes)
+        cv_text = await self.extract_cv_text(
+            pdf_bytes, digest, candidate.cv_pdf_hash, candidate.cv_text,
+        )
 
         # Parsen: Text oder Vision
         if cv_text and len(cv_text.strip()) >= 50:
@@ -687,7 +719,7 @@ class CVParserService:
             # Fallback: Vision-Parsing (Bild-PDFs)
             logger.info(f"Vision-Fallback für Kandidat {candidate_id} (kein extrahierbarer Text)")
             try:
-                pdf_images = self.extract_images_from_pdf(pdf_bytes)
+                pdf_images = await self.extract_images_from_pdf_async(pdf_bytes)
                 parse_result = await self.parse_cv_with_vision(pdf_images)
                 cv_text = parse_result.raw_text or "[Vision-Parse]"
             except ValueError as e:
@@ -696,10 +728,40 @@ class CVParserService:
         if parse_result.success and parse_result.data:
             # Kandidat aktualisieren
             await self._update_candidate_from_cv(candidate, parse_result.data, cv_text)
+            candidate.cv_pdf_hash = digest
             await self.db.commit()
 
         return candidate, parse_result
 
+    async def extract_cv_text(
+        self,
+        pdf_bytes: bytes,
+        digest: str,
+        known_hash: str | None = None,
+        known_text: str | None = None,
+    ) -> str | None:
+        """Text eines CVs — ohne Extraktion, wenn das PDF unveraendert ist.
+
+        Reihenfolge: bekannter cv_text (gleicher cv_pdf_hash) →
+        Prozess-Cache → PyMuPDF im Prozess-Pool.
+
+        Args:
+            pdf_bytes: PDF als Bytes
+            digest: pdf_hash(pdf_bytes)
+            known_hash: cv_pdf_hash des Kandidaten
+            known_text: cv_text des Kandidaten
+
+        Returns:
+            Text oder None (kein extrahierbarer Text → Vision-Fallback)
+        """
+        if known_hash == digest and known_text and not known_text.startswith("[Vision-Parse"):
+            return known_text
+
+        try:
+            return await self.extract_text_from_pdf_async(pdf_bytes, digest)
+        except ValueError:
+            return None  # Kein Text → Vision-Fallback
+
     async def _update_candidate_from_cv(
         self,
         candidate: Candidate,
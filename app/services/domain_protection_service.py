@@ -13,10 +13,18 @@ Bounce-Schwellen:
 - Warnung: 3%
 - Pause: 5%
 - Spam-Complaints: 0.3% Sofort-Stopp
+
+Tages-Zaehler: domain_send_counter haelt die heutigen Sends pro Domain im
+Prozess (ein gruppierter Query pro Tag + periodischer Abgleich), Versender
+zaehlen per record_send hoch. check_domain_capacity ist damit in
+Versand-Schleifen O(1) ohne DB-Roundtrip.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import date, datetime, timezone, timedelta
+from typing import Callable
 
 from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,6 +48,35 @@ SENDING_WINDOWS = [
 BEST_DAYS = {1, 2, 3}  # Di, Mi, Do
 REDUCED_DAYS = {0, 4}   # Mo, Fr (-30%)
 
+# ── Tages-Zaehler ──
+# Abgleich mit der DB spaetestens nach so vielen Sekunden (Sends anderer
+# Worker, n8n-Cron-Follow-Ups, Akquise-Scheduler)
+SEND_COUNT_RECONCILE_SECONDS = 120
+# Limit fuer Domains ohne Eintrag (konservativ)
+UNKNOWN_DOMAIN_LIMIT = 30
+
+# Heute gesendete E-Mails pro Domain (inkl. Follow-Ups + Akquise-Mails).
+# DISTINCT Presentations mit mindestens einem Send heute — ein Record der
+# heute erstellt UND nachgefasst wurde zaehlt nur 1x.
+_DAILY_SEND_COUNTS_SQL = """
+    SELECT sender_domain, COUNT(*) FROM (
+        SELECT sender_domain FROM client_presentations
+        WHERE status != 'cancelled'
+        AND (
+            created_at >= :today_start
+            OR followup1_sent_at >= :today_start
+            OR followup2_sent_at >= :today_start
+        )
+        {presentation_domain_filter}
+        UNION ALL
+        SELECT sender_domain FROM acquisition_emails
+        WHERE sent_at >= :today_start
+        AND status = 'sent'
+        {acquisition_domain_filter}
+    ) sends
+    GROUP BY sender_domain
+"""
+
 
 def get_domain_from_email(email: str) -> str:
     """Extrahiert Domain aus E-Mail-Adresse."""
@@ -70,40 +107,113 @@ async def get_domain_limits(db: AsyncSession) -> dict[str, int]:
     return limits
 
 
-async def get_daily_send_count(db: AsyncSession, domain: str) -> int:
-    """Zaehlt heute gesendete E-Mails fuer eine Domain (inkl. Follow-Ups + Akquise-Mails).
+def _today_start() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
 
-    Zaehlt DISTINCT Presentations die heute mindestens einen Send hatten:
-    - Erstversand (created_at >= today)
-    - Follow-Up 1 (followup1_sent_at >= today)
-    - Follow-Up 2 (followup2_sent_at >= today)
-    Keine Doppelzaehlung: Ein Record der heute erstellt UND Follow-Up hatte zaehlt nur 1x.
+async def get_daily_send_counts(db: AsyncSession, domain: str | None = None) -> dict[str, int]:
+    """Zaehlt heute gesendete E-Mails pro Domain in einem gruppierten Query.
+
+    Nutzt die generierte Spalte sender_domain (indiziert) statt
+    email_from LIKE '%@domain'.
     """
-    today_start = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
+    params = {"today_start": _today_start()}
+    presentation_filter = acquisition_filter = ""
+    if domain:
+        params["domain"] = domain.lower()
+        presentation_filter = acquisition_filter = "AND sender_domain = :domain"
 
     result = await db.execute(
-        text("""
-            SELECT (
-                SELECT COUNT(*) FROM client_presentations
-                WHERE email_from LIKE :domain_pattern
-                AND status != 'cancelled'
-                AND (
-                    created_at >= :today_start
-                    OR followup1_sent_at >= :today_start
-                    OR followup2_sent_at >= :today_start
-                )
-            ) + (
-                SELECT COUNT(*) FROM acquisition_emails
-                WHERE from_email LIKE :domain_pattern
-                AND sent_at >= :today_start
-                AND status = 'sent'
-            )
-        """),
-        {"domain_pattern": f"%@{domain}", "today_start": today_start},
+        text(_DAILY_SEND_COUNTS_SQL.format(
+            presentation_domain_filter=presentation_filter,
+            acquisition_domain_filter=acquisition_filter,
+        )),
+        params,
     )
-    return result.scalar() or 0
+    return {row[0]: row[1] for row in result.all() if row[0]}
+
+
+async def get_daily_send_count(db: AsyncSession, domain: str) -> int:
+    """Zaehlt heute gesendete E-Mails fuer eine Domain direkt in der DB (ohne Cache)."""
+    counts = await get_daily_send_counts(db, domain)
+    return counts.get(domain.lower(), 0)
+
+
+class DomainSendCounter:
+    """In-Process-Tageszaehler fuer Sends pro Domain.
+
+    Wird einmal pro Tag aus get_daily_send_counts geladen und alle
+    `reconcile_seconds` mit der DB abgeglichen; dazwischen zaehlen die
+    Versender per record_send hoch. Domain-Limits werden mitgeladen.
+    """
+
+    def __init__(
+        self,
+        reconcile_seconds: float = SEND_COUNT_RECONCILE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.reconcile_seconds = reconcile_seconds
+        self._clock = clock
+        self._counts: dict[str, int] = {}
+        self._limits: dict[str, int] = {}
+        self._day: date | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        return (
+            self._day == datetime.now(timezone.utc).date()
+            and self._clock() - self._loaded_at < self.reconcile_seconds
+        )
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Laedt Zaehler + Limits nur, wenn neuer Tag oder Abgleich faellig."""
+        if self.is_fresh():
+            return
+        async with self._lock:
+            if not self.is_fresh():
+                await self.reconcile(db)
+
+    async def reconcile(self, db: AsyncSession) -> None:
+        """Ersetzt die lokalen Zaehler durch den DB-Stand."""
+        day = datetime.now(timezone.utc).date()
+        counts = await get_daily_send_counts(db)
+        limits = await get_domain_limits(db)
+        self._counts = counts
+        self._limits = limits
+        self._day = day
+        self._loaded_at = self._clock()
+
+    def invalidate(self) -> None:
+        """Naechster Zugriff laedt neu (z.B. nach Aenderung der Domain-Limits)."""
+        self._loaded_at = float("-inf")
+
+    def record_send(self, email_or_domain: str, count: int = 1) -> None:
+        """Zaehlt einen Send lokal hoch (ohne DB-Zugriff)."""
+        domain = get_domain_from_email(email_or_domain) if "@" in email_or_domain else email_or_domain.lower()
+        if not domain:
+            return
+        if self._day != datetime.now(timezone.utc).date():
+            # Tageswechsel: alter Stand verfaellt, naechstes ensure_fresh laedt neu
+            return
+        self._counts[domain] = self._counts.get(domain, 0) + count
+
+    def sent_today(self, domain: str) -> int:
+        return self._counts.get(domain, 0)
+
+    def limits(self) -> dict[str, int]:
+        return dict(self._limits or DEFAULT_DOMAIN_LIMITS)
+
+    def base_limit(self, domain: str) -> int:
+        return self.limits().get(domain, UNKNOWN_DOMAIN_LIMIT)
+
+
+domain_send_counter = DomainSendCounter()
+
+
+def record_send(email_from: str, count: int = 1) -> None:
+    """Meldet einen erfolgten Send an den Tageszaehler."""
+    domain_send_counter.record_send(email_from, count)
 
 
 async def check_domain_capacity(
@@ -127,15 +237,15 @@ async def check_domain_capacity(
     if not domain:
         return {"allowed": False, "domain": "", "reason": "Ungueltige E-Mail"}
 
-    limits = await get_domain_limits(db)
-    limit = limits.get(domain, 30)  # Unbekannte Domains: konservativ 30/Tag
+    await domain_send_counter.ensure_fresh(db)
+    limit = domain_send_counter.base_limit(domain)  # Unbekannte Domains: konservativ 30/Tag
 
     # Mo/Fr: Limit um 30% reduzieren
     today = datetime.now(timezone.utc)
     is_reduced = today.weekday() in REDUCED_DAYS
     effective_limit = int(limit * 0.7) if is_reduced else limit
 
-    sent_today = await get_daily_send_count(db, domain)
+    sent_today = domain_send_counter.sent_today(domain)
     remaining = max(0, effective_limit - sent_today)
 
     return {
@@ -253,14 +363,14 @@ async def get_all_domain_stats(db: AsyncSession) -> list[dict]:
     Returns:
         Liste von {domain, sent_today, limit, remaining, percentage}
     """
-    limits = await get_domain_limits(db)
+    await domain_send_counter.ensure_fresh(db)
     today = datetime.now(timezone.utc)
     is_reduced = today.weekday() in REDUCED_DAYS
 
     stats = []
-    for domain, base_limit in limits.items():
+    for domain, base_limit in domain_send_counter.limits().items():
         effective_limit = int(base_limit * 0.7) if is_reduced else base_limit
-        sent = await get_daily_send_count(db, domain)
+        sent = domain_send_counter.sent_today(domain)
         remaining = max(0, effective_limit - sent)
         stats.append({
             "domain": domain,
@@ -8,7 +8,6 @@ Nutzt OpenAI text-embedding-3-small (1536 Dimensionen):
 """
 
 import logging
-import math
 from typing import Any
 from uuid import UUID
 
@@ -19,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.models.candidate import Candidate
 from app.models.job import Job
+from app.services import similarity
 
 logger = logging.getLogger(__name__)
 
@@ -599,24 +599,9 @@ class EmbeddingService:
         return stats
 
     # ═══════════════════════════════════════════════════════════════
-    # SIMILARITY-SUCHE (Python Cosine-Similarity + PostGIS Distanz)
+    # SIMILARITY-SUCHE (vektorisierte Cosine-Similarity + PostGIS Distanz)
     # ═══════════════════════════════════════════════════════════════
 
-    @staticmethod
-    def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-        """Berechnet die Cosine-Similarity zwischen zwei Vektoren.
-
-        Rein Python — kein numpy noetig. Performant genug fuer ~2000 Kandidaten.
-        """
-        dot_product = sum(a * b for a, b in zip(vec_a, vec_b))
-        norm_a = math.sqrt(sum(a * a for a in vec_a))
-        norm_b = math.sqrt(sum(b * b for b in vec_b))
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot_product / (norm_a * norm_b)
-
     async def find_similar_candidates(
         self,
         job_id: UUID,
@@ -628,10 +613,10 @@ class EmbeddingService:
         Ablauf:
         1. Job-Embedding laden
         2. Alle Finance-Kandidaten mit Embedding + Distanz laden (PostGIS-Filter in SQL)
-        3. Cosine-Similarity in Python berechnen
+        3. Cosine-Similarity vektorisiert berechnen (app.services.similarity)
         4. Top N zurueckgeben
 
-        Performant genug fuer ~2000 Finance-Kandidaten (< 100ms in Python).
+        Ein Matrix-Vektor-Produkt ueber alle Kandidaten im Umkreis.
 
         Args:
             job_id: Job-ID
@@ -695,20 +680,19 @@ class EmbeddingService:
             },
         )
 
-        # ── Schritt 2: Cosine-Similarity in Python berechnen ──
+        # ── Schritt 2: Cosine-Similarity vektorisiert (eine Matrix-Operation) ──
+        rows = [
+            row for row in result.all()
+            if isinstance(row[1], list) and len(row[1]) > 0  # JSONB → Python list
+        ]
+        similarities = similarity.cosine_batch(job_embedding, [row[1] for row in rows])
+
         scored_candidates = []
-        for row in result.all():
-            cand_id = row[0]
-            cand_embedding = row[1]  # JSONB → Python list
+        for row, score in zip(rows, similarities):
             distance_km = row[2]
-
-            if not isinstance(cand_embedding, list) or len(cand_embedding) == 0:
-                continue
-
-            similarity = self._cosine_similarity(job_embedding, cand_embedding)
             scored_candidates.append({
-                "candidate_id": cand_id,
-                "similarity": round(similarity, 4),
+                "candidate_id": row[0],
+                "similarity": round(score, 4),
                 "distance_km": round(float(distance_km), 1) if distance_km is not None else None,
             })
 
@@ -0,0 +1,82 @@
+"""Streaming-Export grosser Ergebnismengen als CSV oder XLSX.
+
+Der Export liest ueber einen serverseitigen Cursor (session.stream +
+yield_per) in Bloecken von EXPORT_BATCH_ROWS Zeilen und schreibt jeden Block
+sofort in die StreamingResponse. Speicherbedarf ist damit konstant, der
+Download beginnt mit der Kopfzeile, bevor die erste Zeile gelesen ist.
+
+Die Abfrage laeuft in einer eigenen Session: die Request-Session (get_db)
+ist beim Streamen des Bodys bereits geschlossen. Zwischen zwei Bloecken
+wartet der Generator nur auf den Client — ein sehr langsamer Client kann
+daher an das Idle-in-Transaction-Limit (30s) stossen. Bricht die Abfrage
+ab, wird der Fehler weitergereicht: die Chunked-Response endet ohne
+Abschluss, der Download schlaegt sichtbar fehl statt unvollstaendig zu sein.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Callable, Sequence
+from urllib.parse import quote
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.database import async_session_maker
+from app.utils.tabular_export import EXPORT_WRITERS
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_ROWS = 1000
+
+ExportField = tuple[str, str]  # (Schluessel im Item, Spaltenueberschrift)
+
+
+async def stream_export_rows(
+    query: Select,
+    fields: Sequence[ExportField],
+    to_item: Callable[[Any], dict],
+    fmt: str = "csv",
+) -> AsyncIterator[bytes]:
+    """Erzeugt die Datei blockweise: Kopfzeile, Datenbloecke, Abschluss."""
+    writer = EXPORT_WRITERS[fmt]()
+    keys = [key for key, _ in fields]
+    yield writer.start([label for _, label in fields])
+
+    rows_written = 0
+    try:
+        async with async_session_maker() as session:
+            result = await session.stream(
+                query.execution_options(yield_per=EXPORT_BATCH_ROWS)
+            )
+            async for partition in result.partitions():
+                items = [to_item(row) for row in partition]
+                rows_written += len(items)
+                yield writer.rows([[item.get(key) for key in keys] for item in items])
+    except Exception as e:
+        # Status 200 ist schon raus — kein Abschluss schreiben, sonst sieht
+        # eine abgeschnittene Datei aus wie ein vollstaendiger Export
+        logger.error(f"Export nach {rows_written} Zeilen abgebrochen: {e}")
+        raise
+
+    yield writer.finish()
+    logger.info(f"Export ({fmt}) abgeschlossen: {rows_written} Zeilen")
+
+
+def streaming_export(
+    query: Select,
+    fields: Sequence[ExportField],
+    to_item: Callable[[Any], dict],
+    fmt: str,
+    filename: str,
+) -> StreamingResponse:
+    """StreamingResponse mit Download-Header fuer einen Export."""
+    writer_cls = EXPORT_WRITERS[fmt]
+    full_name = f"{filename}.{writer_cls.extension}"
+    return StreamingResponse(
+        stream_export_rows(query, fields, to_item, fmt),
+        media_type=writer_cls.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(full_name)}",
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,309 @@
+"""Feedback Analytics — Spaltenbasierter Analyse-Kern fuer Lernen und Kalibrierung.
+
+Ersetzt die verschachtelten Python-Schleifen in MatchingLearningService und
+CalibrationService durch NumPy-Arrays, die einmal pro Lauf aufgebaut werden:
+
+1. Trennkraft (good vs. bad) pro Score-Komponente
+   → FeatureMatrix (n x k, NaN = fehlender Wert) + SeparationAccumulator
+   → Accumulator haelt laufende Summen und kann inkrementell nur neue
+     Feedbacks einrechnen (kein 500-Zeilen-Limit mehr)
+
+2. Rollen-Paar-Statistiken (Count, Mittelwert, Min, Max)
+   → role_pair_stats() via bincount / ufunc.at
+
+3. Keyword-Lift (Vorkommen in guten / schlechten / allen Matches)
+   → term_counts() ueber flache (Zeile, Term-ID)-Arrays
+
+Kosten: $0.00 (alles lokal, kein KI-Aufruf)
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+
+# ══════════════════════════════════════════════════════════════════
+# TRENNKRAFT (Score-Komponenten)
+# ══════════════════════════════════════════════════════════════════
+
+@dataclass
+class FeatureMatrix:
+    """Feature-Snapshots als dichte Matrix.
+
+    values: float64-Array (n_rows x n_components), NaN wenn Komponente fehlt
+    is_good: bool-Array (n_rows,), True = "good", False = "bad"
+    """
+    components: list[str]
+    values: np.ndarray
+    is_good: np.ndarray
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[dict | None, str]],
+        components: Sequence[str],
+    ) -> "FeatureMatrix":
+        """Baut die Matrix aus (features, outcome)-Tupeln.
+
+        Zeilen ohne Features oder mit anderem Outcome als good/bad werden ignoriert.
+        Nicht-numerische Werte werden wie fehlende Werte behandelt.
+        """
+        comps = list(components)
+        flat: list[float] = []
+        outcomes: list[bool] = []
+        nan = float("nan")
+
+        for features, outcome in rows:
+            if not features or outcome not in ("good", "bad"):
+                continue
+            for comp in comps:
+                val = features.get(comp)
+                flat.append(float(val) if isinstance(val, (int, float)) else nan)
+            outcomes.append(outcome == "good")
+
+        values = np.array(flat, dtype=np.float64).reshape(len(outcomes), len(comps))
+        return cls(
+            components=comps,
+            values=values,
+            is_good=np.array(outcomes, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+
+@dataclass
+class ComponentSeparation:
+    """Trennkraft einer Komponente (Durchschnitt good - Durchschnitt bad)."""
+    component: str
+    avg_good: float
+    avg_bad: float
+    count_good: int
+    count_bad: int
+
+    @property
+    def separation(self) -> float:
+        return self.avg_good - self.avg_bad
+
+
+class SeparationAccumulator:
+    """Laufende Summen pro Komponente und Outcome.
+
+    Erlaubt inkrementelles Lernen: Nach dem ersten Voll-Lauf werden nur noch
+    Feedbacks mit created_at > watermark geladen und per update() eingerechnet.
+    """
+
+    def __init__(self, components: Sequence[str]):
+        self.components = list(components)
+        k = len(self.components)
+        self.sum_good = np.zeros(k, dtype=np.float64)
+        self.sum_bad = np.zeros(k, dtype=np.float64)
+        self.count_good = np.zeros(k, dtype=np.int64)
+        self.count_bad = np.zeros(k, dtype=np.int64)
+        self.rows_seen = 0
+        self.rows_skipped = 0  # geladene Zeilen ohne Features (nicht in der Matrix)
+        self.watermark: datetime | None = None
+
+    def update(
+        self,
+        matrix: FeatureMatrix,
+        watermark: datetime | None = None,
+        rows_skipped: int = 0,
+    ) -> None:
+        """Rechnet eine FeatureMatrix in die laufenden Summen ein.
+
+        rows_skipped: geladene Zeilen, die from_rows verworfen hat — zaehlen
+        fuer den Abgleich mit der DB, nicht fuer die Statistik.
+        """
+        if matrix.components != self.components:
+            raise ValueError("FeatureMatrix hat andere Komponenten als der Accumulator")
+        self.rows_skipped += rows_skipped
+
+        if len(matrix):
+            present = ~np.isnan(matrix.values)
+            filled = np.where(present, matrix.values, 0.0)
+            good = matrix.is_good[:, None]
+            bad = ~good
+
+            self.sum_good += (filled * good).sum(axis=0)
+            self.sum_bad += (filled * bad).sum(axis=0)
+            self.count_good += (present & good).sum(axis=0)
+            self.count_bad += (present & bad).sum(axis=0)
+            self.rows_seen += len(matrix)
+
+        if watermark is not None and (self.watermark is None or watermark > self.watermark):
+            self.watermark = watermark
+
+    def results(self) -> list[ComponentSeparation]:
+        """Durchschnitte pro Komponente (0.0 wenn keine Werte vorhanden)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_good = np.where(self.count_good > 0, self.sum_good / self.count_good, 0.0)
+            avg_bad = np.where(self.count_bad > 0, self.sum_bad / self.count_bad, 0.0)
+
+        return [
+            ComponentSeparation(
+                component=comp,
+                avg_good=float(avg_good[i]),
+                avg_bad=float(avg_bad[i]),
+                count_good=int(self.count_good[i]),
+                count_bad=int(self.count_bad[i]),
+            )
+            for i, comp in enumerate(self.components)
+        ]
+
+    def separation_power(self, min_samples: int = 0) -> dict[str, float]:
+        """Trennkraft pro Komponente; 0.0 wenn good/bad < min_samples Werte haben."""
+        return {
+            r.component: (
+                r.separation
+                if r.count_good >= min_samples and r.count_bad >= min_samples
+                else 0.0
+            )
+            for r in self.results()
+        }
+
+
+# ══════════════════════════════════════════════════════════════════
+# INTERNING (Strings → Integer-IDs)
+# ══════════════════════════════════════════════════════════════════
+
+class Vocabulary:
+    """Vergibt fortlaufende Integer-IDs in Reihenfolge des ersten Auftretens."""
+
+    def __init__(self):
+        self._ids: dict = {}
+        self.items: list = []
+
+    def intern(self, item) -> int:
+        idx = self._ids.get(item)
+        if idx is None:
+            idx = len(self.items)
+            self._ids[item] = idx
+            self.items.append(item)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+# ══════════════════════════════════════════════════════════════════
+# ROLLEN-PAARE
+# ══════════════════════════════════════════════════════════════════
+
+@dataclass
+class GroupStats:
+    """Aggregierte Scores pro Gruppe (z.B. Rollen-Paar)."""
+    key: object
+    count: int
+    mean: float
+    min: float
+    max: float
+
+
+def group_score_stats(
+    group_ids: np.ndarray, scores: np.ndarray, n_groups: int,
+) -> list[GroupStats]:
+    """Count/Mean/Min/Max pro Gruppen-ID (ohne Keys — siehe role_pair_stats)."""
+    counts = np.bincount(group_ids, minlength=n_groups)
+    sums = np.bincount(group_ids, weights=scores, minlength=n_groups)
+    mins = np.full(n_groups, np.inf)
+    maxs = np.full(n_groups, -np.inf)
+    np.minimum.at(mins, group_ids, scores)
+    np.maximum.at(maxs, group_ids, scores)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+
+    return [
+        GroupStats(
+            key=i,
+            count=int(counts[i]),
+            mean=float(means[i]),
+            min=float(mins[i]),
+            max=float(maxs[i]),
+        )
+        for i in range(n_groups)
+    ]
+
+
+def role_pair_stats(
+    job_roles: Sequence[str],
+    candidate_roles: Sequence[str],
+    scores: np.ndarray,
+) -> list[GroupStats]:
+    """Statistiken pro (job_role, candidate_role), sortiert nach Paar.
+
+    Zeilen mit leerer Rolle werden ignoriert.
+    """
+    vocab = Vocabulary()
+    ids = np.empty(len(job_roles), dtype=np.int64)
+    keep = np.zeros(len(job_roles), dtype=bool)
+    for i, (jr, cr) in enumerate(zip(job_roles, candidate_roles)):
+        if jr and cr:
+            ids[i] = vocab.intern((jr, cr))
+            keep[i] = True
+
+    if not len(vocab):
+        return []
+
+    stats = group_score_stats(ids[keep], np.asarray(scores, dtype=np.float64)[keep], len(vocab))
+    for s in stats:
+        s.key = vocab.items[s.key]
+    stats.sort(key=lambda s: s.key)
+    return stats
+
+
+# ══════════════════════════════════════════════════════════════════
+# TERM-ZAEHLUNG (Keywords, Staerken/Schwaechen)
+# ══════════════════════════════════════════════════════════════════
+
+@dataclass
+class TermCounts:
+    """Zaehlungen pro Term: gesamt, in guten und in schlechten Zeilen.
+
+    Terms sind in Reihenfolge des ersten Auftretens (fuer stabile Sortierung).
+    """
+    terms: list
+    total: np.ndarray
+    good: np.ndarray
+    bad: np.ndarray
+
+    def order_by_total(self) -> np.ndarray:
+        """Indizes nach total absteigend, bei Gleichstand in Auftritts-Reihenfolge."""
+        return np.argsort(-self.total, kind="stable")
+
+
+def term_counts(
+    term_lists: Sequence[Iterable],
+    is_good: np.ndarray,
+    is_bad: np.ndarray,
+    vocab: Vocabulary | None = None,
+) -> TermCounts:
+    """Zaehlt Term-Vorkommen pro Zeile, gesplittet nach good/bad.
+
+    Jedes Vorkommen zaehlt (auch Duplikate in derselben Zeile), wie in den
+    bisherigen Schleifen. Leere Terms muessen vom Aufrufer gefiltert werden.
+    """
+    if vocab is None:
+        vocab = Vocabulary()
+    row_idx: list[int] = []
+    term_idx: list[int] = []
+    for i, terms in enumerate(term_lists):
+        for t in terms:
+            row_idx.append(i)
+            term_idx.append(vocab.intern(t))
+
+    n = len(vocab)
+    rows = np.array(row_idx, dtype=np.int64)
+    tids = np.array(term_idx, dtype=np.int64)
+    good_w = np.asarray(is_good, dtype=np.float64)[rows] if len(rows) else np.zeros(0)
+    bad_w = np.asarray(is_bad, dtype=np.float64)[rows] if len(rows) else np.zeros(0)
+
+    return TermCounts(
+        terms=list(vocab.items),
+        total=np.bincount(tids, minlength=n).astype(np.int64),
+        good=np.bincount(tids, weights=good_w, minlength=n).astype(np.int64),
+        bad=np.bincount(tids, weights=bad_w, minlength=n).astype(np.int64),
+    )
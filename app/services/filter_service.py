@@ -21,6 +21,7 @@ from app.schemas.filters import (
     JobSortBy,
     SortOrder,
 )
+from app.templating import fragment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -366,6 +367,7 @@ class FilterService:
         )
         self.db.add(city)
         await self.db.commit()
+        fragment_cache.invalidate("priority_cities")
         await self.db.refresh(city)
 
         return city
@@ -394,6 +396,7 @@ class FilterService:
             new_cities.append(city)
 
         await self.db.commit()
+        fragment_cache.invalidate("priority_cities")
 
         return new_cities
 
@@ -405,6 +408,7 @@ class FilterService:
 
         await self.db.delete(city)
         await self.db.commit()
+        fragment_cache.invalidate("priority_cities")
 
         return True
 
@@ -435,6 +439,7 @@ class FilterService:
         )
         self.db.add(preset)
         await self.db.commit()
+        fragment_cache.invalidate("filter_presets")
         await self.db.refresh(preset)
 
         return preset
@@ -447,6 +452,7 @@ class FilterService:
 
         await self.db.delete(preset)
         await self.db.commit()
+        fragment_cache.invalidate("filter_presets")
 
         return True
 
@@ -463,6 +469,7 @@ class FilterService:
 
         preset.is_default = True
         await self.db.commit()
+        fragment_cache.invalidate("filter_presets")
         await self.db.refresh(preset)
 
         return preset
@@ -13,6 +13,7 @@ from app.api.exception_handlers import NotFoundException
 from app.config import Limits
 from app.models import Job, Match, PriorityCity
 from app.schemas import JobCreate, JobFilterParams, JobUpdate, PaginatedResponse
+from app.templating import fragment_cache
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,10 @@ class JobService:
 
         job = Job(**job_data)
         self.db.add(job)
-        await self.db.flush()
+        await self.db.commit()
+        # Erst nach dem Commit invalidieren — sonst rendert ein paralleler
+        # Request noch den alten Stand unter der neuen Version
+        fragment_cache.invalidate("filter_options")
 
         logger.info(f"Job erstellt: {job.id} - {job.company_name} / {job.position}")
         return job
@@ -110,6 +114,7 @@ class JobService:
             setattr(job, field, value)
 
         await self.db.commit()
+        fragment_cache.invalidate("filter_options")
 
         # Betroffene Matches als stale markieren
         if stale_changed:
@@ -181,6 +186,7 @@ class JobService:
         )
 
         await self.db.commit()
+        fragment_cache.invalidate("filter_options")
 
         cascaded_count = cascade_result.rowcount
         logger.info(f"Job soft-deleted: {job_id}, {cascaded_count} ATSJobs cascaded")
@@ -210,6 +216,7 @@ class JobService:
         )
 
         await self.db.commit()
+        fragment_cache.invalidate("filter_options")
 
         cascaded_count = cascade_result.rowcount
         logger.info(f"Job wiederhergestellt: {job_id}, {cascaded_count} ATSJobs restored")
@@ -253,6 +260,7 @@ class JobService:
         )
 
         await self.db.commit()
+        fragment_cache.invalidate("filter_options")
 
         cascaded_count = cascade_result.rowcount
         logger.info(f"Batch-Delete: {len(jobs)} Jobs geloescht, {cascaded_count} ATSJobs cascaded")
@@ -271,6 +279,7 @@ class JobService:
         job = await self.get_job(job_id)
         await self.db.delete(job)
         await self.db.commit()
+        fragment_cache.invalidate("filter_options")
 
         logger.info(f"Job permanent gelöscht: {job_id}")
         return True
@@ -311,27 +320,8 @@ class JobService:
         Returns:
             PaginatedResponse mit Jobs
         """
-        # Basis-Query mit Company-Relationship fuer Domain-Anzeige
-        query = select(Job).options(selectinload(Job.company))
-
-        # Gelöschte ausschließen (außer explizit angefordert)
-        if not filters.include_deleted:
-            query = query.where(Job.deleted_at.is_(None))
-
-        # Abgelaufene ausschließen (außer explizit angefordert)
-        if not filters.include_expired:
-            query = query.where(
-                or_(
-                    Job.expires_at.is_(None),
-                    Job.expires_at > datetime.now(timezone.utc),
-                )
-            )
-
-        # Filter anwenden
-        query = self._apply_filters(query, filters)
-
-        # Sortierung mit Prio-Städte Unterstützung
-        query = await self._apply_sorting(query, filters)
+        # Company-Relationship fuer Domain-Anzeige
+        query = (await self.build_list_query(filters)).options(selectinload(Job.company))
 
         # Gesamtanzahl ermitteln
         count_query = select(func.count()).select_from(query.subquery())
@@ -359,6 +349,34 @@ class JobService:
             pages=pages,
         )
 
+    async def build_list_query(self, filters: JobFilterParams):
+        """
+        Gefilterte, sortierte Job-Abfrage ohne Pagination.
+
+        Gemeinsame Basis fuer die Job-Liste und den Streaming-Export, damit
+        beide dieselben Filter-Semantiken haben.
+        """
+        query = select(Job)
+
+        # Gelöschte ausschließen (außer explizit angefordert)
+        if not filters.include_deleted:
+            query = query.where(Job.deleted_at.is_(None))
+
+        # Abgelaufene ausschließen (außer explizit angefordert)
+        if not filters.include_expired:
+            query = query.where(
+                or_(
+                    Job.expires_at.is_(None),
+                    Job.expires_at > datetime.now(timezone.utc),
+                )
+            )
+
+        # Filter anwenden
+        query = self._apply_filters(query, filters)
+
+        # Sortierung mit Prio-Städte Unterstützung
+        return await self._apply_sorting(query, filters)
+
     def _apply_filters(self, query, filters: JobFilterParams):
         """Wendet Filter auf die Query an."""
         # Textsuche (Position oder Unternehmen)
@@ -7,19 +7,99 @@ Kosten OpenAI:
 - $0.02 pro 1M Tokens
 - 5.000 Kandidaten + 1.500 Jobs = ~$0.05 (einmalig)
 - Laufend: ~$0.01/Woche
+
+Durchsatz: embed_batch teilt Texte nach MAX_BATCH_SIZE und
+MAX_BATCH_TOKENS in Requests auf. Identische Texte werden nur einmal
+angefragt, fertige Vektoren liegen in einem prozessweiten LRU-Cache
+(Schluessel: Hash von Modell + Text).
 """
 
+import hashlib
 import logging
-import math
+from array import array
+from collections import OrderedDict
 from typing import Sequence
 
 import httpx
 
 from app.config import settings
+from app.services import similarity
 
 logger = logging.getLogger(__name__)
 
 
+# ══════════════════════════════════════════════════════════════════
+# VEKTOR-CACHE
+# ══════════════════════════════════════════════════════════════════
+
+class EmbeddingCache:
+    """LRU-Cache Text-Hash → Vektor, geteilt von allen EmbeddingService-Instanzen.
+
+    Vektoren werden als array('d') gehalten (~3 KB bei 384 Dimensionen
+    statt ~12 KB als Python-Liste).
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, array] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, dimensions: int, text: str) -> str:
+        raw = f"{model}|{dimensions}|{text}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        vector = self._entries.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return vector.tolist()
+
+    def set(self, key: str, vector: Sequence[float]) -> None:
+        self._entries[key] = array("d", vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ══════════════════════════════════════════════════════════════════
+# BATCHING
+# ══════════════════════════════════════════════════════════════════
+
+def estimate_tokens(text: str) -> int:
+    """Grobe Token-Schaetzung (deutsch: ~3 Zeichen pro Token, eher zu hoch)."""
+    return len(text) // 3 + 1
+
+
+def chunk_texts(texts: Sequence[str], max_items: int, max_tokens: int) -> list[list[str]]:
+    """Teilt Texte in Batches, die Anzahl- UND Token-Grenze einhalten."""
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class EmbeddingService:
     """Generiert 384-dimensionale Embeddings fuer Texte.
 
@@ -30,6 +110,11 @@ class EmbeddingService:
     MODEL = "text-embedding-3-small"
     DIMENSIONS = 384
     MAX_BATCH_SIZE = 100  # OpenAI erlaubt bis 2048, aber wir bleiben konservativ
+    MAX_BATCH_TOKENS = 200_000  # OpenAI-Limit pro Request: 300k Tokens
+    MAX_TEXT_CHARS = 20000
+    CACHE_SIZE = 4096
+
+    cache = EmbeddingCache(CACHE_SIZE)
 
     def __init__(self):
         self.api_key = settings.openai_api_key
@@ -56,48 +141,75 @@ class EmbeddingService:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
-    async def embed(self, text: str) -> list[float] | None:
-        """Erstellt ein 384-dim Embedding fuer einen einzelnen Text.
+    def _cache_key(self, text: str) -> str:
+        return EmbeddingCache.key(self.MODEL, self.DIMENSIONS, text)
 
-        Args:
-            text: Eingabetext (max ~8000 Tokens)
+    async def _request_embeddings(self, texts: list[str]) -> list[list[float] | None]:
+        """Ein API-Request fuer mehrere (bereits gekuerzte) Texte.
 
-        Returns:
-            384-dim float-Liste oder None bei Fehler
+        Schlaegt der Batch fehl, wird jeder Text einzeln versucht. Erfolgreiche
+        Vektoren landen im Cache.
         """
-        if not self.api_key or not text or not text.strip():
-            return None
-
-        # Text kuerzen (OpenAI Limit: ~8191 Tokens ≈ 30.000 Zeichen)
-        clean_text = text.strip()[:20000]
-
         client = await self._get_client()
+        results: list[list[float] | None] = [None] * len(texts)
         try:
             response = await client.post(
                 "/embeddings",
                 json={
                     "model": self.MODEL,
-                    "input": clean_text,
+                    "input": texts,
                     "dimensions": self.DIMENSIONS,
                 },
             )
             response.raise_for_status()
             data = response.json()
-            return data["data"][0]["embedding"]
+            for item in data["data"]:
+                idx = item["index"]
+                if idx < len(texts):
+                    results[idx] = item["embedding"]
 
         except httpx.TimeoutException:
-            logger.warning("Embedding Timeout")
-            return None
+            logger.warning(f"Embedding Timeout ({len(texts)} Texte)")
+            if len(texts) > 1:
+                return await self._request_individually(texts)
         except httpx.HTTPStatusError as e:
-            logger.error(f"Embedding API-Fehler: {e.response.status_code}")
-            return None
+            logger.error(f"Embedding API-Fehler: {e.response.status_code} ({len(texts)} Texte)")
+            if len(texts) > 1:
+                return await self._request_individually(texts)
         except Exception as e:
             logger.error(f"Embedding Fehler: {e}")
-            return None
+            if len(texts) > 1:
+                return await self._request_individually(texts)
+
+        for text, vector in zip(texts, results):
+            if vector:
+                self.cache.set(self._cache_key(text), vector)
+        return results
+
+    async def _request_individually(self, texts: list[str]) -> list[list[float] | None]:
+        """Fallback: Texte einzeln anfragen (ein kaputter Text blockiert nicht alle)."""
+        results = []
+        for text in texts:
+            results.extend(await self._request_embeddings([text]))
+        return results
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Erstellt ein 384-dim Embedding fuer einen einzelnen Text.
+
+        Args:
+            text: Eingabetext (max ~8000 Tokens)
+
+        Returns:
+            384-dim float-Liste oder None bei Fehler
+        """
+        return (await self.embed_batch([text]))[0]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float] | None]:
         """Erstellt Embeddings fuer mehrere Texte (Batch).
 
+        Cache-Treffer und doppelte Texte kosten keinen API-Call; der Rest
+        wird nach Anzahl und Token-Budget in Requests aufgeteilt.
+
         Args:
             texts: Liste von Texten
 
@@ -108,45 +220,23 @@ class EmbeddingService:
             return [None] * len(texts)
 
         results: list[list[float] | None] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
 
-        # In Batches aufteilen
-        for batch_start in range(0, len(texts), self.MAX_BATCH_SIZE):
-            batch_end = min(batch_start + self.MAX_BATCH_SIZE, len(texts))
-            batch_texts = []
-            batch_indices = []
-
-            for i in range(batch_start, batch_end):
-                text = texts[i]
-                if text and text.strip():
-                    batch_texts.append(text.strip()[:20000])
-                    batch_indices.append(i)
-
-            if not batch_texts:
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
                 continue
+            clean_text = text.strip()[:self.MAX_TEXT_CHARS]
+            cached = self.cache.get(self._cache_key(clean_text))
+            if cached is not None:
+                results[i] = cached
+            else:
+                missing.setdefault(clean_text, []).append(i)
 
-            client = await self._get_client()
-            try:
-                response = await client.post(
-                    "/embeddings",
-                    json={
-                        "model": self.MODEL,
-                        "input": batch_texts,
-                        "dimensions": self.DIMENSIONS,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                for item in data["data"]:
-                    idx = item["index"]
-                    if idx < len(batch_indices):
-                        results[batch_indices[idx]] = item["embedding"]
-
-            except Exception as e:
-                logger.error(f"Batch-Embedding Fehler: {e}")
-                # Fallback: Einzeln versuchen
-                for i, text in zip(batch_indices, batch_texts):
-                    results[i] = await self.embed(text)
+        for chunk in chunk_texts(list(missing), self.MAX_BATCH_SIZE, self.MAX_BATCH_TOKENS):
+            vectors = await self._request_embeddings(chunk)
+            for text, vector in zip(chunk, vectors):
+                for i in missing[text]:
+                    results[i] = vector
 
         return results
 
@@ -160,17 +250,7 @@ class EmbeddingService:
         Returns:
             Float zwischen -1.0 und 1.0
         """
-        if not a or not b or len(a) != len(b):
-            return 0.0
-
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot / (norm_a * norm_b)
+        return similarity.cosine(a, b)
 
     @staticmethod
     def cosine_similarity_batch(
@@ -179,7 +259,7 @@ class EmbeddingService:
     ) -> list[float]:
         """Berechnet Kosinus-Aehnlichkeit von einem Query gegen viele Kandidaten.
 
-        Optimiert fuer Batch-Vergleich (kein numpy noetig).
+        Vektorisiert ueber app.services.similarity (NumPy, Fallback Python).
 
         Args:
             query: Query-Vektor (384-dim)
@@ -188,29 +268,7 @@ class EmbeddingService:
         Returns:
             Liste von Similarity-Scores
         """
-        if not query or not candidates:
-            return []
-
-        # Query-Norm nur 1x berechnen
-        query_norm = math.sqrt(sum(x * x for x in query))
-        if query_norm == 0:
-            return [0.0] * len(candidates)
-
-        scores = []
-        for cand in candidates:
-            if not cand or len(cand) != len(query):
-                scores.append(0.0)
-                continue
-
-            dot = sum(q * c for q, c in zip(query, cand))
-            cand_norm = math.sqrt(sum(x * x for x in cand))
-
-            if cand_norm == 0:
-                scores.append(0.0)
-            else:
-                scores.append(dot / (query_norm * cand_norm))
-
-        return scores
+        return similarity.cosine_batch(query, candidates)
 
 
 # Singleton-Instanz
@@ -0,0 +1,290 @@
+"""Zentrale, kompilierte Matching-Konfiguration mit Hot-Reload.
+
+Bisher hatte jede Stelle ihren eigenen Loader:
+- MatchingEngineV2 cachte skill_weights.json / skill_hierarchy.json auf
+  Klassen-Level fuer immer (Aenderung erst nach Neustart)
+- _load_weights(job_category) fragte MatchV2ScoringWeight pro Job ab
+  (nur globale Gewichte waren gecached), dazu drive_time_score_threshold
+- matching_pipeline_v3 lud role_compatibility.json separat
+
+Hier entsteht daraus ein Snapshot (MatchingConfig), den alle Engine-
+Instanzen teilen:
+
+- Datei-Teil (FileConfig): neu kompiliert, wenn sich mtime/Groesse einer
+  Datei aendert (Pruefung hoechstens alle FILE_CHECK_SECONDS)
+- DB-Teil: Scoring-Gewichte aller Kategorien + Fahrzeit-Schwelle, neu
+  geladen, wenn sich system_settings.matching_config_version aendert
+  (Pruefung hoechstens alle DB_CHECK_SECONDS, ein kleines Query).
+  MatchingLearningService erhoeht die Version bei jeder Gewichtsaenderung.
+
+MatchingConfig.version / FileConfig.version taugen als Cache-Schluessel
+(z.B. fuer das Score-Memo). Die Strukturen sind read-only (MappingProxy /
+Tupel) und duerfen von Aufrufern nicht veraendert werden.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match_v2_models import MatchV2ScoringWeight
+from app.models.settings import SystemSetting
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+CONFIG_FILES = ("skill_weights.json", "skill_hierarchy.json", "role_compatibility.json")
+
+FILE_CHECK_SECONDS = 5.0
+DB_CHECK_SECONDS = 30.0
+
+VERSION_SETTING_KEY = "matching_config_version"
+DRIVE_TIME_SETTING_KEY = "drive_time_score_threshold"
+DEFAULT_DRIVE_TIME_THRESHOLD = 80
+
+
+# ══════════════════════════════════════════════════════════════════
+# KOMPILIERTE STRUKTUREN
+# ══════════════════════════════════════════════════════════════════
+
+
+@dataclass(frozen=True, slots=True)
+class FileConfig:
+    """Kompilierter Stand der Config-Dateien."""
+    version: str
+    skill_weights: Mapping[str, Any]  # rolle → kategorie → {weight, skills}
+    skill_to_category: Mapping[str, tuple[str, int]]  # "rolle::skill_lower" → (kategorie, weight)
+    skill_hierarchy: Mapping[str, Any]  # rolle → parent_skill → {children}
+    role_compatibility: Mapping[str, tuple[str, ...]]  # Kandidaten-Rolle → erlaubte Job-Rollen
+    allowed_candidate_roles: Mapping[str, frozenset[str]]  # Job-Rolle → Kandidaten-Rollen
+
+
+@dataclass(frozen=True, slots=True)
+class MatchingConfig:
+    """Snapshot aus Datei- und DB-Konfiguration."""
+    files: FileConfig
+    db_version: str
+    scoring_weights: Mapping[str | None, Mapping[str, float]]  # job_category (None = global)
+    drive_time_threshold: int = DEFAULT_DRIVE_TIME_THRESHOLD
+
+    @property
+    def version(self) -> str:
+        return f"{self.files.version}:{self.db_version}"
+
+    def weights_for(self, job_category: str | None) -> Mapping[str, float] | None:
+        """Kategorie-Gewichte, sonst globale; None wenn keine in der DB stehen."""
+        if job_category and job_category in self.scoring_weights:
+            return self.scoring_weights[job_category]
+        return self.scoring_weights.get(None)
+
+
+def _read_json(path: Path, digest) -> dict:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        logger.warning(f"{path.name} nicht gefunden: {path}")
+        return {}
+    digest.update(path.name.encode("utf-8") + b"\0" + raw)
+    return json.loads(raw)
+
+
+def compile_file_config(config_dir: Path = CONFIG_DIR) -> FileConfig:
+    """Liest und kompiliert alle Config-Dateien (JSON-Fehler werden geworfen)."""
+    digest = hashlib.sha1()
+    skill_weights = _read_json(config_dir / "skill_weights.json", digest)
+    skill_hierarchy = _read_json(config_dir / "skill_hierarchy.json", digest)
+    role_config = _read_json(config_dir / "role_compatibility.json", digest)
+
+    # Reverse-Lookup: rolle::skill_lower → (kategorie, weight)
+    skill_to_category = {}
+    for role, categories in skill_weights.items():
+        for cat_name, cat_data in categories.items():
+            weight = cat_data.get("weight", 5)
+            for skill in cat_data.get("skills", []):
+                skill_to_category[f"{role}::{skill.lower().strip()}"] = (cat_name, weight)
+
+    role_compatibility = {}
+    allowed_candidate_roles: dict[str, set[str]] = {}
+    for cand_role, config in role_config.items():
+        if cand_role.startswith("_"):
+            continue  # Kommentare
+        allowed = tuple(config.get("allowed_job_roles", []))
+        role_compatibility[cand_role] = allowed
+        for job_role in allowed:
+            allowed_candidate_roles.setdefault(job_role, set()).add(cand_role)
+
+    return FileConfig(
+        version=digest.hexdigest()[:12],
+        skill_weights=MappingProxyType(skill_weights),
+        skill_to_category=MappingProxyType(skill_to_category),
+        skill_hierarchy=MappingProxyType(skill_hierarchy),
+        role_compatibility=MappingProxyType(role_compatibility),
+        allowed_candidate_roles=MappingProxyType(
+            {role: frozenset(cands) for role, cands in allowed_candidate_roles.items()}
+        ),
+    )
+
+
+# ══════════════════════════════════════════════════════════════════
+# REGISTRY
+# ══════════════════════════════════════════════════════════════════
+
+
+class MatchingConfigRegistry:
+    """Haelt den aktuellen Snapshot und erneuert ihn bei Aenderungen."""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR):
+        self.config_dir = config_dir
+        self._files: FileConfig | None = None
+        self._file_stamp: tuple | None = None
+        self._files_checked_at = 0.0
+        self._config: MatchingConfig | None = None
+        self._db_checked_at = 0.0
+
+    def _stamp(self) -> tuple:
+        stamp = []
+        for name in CONFIG_FILES:
+            try:
+                stat = (self.config_dir / name).stat()
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def files(self) -> FileConfig:
+        """Datei-Konfiguration; bei geaenderter Datei neu kompiliert."""
+        now = time.monotonic()
+        if self._files is not None and now - self._files_checked_at < FILE_CHECK_SECONDS:
+            return self._files
+        self._files_checked_at = now
+
+        stamp = self._stamp()
+        if self._files is not None and stamp == self._file_stamp:
+            return self._files
+
+        try:
+            files = compile_file_config(self.config_dir)
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.error(f"Matching-Config Parse-Fehler: {e}")
+            if self._files is not None:
+                return self._files  # Letzten gueltigen Stand behalten
+            files = FileConfig(
+                version="empty",
+                skill_weights=MappingProxyType({}),
+                skill_to_category=MappingProxyType({}),
+                skill_hierarchy=MappingProxyType({}),
+                role_compatibility=MappingProxyType({}),
+                allowed_candidate_roles=MappingProxyType({}),
+            )
+
+        if self._files is not None:
+            logger.info(f"Matching-Config neu geladen: {self._files.version} → {files.version}")
+        self._files = files
+        self._file_stamp = stamp
+        return files
+
+    @property
+    def version(self) -> str | None:
+        """Version des zuletzt geladenen Snapshots (None vor dem ersten Laden)."""
+        return self._config.version if self._config else None
+
+    def invalidate(self) -> None:
+        """Naechstes get() prueft Dateien und DB sofort."""
+        self._files_checked_at = 0.0
+        self._db_checked_at = 0.0
+
+    async def get(self, db: AsyncSession) -> MatchingConfig:
+        """Aktueller Snapshot; DB-Version wird hoechstens alle DB_CHECK_SECONDS geprueft."""
+        files = self.files()
+        config = self._config
+        now = time.monotonic()
+        if config is not None and now - self._db_checked_at < DB_CHECK_SECONDS:
+            if config.files is not files:
+                config = self._config = MatchingConfig(
+                    files=files,
+                    db_version=config.db_version,
+                    scoring_weights=config.scoring_weights,
+                    drive_time_threshold=config.drive_time_threshold,
+                )
+            return config
+        self._db_checked_at = now
+
+        db_version = "0"
+        drive_time_threshold = DEFAULT_DRIVE_TIME_THRESHOLD
+        scoring_weights = config.scoring_weights if config else None
+        try:
+            result = await db.execute(
+                select(SystemSetting.key, SystemSetting.value).where(
+                    SystemSetting.key.in_([VERSION_SETTING_KEY, DRIVE_TIME_SETTING_KEY])
+                )
+            )
+            settings = dict(result.all())
+            db_version = settings.get(VERSION_SETTING_KEY) or "0"
+            if settings.get(DRIVE_TIME_SETTING_KEY) is not None:
+                drive_time_threshold = int(settings[DRIVE_TIME_SETTING_KEY])
+
+            if config is None or config.db_version != db_version:
+                result = await db.execute(
+                    select(
+                        MatchV2ScoringWeight.job_category,
+                        MatchV2ScoringWeight.component,
+                        MatchV2ScoringWeight.weight,
+                    )
+                )
+                by_category: dict[str | None, dict[str, float]] = {}
+                for category, component, weight in result.all():
+                    by_category.setdefault(category, {})[component] = weight
+                scoring_weights = MappingProxyType(
+                    {cat: MappingProxyType(w) for cat, w in by_category.items()}
+                )
+                logger.info(
+                    f"Scoring-Gewichte geladen: {len(by_category)} Kategorien "
+                    f"(Version {db_version})"
+                )
+        except Exception as e:
+            logger.warning(f"Matching-Config aus DB nicht ladbar, nutze letzten Stand: {e}")
+            if config is not None:
+                db_version = config.db_version
+                drive_time_threshold = config.drive_time_threshold
+
+        self._config = MatchingConfig(
+            files=files,
+            db_version=db_version,
+            scoring_weights=scoring_weights if scoring_weights is not None else MappingProxyType({}),
+            drive_time_threshold=drive_time_threshold,
+        )
+        return self._config
+
+
+matching_config_registry = MatchingConfigRegistry()
+
+
+async def bump_matching_config_version(db: AsyncSession) -> str:
+    """Markiert Gewichte/Einstellungen als geaendert (alle Worker laden neu).
+
+    Laeuft in der Transaktion des Aufrufers — wirksam mit dessen Commit.
+    """
+    version = uuid.uuid4().hex[:12]
+    await db.execute(
+        insert(SystemSetting)
+        .values(
+            key=VERSION_SETTING_KEY,
+            value=version,
+            description="Version der Matching-Konfiguration (automatisch)",
+        )
+        .on_conflict_do_update(
+            index_elements=[SystemSetting.key],
+            set_={"value": version, "updated_at": func.now()},
+        )
+    )
+    matching_config_registry.invalidate()
+    return version
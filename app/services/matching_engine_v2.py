@@ -7,14 +7,12 @@ Schicht 3: Pattern Boost/Penalty — gelernte Regeln anwenden
 Kosten pro Match: $0.00 (alles lokal/vorberechnet)
 """
 
-import json
 import logging
 import math
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Sequence
+from typing import Mapping, Sequence
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_, text, literal_column
@@ -23,11 +21,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.candidate import Candidate
 from app.models.job import Job
 from app.models.match import Match, MatchStatus
-from app.models.match_v2_models import (
-    MatchV2LearnedRule,
-    MatchV2ScoringWeight,
-)
+from app.models.match_v2_models import MatchV2LearnedRule
 from app.services.local_embedding_service import EmbeddingService
+from app.services.matching_config import (
+    FileConfig,
+    MatchingConfig,
+    matching_config_registry,
+)
+from app.services.score_memo import PairScore, ScoreMemo, fingerprint
+from app.services.skill_vocabulary import (
+    CandidateSkillProfile,
+    JobSkillEntry,
+    SkillVocabulary,
+)
+from app.services.spatial_candidate_service import (
+    SPATIAL_BATCH_SIZE,
+    SpatialCandidateIndex,
+    SpatialCandidateService,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +98,21 @@ class MatchResult:
     scoring_weights: dict
 
 
+@dataclass
+class V3JobContext:
+    """Job-Seite des V3-Scorings, einmal pro Job vorbereitet."""
+    job_level: int
+    job_skills: list[dict]
+    job_embedding: list[float] | None
+    job_industry: str | None
+    job_role: str | None
+    job_is_leadership: bool
+    has_job_skills: bool  # Expandierte Job-Skills vorhanden (sonst Skill-Tiefe neutral)
+    job_skill_profile: list[JobSkillEntry]
+    # Vokabular, mit dem job_skill_profile kompiliert wurde (IDs gelten nur dort)
+    skill_vocabulary: SkillVocabulary
+
+
 @dataclass
 class BatchMatchResult:
     """Ergebnis fuer einen Batch-Match-Lauf."""
@@ -137,70 +163,42 @@ class MatchingEngineV2:
     TOP_N = 50   # Max. Matches pro Job (zurueck von 200 — Bloat-Fix)
     MIN_SCORE = 25.0  # Matches unter diesem Score werden nicht gespeichert
 
-    # Skill-Weights Cache (Klassen-Level, einmal laden)
-    _skill_weights: dict | None = None
-    _skill_to_category: dict[str, tuple[str, int]] | None = None  # skill_lower → (kategorie, weight)
+    # Datei-Konfiguration (skill_weights/skill_hierarchy/role_compatibility) aus
+    # der MatchingConfigRegistry; abgeleitete Caches werden bei Reload verworfen
+    _file_config: FileConfig | None = None
+    _hierarchy_lookup: dict[str, dict[str, dict]] = {}  # rolle → parent_lower/normalisiert → config
+
+    # Kompiliertes Skill-Vokabular (Klassen-Level, waechst mit neuen Skills)
+    _skill_vocabulary: SkillVocabulary | None = None
 
-    # Skill-Hierarchie Cache (Klassen-Level, einmal laden)
-    _skill_hierarchy: dict | None = None
+    # Score-Memo ueber Laeufe hinweg (Tabelle match_v2_score_memo)
+    # SCORE_MEMO_VERSION erhoehen, wenn sich die V3-Bewertungslogik aendert
+    SCORE_MEMO_VERSION = 1
 
     @classmethod
-    def _load_skill_weights(cls) -> dict:
-        """Laedt skill_weights.json (cached auf Klassen-Level)."""
-        if cls._skill_weights is not None:
-            return cls._skill_weights
+    def _sync_file_config(cls) -> FileConfig:
+        """Aktuelle Datei-Konfiguration; bei Reload abgeleitete Caches verwerfen."""
+        files = matching_config_registry.files()
+        if files is not cls._file_config:
+            cls._file_config = files
+            cls._hierarchy_lookup = {}
+            cls._skill_vocabulary = None
+        return files
 
-        config_path = Path(__file__).parent.parent / "config" / "skill_weights.json"
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                cls._skill_weights = json.load(f)
-            # Baue Reverse-Lookup: skill_name_lower → (kategorie, weight)
-            cls._skill_to_category = {}
-            for role, categories in cls._skill_weights.items():
-                for cat_name, cat_data in categories.items():
-                    weight = cat_data.get("weight", 5)
-                    for skill in cat_data.get("skills", []):
-                        # Speichere pro Rolle: "bilanzbuchhalter::skill_lower" → (cat, weight)
-                        key = f"{role}::{skill.lower().strip()}"
-                        cls._skill_to_category[key] = (cat_name, weight)
-            logger.info(f"Skill-Weights geladen: {len(cls._skill_weights)} Rollen, {len(cls._skill_to_category)} Skill-Mappings")
-        except FileNotFoundError:
-            logger.warning(f"skill_weights.json nicht gefunden: {config_path}")
-            cls._skill_weights = {}
-            cls._skill_to_category = {}
-        except json.JSONDecodeError as e:
-            logger.error(f"skill_weights.json Parse-Fehler: {e}")
-            cls._skill_weights = {}
-            cls._skill_to_category = {}
-        return cls._skill_weights
+    @classmethod
+    def _load_skill_weights(cls) -> Mapping:
+        """skill_weights.json (kompiliert, geteilt ueber die MatchingConfigRegistry)."""
+        return cls._sync_file_config().skill_weights
 
     @classmethod
-    def _load_skill_hierarchy(cls) -> dict:
-        """Laedt skill_hierarchy.json (cached auf Klassen-Level).
+    def _load_skill_hierarchy(cls) -> Mapping:
+        """skill_hierarchy.json (kompiliert, geteilt ueber die MatchingConfigRegistry).
 
         Die Hierarchie definiert Parent→Children-Beziehungen fuer Skills.
         Beispiel: Job sucht 'Finanzbuchhaltung' → expandiert zu
         'Kreditorenbuchhaltung', 'Debitorenbuchhaltung', etc.
         """
-        if cls._skill_hierarchy is not None:
-            return cls._skill_hierarchy
-
-        config_path = Path(__file__).parent.parent / "config" / "skill_hierarchy.json"
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                cls._skill_hierarchy = json.load(f)
-            total_parents = sum(len(cats) for cats in cls._skill_hierarchy.values())
-            logger.info(
-                f"Skill-Hierarchie geladen: {len(cls._skill_hierarchy)} Rollen, "
-                f"{total_parents} Parent-Skills"
-            )
-        except FileNotFoundError:
-            logger.warning(f"skill_hierarchy.json nicht gefunden: {config_path}")
-            cls._skill_hierarchy = {}
-        except json.JSONDecodeError as e:
-            logger.error(f"skill_hierarchy.json Parse-Fehler: {e}")
-            cls._skill_hierarchy = {}
-        return cls._skill_hierarchy
+        return cls._sync_file_config().skill_hierarchy
 
     @classmethod
     def _expand_job_skills_with_hierarchy(
@@ -219,20 +217,21 @@ class MatchingEngineV2:
         Children bekommen dieselben Attribute (importance, category) wie der Parent,
         aber mit einem Flag 'from_hierarchy': True fuer Debugging.
         """
-        hierarchy = cls._load_skill_hierarchy()
-        role_hierarchy = hierarchy.get(job_role, {})
-        if not role_hierarchy:
+        role_hierarchy = cls._load_skill_hierarchy().get(job_role, {})
+        parent_lookup = cls._hierarchy_lookup.get(job_role)
+        if parent_lookup is None:
+            # Lookup einmal pro Rolle: parent_skill_lower → config
+            parent_lookup = {}
+            for parent_skill, config in role_hierarchy.items():
+                parent_lookup[parent_skill.lower().strip()] = config
+                # Auch Synonym-normalisierten Namen registrieren
+                normalized = cls._normalize_skill(parent_skill.lower().strip())
+                if normalized not in parent_lookup:
+                    parent_lookup[normalized] = config
+            cls._hierarchy_lookup[job_role] = parent_lookup
+        if not parent_lookup:
             return job_skills
 
-        # Baue Lookup: parent_skill_lower → config
-        parent_lookup: dict[str, dict] = {}
-        for parent_skill, config in role_hierarchy.items():
-            parent_lookup[parent_skill.lower().strip()] = config
-            # Auch Synonym-normalisierten Namen registrieren
-            normalized = cls._normalize_skill(parent_skill.lower().strip())
-            if normalized not in parent_lookup:
-                parent_lookup[normalized] = config
-
         # Sammle existierende Skill-Namen (lowercase) um Duplikate zu vermeiden
         existing_skills = {js.get("skill", "").lower().strip() for js in job_skills if isinstance(js, dict)}
 
@@ -283,21 +282,44 @@ class MatchingEngineV2:
     @classmethod
     def _get_skill_weight(cls, role: str, skill_name: str) -> int | None:
         """Gibt das Kategorie-Gewicht fuer einen Skill zurueck (oder None wenn nicht gefunden)."""
-        if cls._skill_to_category is None:
-            cls._load_skill_weights()
-        if not cls._skill_to_category:
+        skill_to_category = cls._sync_file_config().skill_to_category
+        if not skill_to_category:
             return None
         # Suche: rolle::skill_name_lower
         key = f"{role}::{skill_name.lower().strip()}"
-        result = cls._skill_to_category.get(key)
+        result = skill_to_category.get(key)
         if result:
             return result[1]
         # Auch normalisierten Skill-Namen versuchen
         normalized = cls._normalize_skill(skill_name)
         key_norm = f"{role}::{normalized}"
-        result = cls._skill_to_category.get(key_norm)
+        result = skill_to_category.get(key_norm)
         return result[1] if result else None
 
+    @classmethod
+    def _get_skill_vocabulary(cls) -> SkillVocabulary:
+        """Skill-Vokabular (Klassen-Level), vorbefuellt aus den Config-Dateien."""
+        cls._sync_file_config()
+        if cls._skill_vocabulary is None:
+            weights = cls._load_skill_weights()
+            hierarchy = cls._load_skill_hierarchy()
+            vocabulary = SkillVocabulary(
+                normalize=cls._normalize_skill,
+                extract_core=cls._extract_core_skill,
+                is_irrelevant=cls._is_irrelevant_skill,
+                skill_weight=cls._get_skill_weight,
+                skip_categories=cls._SKIP_CATEGORIES,
+            )
+            for categories in weights.values():
+                for cat_data in categories.values():
+                    vocabulary.warm(cat_data.get("skills", []))
+            for role_hierarchy in hierarchy.values():
+                for parent_skill, config in role_hierarchy.items():
+                    vocabulary.warm([parent_skill, *config.get("children", [])])
+            cls._skill_vocabulary = vocabulary
+            logger.info(f"Skill-Vokabular kompiliert: {len(vocabulary)} Skills")
+        return cls._skill_vocabulary
+
     @classmethod
     def _detect_job_role(cls, job_title: str | None, position: str | None, classification_data: dict | None = None) -> str | None:
         """Erkennt die Job-Rolle fuer Skill-Weight-Lookup.
@@ -306,8 +328,7 @@ class MatchingEngineV2:
         1. classification_data.primary_role (von Deep Classification) — zuverlaessigste Quelle
         2. Fallback: Titel/Position Keywords (wie bisher)
         """
-        if cls._skill_weights is None:
-            cls._load_skill_weights()
+        skill_weights = cls._load_skill_weights()
 
         # V2: classification_data hat hoechste Prioritaet
         if classification_data and isinstance(classification_data, dict):
@@ -323,7 +344,7 @@ class MatchingEngineV2:
                     "Steuerfachangestellte/r": "steuerfachangestellte",
                 }
                 role_key = role_mapping.get(primary_role)
-                if role_key and role_key in (cls._skill_weights or {}):
+                if role_key and role_key in skill_weights:
                     return role_key
 
         # Fallback: Titel/Position Keywords
@@ -374,49 +395,40 @@ class MatchingEngineV2:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._weights: dict[str, float] | None = None
+        self._config: MatchingConfig | None = None
         self._rules: list[dict] | None = None
         self._embedding_service = EmbeddingService()
+        # Batch-Modus: vorgeladene Kandidaten-Zeilen (id → Row) fuer Spatial-Jobs
+        self._batch_candidate_rows: dict[UUID, tuple] = {}
+        # Kompilierte Skill-Profile (Kandidat → Vokabular + IDs/Bitset), gueltig fuer diesen Lauf;
+        # nach einem Config-Reload (neues Vokabular) wird neu kompiliert
+        self._skill_profiles: dict[UUID, tuple[SkillVocabulary, CandidateSkillProfile]] = {}
+        # Kandidaten-Fingerprints fuer das Score-Memo, gueltig fuer diesen Lauf
+        self._candidate_versions: dict[UUID, str] = {}
+        # Persistiertes Score-Memo, pro Job geladen
+        self._score_memo = ScoreMemo(db)
+
+    async def _get_config(self) -> MatchingConfig:
+        """Config-Snapshot dieser Engine-Instanz (einmal geholt, dann fix).
+
+        Ein Batch-Lauf arbeitet so durchgehend mit demselben Stand und
+        stellt pro Job keine Config-Queries mehr.
+        """
+        if self._config is None:
+            self._config = await matching_config_registry.get(self.db)
+        return self._config
 
     async def _load_weights(self, job_category: str | None = None) -> dict[str, float]:
-        """Laedt aktuelle Scoring-Gewichte aus der DB.
+        """Scoring-Gewichte aus dem Config-Snapshot.
 
         Pro-Kategorie-Lernen: Wenn eine job_category angegeben wird,
-        werden zuerst kategorie-spezifische Gewichte gesucht.
+        werden zuerst kategorie-spezifische Gewichte genommen.
         Falls keine vorhanden → globale Gewichte (job_category IS NULL).
         Falls auch keine → DEFAULT_WEIGHTS.
         """
-        # Cache nur fuer globale Gewichte (pro-Job Gewichte werden frisch geladen)
-        if job_category is None and self._weights is not None:
-            return self._weights
-
-        if job_category:
-            # Versuche kategorie-spezifische Gewichte
-            result = await self.db.execute(
-                select(MatchV2ScoringWeight.component, MatchV2ScoringWeight.weight)
-                .where(MatchV2ScoringWeight.job_category == job_category)
-            )
-            rows = result.all()
-            if rows:
-                return {r[0]: r[1] for r in rows}
-
-        # Globale Gewichte (job_category IS NULL)
-        result = await self.db.execute(
-            select(MatchV2ScoringWeight.component, MatchV2ScoringWeight.weight)
-            .where(MatchV2ScoringWeight.job_category.is_(None))
-        )
-        rows = result.all()
-
-        if rows:
-            weights = {r[0]: r[1] for r in rows}
-        else:
-            weights = DEFAULT_WEIGHTS.copy()
-
-        # Nur globale Gewichte cachen
-        if job_category is None:
-            self._weights = weights
-
-        return weights
+        config = await self._get_config()
+        weights = config.weights_for(job_category)
+        return dict(weights) if weights else DEFAULT_WEIGHTS.copy()
 
     async def _load_rules(self) -> list[dict]:
         """Laedt aktive gelernte Regeln aus der DB."""
@@ -441,10 +453,129 @@ class MatchingEngineV2:
 
     # ── Schicht 1: Hard Filters ─────────────────────────────
 
+    @staticmethod
+    def _base_candidate_conditions() -> list:
+        """Job-unabhaengige Hard Filters (v2-Profil, nicht geloescht/hidden)."""
+        return [
+            Candidate.v2_profile_created_at.isnot(None),
+            Candidate.v2_seniority_level.isnot(None),
+            Candidate.deleted_at.is_(None),
+            Candidate.hidden == False,
+        ]
+
+    @staticmethod
+    def _candidate_columns(distance_expr) -> list:
+        """Spalten fuer MatchCandidate (Reihenfolge = Row-Index)."""
+        return [
+            Candidate.id,                    # 0
+            Candidate.v2_seniority_level,     # 1
+            Candidate.v2_career_trajectory,   # 2
+            Candidate.v2_years_experience,    # 3
+            Candidate.v2_structured_skills,   # 4
+            Candidate.v2_current_role_summary, # 5
+            Candidate.v2_embedding_current,   # 6
+            Candidate.v2_embedding_full,      # 7
+            Candidate.city,                   # 8
+            Candidate.hotlist_category,        # 9
+            distance_expr,                    # 10
+            # v2.5 Felder
+            Candidate.v2_certifications,      # 11
+            Candidate.v2_industries,          # 12
+            Candidate.erp,                    # 13
+            Candidate.hotlist_job_titles,      # 14
+            Candidate.manual_job_titles,       # 15
+            # Phase 10: PLZ + Koordinaten für Google Maps Fahrzeit
+            Candidate.postal_code,             # 16
+            func.ST_Y(func.ST_GeomFromWKB(Candidate.address_coords)).label("cand_lat"),  # 17
+            func.ST_X(func.ST_GeomFromWKB(Candidate.address_coords)).label("cand_lng"),  # 18
+            # v3: Kandidaten-Rolle fuer Gate-Checks
+            Candidate.hotlist_job_title,        # 19 (primary_role)
+            Candidate.classification_data,      # 20
+            Candidate.v2_profile_created_at,    # 21 (Sortierung im Batch-Modus)
+        ]
+
+    @staticmethod
+    def _row_to_match_candidate(row, distance_km: float | None) -> MatchCandidate:
+        """Baut einen MatchCandidate aus einer Zeile von _candidate_columns()."""
+        # Job-Titel zusammenmergen (hotlist + manual)
+        all_titles = list(row[14] or []) + list(row[15] or [])
+
+        return MatchCandidate(
+            id=row[0],
+            seniority_level=row[1] or 2,
+            career_trajectory=row[2] or "lateral",
+            years_experience=row[3] or 0,
+            structured_skills=row[4] or [],
+            current_role_summary=row[5] or "",
+            embedding_current=row[6],
+            embedding_full=row[7],
+            city=row[8],
+            hotlist_category=row[9],
+            distance_km=distance_km,
+            certifications=row[11] or [],
+            industries=row[12] or [],
+            erp=row[13] or [],
+            job_titles=all_titles,
+            postal_code=row[16],
+            _lat=row[17],
+            _lng=row[18],
+            # v3: Kandidaten-Rolle
+            primary_role=row[19],
+            classification_data=row[20] or {},
+        )
+
+    async def _preload_spatial_candidates(self, job_ids: list[UUID]) -> SpatialCandidateIndex:
+        """Batch-Modus: Ein Spatial-Join fuer alle Jobs + eine Abfrage fuer die Kandidaten.
+
+        Ersetzt das per-Job ST_DWithin-Query in _hard_filter_candidates fuer
+        alle Jobs mit Koordinaten (inkl. Firmen-Standort-Fallback).
+        """
+        spatial = await SpatialCandidateService(self.db).for_jobs(
+            job_ids,
+            radius_km=MAX_DISTANCE_KM,
+            candidate_conditions=self._base_candidate_conditions(),
+            company_fallback=True,
+        )
+
+        missing = spatial.candidate_ids - self._batch_candidate_rows.keys()
+        if missing:
+            result = await self.db.execute(
+                select(*self._candidate_columns(literal_column("NULL::float")))
+                .where(Candidate.id.in_(missing))
+            )
+            for row in result.all():
+                self._batch_candidate_rows[row[0]] = row
+
+        return spatial
+
+    def _filter_preloaded_candidates(
+        self,
+        job: Job,
+        pairs: list[tuple[UUID, float]],
+        min_level: int,
+        max_level: int,
+    ) -> list[MatchCandidate]:
+        """Job-spezifische Hard Filters auf vorgeladenen Kandidaten (wie SQL-Pfad)."""
+        rows = []
+        for cand_id, distance_km in pairs:
+            row = self._batch_candidate_rows.get(cand_id)
+            if row is None or not (min_level <= row[1] <= max_level):
+                continue
+            if job.hotlist_category and row[9] not in (job.hotlist_category, None):
+                continue
+            rows.append((row, distance_km))
+
+        # Gleiche Reihenfolge wie SQL: Embeddings zuerst, dann neueste Profile
+        rows.sort(key=lambda r: r[0][21], reverse=True)
+        rows.sort(key=lambda r: r[0][6] is None)
+
+        return [self._row_to_match_candidate(row, dist) for row, dist in rows[:2000]]
+
     async def _hard_filter_candidates(
         self,
         job: Job,
         job_level: int,
+        spatial: SpatialCandidateIndex | None = None,
     ) -> list[MatchCandidate]:
         """Schicht 1: SQL-basierte Hard Filters.
 
@@ -456,6 +587,9 @@ class MatchingEngineV2:
         - ZU WEIT WEG: >60km Luftlinie → HARD FILTER!
           (Remote-Jobs ueberspringen den Entfernungs-Filter)
 
+        Im Batch-Modus (spatial gesetzt) kommen Umkreis-Kandidaten aus dem
+        vorab berechneten Spatial-Join statt aus einem eigenen Query.
+
         Returns:
             Liste von MatchCandidate-Objekten (vorgeflitert)
         """
@@ -466,22 +600,30 @@ class MatchingEngineV2:
         # Prüfe ob Job Geodaten hat (fuer Distanz-Filter)
         job_has_coords = job.location_coords is not None
 
-        # Basis-Filter
-        conditions = [
-            Candidate.v2_profile_created_at.isnot(None),
-            Candidate.v2_seniority_level.isnot(None),
-            Candidate.v2_seniority_level >= min_level,
-            Candidate.v2_seniority_level <= max_level,
-            Candidate.deleted_at.is_(None),
-            Candidate.hidden == False,
-        ]
-
         # HARD FILTER: Entfernung max. 30km (wenn Job Koordinaten hat)
         # Remote-Jobs ueberspringen den Entfernungs-Filter komplett!
         # Kandidaten OHNE Koordinaten werden AUSGESCHLOSSEN (nicht mehr durchgelassen).
         # Grund: Sonst werden z.B. Kandidaten aus Bayern mit Jobs in Hamburg gematcht.
         job_is_remote = getattr(job, "work_arrangement", None) == "remote"
 
+        if spatial is not None and spatial.covers(job.id):
+            candidates = self._filter_preloaded_candidates(
+                job, spatial.candidates_for(job.id), min_level, max_level,
+            )
+            logger.info(
+                f"Hard Filter (Batch): {len(candidates)} Kandidaten fuer Job Level {job_level} "
+                f"(Range {min_level}-{max_level}, Category: {job.hotlist_category}, "
+                f"Distance Hard Filter: <={MAX_DISTANCE_KM}km)"
+            )
+            return candidates
+
+        # Basis-Filter
+        conditions = [
+            *self._base_candidate_conditions(),
+            Candidate.v2_seniority_level >= min_level,
+            Candidate.v2_seniority_level <= max_level,
+        ]
+
         if job_has_coords and not job_is_remote:
             conditions.append(
                 # Kandidat MUSS Koordinaten haben UND innerhalb MAX_DISTANCE_KM sein
@@ -511,32 +653,7 @@ class MatchingEngineV2:
             distance_expr = literal_column("NULL::float").label("distance_m")
 
         query = (
-            select(
-                Candidate.id,                    # 0
-                Candidate.v2_seniority_level,     # 1
-                Candidate.v2_career_trajectory,   # 2
-                Candidate.v2_years_experience,    # 3
-                Candidate.v2_structured_skills,   # 4
-                Candidate.v2_current_role_summary, # 5
-                Candidate.v2_embedding_current,   # 6
-                Candidate.v2_embedding_full,      # 7
-                Candidate.city,                   # 8
-                Candidate.hotlist_category,        # 9
-                distance_expr,                    # 10
-                # v2.5 Felder
-                Candidate.v2_certifications,      # 11
-                Candidate.v2_industries,          # 12
-                Candidate.erp,                    # 13
-                Candidate.hotlist_job_titles,      # 14
-                Candidate.manual_job_titles,       # 15
-                # Phase 10: PLZ + Koordinaten für Google Maps Fahrzeit
-                Candidate.postal_code,             # 16
-                func.ST_Y(func.ST_GeomFromWKB(Candidate.address_coords)).label("cand_lat"),  # 17
-                func.ST_X(func.ST_GeomFromWKB(Candidate.address_coords)).label("cand_lng"),  # 18
-                # v3: Kandidaten-Rolle fuer Gate-Checks
-                Candidate.hotlist_job_title,        # 19 (primary_role)
-                Candidate.classification_data,      # 20
-            )
+            select(*self._candidate_columns(distance_expr))
             .where(and_(*conditions))
             .order_by(
                 # Priorisiere Kandidaten mit Embeddings
@@ -553,33 +670,7 @@ class MatchingEngineV2:
         for row in rows:
             distance_m = row[10]  # Meter oder None
             distance_km = round(distance_m / 1000, 1) if distance_m is not None else None
-
-            # Job-Titel zusammenmergen (hotlist + manual)
-            all_titles = list(row[14] or []) + list(row[15] or [])
-
-            candidates.append(MatchCandidate(
-                id=row[0],
-                seniority_level=row[1] or 2,
-                career_trajectory=row[2] or "lateral",
-                years_experience=row[3] or 0,
-                structured_skills=row[4] or [],
-                current_role_summary=row[5] or "",
-                embedding_current=row[6],
-                embedding_full=row[7],
-                city=row[8],
-                hotlist_category=row[9],
-                distance_km=distance_km,
-                certifications=row[11] or [],
-                industries=row[12] or [],
-                erp=row[13] or [],
-                job_titles=all_titles,
-                postal_code=row[16],
-                _lat=row[17],
-                _lng=row[18],
-                # v3: Kandidaten-Rolle
-                primary_role=row[19],
-                classification_data=row[20] or {},
-            ))
+            candidates.append(self._row_to_match_candidate(row, distance_km))
 
         logger.info(
             f"Hard Filter: {len(candidates)} Kandidaten fuer Job Level {job_level} "
@@ -799,12 +890,13 @@ class MatchingEngineV2:
                 return core
         return name
 
-    def _is_irrelevant_skill(self, skill_name: str, category: str | None) -> bool:
+    @classmethod
+    def _is_irrelevant_skill(cls, skill_name: str, category: str | None) -> bool:
         """Prueft ob ein Skill fuer den fachlichen Overlap irrelevant ist.
 
         Ignoriert: Sprachen, Soft Skills (Teamarbeit, Analytisches Denken etc.)
         """
-        if category and category.lower() in self._SKIP_CATEGORIES:
+        if category and category.lower() in cls._SKIP_CATEGORIES:
             return True
 
         name = skill_name.lower().strip()
@@ -814,11 +906,11 @@ class MatchingEngineV2:
                        "spanisch", "italienisch", "russisch", "türkisch",
                        "tuerkisch", "polnisch", "tschechisch", "portugiesisch",
                        "niederländisch", "niederlaendisch"}
-        core = self._extract_core_skill(name)
+        core = cls._extract_core_skill(name)
         if core in known_langs:
             return True
         # Pattern: "Deutsch (sehr gut)", "Englisch (C1)" etc.
-        if self._LANG_BRACKET_RE.match(name) and core in known_langs:
+        if cls._LANG_BRACKET_RE.match(name) and core in known_langs:
             return True
 
         # Soft Skills erkennen
@@ -974,8 +1066,7 @@ class MatchingEngineV2:
         # ── Scoring-System waehlen ──
         use_weighted = (
             job_role is not None
-            and self._skill_weights is not None
-            and job_role in self._skill_weights
+            and job_role in self._load_skill_weights()
         )
 
         if use_weighted:
@@ -1356,7 +1447,7 @@ class MatchingEngineV2:
     # V3 SCORING: Qualification-First Multi-Gate Scoring
     # ═══════════════════════════════════════════════════════════════
 
-    # Rollen-Kompatibilitaets-Matrix (geladen aus Config oder inline)
+    # Rollen-Kompatibilitaets-Matrix: Fallback, falls role_compatibility.json fehlt
     _ROLE_COMPATIBILITY: dict[str, list[str]] = {
         "bilanzbuchhalter": ["bilanzbuchhalter", "finanzbuchhalter", "kreditorenbuchhalter", "debitorenbuchhalter", "steuerfachangestellte"],
         "finanzbuchhalter": ["finanzbuchhalter", "kreditorenbuchhalter", "debitorenbuchhalter"],
@@ -1408,8 +1499,8 @@ class MatchingEngineV2:
         """Prueft ob die Kandidaten-Rolle mit der Job-Rolle kompatibel ist."""
         if not job_role or not candidate_role:
             return True  # Wenn Rolle unbekannt, kein Gate (um Datenluecken nicht zu bestrafen)
-        allowed = self._ROLE_COMPATIBILITY.get(candidate_role, [])
-        return job_role in allowed
+        compatibility = self._sync_file_config().role_compatibility or self._ROLE_COMPATIBILITY
+        return job_role in compatibility.get(candidate_role, ())
 
     def _score_role_depth(self, candidate_role: str | None, job_role: str | None) -> int:
         """Layer 1A: Wie tief passt die Rolle? (0-15 Punkte)"""
@@ -1428,105 +1519,44 @@ class MatchingEngineV2:
             return 8
         return 5  # Sonstige erlaubte Kombination
 
-    # Recency-Modifier: aktuell=1.0, kuerzlich=0.75, veraltet=0.4
-    _RECENCY_MODIFIERS = {"aktuell": 1.0, "kuerzlich": 0.75, "veraltet": 0.4}
-
     def _score_skill_depth_v3(self, cand_skills: list[dict], job_skills: list[dict],
                                job_role: str | None, cand_certifications: list[str]) -> tuple[int, int]:
         """Layer 1B: Skill-Tiefe (0-20 Punkte) + Anzahl fachkenntnisse-Matches fuer Gate 2.
 
         Recency-Modifier: aktuell × 1.0, kuerzlich × 0.75, veraltet × 0.4
 
+        Im Scoring-Loop werden Job- und Kandidaten-Profil nur einmal
+        kompiliert (siehe _score_candidates_v3); diese Methode ist die
+        Einzelaufruf-Variante.
+
         Returns:
             (skill_points, fachkenntnisse_match_count)
         """
         if not job_skills:
             return 10, 1  # Keine Job-Skills → neutral
 
-        # Kandidaten-Skills normalisieren: name → recency
-        cand_skill_recency: dict[str, str] = {}
-        for s in (cand_skills or []):
-            if not isinstance(s, dict):
-                continue
-            name = self._normalize_skill(s.get("skill", "").lower().strip())
-            if name and not self._is_irrelevant_skill(name, s.get("category", "")):
-                recency = s.get("recency", "aktuell")
-                # Behalte den besten (aktuellsten) Wert
-                existing = cand_skill_recency.get(name)
-                if existing is None or self._RECENCY_MODIFIERS.get(recency, 1.0) > self._RECENCY_MODIFIERS.get(existing, 1.0):
-                    cand_skill_recency[name] = recency
-        # Zertifizierungen als Skills hinzufuegen (immer aktuell)
-        for cert in (cand_certifications or []):
-            cn = cert.lower().strip()
-            if cn:
-                cand_skill_recency[cn] = "aktuell"
-        # ERP-Skills aus structured_skills
-        for s in (cand_skills or []):
-            if not isinstance(s, dict):
-                continue
-            if s.get("category") in ("software", "erp", "tool"):
-                name = self._normalize_skill(s.get("skill", "").lower().strip())
-                if name:
-                    cand_skill_recency.setdefault(name, s.get("recency", "aktuell"))
-
-        cand_skill_names = set(cand_skill_recency.keys())
-
-        points = 0.0
-        fachkenntnisse_matches = 0
-
-        for js in job_skills:
-            if not isinstance(js, dict):
-                continue
-            js_name = self._normalize_skill(js.get("skill", "").lower().strip())
-            if not js_name or self._is_irrelevant_skill(js_name, js.get("category", "")):
-                continue
-
-            # Skill-Gewicht aus Config (default 5 wenn nicht in Config)
-            weight = (self._get_skill_weight(job_role, js_name) if job_role else 5) or 5
-            is_fachkenntnis = weight >= 9  # fachkenntnisse haben Gewicht 9-10
-            is_taetigkeit = 7 <= weight < 9
-            is_software = weight <= 4
-
-            if is_software:
-                continue  # Software wird in Layer 2 bewertet
-
-            # Match-Suche
-            match_score = 0.0
-            matched = False
-            matched_cand_skill = None
-
-            # Exact match
-            if js_name in cand_skill_names:
-                match_score = 2.0 if is_fachkenntnis else 1.5
-                matched = True
-                matched_cand_skill = js_name
-            else:
-                # Synonym match
-                for cs in cand_skill_names:
-                    core_js = self._extract_core_skill(js_name)
-                    core_cs = self._extract_core_skill(cs)
-                    if core_js and core_cs and core_js == core_cs:
-                        match_score = 1.5 if is_fachkenntnis else 1.0
-                        matched = True
-                        matched_cand_skill = cs
-                        break
-                    # Contains match
-                    if len(js_name) > 3 and len(cs) > 3:
-                        if js_name in cs or cs in js_name:
-                            match_score = 0.8 if is_fachkenntnis else 0.5
-                            matched = True
-                            matched_cand_skill = cs
-                            break
+        vocabulary = self._get_skill_vocabulary()
+        return vocabulary.score_depth(
+            vocabulary.job_profile(job_skills, job_role),
+            vocabulary.candidate_profile(cand_skills, cand_certifications),
+        )
 
-            if matched:
-                # Recency-Modifier anwenden
-                recency = cand_skill_recency.get(matched_cand_skill, "aktuell")
-                recency_mod = self._RECENCY_MODIFIERS.get(recency, 1.0)
-                points += match_score * recency_mod
-                if is_fachkenntnis:
-                    fachkenntnisse_matches += 1
+    def _candidate_skill_profile(
+        self, cand: MatchCandidate, vocabulary: SkillVocabulary | None = None,
+    ) -> CandidateSkillProfile:
+        """Kompiliertes Skill-Profil, pro Engine-Instanz und Vokabular einmal je Kandidat.
 
-        return min(20, int(round(points))), fachkenntnisse_matches
+        Skill-IDs und Bitsets gelten nur im Vokabular, das sie vergeben hat —
+        nach einem Config-Reload waehrend eines Laufs wird neu kompiliert.
+        """
+        if vocabulary is None:
+            vocabulary = self._get_skill_vocabulary()
+        cached = self._skill_profiles.get(cand.id)
+        if cached is not None and cached[0] is vocabulary:
+            return cached[1]
+        profile = vocabulary.candidate_profile(cand.structured_skills, cand.certifications)
+        self._skill_profiles[cand.id] = (vocabulary, profile)
+        return profile
 
     def _score_certification_match_v3(self, cand: MatchCandidate, job_role: str | None) -> int:
         """Layer 1C: Zertifizierungs-Match (0-10 Punkte)"""
@@ -1628,12 +1658,210 @@ class MatchingEngineV2:
             return 3  # Kandidat hat kein ERP
         return 1  # Cross-Ecosystem
 
+    # ── V3 Score-Memo ──
+
+    def _job_version(self, ctx: V3JobContext, job: Job) -> str:
+        """Fingerprint aller Job-Eingaben, die das ortsunabhaengige Scoring nutzt."""
+        return fingerprint(
+            {
+                "level": ctx.job_level,
+                "skills": ctx.job_skills,
+                "industry": ctx.job_industry,
+                "role": ctx.job_role,
+                "leadership": ctx.job_is_leadership,
+                "classification": getattr(job, "classification_data", None),
+            },
+            ctx.job_embedding,
+        )
+
+    def _candidate_version(self, cand: MatchCandidate) -> str:
+        """Fingerprint der Kandidaten-Eingaben (ohne Standort), pro Lauf gecached."""
+        version = self._candidate_versions.get(cand.id)
+        if version is None:
+            version = fingerprint(
+                {
+                    "level": cand.seniority_level,
+                    "trajectory": cand.career_trajectory,
+                    "skills": cand.structured_skills,
+                    "certifications": cand.certifications,
+                    "industries": cand.industries,
+                    "erp": cand.erp,
+                    "titles": cand.job_titles,
+                    "role": cand.primary_role,
+                    "classification": cand.classification_data,
+                },
+                cand.embedding_current,
+            )
+            self._candidate_versions[cand.id] = version
+        return version
+
+    def _scoring_config_version(self, weights: dict | None, rules: list[dict]) -> str:
+        """Engine-Version + Config-Dateien (FileConfig.version) + Gewichte + Regeln."""
+        return fingerprint([
+            self.SCORE_MEMO_VERSION,
+            self._sync_file_config().version,
+            weights or {},
+            rules,
+        ])
+
+    def _score_pair_v3(self, cand: MatchCandidate, ctx: V3JobContext) -> PairScore:
+        """Layer 0 bis Layer 3B fuer ein Paar — alles ausser Standort."""
+        # ═══ LAYER 0: HARD GATES ═══
+
+        # Gate 1: Rollen-Kompatibilitaet
+        cand_role = self._get_candidate_role_key(cand)
+        if not self._check_role_compatibility(cand_role, ctx.job_role):
+            return PairScore(reject_reason=f"role_incompatible:{cand_role}→{ctx.job_role}")
+
+        # Gate 2: Minimum-Skill (mindestens 1 fachkenntnisse-Match)
+        # Skill-Tiefe wird hier einmal berechnet und in Layer 1B wiederverwendet
+        if ctx.has_job_skills:
+            skill_depth, fk_matches = ctx.skill_vocabulary.score_depth(
+                ctx.job_skill_profile, self._candidate_skill_profile(cand, ctx.skill_vocabulary)
+            )
+        else:
+            skill_depth, fk_matches = 10, 1  # Keine Job-Skills → neutral
+        if fk_matches == 0:
+            return PairScore(reject_reason="zero_fachkenntnisse")
+
+        # Gate 5: Leadership-Filter
+        if not ctx.job_is_leadership and cand.seniority_level >= 6:
+            return PairScore(reject_reason="executive_on_ic_job")
+        if ctx.job_is_leadership and cand.seniority_level <= 2:
+            return PairScore(reject_reason="junior_on_leadership_job")
+
+        # ═══ LAYER 1: QUALIFIKATIONS-SCORE (0-45) ═══
+
+        # 1A: Rollen-Tiefe (0-15)
+        role_depth = self._score_role_depth(cand_role, ctx.job_role)
+
+        # 1B: Skill-Tiefe (0-20) — bereits in Gate 2 berechnet
+
+        # 1C: Zertifizierungs-Match (0-10)
+        cert_match = self._score_certification_match_v3(cand, ctx.job_role)
+
+        # Layer 1 Minimum: Wenn < 15 → REJECT
+        if role_depth + skill_depth + cert_match < 15:
+            return PairScore(reject_reason="layer1_below_minimum")
+
+        # ═══ LAYER 2: KOMPATIBILITAETS-SCORE (0-40) ═══
+
+        # 2A: Seniority-Fit (0-12)
+        seniority_pts, qualification_tag = self._score_seniority_v3(
+            cand.seniority_level, ctx.job_level
+        )
+
+        # 2B: Software-Ecosystem (0-10)
+        software_pts = self._score_software_v3(
+            cand.structured_skills, ctx.job_skills, cand.erp
+        )
+
+        # 2C: Embedding-Similarity (0-8)
+        emb_raw = self._score_embedding_similarity(
+            cand.embedding_current, ctx.job_embedding
+        )
+        embedding_pts = min(8, int(round(emb_raw * 8)))
+
+        # 2D: Career-Fit (0-10)
+        career_raw, career_note = self._score_career_fit(
+            cand.career_trajectory, cand.seniority_level, ctx.job_level
+        )
+        career_pts = min(10, int(round(career_raw * 10)))
+
+        # ═══ LAYER 3: KONTEXT-SCORE (0-15), ohne Standort ═══
+
+        # 3A: Branchen-Fit (0-5)
+        ind_raw = self._score_industry_fit(cand.industries, ctx.job_industry)
+        if ind_raw >= 0.9:
+            industry_pts = 5
+        elif ind_raw >= 0.5:
+            industry_pts = 3
+        elif ind_raw >= 0.25:
+            industry_pts = 2
+        else:
+            industry_pts = 1
+
+        # 3B: Recency (0-5) — basiert auf Skill-Recency der Fachkenntnisse
+        # Primaer: Pruefe ob Fachkenntnisse "aktuell" / "kuerzlich" / "veraltet" sind
+        best_recency = None
+        for s in (cand.structured_skills or []):
+            if not isinstance(s, dict):
+                continue
+            cat = s.get("category", "")
+            if cat in ("fachlich", "taetigkeitsfeld", "fachkenntnisse", "qualifikation", "zertifizierung"):
+                r = s.get("recency", "")
+                if r == "aktuell":
+                    best_recency = "aktuell"
+                    break  # Bestes Ergebnis
+                elif r == "kuerzlich" and best_recency != "aktuell":
+                    best_recency = "kuerzlich"
+                elif r == "veraltet" and best_recency is None:
+                    best_recency = "veraltet"
+
+        if best_recency == "aktuell":
+            recency_pts = 5  # Letzte relevante Position: aktuell
+        elif best_recency == "kuerzlich":
+            recency_pts = 3  # 2-5 Jahre her
+        elif best_recency == "veraltet":
+            recency_pts = 1  # >5 Jahre her
+        else:
+            # Fallback: career_trajectory als Proxy
+            trajectory = (cand.career_trajectory or "").lower()
+            if trajectory in ("aufsteigend", "lateral"):
+                recency_pts = 4  # Aktiv in Karriere
+            elif trajectory == "einstieg":
+                recency_pts = 4  # Neueinsteiger
+            else:
+                recency_pts = 3  # Unbekannt
+
+        return PairScore(
+            candidate_role=cand_role,
+            role_depth=role_depth,
+            skill_depth=skill_depth,
+            cert_match=cert_match,
+            seniority_pts=seniority_pts,
+            qualification_tag=qualification_tag,
+            software_pts=software_pts,
+            emb_raw=emb_raw,
+            embedding_pts=embedding_pts,
+            career_raw=career_raw,
+            career_note=career_note,
+            career_pts=career_pts,
+            ind_raw=ind_raw,
+            industry_pts=industry_pts,
+            recency_pts=recency_pts,
+        )
+
+    @staticmethod
+    def _score_location_v3(cand: MatchCandidate) -> int:
+        """Layer 3C: Standort-Qualitaet (0-5) — Fahrzeit bevorzugt, Fallback Luftlinie."""
+        if cand.drive_time_car_min is not None:
+            # Fahrzeit Auto (NEUKONZEPT: primaere Metrik)
+            if cand.drive_time_car_min <= 15:
+                return 5
+            if cand.drive_time_car_min <= 30:
+                return 4
+            if cand.drive_time_car_min <= 45:
+                return 3
+            return 1
+        if cand.distance_km is not None:
+            # Fallback: Luftlinie (wenn keine Fahrzeit verfuegbar)
+            if cand.distance_km <= 10:
+                return 5
+            if cand.distance_km <= 20:
+                return 4
+            if cand.distance_km <= 30:
+                return 3
+            return 1
+        return 2  # Remote oder keine Daten
+
     # ── V3 Main Scoring ──
 
     async def _score_candidates_v3(
         self,
         job: Job,
         candidates: list[MatchCandidate],
+        weights: dict[str, float] | None = None,
     ) -> list[ScoredMatch]:
         """V3 Scoring: Qualification-First Multi-Gate Scoring.
 
@@ -1642,11 +1870,13 @@ class MatchingEngineV2:
         Layer 2: Kompatibilitaets-Score (0-40)
         Layer 3: Kontext-Score (0-15)
         Total: 0-100, Minimum 35 fuer Speicherung
+
+        Layer 0 bis 3B kommen pro Paar aus dem Score-Memo, solange Job,
+        Kandidat und Konfiguration unveraendert sind; Standort, Quality-Cap
+        und Leer-CV-Abzug werden immer neu berechnet.
         """
         job_level = job.v2_seniority_level or 2
         job_skills = job.v2_required_skills or []
-        job_embedding = job.v2_embedding
-        job_industry = job.industry
 
         # Job-Rolle erkennen
         self._load_skill_weights()
@@ -1667,160 +1897,50 @@ class MatchingEngineV2:
         if quality_score == "medium":
             quality_cap = 75
 
-        # Job is_leadership pruefen
-        job_is_leadership = job_cd.get("is_leadership", False)
-
-        # Expanded Job-Skills (Hierarchie)
+        # Expanded Job-Skills (Hierarchie), einmal pro Job kompiliert
         expanded_job_skills = self._expand_job_skills_with_hierarchy(job_skills, job_role)
+        vocabulary = self._get_skill_vocabulary()
+        ctx = V3JobContext(
+            job_level=job_level,
+            job_skills=job_skills,
+            job_embedding=job.v2_embedding,
+            job_industry=job.industry,
+            job_role=job_role,
+            job_is_leadership=job_cd.get("is_leadership", False),
+            has_job_skills=bool(expanded_job_skills),
+            job_skill_profile=vocabulary.job_profile(expanded_job_skills, job_role),
+            skill_vocabulary=vocabulary,
+        )
+
+        memo = self._score_memo
+        job_version = self._job_version(ctx, job)
+        config_version = self._scoring_config_version(weights, await self._load_rules())
+        await memo.load(job.id, job_version, config_version)
 
         scored = []
         gate_rejected = 0
+        memo_hits = 0
 
         for cand in candidates:
-            # ═══ LAYER 0: HARD GATES ═══
-            reject_reason = None
-
-            # Gate 1: Rollen-Kompatibilitaet
-            cand_role = self._get_candidate_role_key(cand)
-            if not self._check_role_compatibility(cand_role, job_role):
-                reject_reason = f"role_incompatible:{cand_role}→{job_role}"
-
-            # Gate 2: Minimum-Skill (mindestens 1 fachkenntnisse-Match)
-            if not reject_reason:
-                _, fk_matches = self._score_skill_depth_v3(
-                    cand.structured_skills, expanded_job_skills, job_role, cand.certifications
-                )
-                if fk_matches == 0:
-                    reject_reason = "zero_fachkenntnisse"
-
-            # Gate 5: Leadership-Filter
-            if not reject_reason:
-                if not job_is_leadership and cand.seniority_level >= 6:
-                    reject_reason = "executive_on_ic_job"
-                if job_is_leadership and cand.seniority_level <= 2:
-                    reject_reason = "junior_on_leadership_job"
-
-            if reject_reason:
-                gate_rejected += 1
-                continue
-
-            # ═══ LAYER 1: QUALIFIKATIONS-SCORE (0-45) ═══
-
-            # 1A: Rollen-Tiefe (0-15)
-            role_depth = self._score_role_depth(cand_role, job_role)
-
-            # 1B: Skill-Tiefe (0-20)
-            skill_depth, _ = self._score_skill_depth_v3(
-                cand.structured_skills, expanded_job_skills, job_role, cand.certifications
-            )
-
-            # 1C: Zertifizierungs-Match (0-10)
-            cert_match = self._score_certification_match_v3(cand, job_role)
-
-            layer1 = role_depth + skill_depth + cert_match  # 0-45
+            memo_key = (job_version, self._candidate_version(cand), config_version)
+            pair = memo.get(job.id, cand.id, memo_key)
+            if pair is None:
+                pair = self._score_pair_v3(cand, ctx)
+                memo.put(job.id, cand.id, memo_key, pair)
+            else:
+                memo_hits += 1
 
-            # Layer 1 Minimum: Wenn < 15 → REJECT
-            if layer1 < 15:
+            if pair.reject_reason:
                 gate_rejected += 1
                 continue
 
-            # ═══ LAYER 2: KOMPATIBILITAETS-SCORE (0-40) ═══
-
-            # 2A: Seniority-Fit (0-12)
-            seniority_pts, qualification_tag = self._score_seniority_v3(
-                cand.seniority_level, job_level
-            )
-
-            # 2B: Software-Ecosystem (0-10)
-            software_pts = self._score_software_v3(
-                cand.structured_skills, job_skills, cand.erp
-            )
-
-            # 2C: Embedding-Similarity (0-8)
-            emb_raw = self._score_embedding_similarity(
-                cand.embedding_current, job_embedding
-            )
-            embedding_pts = min(8, int(round(emb_raw * 8)))
-
-            # 2D: Career-Fit (0-10)
-            career_raw, career_note = self._score_career_fit(
-                cand.career_trajectory, cand.seniority_level, job_level
-            )
-            career_pts = min(10, int(round(career_raw * 10)))
-
-            layer2 = seniority_pts + software_pts + embedding_pts + career_pts  # 0-40
+            layer1 = pair.layer1  # 0-45
+            layer2 = pair.layer2  # 0-40
 
-            # ═══ LAYER 3: KONTEXT-SCORE (0-15) ═══
-
-            # 3A: Branchen-Fit (0-5)
-            ind_raw = self._score_industry_fit(cand.industries, job_industry)
-            if ind_raw >= 0.9:
-                industry_pts = 5
-            elif ind_raw >= 0.5:
-                industry_pts = 3
-            elif ind_raw >= 0.25:
-                industry_pts = 2
-            else:
-                industry_pts = 1
-
-            # 3B: Recency (0-5) — basiert auf Skill-Recency der Fachkenntnisse
-            # Primaer: Pruefe ob Fachkenntnisse "aktuell" / "kuerzlich" / "veraltet" sind
-            best_recency = None
-            for s in (cand.structured_skills or []):
-                if not isinstance(s, dict):
-                    continue
-                cat = s.get("category", "")
-                if cat in ("fachlich", "taetigkeitsfeld", "fachkenntnisse", "qualifikation", "zertifizierung"):
-                    r = s.get("recency", "")
-                    if r == "aktuell":
-                        best_recency = "aktuell"
-                        break  # Bestes Ergebnis
-                    elif r == "kuerzlich" and best_recency != "aktuell":
-                        best_recency = "kuerzlich"
-                    elif r == "veraltet" and best_recency is None:
-                        best_recency = "veraltet"
-
-            if best_recency == "aktuell":
-                recency_pts = 5  # Letzte relevante Position: aktuell
-            elif best_recency == "kuerzlich":
-                recency_pts = 3  # 2-5 Jahre her
-            elif best_recency == "veraltet":
-                recency_pts = 1  # >5 Jahre her
-            else:
-                # Fallback: career_trajectory als Proxy
-                trajectory = (cand.career_trajectory or "").lower()
-                if trajectory in ("aufsteigend", "lateral"):
-                    recency_pts = 4  # Aktiv in Karriere
-                elif trajectory == "einstieg":
-                    recency_pts = 4  # Neueinsteiger
-                else:
-                    recency_pts = 3  # Unbekannt
-
-            # 3C: Standort-Qualitaet (0-5) — Fahrzeit bevorzugt, Fallback Luftlinie
-            if cand.drive_time_car_min is not None:
-                # Fahrzeit Auto (NEUKONZEPT: primaere Metrik)
-                if cand.drive_time_car_min <= 15:
-                    location_pts = 5
-                elif cand.drive_time_car_min <= 30:
-                    location_pts = 4
-                elif cand.drive_time_car_min <= 45:
-                    location_pts = 3
-                else:
-                    location_pts = 1
-            elif cand.distance_km is not None:
-                # Fallback: Luftlinie (wenn keine Fahrzeit verfuegbar)
-                if cand.distance_km <= 10:
-                    location_pts = 5
-                elif cand.distance_km <= 20:
-                    location_pts = 4
-                elif cand.distance_km <= 30:
-                    location_pts = 3
-                else:
-                    location_pts = 1
-            else:
-                location_pts = 2  # Remote oder keine Daten
+            # 3C: Standort-Qualitaet (0-5) — nicht im Memo, haengt an Distanz/Fahrzeit
+            location_pts = self._score_location_v3(cand)
 
-            layer3 = industry_pts + recency_pts + location_pts  # 0-15
+            layer3 = pair.industry_pts + pair.recency_pts + location_pts  # 0-15
 
             # ═══ GESAMT ═══
 
@@ -1851,38 +1971,38 @@ class MatchingEngineV2:
                 "v3_layer2_compatibility": layer2,
                 "v3_layer3_context": layer3,
                 # V3 Detail
-                "v3_role_depth": role_depth,
-                "v3_skill_depth": skill_depth,
-                "v3_cert_match": cert_match,
-                "v3_seniority_pts": seniority_pts,
-                "v3_software_pts": software_pts,
-                "v3_embedding_pts": embedding_pts,
-                "v3_career_pts": career_pts,
-                "v3_industry_pts": industry_pts,
-                "v3_recency_pts": recency_pts,
+                "v3_role_depth": pair.role_depth,
+                "v3_skill_depth": pair.skill_depth,
+                "v3_cert_match": pair.cert_match,
+                "v3_seniority_pts": pair.seniority_pts,
+                "v3_software_pts": pair.software_pts,
+                "v3_embedding_pts": pair.embedding_pts,
+                "v3_career_pts": pair.career_pts,
+                "v3_industry_pts": pair.industry_pts,
+                "v3_recency_pts": pair.recency_pts,
                 "v3_location_pts": location_pts,
                 # Kompatibilitaet mit altem Format
-                "skill_overlap": round(skill_depth / 20, 3),  # Normalisiert 0-1 fuer Templates
-                "seniority_fit": round(seniority_pts / 12, 3),
-                "embedding_sim": round(emb_raw, 3),
-                "industry_fit": round(ind_raw, 3),
-                "career_fit": round(career_raw, 3),
-                "software_match": round(software_pts / 10, 3),
+                "skill_overlap": round(pair.skill_depth / 20, 3),  # Normalisiert 0-1 fuer Templates
+                "seniority_fit": round(pair.seniority_pts / 12, 3),
+                "embedding_sim": round(pair.emb_raw, 3),
+                "industry_fit": round(pair.ind_raw, 3),
+                "career_fit": round(pair.career_raw, 3),
+                "software_match": round(pair.software_pts / 10, 3),
                 "job_title_fit": 0.0,  # Deaktiviert
                 # Metadaten
                 "distance_km": cand.distance_km,
                 "drive_time_car_min": cand.drive_time_car_min,
                 "drive_time_transit_min": cand.drive_time_transit_min,
-                "qualification_tag": qualification_tag,
+                "qualification_tag": pair.qualification_tag,
                 "candidate_level": cand.seniority_level,
                 "job_level": job_level,
                 "job_role": job_role,
-                "candidate_role": cand_role,
+                "candidate_role": pair.candidate_role,
                 "empty_cv_penalty": empty_cv_penalty,
                 "scoring_version": "v3",
             }
-            if career_note:
-                breakdown["career_note"] = career_note
+            if pair.career_note:
+                breakdown["career_note"] = pair.career_note
 
             scored.append(ScoredMatch(
                 candidate_id=cand.id,
@@ -1890,8 +2010,11 @@ class MatchingEngineV2:
                 breakdown=breakdown,
             ))
 
+        await memo.flush()
+
         logger.info(
-            f"V3 Scoring: {len(scored)} scored, {gate_rejected} gate-rejected "
+            f"V3 Scoring: {len(scored)} scored, {gate_rejected} gate-rejected, "
+            f"{memo_hits}/{len(candidates)} aus Score-Memo "
             f"(Rolle: {job_role}, Level: {job_level})"
         )
 
@@ -1993,6 +2116,7 @@ class MatchingEngineV2:
         self,
         job_id: UUID,
         save_to_db: bool = True,
+        spatial: SpatialCandidateIndex | None = None,
     ) -> MatchResult:
         """Matcht einen Job gegen alle passenden Kandidaten.
 
@@ -2004,6 +2128,7 @@ class MatchingEngineV2:
         Args:
             job_id: UUID des Jobs
             save_to_db: Ob Matches in DB gespeichert werden sollen
+            spatial: Vorab berechnete Umkreis-Kandidaten (Batch-Modus)
 
         Returns:
             MatchResult mit Top-50 Matches
@@ -2050,7 +2175,7 @@ class MatchingEngineV2:
         weights = await self._load_weights(job_category=job_category)
 
         # ── Schicht 1: Hard Filters ──
-        candidates = await self._hard_filter_candidates(job, job_level)
+        candidates = await self._hard_filter_candidates(job, job_level, spatial=spatial)
         total_checked = 2000  # Safety-Limit aus Query
 
         if not candidates:
@@ -2064,7 +2189,7 @@ class MatchingEngineV2:
             )
 
         # ── Schicht 2: V3 Qualification-First Multi-Gate Scoring ──
-        scored = await self._score_candidates_v3(job, candidates)
+        scored = await self._score_candidates_v3(job, candidates, weights=weights)
 
         # Build Lookup fuer Schicht 3
         cand_map = {c.id: c for c in candidates}
@@ -2073,8 +2198,7 @@ class MatchingEngineV2:
         scored = await self._apply_learned_rules(scored, job, cand_map)
 
         # ── Phase 10: Google Maps Fahrzeit (NUR für Score ≥ Threshold) ──
-        from app.api.routes_settings import get_drive_time_threshold
-        DRIVE_TIME_SCORE_THRESHOLD = await get_drive_time_threshold(self.db)
+        DRIVE_TIME_SCORE_THRESHOLD = (await self._get_config()).drive_time_threshold
         try:
             from app.services.distance_matrix_service import distance_matrix_service
 
@@ -2234,6 +2358,11 @@ class MatchingEngineV2:
         """
         result = BatchMatchResult()
 
+        # Ein Config-Snapshot fuer den ganzen Batch (keine Config-Queries pro Job)
+        self._config = None
+        config = await self._get_config()
+        logger.info(f"Batch-Matching mit Matching-Config {config.version}")
+
         if job_ids:
             ids = job_ids
         else:
@@ -2271,9 +2400,22 @@ class MatchingEngineV2:
         total = len(ids)
         logger.info(f"Batch-Matching: {total} Jobs zu matchen")
 
+        spatial: SpatialCandidateIndex | None = None
         for i, job_id in enumerate(ids):
+            # Ein Spatial-Join pro Block statt ein ST_DWithin-Query pro Job
+            if i % SPATIAL_BATCH_SIZE == 0:
+                self._batch_candidate_rows.clear()
+                try:
+                    spatial = await self._preload_spatial_candidates(
+                        ids[i:i + SPATIAL_BATCH_SIZE],
+                    )
+                except Exception as e:
+                    logger.warning(f"Spatial-Join fehlgeschlagen, per-Job-Filter: {e}")
+                    await self.db.rollback()
+                    spatial = None
+
             try:
-                match_result = await self.match_job(job_id, save_to_db=True)
+                match_result = await self.match_job(job_id, save_to_db=True, spatial=spatial)
                 result.jobs_matched += 1
                 result.total_matches_created += len(match_result.matches)
                 result.total_duration_ms += match_result.duration_ms
@@ -2294,6 +2436,7 @@ class MatchingEngineV2:
 
         # Final commit
         await self.db.commit()
+        self._batch_candidate_rows.clear()
 
         logger.info(
             f"Batch-Matching abgeschlossen: {result.jobs_matched} Jobs, "
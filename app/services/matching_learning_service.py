@@ -12,6 +12,7 @@ Kosten: $0.00 (alles lokal, kein KI-Aufruf)
 
 import logging
 import math
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import UUID
@@ -27,9 +28,25 @@ from app.models.match_v2_models import (
     MatchV2LearnedRule,
     MatchV2ScoringWeight,
 )
+from app.services.feedback_analytics import FeatureMatrix, SeparationAccumulator
+from app.services.matching_config import bump_matching_config_version
 
 logger = logging.getLogger(__name__)
 
+# Inkrementelle Trennkraft-Summen pro Job-Kategorie (None = alle Feedbacks).
+# Prozess-lokal; nach Neustart wird einmal die komplette Historie eingelesen.
+# Vor jedem inkrementellen Update wird die Zeilenzahl bis zum Watermark
+# gegengeprueft: geloeschte Training-Daten (Admin-Reset, auch aus anderen
+# Workern) oder spaet committete Feedbacks erzwingen einen Neuaufbau.
+# Zusaetzlich Voll-Neuaufbau spaetestens nach einer Stunde.
+_separation_cache: dict[str | None, tuple[float, SeparationAccumulator]] = {}
+_SEPARATION_FULL_REBUILD_SECONDS = 3600
+
+
+def clear_separation_cache() -> None:
+    """Verwirft die Trennkraft-Summen (nach Loeschen von Training-Daten)."""
+    _separation_cache.clear()
+
 
 # ══════════════════════════════════════════════════════════════════
 # DATENKLASSEN
@@ -396,52 +413,14 @@ class MatchingLearningService:
         Distanz-Lernen: distance_km wird als Analyse-Dimension aufgenommen.
         Bei hoher Trennkraft (bad_distance haeuft sich) wird das geloggt.
         """
-        # Feedbacks laden (pro Kategorie oder alle)
-        query = (
-            select(
-                MatchV2TrainingData.features,
-                MatchV2TrainingData.outcome,
-            )
-            .where(MatchV2TrainingData.outcome.in_(["good", "bad"]))
-            .order_by(MatchV2TrainingData.created_at.desc())
-            .limit(500)
-        )
-        if job_category:
-            query = query.where(MatchV2TrainingData.job_category == job_category)
-
-        result = await self.db.execute(query)
-        rows = result.all()
+        # Komplette Feedback-Historie (inkrementell, nur neue Zeilen werden geladen)
+        acc = await self._load_separation(job_category)
 
-        if len(rows) < self.MIN_FEEDBACKS_FOR_CORRELATION:
+        if acc.rows_seen < self.MIN_FEEDBACKS_FOR_CORRELATION:
             return {}
 
-        # Sammle Scores pro Komponente und Outcome (inkl. distance_km als Analyse)
-        analysis_components = self.SCORE_COMPONENTS + ["distance_km"]
-
-        stats: dict[str, dict] = {}
-        for comp in analysis_components:
-            stats[comp] = {"good_scores": [], "bad_scores": []}
-
-        for features, outcome in rows:
-            if not features:
-                continue
-            for comp in analysis_components:
-                val = features.get(comp)
-                if val is not None:
-                    stats[comp][f"{outcome}_scores"].append(val)
-
         # Trennkraft berechnen (Differenz zwischen Durchschnitt good vs. bad)
-        separation_power = {}
-        for comp in analysis_components:
-            good = stats[comp]["good_scores"]
-            bad = stats[comp]["bad_scores"]
-
-            if len(good) >= 10 and len(bad) >= 10:
-                avg_good = sum(good) / len(good)
-                avg_bad = sum(bad) / len(bad)
-                separation_power[comp] = avg_good - avg_bad
-            else:
-                separation_power[comp] = 0.0
+        separation_power = acc.separation_power(min_samples=10)
 
         # Distanz-Trennkraft loggen (distance_km ist kein Gewicht, aber liefert Info)
         dist_sep = separation_power.pop("distance_km", 0.0)
@@ -500,6 +479,74 @@ class MatchingLearningService:
 
     # ── Hilfsmethoden ────────────────────────────────────
 
+    async def _load_separation(
+        self, job_category: str | None = None,
+    ) -> SeparationAccumulator:
+        """Liefert die Trennkraft-Summen fuer eine Kategorie (None = alle Feedbacks).
+
+        Beim ersten Aufruf wird die komplette Historie geladen, danach nur noch
+        Feedbacks mit created_at > watermark (spaltenweise via NumPy verrechnet).
+        """
+        # Alle 7 Score-Komponenten + distance_km als Analyse-Dimension
+        analysis_components = self.SCORE_COMPONENTS + ["distance_km"]
+
+        conditions = [MatchV2TrainingData.outcome.in_(["good", "bad"])]
+        if job_category:
+            conditions.append(MatchV2TrainingData.job_category == job_category)
+
+        built_at, acc = _separation_cache.get(job_category, (0.0, None))
+        if (
+            acc is None
+            or acc.components != analysis_components
+            or time.monotonic() - built_at > _SEPARATION_FULL_REBUILD_SECONDS
+            or not await self._separation_still_valid(acc, conditions)
+        ):
+            built_at, acc = time.monotonic(), SeparationAccumulator(analysis_components)
+
+        query = (
+            select(
+                MatchV2TrainingData.features,
+                MatchV2TrainingData.outcome,
+                MatchV2TrainingData.created_at,
+            )
+            .where(*conditions)
+            .order_by(MatchV2TrainingData.created_at.asc())
+        )
+        if acc.watermark is not None:
+            query = query.where(MatchV2TrainingData.created_at > acc.watermark)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+
+        if rows:
+            matrix = FeatureMatrix.from_rows(
+                ((features, outcome) for features, outcome, _ in rows),
+                analysis_components,
+            )
+            acc.update(matrix, watermark=rows[-1][2], rows_skipped=len(rows) - len(matrix))
+
+        _separation_cache[job_category] = (built_at, acc)
+        return acc
+
+    async def _separation_still_valid(self, acc: SeparationAccumulator, conditions: list) -> bool:
+        """Summen passen noch zur DB: gleiche Zeilenzahl bis zum Watermark.
+
+        Verglichen wird mit allen geladenen Zeilen, inklusive der ohne
+        Features (rows_skipped) — sonst wuerde jede solche Zeile einen
+        Voll-Rebuild bei jedem Aufruf ausloesen.
+
+        Faengt geloeschte Training-Daten (auch aus anderen Workern) und spaet
+        committete Feedbacks vor dem Watermark ab.
+        """
+        if acc.watermark is None:
+            return True
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(MatchV2TrainingData)
+            .where(*conditions, MatchV2TrainingData.created_at <= acc.watermark)
+        )
+        return result.scalar() == acc.rows_seen + acc.rows_skipped
+
     async def _count_feedbacks(self) -> int:
         """Zaehlt die Gesamtanzahl der Feedbacks."""
         result = await self.db.execute(
@@ -512,6 +559,9 @@ class MatchingLearningService:
 
         Wenn job_category angegeben, werden nur die Gewichte dieser Kategorie normalisiert.
         Sonst nur die globalen (job_category IS NULL).
+
+        Wird nach jeder Gewichtsaenderung aufgerufen und erhoeht deshalb auch
+        die Matching-Config-Version (Engines laden die Gewichte neu).
         """
         if job_category:
             query = select(MatchV2ScoringWeight).where(
@@ -531,6 +581,8 @@ class MatchingLearningService:
             for w in weights:
                 w.weight = round(w.weight * factor, 3)
 
+        await bump_matching_config_version(self.db)
+
     # ── Statistiken ──────────────────────────────────────
 
     async def get_learning_stats(self) -> LearningStats:
@@ -597,48 +649,19 @@ class MatchingLearningService:
 
     async def _analyze_component_performance(self) -> list[dict]:
         """Analysiert welche Scoring-Komponenten am besten gut/schlecht trennen."""
-        result = await self.db.execute(
-            select(
-                MatchV2TrainingData.features,
-                MatchV2TrainingData.outcome,
-            )
-            .where(MatchV2TrainingData.outcome.in_(["good", "bad"]))
-            .limit(500)
-        )
-        rows = result.all()
-
-        # Alle 7 Score-Komponenten + distance_km als Analyse-Dimension
-        analysis_components = self.SCORE_COMPONENTS + ["distance_km"]
+        acc = await self._load_separation()
 
-        stats = {}
-        for comp in analysis_components:
-            stats[comp] = {"good": [], "bad": []}
-
-        for features, outcome in rows:
-            if not features:
-                continue
-            for comp in analysis_components:
-                val = features.get(comp)
-                if val is not None:
-                    stats[comp][outcome].append(val)
-
-        performance = []
-        for comp in analysis_components:
-            good = stats[comp]["good"]
-            bad = stats[comp]["bad"]
-
-            avg_good = sum(good) / len(good) if good else 0
-            avg_bad = sum(bad) / len(bad) if bad else 0
-            separation = avg_good - avg_bad
-
-            performance.append({
-                "component": comp,
-                "avg_score_good_matches": round(avg_good, 3),
-                "avg_score_bad_matches": round(avg_bad, 3),
-                "separation_power": round(separation, 3),
-                "sample_count_good": len(good),
-                "sample_count_bad": len(bad),
-            })
+        performance = [
+            {
+                "component": r.component,
+                "avg_score_good_matches": round(r.avg_good, 3),
+                "avg_score_bad_matches": round(r.avg_bad, 3),
+                "separation_power": round(r.separation, 3),
+                "sample_count_good": r.count_good,
+                "sample_count_bad": r.count_bad,
+            }
+            for r in acc.results()
+        ]
 
         # Sortiere nach Trennkraft (hoechste zuerst)
         performance.sort(key=lambda x: abs(x["separation_power"]), reverse=True)
@@ -681,6 +704,7 @@ class MatchingLearningService:
             w.adjustment_count = 0
             w.last_adjusted_at = None
 
+        await bump_matching_config_version(self.db)
         await self.db.commit()
 
         logger.info("Gewichte auf Defaults zurueckgesetzt")
@@ -28,7 +28,6 @@ import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
 from uuid import UUID
 
 import httpx
@@ -39,9 +38,15 @@ from app.config import settings
 from app.models.candidate import Candidate
 from app.models.job import Job
 from app.models.match import Match, MatchStatus
+from app.services.matching_config import matching_config_registry
 
 # Wiederverwendung des vollstaendigen Branchenwissen-Prompts
 from app.services.smart_matching_service import SMART_MATCH_SYSTEM_PROMPT
+from app.services.spatial_candidate_service import (
+    SPATIAL_BATCH_SIZE,
+    SpatialCandidateIndex,
+    SpatialCandidateService,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,24 +73,9 @@ ROLE_KEY_TO_DISPLAY = {v: k for k, v in ROLE_DISPLAY_TO_KEY.items()}
 
 
 # ═══════════════════════════════════════════════════════════════
-# ROLE COMPATIBILITY LADEN
+# ROLE COMPATIBILITY (aus der MatchingConfigRegistry)
 # ═══════════════════════════════════════════════════════════════
 
-_role_compat_cache: dict | None = None
-
-
-def _load_role_compatibility() -> dict:
-    """Laedt die Rollen-Kompatibilitaetsmatrix (gecached)."""
-    global _role_compat_cache
-    if _role_compat_cache is not None:
-        return _role_compat_cache
-
-    config_path = Path(__file__).parent.parent / "config" / "role_compatibility.json"
-    with open(config_path, "r", encoding="utf-8") as f:
-        _role_compat_cache = json.load(f)
-    return _role_compat_cache
-
-
 def get_allowed_candidate_roles(job_role_key: str) -> set[str]:
     """Findet alle Kandidaten-Rollen, die auf einen Job-Typ matchen duerfen.
 
@@ -98,14 +88,8 @@ def get_allowed_candidate_roles(job_role_key: str) -> set[str]:
     → steuerfachangestellte.allowed = [..., "finanzbuchhalter", ...] ✓
     → Ergebnis: {finanzbuchhalter, bilanzbuchhalter, steuerfachangestellte}
     """
-    compat = _load_role_compatibility()
-    allowed = set()
-    for cand_role_key, config in compat.items():
-        if cand_role_key.startswith("_"):
-            continue  # Skip comments
-        if job_role_key in config.get("allowed_job_roles", []):
-            allowed.add(cand_role_key)
-    return allowed
+    files = matching_config_registry.files()
+    return set(files.allowed_candidate_roles.get(job_role_key, ()))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -197,9 +181,20 @@ class MatchingPipelineV3:
 
         return None
 
+    @staticmethod
+    def _base_candidate_conditions() -> list:
+        """Job-unabhaengige Filter: FINANCE, klassifiziert, nicht geloescht/versteckt."""
+        return [
+            Candidate.hotlist_category == "FINANCE",
+            Candidate.deleted_at.is_(None),
+            Candidate.hidden == False,  # noqa: E712
+            Candidate.classification_data.isnot(None),
+        ]
+
     async def find_compatible_candidates(
         self,
         job: Job,
+        spatial: SpatialCandidateIndex | None = None,
     ) -> list[tuple[Candidate, float | None]]:
         """Phase 2: Findet kompatible Kandidaten per SQL.
 
@@ -209,6 +204,9 @@ class MatchingPipelineV3:
         3. Distanz <= 30km (PostGIS), es sei denn Job ist remote
         4. Nicht geloescht/versteckt
 
+        Im Batch-Modus (spatial gesetzt) kommt der Umkreis aus dem vorab
+        berechneten Spatial-Join; hier werden nur noch die Rollen gefiltert.
+
         Returns:
             Liste von (Candidate, distance_km) Tupeln
         """
@@ -236,10 +234,7 @@ class MatchingPipelineV3:
 
         # SQL-Bedingungen
         conditions = [
-            Candidate.hotlist_category == "FINANCE",
-            Candidate.deleted_at.is_(None),
-            Candidate.hidden == False,  # noqa: E712
-            Candidate.classification_data.isnot(None),
+            *self._base_candidate_conditions(),
             or_(
                 *[
                     Candidate.hotlist_job_title == role
@@ -248,6 +243,20 @@ class MatchingPipelineV3:
             ),
         ]
 
+        # Batch-Modus: Umkreis-Kandidaten aus dem Spatial-Join (nach Distanz sortiert)
+        if spatial is not None and spatial.covers(job.id):
+            distances = dict(spatial.candidates_for(job.id))
+            if not distances:
+                return []
+            result = await self.db.execute(
+                select(Candidate).where(
+                    Candidate.id.in_(distances.keys()),
+                    *conditions,
+                )
+            )
+            found = sorted(result.scalars().all(), key=lambda c: distances[c.id])
+            return [(c, distances[c.id]) for c in found[:MAX_CANDIDATES_PER_JOB]]
+
         # Distanz: Hard-Filter 30km (ausser Remote-Jobs)
         job_is_remote = getattr(job, "work_arrangement", None) == "remote"
         has_coords = job.location_coords is not None
@@ -604,6 +613,7 @@ Bewerte realistisch — kein Wunschdenken."""
         self,
         job_id: UUID,
         progress_callback=None,
+        spatial: SpatialCandidateIndex | None = None,
     ) -> PipelineResult:
         """Volle 3-Phasen-Pipeline fuer einen Job.
 
@@ -611,6 +621,8 @@ Bewerte realistisch — kein Wunschdenken."""
         2. Phase 2: Finde kompatible Kandidaten (SQL)
         3. Phase 3: KI-Bewertung fuer jeden
         4. Speichere Matches >= 50%
+
+        spatial: Vorab berechnete Umkreis-Kandidaten (Batch-Modus, siehe run_all)
         """
         start = time.time()
 
@@ -656,7 +668,7 @@ Bewerte realistisch — kein Wunschdenken."""
             )
 
         # ── Phase 2: Rollen-Gated Filterung ──
-        candidates = await self.find_compatible_candidates(job)
+        candidates = await self.find_compatible_candidates(job, spatial=spatial)
         result.phase2_candidates_found = len(candidates)
 
         if not candidates:
@@ -752,9 +764,9 @@ Bewerte realistisch — kein Wunschdenken."""
             return {"error": "Keine normalisierte Rolle", "matches_created": 0}
 
         # Kompatible Job-Rollen
-        compat = _load_role_compatibility()
-        cand_config = compat.get(cand_role_key, {})
-        allowed_job_keys = cand_config.get("allowed_job_roles", [])
+        allowed_job_keys = list(
+            matching_config_registry.files().role_compatibility.get(cand_role_key, ())
+        )
 
         if not allowed_job_keys:
             return {"error": "Keine kompatiblen Job-Rollen", "matches_created": 0}
@@ -903,7 +915,21 @@ Bewerte realistisch — kein Wunschdenken."""
         if progress_callback:
             progress_callback("init", f"{len(jobs)} Jobs zu matchen...")
 
+        spatial: SpatialCandidateIndex | None = None
         for i, (job_id, position, company) in enumerate(jobs):
+            # Ein Spatial-Join pro Block statt ein ST_DWithin-Query pro Job
+            if i % SPATIAL_BATCH_SIZE == 0:
+                try:
+                    spatial = await SpatialCandidateService(self.db).for_jobs(
+                        [j[0] for j in jobs[i:i + SPATIAL_BATCH_SIZE]],
+                        radius_km=MAX_DISTANCE_KM,
+                        candidate_conditions=self._base_candidate_conditions(),
+                    )
+                except Exception as e:
+                    logger.warning(f"V3 Spatial-Join fehlgeschlagen, per-Job-Filter: {e}")
+                    await self.db.rollback()
+                    spatial = None
+
             try:
                 if progress_callback:
                     progress_callback(
@@ -911,7 +937,7 @@ Bewerte realistisch — kein Wunschdenken."""
                         f"Job {i + 1}/{len(jobs)}: {position} ({company})",
                     )
 
-                job_result = await self.run_for_job(job_id)
+                job_result = await self.run_for_job(job_id, spatial=spatial)
 
                 if job_result.errors and not job_result.matches_created:
                     stats["jobs_skipped"] += 1
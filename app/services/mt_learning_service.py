@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.candidate import Candidate
 from app.models.mt_training import MTTrainingData
+from app.services import similarity
 
 logger = logging.getLogger(__name__)
 
@@ -205,24 +206,25 @@ class MTLearningService:
         if not cand_emb or not isinstance(cand_emb, list):
             return None
 
+        entries = [
+            entry for entry in entries
+            if entry.embedding and isinstance(entry.embedding, list)
+        ]
+        similarities = similarity.cosine_batch(cand_emb, [entry.embedding for entry in entries])
+
         best_score = -1.0
         best_entry = None
         title_votes: dict[str, float] = {}
 
-        for entry in entries:
-            if not entry.embedding or not isinstance(entry.embedding, list):
-                continue
-
-            similarity = self._cosine_similarity(cand_emb, entry.embedding)
-
-            if similarity > best_score:
-                best_score = similarity
+        for entry, score in zip(entries, similarities):
+            if score > best_score:
+                best_score = score
                 best_entry = entry
 
             # Titel-Voting: Aehnlichkeit als Gewicht
-            if similarity > 0.75 and entry.assigned_titles:
+            if score > 0.75 and entry.assigned_titles:
                 for title in entry.assigned_titles:
-                    title_votes[title] = title_votes.get(title, 0) + similarity
+                    title_votes[title] = title_votes.get(title, 0) + score
 
         if not title_votes or best_score < 0.75:
             return None
@@ -367,18 +369,3 @@ class MTLearningService:
                 parts.append(f"Sprachen: {', '.join(lang_strs)}")
 
         return "\n".join(parts) if parts else "Keine CV-Daten verfuegbar"
-
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Berechnet Cosinus-Aehnlichkeit zwischen zwei Vektoren."""
-        if len(a) != len(b) or not a:
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot_product / (norm_a * norm_b)
@@ -0,0 +1,280 @@
+"""PageDataService — Daten fuer Detailseiten in wenigen Round-Trips.
+
+Die Detail-Routen haben bisher jede Liste einzeln und nacheinander geladen
+(inkl. COUNT-Queries, die nirgends angezeigt wurden, und selectinload-
+Nachlade-Queries pro Relationship). Hier:
+
+- Many-to-one-Relationships per joinedload (keine Extra-Query)
+- Unabhaengige Listen parallel, jede in eigener kurzer Session
+- Kennzahlen als EIN Aggregat-Query (Scalar-Subqueries + FILTER)
+- Identity-Cache pro Request: der Kandidat wird einmal geladen und in alle
+  verknuepften Objekte (call_note.candidate, todo.candidate) eingesetzt,
+  statt ihn pro Liste erneut mitzuladen
+
+Ergebnis: konstante Anzahl Queries pro Seite, unabhaengig von der Datenmenge.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.database import async_session_maker
+from app.models.ats_call_note import ATSCallNote
+from app.models.ats_job import ATSJob
+from app.models.ats_todo import ATSTodo
+from app.models.candidate import Candidate
+from app.models.candidate_email import CandidateEmail
+from app.models.candidate_task import CandidateTask
+from app.models.company import Company
+from app.models.company_contact import CompanyContact
+from app.models.email_draft import EmailDraft
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Max. gleichzeitige Loader-Sessions ueber alle Requests (Pool: 5 + 10 Overflow)
+PAGE_LOADER_CONCURRENCY = 6
+_loader_slots = asyncio.Semaphore(PAGE_LOADER_CONCURRENCY)
+
+# Schluessel im Session.info-Dict fuer den Identity-Cache pro Request
+_CACHE_KEY = "page_data_cache"
+
+
+@dataclass
+class CandidatePageData:
+    """Alles, was candidate_detail.html braucht."""
+
+    candidate: Candidate
+    call_notes: list[ATSCallNote] = field(default_factory=list)
+    todos: list[ATSTodo] = field(default_factory=list)
+    email_drafts: list[EmailDraft] = field(default_factory=list)
+    seq_emails: list[CandidateEmail] = field(default_factory=list)
+    seq_tasks: list[CandidateTask] = field(default_factory=list)
+
+
+@dataclass
+class CompanyPageData:
+    """Alles, was company_detail.html braucht."""
+
+    company: Company
+    contacts: list[CompanyContact] = field(default_factory=list)
+    job_count: int = 0
+    ats_job_count: int = 0
+    akquise_count: int = 0
+    call_count: int = 0
+    call_total_duration: int = 0
+    contact_count: int = 0
+
+
+class PageDataService:
+    """Loader fuer Detailseiten. Eine Instanz pro Request (Request-Session)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ── Identity-Cache pro Request ──
+
+    def _cache(self) -> dict[tuple[type, UUID], Any]:
+        return self.db.info.setdefault(_CACHE_KEY, {})
+
+    async def candidate(self, candidate_id: UUID) -> Candidate | None:
+        """Kandidat — innerhalb eines Requests nur einmal aus der DB."""
+        key = (Candidate, candidate_id)
+        cache = self._cache()
+        if key not in cache:
+            cache[key] = await self.db.get(Candidate, candidate_id)
+        return cache[key]
+
+    # ── Kandidaten-Detailseite ──
+
+    async def candidate_page(self, candidate_id: UUID) -> CandidatePageData | None:
+        """Kandidat + Anrufe, Aufgaben, Drafts, Sequenz-E-Mails/-Tasks.
+
+        6 Queries: Kandidat, danach 5 Listen parallel.
+        """
+        candidate = await self.candidate(candidate_id)
+        if not candidate:
+            return None
+
+        call_notes, todos, drafts, seq_emails, seq_tasks = await asyncio.gather(
+            _in_own_session(lambda s: _load_call_notes(s, candidate_id)),
+            _in_own_session(lambda s: _load_todos(s, candidate_id)),
+            _in_own_session(lambda s: _load_email_drafts(s, candidate_id)),
+            _in_own_session(lambda s: _load_seq_emails(s, candidate_id)),
+            _in_own_session(lambda s: _load_seq_tasks(s, candidate_id)),
+        )
+
+        # Kandidat nicht pro Liste erneut laden — geladene Instanz einsetzen
+        for obj in (*call_notes, *todos):
+            set_committed_value(obj, "candidate", candidate)
+
+        return CandidatePageData(
+            candidate=candidate,
+            call_notes=call_notes,
+            todos=todos,
+            email_drafts=drafts,
+            seq_emails=seq_emails,
+            seq_tasks=seq_tasks,
+        )
+
+    # ── Unternehmen-Detailseite ──
+
+    async def company_page(self, company_id: UUID) -> CompanyPageData | None:
+        """Unternehmen (mit Kontakten/Korrespondenz) + alle Kennzahlen.
+
+        Unternehmen (3 Queries inkl. selectinload) parallel zu EINEM
+        Aggregat-Query fuer Jobs, ATS-Jobs, Akquise, Anrufe, Anrufdauer.
+        """
+        company_query = (
+            select(Company)
+            .options(
+                selectinload(Company.contacts),
+                selectinload(Company.correspondence),
+            )
+            .where(Company.id == company_id)
+        )
+        company_result, stats = await asyncio.gather(
+            self.db.execute(company_query),
+            _in_own_session(lambda s: _load_company_stats(s, company_id)),
+        )
+        company = company_result.scalar_one_or_none()
+        if not company:
+            return None
+
+        # Wie ORDER BY last_name ASC (NULLs zuletzt)
+        contacts = sorted(
+            company.contacts,
+            key=lambda c: (c.last_name is None, c.last_name or ""),
+        )
+
+        return CompanyPageData(
+            company=company,
+            contacts=contacts,
+            contact_count=len(contacts),
+            **stats,
+        )
+
+
+# ═══════════════════════════════════════════════════════════════
+# EINZELNE LOADER (je eine Query, laufen in eigener Session)
+# ═══════════════════════════════════════════════════════════════
+
+
+async def _in_own_session(load: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+    """Fuehrt einen Loader in einer eigenen, kurzen Session aus.
+
+    Geladene Objekte sind danach detached (expire_on_commit=False) — alle
+    vom Template genutzten Relationships muessen eager geladen sein.
+    """
+    async with _loader_slots:
+        async with async_session_maker() as session:
+            return await load(session)
+
+
+async def _load_call_notes(db: AsyncSession, candidate_id: UUID) -> list[ATSCallNote]:
+    result = await db.execute(
+        select(ATSCallNote)
+        .options(
+            joinedload(ATSCallNote.company),
+            joinedload(ATSCallNote.contact),
+        )
+        .where(ATSCallNote.candidate_id == candidate_id)
+        .order_by(ATSCallNote.called_at.desc())
+        .limit(100)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_todos(db: AsyncSession, candidate_id: UUID) -> list[ATSTodo]:
+    # Sortierung wie ATSTodoService.list_todos
+    result = await db.execute(
+        select(ATSTodo)
+        .options(
+            joinedload(ATSTodo.company),
+            joinedload(ATSTodo.ats_job),
+            joinedload(ATSTodo.contact),
+            joinedload(ATSTodo.call_note),
+        )
+        .where(ATSTodo.candidate_id == candidate_id)
+        .order_by(
+            ATSTodo.status.asc(),
+            ATSTodo.priority.desc(),
+            ATSTodo.due_date.asc().nullslast(),
+            ATSTodo.created_at.desc(),
+        )
+        .limit(100)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_email_drafts(db: AsyncSession, candidate_id: UUID) -> list[EmailDraft]:
+    result = await db.execute(
+        select(EmailDraft)
+        .where(EmailDraft.candidate_id == candidate_id)
+        .order_by(EmailDraft.created_at.desc())
+        .limit(50)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_seq_emails(db: AsyncSession, candidate_id: UUID) -> list[CandidateEmail]:
+    result = await db.execute(
+        select(CandidateEmail)
+        .where(CandidateEmail.candidate_id == candidate_id)
+        .order_by(CandidateEmail.created_at.desc())
+        .limit(50)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_seq_tasks(db: AsyncSession, candidate_id: UUID) -> list[CandidateTask]:
+    result = await db.execute(
+        select(CandidateTask)
+        .where(CandidateTask.candidate_id == candidate_id)
+        .order_by(CandidateTask.created_at.desc())
+        .limit(50)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_company_stats(db: AsyncSession, company_id: UUID) -> dict[str, int]:
+    """Alle Kennzahlen eines Unternehmens in einem Query."""
+    jobs = (
+        select(
+            func.count(Job.id).label("job_count"),
+            func.count(Job.id).filter(Job.acquisition_source.isnot(None)).label("akquise_count"),
+        )
+        .where(Job.company_id == company_id, Job.deleted_at.is_(None))
+        .subquery()
+    )
+    ats_jobs = (
+        select(func.count(ATSJob.id).label("ats_job_count"))
+        .where(ATSJob.company_id == company_id, ATSJob.deleted_at.is_(None))
+        .subquery()
+    )
+    calls = (
+        select(
+            func.count(ATSCallNote.id).label("call_count"),
+            func.coalesce(func.sum(ATSCallNote.duration_minutes), 0).label("call_total_duration"),
+        )
+        .where(ATSCallNote.company_id == company_id)
+        .subquery()
+    )
+    row = (await db.execute(
+        select(
+            jobs.c.job_count,
+            jobs.c.akquise_count,
+            ats_jobs.c.ats_job_count,
+            calls.c.call_count,
+            calls.c.call_total_duration,
+        ).select_from(jobs.join(ats_jobs, true()).join(calls, true()))
+    )).one()
+    return {key: int(value or 0) for key, value in row._mapping.items()}
+
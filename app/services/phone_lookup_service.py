@@ -0,0 +1,202 @@
+"""PhoneLookupService — Ein Telefon-Lookup fuer Kandidaten, Kontakte und Firmen.
+
+Telefonnummern stehen in beliebigen Formaten in der DB ("0170 / 123 45 67",
+"+49 170 1234567", ...). Verglichen wird ueber zwei Keys:
+
+1. E.164 (+491701234567) — exakter Treffer, bevorzugt sortiert
+2. Suffix-Key (letzte 8 Ziffern) — deckt +49 / 0049 / 0 Praefixe ab
+
+Der Suffix-Key ist als Expression-Index auf candidates.phone,
+company_contacts.phone/mobile und companies.phone angelegt (siehe init_db).
+Postgres pflegt diese Indizes bei jedem Schreibzugriff selbst — auch bei
+Raw-SQL-Updates —, ein Lookup ist damit ein Index-Scan statt Full-Table-Scan.
+
+Kuerzere Eingaben (4-7 Ziffern, z.B. Durchwahlen) treffen wie bisher jede
+Nummer, die auf diese Ziffern endet (LIKE '%1234' — ohne Index).
+
+WICHTIG: phone_suffix_sql() muss zeichengleich zum Index-Ausdruck in
+init_db bleiben, sonst nutzt Postgres den Index nicht.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Laenge des Suffix-Keys (identisch zu den bisherigen "letzte 8 Ziffern"-Vergleichen)
+PHONE_SUFFIX_LENGTH = 8
+
+# Sortierung bei gleicher Trefferguete: Kandidaten > Kontakte > Unternehmen
+_ENTITY_PRIORITY = {"candidate": 0, "contact": 1, "company": 2}
+
+
+def normalize_e164(raw: str | None) -> str | None:
+    """Normalisiert eine Telefonnummer nach E.164 (Default-Land: DE)."""
+    if not raw or not raw.strip():
+        return None
+    phone = re.sub(r"[^0-9+]", "", raw.strip())
+    if not phone:
+        return None
+    if phone.startswith("0") and not phone.startswith("00"):
+        phone = "+49" + phone[1:]
+    elif phone.startswith("00"):
+        phone = "+" + phone[2:]
+    elif not phone.startswith("+"):
+        phone = "+49" + phone
+    return phone[:20]
+
+
+def phone_suffix_key(raw: str | None) -> str:
+    """Letzte 8 Ziffern einer Nummer (kuerzere Nummern: alle Ziffern)."""
+    if not raw:
+        return ""
+    digits = re.sub(r"\D", "", raw)
+    return digits[-PHONE_SUFFIX_LENGTH:]
+
+
+def phone_suffix_sql(column: str) -> str:
+    """SQL-Ausdruck des Suffix-Keys — identisch zum Expression-Index in init_db."""
+    return (
+        f"right(regexp_replace(COALESCE({column}, ''), '[^0-9]', '', 'g'), "
+        f"{PHONE_SUFFIX_LENGTH})"
+    )
+
+
+def phone_e164_sql(column: str) -> str:
+    """normalize_e164() als SQL-Ausdruck (fuer die Sortierung vor dem LIMIT)."""
+    digits = f"regexp_replace(COALESCE({column}, ''), '[^0-9+]', '', 'g')"
+    return (
+        f"left(CASE WHEN {digits} LIKE '+%' THEN {digits} "
+        f"WHEN {digits} LIKE '00%' THEN '+' || substr({digits}, 3) "
+        f"WHEN {digits} LIKE '0%' THEN '+49' || substr({digits}, 2) "
+        f"ELSE '+49' || {digits} END, 20)"
+    )
+
+
+def _suffix_match(column: str, partial: bool) -> str:
+    """Suffix-Key gleich (Index) oder — bei kurzer Eingabe — endet auf :suffix."""
+    return f"{phone_suffix_sql(column)} {'LIKE' if partial else '='} :suffix"
+
+
+@dataclass
+class PhoneMatch:
+    """Ein Treffer fuer eine Telefonnummer."""
+    entity_type: str  # candidate / contact / company
+    entity_id: UUID
+    name: str
+    company_id: UUID | None
+    company_name: str | None
+    phone: str | None
+    mobile: str | None
+    exact: bool  # True = gleiche E.164-Nummer, False = nur Suffix gleich
+
+
+def _lookup_parts(partial: bool) -> dict[str, str]:
+    """Eine Teil-Abfrage pro Entitaet (gleiche Spalten, per UNION ALL kombiniert)."""
+    return {
+        "candidate": f"""
+            SELECT 'candidate' AS entity_type, id, first_name, last_name,
+                   NULL::uuid AS company_id, NULL AS company_name, phone, NULL AS mobile,
+                   {phone_e164_sql("phone")} = :e164 AS exact,
+                   {_ENTITY_PRIORITY["candidate"]} AS priority
+            FROM candidates
+            WHERE {_suffix_match("phone", partial)}
+              AND deleted_at IS NULL
+        """,
+        "contact": f"""
+            SELECT 'contact', cc.id, cc.first_name, cc.last_name,
+                   cc.company_id, c.name, cc.phone, cc.mobile,
+                   {phone_e164_sql("cc.phone")} = :e164
+                       OR {phone_e164_sql("cc.mobile")} = :e164,
+                   {_ENTITY_PRIORITY["contact"]}
+            FROM company_contacts cc
+            LEFT JOIN companies c ON c.id = cc.company_id
+            WHERE {_suffix_match("cc.phone", partial)}
+               OR {_suffix_match("cc.mobile", partial)}
+               OR cc.phone_normalized = :e164
+        """,
+        "company": f"""
+            SELECT 'company', id, NULL, NULL, id, name, phone, NULL,
+                   {phone_e164_sql("phone")} = :e164,
+                   {_ENTITY_PRIORITY["company"]}
+            FROM companies
+            WHERE {_suffix_match("phone", partial)}
+        """,
+    }
+
+
+# Volle Suffix-Keys (Index-Gleichheit) und kurze Eingaben (Endung)
+_LOOKUP_PARTS = {False: _lookup_parts(False), True: _lookup_parts(True)}
+
+
+class PhoneLookupService:
+    """Sucht eine Telefonnummer in allen Entitaeten mit einer Abfrage."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def lookup(
+        self,
+        phone: str | None,
+        entity_types: set[str] | None = None,
+        limit: int = 20,
+    ) -> list[PhoneMatch]:
+        """Alle Entitaeten mit dieser Nummer.
+
+        Sortierung: exakte E.164-Treffer zuerst, dann Kandidaten > Kontakte > Firmen.
+
+        Args:
+            phone: Nummer in beliebigem Format (min. 4 Ziffern; unter 8 Ziffern
+                Endungs-Suche wie eine Durchwahl)
+            entity_types: Optional nur diese Typen zurueckgeben
+            limit: Maximale Trefferzahl
+        """
+        suffix = phone_suffix_key(phone)
+        if len(suffix) < 4:
+            return []
+        partial = len(suffix) < PHONE_SUFFIX_LENGTH
+        e164 = normalize_e164(phone)
+
+        parts = [
+            sql for entity_type, sql in _LOOKUP_PARTS[partial].items()
+            if not entity_types or entity_type in entity_types
+        ]
+        # Sortierung in SQL, damit das LIMIT keine exakten Treffer abschneidet
+        result = await self.db.execute(
+            text(
+                "SELECT * FROM (" + " UNION ALL ".join(parts) + ") AS hits "
+                "ORDER BY exact DESC, priority LIMIT :limit"
+            ),
+            {"suffix": f"%{suffix}" if partial else suffix, "e164": e164 or "", "limit": limit},
+        )
+
+        matches = []
+        for row in result.fetchall():
+            entity_type = row[0]
+            if entity_type == "company":
+                name = row[5] or ""
+            else:
+                name = f"{row[2] or ''} {row[3] or ''}".strip()
+            matches.append(PhoneMatch(
+                entity_type=entity_type,
+                entity_id=row[1],
+                name=name,
+                company_id=row[4],
+                company_name=row[5],
+                phone=row[6],
+                mobile=row[7],
+                exact=bool(e164) and bool(row[8]),
+            ))
+        return matches
+
+    async def find_first(
+        self, phone: str | None, entity_types: set[str] | None = None,
+    ) -> PhoneMatch | None:
+        """Bester Treffer (oder None)."""
+        matches = await self.lookup(phone, entity_types=entity_types)
+        return matches[0] if matches else None
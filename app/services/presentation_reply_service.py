@@ -7,20 +7,32 @@ Wird von n8n aufgerufen (alle 15 Min), klassifiziert Kunden-Antworten per GPT-4o
 - AUTO_REPLY: Abwesenheit/Lesebestaetigung → Komplett ignorieren, Sequenz laeuft weiter
 """
 
+import asyncio
 import json
 import logging
 import random
+import re
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, delete, func, and_, or_
+from sqlalchemy import select, delete, and_, or_, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.event_bus import event_bus
+
 logger = logging.getLogger(__name__)
 
+# Aktive Presentations (Antworten werden nur diesen zugeordnet)
+ACTIVE_PRESENTATION_STATUSES = ("sent", "followup_1", "followup_2", "draft")
+# Blocklist-Cache: Abgleich mit der DB spaetestens nach dieser Zeit
+# (Versandpfade bestaetigen Cache-Misses zusaetzlich per Index-Lookup)
+BLOCKLIST_REFRESH_SECONDS = 60
+BLOCKLIST_TOPIC = "email_blocklist"
+
 
 # ═══════════════════════════════════════════════════════════════
 #  REPLY CLASSIFICATION PROMPT (GPT-4o-mini)
@@ -188,6 +200,96 @@ def _next_business_morning() -> datetime:
     return next_day.replace(hour=8, minute=0, second=0, microsecond=0)
 
 
+# ═══════════════════════════════════════════════════════════════
+#  BLOCKLIST-CACHE
+# ═══════════════════════════════════════════════════════════════
+
+class BlocklistCache:
+    """In-Process-Set der blockierten Domains.
+
+    Wird bei Bedarf komplett aus email_blocklist geladen (eine Query) und
+    spaetestens alle `refresh_seconds` abgeglichen. Aenderungen in diesem
+    Worker wirken sofort (add/invalidate), andere Worker werden ueber den
+    Event-Bus benachrichtigt. Vor dem Versand fragt is_blocked(confirm=True)
+    bei einem Cache-Miss die DB — ein verpasstes NOTIFY laesst so keine
+    Mail an eine gerade blockierte Domain durch.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float = BLOCKLIST_REFRESH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._domains: set[str] = set()
+        self._loaded_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        return self._clock() - self._loaded_at < self.refresh_seconds
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Laedt die Blocklist nur, wenn noch nie geladen oder Abgleich faellig."""
+        if self.is_fresh():
+            return
+        async with self._lock:
+            if not self.is_fresh():
+                await self.reload(db)
+
+    async def reload(self, db: AsyncSession) -> None:
+        from app.models.email_blocklist import EmailBlocklist
+
+        result = await db.execute(select(EmailBlocklist.domain))
+        self._domains = {domain.lower() for domain in result.scalars().all()}
+        self._loaded_at = self._clock()
+
+    def contains(self, domain: str) -> bool:
+        return domain.strip().lower() in self._domains
+
+    async def is_blocked(self, db: AsyncSession, domain: str, confirm: bool = False) -> bool:
+        """Cache-Abfrage; mit confirm=True wird ein Miss per Index-Lookup bestaetigt."""
+        from app.models.email_blocklist import EmailBlocklist
+
+        domain = domain.strip().lower()
+        await self.ensure_fresh(db)
+        if domain in self._domains:
+            return True
+        if not confirm:
+            return False
+        result = await db.execute(
+            select(EmailBlocklist.id).where(EmailBlocklist.domain == domain).limit(1)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+        # Block aus einem anderen Worker, dessen Event hier nicht ankam
+        self._domains.add(domain)
+        return True
+
+    def add(self, domain: str) -> None:
+        """Domain wurde blockiert (nach Commit aufrufen)."""
+        self._domains.add(domain.strip().lower())
+        event_bus.emit(BLOCKLIST_TOPIC, {})
+
+    def invalidate(self) -> None:
+        """Naechster Zugriff laedt neu (z.B. nach Entfernen einer Domain)."""
+        self._expire()
+        event_bus.emit(BLOCKLIST_TOPIC, {})
+
+    def _expire(self) -> None:
+        self._loaded_at = float("-inf")
+
+
+blocklist_cache = BlocklistCache()
+
+
+def _on_remote_blocklist_change(payload: dict[str, Any]) -> None:
+    blocklist_cache._expire()
+
+
+event_bus.on(BLOCKLIST_TOPIC, _on_remote_blocklist_change)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  MAIN SERVICE CLASS
 # ═══════════════════════════════════════════════════════════════
@@ -203,15 +305,19 @@ class PresentationReplyService:
         email_from: str,
         email_subject: str,
         in_reply_to_subject: str = "",
+        thread_ids: list[str] | None = None,
     ) -> Optional[dict]:
         """Findet die passende Presentation zu einer eingehenden Antwort.
 
-        Matching-Strategie (Prioritaet):
-        1. email_from == email_to einer aktiven Presentation
-           - Bei mehreren Treffern: Betreff-basierter Tie-Breaker
-             (Kandidatenname oder Original-Betreff im Reply-Betreff)
+        Ein einziger Lookup ueber den Reply-Index (recipient_email,
+        subject_key, message_id), Rang pro Treffer (Prioritaet):
+        0. In-Reply-To/References == message_id der Presentation
+        1. email_from == Empfaenger UND gleicher Betreff-Schluessel
+        2. email_from == Empfaenger
+           - Bei mehreren Treffern: Tie-Breaker ueber Kandidatenname im Betreff
            - Fallback: neueste Presentation
-        2. Betreff-Matching als Fallback (Re:/AW: entfernen, dann vergleichen)
+        3. Gleicher Betreff-Schluessel + gleiche Domain (Kollege antwortet)
+        4. Gleicher Betreff-Schluessel
 
         Returns:
             Dict mit Presentation-Daten oder None
@@ -222,8 +328,13 @@ class PresentationReplyService:
             from app.models.company import Company
 
             sender = email_from.strip().lower()
+            sender_domain = sender.split("@", 1)[1] if "@" in sender else ""
             reply_subject_clean = _clean_subject(email_subject or "").lower()
             reply_in_reply_clean = _clean_subject(in_reply_to_subject or "").lower()
+            subject_key = _subject_key(in_reply_to_subject or email_subject)
+            if len(subject_key) <= 10:
+                subject_key = ""  # Zu kurz fuer eindeutiges Betreff-Matching
+            message_ids = [mid for mid in (_normalize_message_id(t) for t in thread_ids or []) if mid]
 
             # ── Gemeinsame Spalten fuer alle Queries ──
             presentation_columns = [
@@ -244,46 +355,48 @@ class PresentationReplyService:
                 Candidate.last_name.label("candidate_last_name"),
             ]
 
-            # Strategie 1: E-Mail-Adresse matchen — ALLE aktiven laden (kein LIMIT 1)
+            # Jede Bedingung trifft einen eigenen Index (BitmapOr)
+            sender_match = ClientPresentation.recipient_email == sender
+            subject_match = ClientPresentation.subject_key == subject_key
+            conditions = [sender_match]
+            rank_whens = []
+            if message_ids:
+                thread_match = ClientPresentation.message_id.in_(message_ids)
+                conditions.append(thread_match)
+                rank_whens.append((thread_match, 0))
+            if subject_key:
+                conditions.append(subject_match)
+                rank_whens.append((and_(sender_match, subject_match), 1))
+            rank_whens.append((sender_match, 2))
+            if subject_key and sender_domain:
+                rank_whens.append((ClientPresentation.recipient_domain == sender_domain, 3))
+            match_rank = case(*rank_whens, else_=4).label("match_rank")
+
             result = await db.execute(
-                select(*presentation_columns)
+                select(*presentation_columns, match_rank)
                 .outerjoin(Company, Company.id == ClientPresentation.company_id)
                 .outerjoin(Candidate, Candidate.id == ClientPresentation.candidate_id)
                 .where(
                     and_(
-                        func.lower(ClientPresentation.email_to) == sender,
-                        ClientPresentation.status.in_(["sent", "followup_1", "followup_2", "draft"]),
+                        or_(*conditions),
+                        ClientPresentation.status.in_(ACTIVE_PRESENTATION_STATUSES),
                     )
                 )
-                .order_by(ClientPresentation.created_at.desc())
+                .order_by(match_rank, ClientPresentation.created_at.desc())
+                .limit(20)
             )
             rows = result.all()
-
-            # Bei mehreren Treffern: Betreff-basierter Tie-Breaker
-            row = _pick_best_match(rows, reply_subject_clean, reply_in_reply_clean)
-
-            # Strategie 2: Betreff-Matching als Fallback
-            if not row and (email_subject or in_reply_to_subject):
-                clean_subject = _clean_subject(in_reply_to_subject or email_subject)
-                if clean_subject and len(clean_subject) > 10:
-                    result = await db.execute(
-                        select(*presentation_columns)
-                        .outerjoin(Company, Company.id == ClientPresentation.company_id)
-                        .outerjoin(Candidate, Candidate.id == ClientPresentation.candidate_id)
-                        .where(
-                            and_(
-                                ClientPresentation.email_subject.ilike(f"%{clean_subject}%"),
-                                ClientPresentation.status.in_(["sent", "followup_1", "followup_2", "draft"]),
-                            )
-                        )
-                        .order_by(ClientPresentation.created_at.desc())
-                    )
-                    rows = result.all()
-                    row = _pick_best_match(rows, reply_subject_clean, reply_in_reply_clean)
-
-            if not row:
+            if not rows:
                 return None
 
+            # Nur die Treffer der besten Stufe; Tie-Breaker bei mehreren
+            best_rank = rows[0].match_rank
+            row = _pick_best_match(
+                [r for r in rows if r.match_rank == best_rank],
+                reply_subject_clean,
+                reply_in_reply_clean,
+            )
+
             return {
                 "id": str(row.id),
                 "candidate_id": str(row.candidate_id) if row.candidate_id else None,
@@ -760,6 +873,8 @@ class PresentationReplyService:
                     logger.info(f"GDPR: Domain '{clean_domain}' war bereits blockiert")
 
             await db.commit()
+            if email_domain:
+                blocklist_cache.add(email_domain.strip().lower())
 
             logger.info(
                 f"GDPR-Loeschung komplett fuer '{company_name}': "
@@ -788,8 +903,6 @@ class PresentationReplyService:
             True wenn blockiert, False wenn nicht
         """
         try:
-            from app.models.email_blocklist import EmailBlocklist
-
             # Domain extrahieren
             if "@" in email:
                 domain = email.split("@", 1)[1].strip().lower()
@@ -799,12 +912,7 @@ class PresentationReplyService:
             if not domain:
                 return False
 
-            result = await db.execute(
-                select(EmailBlocklist.id).where(
-                    EmailBlocklist.domain == domain
-                ).limit(1)
-            )
-            return result.scalar_one_or_none() is not None
+            return await blocklist_cache.is_blocked(db, domain, confirm=True)
 
         except Exception as e:
             logger.error(f"Blocklist-Check fehlgeschlagen fuer {email}: {e}")
@@ -848,6 +956,7 @@ class PresentationReplyService:
         email_subject: str,
         email_body: str,
         in_reply_to_subject: str = "",
+        thread_ids: list[str] | None = None,
     ) -> dict:
         """Verarbeitet eine eingehende Antwort komplett.
 
@@ -884,6 +993,7 @@ class PresentationReplyService:
                     email_from=email_from,
                     email_subject=email_subject,
                     in_reply_to_subject=in_reply_to_subject,
+                    thread_ids=thread_ids,
                 )
             # Session geschlossen!
 
@@ -1091,6 +1201,7 @@ class PresentationReplyService:
                                     blocked_by="auto_reply_monitor",
                                 ))
                                 await db.commit()
+                                blocklist_cache.add(email_domain)
                         # Session geschlossen!
 
                 # Loeschbestaetigung senden — DSGVO-Loeschung ist SOFORT,
@@ -1221,6 +1332,34 @@ def _pick_best_match(rows: list, reply_subject_clean: str, reply_in_reply_clean:
     return rows[0]
 
 
+def _subject_key(subject: str) -> str:
+    """Betreff-Schluessel wie die generierte Spalte client_presentations.subject_key."""
+    return _clean_subject(subject or "").lower()
+
+
+def _normalize_message_id(message_id: str) -> str:
+    """Message-ID ohne spitze Klammern/Whitespace ("<abc@x>" → "abc@x")."""
+    return (message_id or "").strip().strip("<>").strip()
+
+
+def extract_thread_ids(headers: list[dict] | None) -> list[str]:
+    """Liest In-Reply-To + References aus Graph internetMessageHeaders.
+
+    Returns:
+        Normalisierte Message-IDs, In-Reply-To zuerst
+    """
+    ids: list[str] = []
+    for name in ("in-reply-to", "references"):
+        for header in headers or []:
+            if (header.get("name") or "").lower() != name:
+                continue
+            for raw in re.findall(r"<[^>]+>|\S+", header.get("value") or ""):
+                mid = _normalize_message_id(raw)
+                if mid and mid not in ids:
+                    ids.append(mid)
+    return ids
+
+
 def _clean_subject(subject: str) -> str:
     """Entfernt Re:/AW:/Fwd: Praefixe und Whitespace aus Betreff.
 
@@ -13,7 +13,7 @@ import logging
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select, update, func, and_, exists
+from sqlalchemy import select, update, and_, exists
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +24,7 @@ from app.models.company_contact import CompanyContact
 from app.models.company_correspondence import CompanyCorrespondence, CorrespondenceDirection
 from app.models.job import Job
 from app.models.match import Match
+from app.services.domain_protection_service import record_send
 
 logger = logging.getLogger(__name__)
 
@@ -379,6 +380,7 @@ class PresentationService:
         logger.info(f"Match {match.id} presentation_status='presented'")
 
         await db.commit()
+        record_send(presentation.email_from)
         return presentation
 
     # ═══════════════════════════════════════════════════════════════
@@ -445,6 +447,7 @@ class PresentationService:
 
         db.add(presentation)
         await db.commit()
+        record_send(presentation.email_from)
         return True
 
     # ═══════════════════════════════════════════════════════════════
@@ -708,7 +711,7 @@ class PresentationService:
                 selectinload(ClientPresentation.company),
                 selectinload(ClientPresentation.contact),
             )
-            .where(func.lower(ClientPresentation.email_to) == email.strip().lower())
+            .where(ClientPresentation.recipient_email == email.strip().lower())
             .where(ClientPresentation.sequence_active == True)
             .order_by(ClientPresentation.created_at.desc())
         )
@@ -724,7 +727,7 @@ class PresentationService:
                     selectinload(ClientPresentation.company),
                     selectinload(ClientPresentation.contact),
                 )
-                .where(func.lower(ClientPresentation.email_to) == email.strip().lower())
+                .where(ClientPresentation.recipient_email == email.strip().lower())
                 .order_by(ClientPresentation.created_at.desc())
             )
             presentation = result.scalar_one_or_none()
@@ -738,15 +741,22 @@ class PresentationService:
     # 11. SENT-BESTAETIGUNG (n8n meldet zurueck: E-Mail gesendet)
     # ═══════════════════════════════════════════════════════════════
 
-    async def confirm_sent(self, presentation_id: UUID, n8n_execution_id: str | None = None) -> bool:
+    async def confirm_sent(
+        self,
+        presentation_id: UUID,
+        n8n_execution_id: str | None = None,
+        message_id: str | None = None,
+    ) -> bool:
         """Bestaetigt, dass die E-Mail erfolgreich gesendet wurde.
 
         Wird von n8n Workflow 1 nach erfolgreichem E-Mail-Versand aufgerufen.
-        Setzt sent_at (falls noch nicht gesetzt) und optional die n8n execution_id.
+        Setzt sent_at (falls noch nicht gesetzt) und optional die n8n execution_id
+        sowie die Message-ID (Reply-Matching ueber In-Reply-To).
 
         Args:
             presentation_id: ID der Vorstellung
             n8n_execution_id: n8n Execution-ID (optional)
+            message_id: Message-ID der gesendeten E-Mail (optional)
 
         Returns:
             True bei Erfolg, False bei Fehler
@@ -776,6 +786,9 @@ class PresentationService:
         if n8n_execution_id:
             presentation.n8n_execution_id = n8n_execution_id
 
+        if message_id and not presentation.message_id:
+            presentation.message_id = message_id.strip().strip("<>").strip()
+
         # CompanyCorrespondence ERST JETZT erstellen (nach bestaetigtem Versand).
         # Verhindert falsche Korrespondenz-Eintraege wenn der E-Mail-Versand scheitert.
         if presentation.company_id and not presentation.correspondence_id:
@@ -0,0 +1,204 @@
+"""Score-Memo fuer das V3-Scoring: ortsunabhaengige Komponenten pro Paar.
+
+Ein erneuter Lauf von match_job / match_batch hat bisher jedes (Job,
+Kandidat)-Paar komplett neu bewertet — auch wenn sich weder Job- noch
+Kandidaten-Profil noch Konfiguration geaendert haben. Die meisten Paare
+einer woechentlichen Voll-Neuberechnung sind genau solche Paare.
+
+Hier wird pro Paar alles gespeichert, was NICHT vom Standort abhaengt
+(Gates, Layer 1, Layer 2, Branche, Recency). Schluessel:
+
+    (Job-Version, Kandidaten-Version, Konfigurations-Version)
+
+Die Versionen sind Fingerprints der tatsaechlich verwendeten Eingaben
+(Profilfelder, Embedding, Skill-Configs, Gewichte, Regeln, Engine-Version).
+Aendert sich etwas davon, passt der Schluessel nicht mehr und das Paar wird
+neu bewertet.
+
+Persistiert wird in match_v2_score_memo (eine Zeile pro Paar, bei neuer
+Version ueberschrieben): das Memo ueberlebt Deploys und ist fuer alle
+Worker dasselbe. Pro Job werden nur die Zeilen mit aktueller Job- und
+Konfigurations-Version geladen, neue Eintraege gesammelt per Upsert
+geschrieben. Ohne DB-Session (Benchmarks, Tests) bleibt es im Speicher.
+
+Standort-Punkte (Fahrzeit / Luftlinie), Quality-Cap und Leer-CV-Abzug
+rechnet die Engine bei jedem Lauf neu — sie sind billig und aendern sich,
+wenn Koordinaten oder Fahrzeiten nachgetragen werden.
+"""
+
+import hashlib
+import json
+import logging
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match_v2_models import MatchV2ScoreMemo
+
+logger = logging.getLogger(__name__)
+
+# Zeilen pro Upsert (6 Parameter pro Zeile, asyncpg erlaubt 32767)
+SCORE_MEMO_UPSERT_CHUNK = 1000
+
+MemoKey = tuple[str, str, str]  # (job_version, candidate_version, config_version)
+
+
+def fingerprint(data: Any, *vectors: Sequence[float] | None) -> str:
+    """Stabiler Hash ueber JSON-Daten plus optionale Vektoren (Embeddings).
+
+    Vektoren werden binaer gehasht statt als JSON serialisiert (384 Floats
+    pro Kandidat wuerden sonst den Grossteil der Zeit kosten).
+    """
+    digest = hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+    )
+    for vector in vectors:
+        digest.update(b"|")
+        if vector is not None and len(vector):
+            digest.update(array("d", vector).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class PairScore:
+    """Ortsunabhaengige V3-Komponenten eines (Job, Kandidat)-Paares.
+
+    reject_reason gesetzt → Paar scheitert an einem Gate oder am
+    Layer-1-Minimum; die restlichen Felder sind dann nicht befuellt.
+    """
+    reject_reason: str | None = None
+    candidate_role: str | None = None
+    role_depth: int = 0
+    skill_depth: int = 0
+    cert_match: int = 0
+    seniority_pts: int = 0
+    qualification_tag: str | None = None
+    software_pts: int = 0
+    emb_raw: float = 0.0
+    embedding_pts: int = 0
+    career_raw: float = 0.0
+    career_note: str | None = None
+    career_pts: int = 0
+    ind_raw: float = 0.0
+    industry_pts: int = 0
+    recency_pts: int = 0
+
+    @property
+    def layer1(self) -> int:
+        return self.role_depth + self.skill_depth + self.cert_match
+
+    @property
+    def layer2(self) -> int:
+        return self.seniority_pts + self.software_pts + self.embedding_pts + self.career_pts
+
+    def to_json(self) -> dict:
+        """Nur Felder abweichend vom Default (Gate-Rejects → ein Feld)."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) != f.default
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "PairScore":
+        return cls(**data)
+
+
+class ScoreMemo:
+    """PairScore-Eintraege eines Engine-Laufs, persistiert in match_v2_score_memo.
+
+    Im Speicher liegen nur die Paare des aktuell bewerteten Jobs (mit DB)
+    bzw. alle Paare dieser Instanz (ohne DB).
+    """
+
+    def __init__(self, db: AsyncSession | None = None):
+        self.db = db
+        self._entries: dict[tuple[UUID, UUID], tuple[MemoKey, PairScore]] = {}
+        self._pending: dict[tuple[UUID, UUID], tuple[MemoKey, PairScore]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self, job_id: UUID, job_version: str, config_version: str) -> None:
+        """Gespeicherte Paare des Jobs mit passender Job-/Config-Version laden."""
+        if self.db is None:
+            return
+        self._entries.clear()
+        result = await self.db.execute(
+            select(
+                MatchV2ScoreMemo.candidate_id,
+                MatchV2ScoreMemo.candidate_version,
+                MatchV2ScoreMemo.scores,
+            ).where(
+                MatchV2ScoreMemo.job_id == job_id,
+                MatchV2ScoreMemo.job_version == job_version,
+                MatchV2ScoreMemo.config_version == config_version,
+            )
+        )
+        for candidate_id, candidate_version, scores in result.all():
+            key = (job_version, candidate_version, config_version)
+            self._entries[(job_id, candidate_id)] = (key, PairScore.from_json(scores))
+
+    def get(self, job_id: UUID, candidate_id: UUID, key: MemoKey) -> PairScore | None:
+        entry = self._entries.get((job_id, candidate_id))
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, job_id: UUID, candidate_id: UUID, key: MemoKey, pair: PairScore) -> None:
+        self._entries[(job_id, candidate_id)] = (key, pair)
+        self._pending[(job_id, candidate_id)] = (key, pair)
+
+    def pending_rows(self) -> list[dict]:
+        """Neue/geaenderte Eintraege seit dem letzten flush() als Tabellenzeilen."""
+        return [
+            {
+                "job_id": job_id,
+                "candidate_id": candidate_id,
+                "job_version": key[0],
+                "candidate_version": key[1],
+                "config_version": key[2],
+                "scores": pair.to_json(),
+            }
+            for (job_id, candidate_id), (key, pair) in self._pending.items()
+        ]
+
+    async def flush(self) -> int:
+        """Neue Eintraege per Upsert schreiben (Transaktion des Aufrufers).
+
+        Laeuft in einem Savepoint: scheitert das Schreiben, wird nur das
+        Memo verworfen, nicht der Matching-Lauf.
+        """
+        rows = self.pending_rows()
+        self._pending.clear()
+        if self.db is None or not rows:
+            return 0
+        try:
+            async with self.db.begin_nested():
+                for i in range(0, len(rows), SCORE_MEMO_UPSERT_CHUNK):
+                    stmt = insert(MatchV2ScoreMemo).values(rows[i:i + SCORE_MEMO_UPSERT_CHUNK])
+                    await self.db.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=[MatchV2ScoreMemo.job_id, MatchV2ScoreMemo.candidate_id],
+                            set_={
+                                "job_version": stmt.excluded.job_version,
+                                "candidate_version": stmt.excluded.candidate_version,
+                                "config_version": stmt.excluded.config_version,
+                                "scores": stmt.excluded.scores,
+                                "updated_at": func.now(),
+                            },
+                        )
+                    )
+        except Exception as e:
+            logger.warning(f"Score-Memo: {len(rows)} Eintraege nicht gespeichert: {e}")
+            return 0
+        return len(rows)
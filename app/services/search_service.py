@@ -20,7 +20,18 @@ class SearchService:
         if "@" in search_stripped:
             cand_filter = func.lower(Candidate.email) == search_stripped.lower()
         elif len(digits_only) >= 6 and len(digits_only) >= len(search_stripped) * 0.5:
-            cand_filter = func.regexp_replace(Candidate.phone, '[^0-9]', '', 'g').ilike(f"%{digits_only}%")
+            # Vollstaendige Nummer → Suffix-Index; sonst Teilstring-Suche
+            phone_ids = []
+            if len(digits_only) >= 8:
+                from app.services.phone_lookup_service import PhoneLookupService
+                matches = await PhoneLookupService(db).lookup(
+                    search_stripped, entity_types={"candidate"},
+                )
+                phone_ids = [m.entity_id for m in matches]
+            if phone_ids:
+                cand_filter = Candidate.id.in_(phone_ids)
+            else:
+                cand_filter = func.regexp_replace(Candidate.phone, '[^0-9]', '', 'g').ilike(f"%{digits_only}%")
         else:
             cand_conditions = [
                 Candidate.first_name.ilike(term),
@@ -0,0 +1,190 @@
+"""Kosinus-Aehnlichkeit fuer Embeddings — gemeinsamer Kern.
+
+Bisher hatten local_embedding_service, embedding_service und
+mt_learning_service je eine eigene Python-Schleife, die pro Aufruf jede
+Kandidaten-Norm neu berechnet hat. Hier:
+
+- VectorIndex normalisiert die Kandidaten-Vektoren EINMAL (float32-Matrix)
+- Danach ist jede Abfrage ein einziges Matrix-Vektor-Produkt
+- top_k per argpartition statt vollstaendiger Sortierung
+- Matrix x Matrix fuer viele Queries auf einmal
+
+Ohne NumPy laufen dieselben Funktionen in reinem Python (Normen werden
+auch dort nur einmal pro Index berechnet).
+
+Vektoren mit falscher Laenge, leere Vektoren oder Null-Vektoren ergeben
+Aehnlichkeit 0.0 — wie bisher in allen drei Implementierungen.
+"""
+
+import heapq
+import logging
+import math
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ist normalerweise installiert
+    np = None
+
+logger = logging.getLogger(__name__)
+
+HAS_NUMPY = np is not None
+
+Vector = Sequence[float]
+
+
+def _is_vector(value, dim: int | None) -> bool:
+    if value is None or isinstance(value, (str, bytes, dict)):
+        return False
+    try:
+        length = len(value)
+    except TypeError:
+        return False
+    return length > 0 and (dim is None or length == dim)
+
+
+def _py_normalize(vector: Vector) -> list[float] | None:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return None
+    return [x / norm for x in vector]
+
+
+class VectorIndex:
+    """Vorab normalisierte Kandidaten-Vektoren fuer wiederholte Abfragen.
+
+    Die Position im Index entspricht der Position in `vectors`; ungueltige
+    Eintraege bleiben erhalten und liefern immer 0.0.
+    """
+
+    def __init__(self, vectors: Sequence[Vector | None], dim: int | None = None):
+        self.size = len(vectors)
+        if dim is None:
+            dim = next((len(v) for v in vectors if _is_vector(v, None)), None)
+        self.dim = dim
+        self._positions = [i for i, v in enumerate(vectors) if dim and _is_vector(v, dim)]
+
+        if not self._positions:
+            self._matrix = None
+            self._rows: list[list[float] | None] = []
+        elif HAS_NUMPY:
+            matrix = np.asarray([vectors[i] for i in self._positions], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            # Null-Vektoren bleiben Null-Zeilen → Score 0.0
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+            self._matrix = matrix
+        else:
+            self._matrix = None
+            self._rows = [_py_normalize(vectors[i]) for i in self._positions]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _query_vector(self, query: Vector | None):
+        """Normalisierte Query oder None (falsche Laenge, Null-Vektor)."""
+        if not self._positions or not _is_vector(query, self.dim):
+            return None
+        if HAS_NUMPY:
+            q = np.asarray(query, dtype=np.float32)
+            norm = float(np.linalg.norm(q))
+            return q / norm if norm > 0 else None
+        return _py_normalize(query)
+
+    def _valid_scores(self, q) -> Sequence[float]:
+        """Scores nur fuer die gueltigen Positionen."""
+        if HAS_NUMPY:
+            return self._matrix @ q
+        return [
+            sum(a * b for a, b in zip(q, row)) if row is not None else 0.0
+            for row in self._rows
+        ]
+
+    def scores(self, query: Vector | None) -> list[float]:
+        """Aehnlichkeit der Query zu jedem Eintrag (gleiche Reihenfolge)."""
+        result = [0.0] * self.size
+        q = self._query_vector(query)
+        if q is None:
+            return result
+        valid = self._valid_scores(q)
+        if HAS_NUMPY:
+            valid = valid.tolist()
+        for position, score in zip(self._positions, valid):
+            result[position] = score
+        return result
+
+    def top_k(self, query: Vector | None, k: int) -> list[tuple[int, float]]:
+        """Die k aehnlichsten Eintraege als (Position, Score), absteigend."""
+        q = self._query_vector(query)
+        if q is None or k <= 0:
+            return []
+        valid = self._valid_scores(q)
+        if HAS_NUMPY:
+            k = min(k, len(valid))
+            best = np.argpartition(-valid, k - 1)[:k]
+            best = best[np.argsort(-valid[best], kind="stable")]
+            return [(self._positions[i], float(valid[i])) for i in best]
+        best = heapq.nlargest(k, range(len(valid)), key=valid.__getitem__)
+        return [(self._positions[i], valid[i]) for i in best]
+
+    def matrix(self, queries: Sequence[Vector | None]) -> list[list[float]]:
+        """Aehnlichkeiten fuer viele Queries: Zeile pro Query, Spalte pro Eintrag."""
+        if not HAS_NUMPY or not self._positions:
+            return [self.scores(q) for q in queries]
+
+        rows = [i for i, q in enumerate(queries) if _is_vector(q, self.dim)]
+        result = [[0.0] * self.size for _ in queries]
+        if not rows:
+            return result
+
+        q_matrix = np.asarray([queries[i] for i in rows], dtype=np.float32)
+        norms = np.linalg.norm(q_matrix, axis=1, keepdims=True)
+        np.divide(q_matrix, norms, out=q_matrix, where=norms > 0)
+        scores = (q_matrix @ self._matrix.T).tolist()
+        for row_index, row_scores in zip(rows, scores):
+            target = result[row_index]
+            for position, score in zip(self._positions, row_scores):
+                target[position] = score
+        return result
+
+
+def cosine(a: Vector | None, b: Vector | None) -> float:
+    """Kosinus-Aehnlichkeit zweier Vektoren (-1.0 bis 1.0, 0.0 bei ungueltig)."""
+    if not _is_vector(a, None) or not _is_vector(b, len(a)):
+        return 0.0
+    if HAS_NUMPY:
+        va = np.asarray(a, dtype=np.float64)
+        vb = np.asarray(b, dtype=np.float64)
+        denom = float(np.linalg.norm(va) * np.linalg.norm(vb))
+        return float(va @ vb) / denom if denom > 0 else 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def cosine_batch(query: Vector | None, candidates: Sequence[Vector | None]) -> list[float]:
+    """Eine Query gegen viele Kandidaten (Reihenfolge bleibt erhalten)."""
+    if not candidates or not _is_vector(query, None):
+        return [0.0] * len(candidates) if candidates else []
+    return VectorIndex(candidates, dim=len(query)).scores(query)
+
+
+def cosine_matrix(
+    queries: Sequence[Vector | None],
+    candidates: Sequence[Vector | None],
+) -> list[list[float]]:
+    """Alle Queries gegen alle Kandidaten in einem Matrix-Produkt."""
+    return VectorIndex(candidates).matrix(queries)
+
+
+def top_k(
+    query: Vector | None,
+    candidates: Sequence[Vector | None],
+    k: int,
+) -> list[tuple[int, float]]:
+    """Die k aehnlichsten Kandidaten als (Index, Score), absteigend sortiert."""
+    if not candidates or not _is_vector(query, None):
+        return []
+    return VectorIndex(candidates, dim=len(query)).top_k(query, k)
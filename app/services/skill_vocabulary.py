@@ -0,0 +1,257 @@
+"""Kompiliertes Skill-Vokabular fuer das V3-Scoring.
+
+Das Skill-Scoring hat pro (Job, Kandidat)-Paar jeden Skill-Namen erneut
+kleingeschrieben, ueber die Synonym-Tabelle normalisiert, den Kern-Namen
+extrahiert und Substring-Vergleiche gemacht — bei 2000 Kandidaten pro Job
+reine String-Arbeit in der innersten Schleife.
+
+Hier wird jeder Skill-Name EINMAL auf eine Integer-ID abgebildet
+(Skills aus skill_weights.json / skill_hierarchy.json beim Aufbau, alle
+weiteren beim ersten Auftreten). Pro ID vorberechnet:
+
+- Kern-ID ("englisch (gut)" → "englisch")
+- ob der Name fachlich irrelevant ist (Sprache, Soft Skill)
+- Gewicht pro Rolle (skill_weights.json)
+- "verwandte" IDs (Kern gleich oder Teilstring) als Bitset, inkrementell
+  erweitert, wenn neue Skills ins Vokabular kommen
+
+Kandidaten- und Job-Profile sind danach nur noch ID-Folgen mit Bitset und
+Recency-Seitenarray; der Vergleich ist Bit-AND plus Dict-Lookups.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+RECENCY_MODIFIERS = {"aktuell": 1.0, "kuerzlich": 0.75, "veraltet": 0.4}
+
+# Kategorien, deren Skills zusaetzlich als ERP-Skills uebernommen werden
+ERP_CATEGORIES = ("software", "erp", "tool")
+
+DEFAULT_SKILL_WEIGHT = 5
+
+
+@dataclass(slots=True)
+class CandidateSkillProfile:
+    """Kandidaten-Skills als IDs: Reihenfolge, Bitset, Recency-Modifier."""
+    order: tuple[int, ...]
+    mask: int
+    recency: dict[int, float]
+
+
+@dataclass(slots=True)
+class JobSkillEntry:
+    skill_id: int
+    is_fachkenntnis: bool
+
+
+class SkillVocabulary:
+    """Interniert Skill-Namen zu IDs und cached alle davon abgeleiteten Werte.
+
+    Die Normalisierungsregeln (Synonyme, Kern-Skill, Irrelevanz, Gewichte)
+    kommen als Funktionen aus MatchingEngineV2 — das Vokabular speichert nur
+    deren Ergebnisse.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[str], str],
+        extract_core: Callable[[str], str],
+        is_irrelevant: Callable[[str, str | None], bool],
+        skill_weight: Callable[[str, str], int | None],
+        skip_categories: Iterable[str],
+    ):
+        self._normalize = normalize
+        self._extract_core = extract_core
+        self._is_irrelevant = is_irrelevant
+        self._skill_weight = skill_weight
+        self._skip_categories = frozenset(skip_categories)
+
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._core_ids: list[int] = []
+        self._irrelevant: list[bool] = []
+        # Rohname → ID (spart lower/strip/Synonym bei wiederholten Namen)
+        self._normalized_ids: dict[str, int] = {}
+        self._exact_ids: dict[str, int] = {}
+        self._weights: dict[tuple[str | None, int], int] = {}
+        # Verwandte IDs pro Job-Skill: (Bitset, geprueft bis ID)
+        self._related: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ── Interning ──
+
+    def _add(self, name: str) -> int:
+        skill_id = self._ids.get(name)
+        if skill_id is not None:
+            return skill_id
+        skill_id = len(self._names)
+        self._ids[name] = skill_id
+        self._names.append(name)
+        self._core_ids.append(-1)  # wird unten gesetzt (Kern kann neuer Name sein)
+        self._irrelevant.append(self._is_irrelevant(name, None))
+        core = self._extract_core(name)
+        self._core_ids[skill_id] = skill_id if core == name else self._add(core)
+        return skill_id
+
+    def intern(self, raw: str) -> int | None:
+        """ID des normalisierten Namens (lower/strip + Synonym); None bei leer."""
+        skill_id = self._normalized_ids.get(raw)
+        if skill_id is None:
+            name = self._normalize(raw.lower().strip())
+            if not name:
+                return None
+            skill_id = self._add(name)
+            self._normalized_ids[raw] = skill_id
+        return skill_id
+
+    def intern_exact(self, raw: str) -> int | None:
+        """ID des Namens ohne Synonym-Normalisierung (Zertifizierungen)."""
+        skill_id = self._exact_ids.get(raw)
+        if skill_id is None:
+            name = raw.lower().strip()
+            if not name:
+                return None
+            skill_id = self._add(name)
+            self._exact_ids[raw] = skill_id
+        return skill_id
+
+    def warm(self, names: Iterable[str]) -> None:
+        """Bekannte Skills vorab internieren (Config-Dateien)."""
+        for name in names:
+            if isinstance(name, str):
+                self.intern(name)
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    # ── Abgeleitete Werte ──
+
+    def is_irrelevant(self, skill_id: int, category: str | None) -> bool:
+        if category and category.lower() in self._skip_categories:
+            return True
+        return self._irrelevant[skill_id]
+
+    def weight(self, role: str | None, skill_id: int) -> int:
+        """Gewicht wie im alten Scoring: Config-Wert oder 5."""
+        key = (role, skill_id)
+        weight = self._weights.get(key)
+        if weight is None:
+            weight = DEFAULT_SKILL_WEIGHT
+            if role:
+                weight = self._skill_weight(role, self._names[skill_id]) or DEFAULT_SKILL_WEIGHT
+            self._weights[key] = weight
+        return weight
+
+    def related_mask(self, skill_id: int) -> int:
+        """Bitset aller IDs mit gleichem Kern oder Teilstring-Beziehung.
+
+        Wird beim ersten Zugriff aufgebaut und spaeter nur um neu
+        hinzugekommene IDs erweitert.
+        """
+        mask, checked = self._related.get(skill_id, (0, 0))
+        total = len(self._names)
+        if checked < total:
+            name = self._names[skill_id]
+            core = self._core_ids[skill_id]
+            long_enough = len(name) > 3
+            for other in range(checked, total):
+                if other == skill_id:
+                    continue
+                if self._core_ids[other] == core:
+                    mask |= 1 << other
+                    continue
+                other_name = self._names[other]
+                if long_enough and len(other_name) > 3 and (name in other_name or other_name in name):
+                    mask |= 1 << other
+            self._related[skill_id] = (mask, total)
+        return mask
+
+    def is_core_match(self, a: int, b: int) -> bool:
+        return self._core_ids[a] == self._core_ids[b]
+
+    # ── Profile ──
+
+    def candidate_profile(self, skills: list[dict], certifications: list[str]) -> CandidateSkillProfile:
+        """Kandidaten-Skills → IDs; beste Recency pro Skill, Zertifikate immer aktuell."""
+        recency: dict[int, str] = {}
+        for s in skills or []:
+            if not isinstance(s, dict):
+                continue
+            skill_id = self.intern(s.get("skill", ""))
+            if skill_id is None or self.is_irrelevant(skill_id, s.get("category", "")):
+                continue
+            value = s.get("recency", "aktuell")
+            existing = recency.get(skill_id)
+            if existing is None or RECENCY_MODIFIERS.get(value, 1.0) > RECENCY_MODIFIERS.get(existing, 1.0):
+                recency[skill_id] = value
+        for cert in certifications or []:
+            skill_id = self.intern_exact(cert)
+            if skill_id is not None:
+                recency[skill_id] = "aktuell"
+        for s in skills or []:
+            if isinstance(s, dict) and s.get("category") in ERP_CATEGORIES:
+                skill_id = self.intern(s.get("skill", ""))
+                if skill_id is not None:
+                    recency.setdefault(skill_id, s.get("recency", "aktuell"))
+
+        mask = 0
+        for skill_id in recency:
+            mask |= 1 << skill_id
+        return CandidateSkillProfile(
+            order=tuple(recency),
+            mask=mask,
+            recency={k: RECENCY_MODIFIERS.get(v, 1.0) for k, v in recency.items()},
+        )
+
+    def job_profile(self, job_skills: list[dict], job_role: str | None) -> list[JobSkillEntry]:
+        """Job-Skills → bewertbare Eintraege (ohne Irrelevante und Software)."""
+        entries = []
+        for js in job_skills or []:
+            if not isinstance(js, dict):
+                continue
+            skill_id = self.intern(js.get("skill", ""))
+            if skill_id is None or self.is_irrelevant(skill_id, js.get("category", "")):
+                continue
+            weight = self.weight(job_role, skill_id)
+            if weight <= 4:
+                continue  # Software wird in Layer 2 bewertet
+            entries.append(JobSkillEntry(skill_id=skill_id, is_fachkenntnis=weight >= 9))
+        return entries
+
+    def score_depth(self, job: list[JobSkillEntry], cand: CandidateSkillProfile) -> tuple[int, int]:
+        """Skill-Tiefe (0-20) und Anzahl Fachkenntnis-Matches.
+
+        Gleiche Punkte wie bisher: exakt 2.0/1.5, Kern 1.5/1.0, Teilstring
+        0.8/0.5 (Fachkenntnis/sonst), jeweils × Recency des Kandidaten-Skills.
+        Bei Kern/Teilstring zaehlt der erste passende Kandidaten-Skill.
+        """
+        if not job:
+            return 0, 0
+
+        points = 0.0
+        fachkenntnisse_matches = 0
+        for entry in job:
+            skill_id = entry.skill_id
+            if cand.mask >> skill_id & 1:
+                matched = skill_id
+                score = 2.0 if entry.is_fachkenntnis else 1.5
+            else:
+                hits = cand.mask & self.related_mask(skill_id)
+                if not hits:
+                    continue
+                matched = next(cid for cid in cand.order if hits >> cid & 1)
+                if self.is_core_match(skill_id, matched):
+                    score = 1.5 if entry.is_fachkenntnis else 1.0
+                else:
+                    score = 0.8 if entry.is_fachkenntnis else 0.5
+
+            points += score * cand.recency.get(matched, 1.0)
+            if entry.is_fachkenntnis:
+                fachkenntnisse_matches += 1
+
+        return min(20, int(round(points))), fachkenntnisse_matches
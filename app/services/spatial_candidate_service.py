@@ -0,0 +1,137 @@
+"""SpatialCandidateService — Umkreis-Kandidaten fuer viele Jobs in einer Abfrage.
+
+Batch-Laeufe (MatchingEngineV2.match_batch, MatchingPipelineV3.run_all)
+haben bisher pro Job ein eigenes ST_DWithin-Query abgesetzt. Dieser Service
+macht daraus einen einzigen Spatial-Join ueber alle Jobs eines Batches:
+
+    jobs j  ⋈  candidates c  ON ST_DWithin(c.address_coords, job_coords, radius)
+
+Ergebnis sind kompakte (job_id, candidate_id, distance_km)-Tupel; die
+per-Job-Scorer laden danach nur noch die Kandidaten, die sie brauchen.
+
+Voraussetzung fuer Index-Nutzung: GiST-Index auf candidates.address_coords
+(wird in init_db sichergestellt).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.candidate import Candidate
+from app.models.company import Company
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Jobs pro Spatial-Join (begrenzt Ergebnisgroesse und Statement-Laufzeit)
+SPATIAL_BATCH_SIZE = 250
+
+
+@dataclass
+class SpatialCandidateIndex:
+    """Umkreis-Kandidaten pro Job.
+
+    covered: Jobs mit Koordinaten (und nicht remote) — nur fuer diese gilt
+             der Distanz-Hard-Filter. Jobs ohne Eintrag hier muessen weiter
+             ueber den normalen per-Job-Pfad gefiltert werden.
+    pairs:   job_id → [(candidate_id, distance_km)], nach Distanz sortiert
+    """
+    covered: set[UUID] = field(default_factory=set)
+    pairs: dict[UUID, list[tuple[UUID, float]]] = field(default_factory=dict)
+
+    def covers(self, job_id: UUID) -> bool:
+        return job_id in self.covered
+
+    def candidates_for(self, job_id: UUID) -> list[tuple[UUID, float]]:
+        return self.pairs.get(job_id, [])
+
+    @property
+    def candidate_ids(self) -> set[UUID]:
+        return {cand_id for pairs in self.pairs.values() for cand_id, _ in pairs}
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self.pairs.values())
+
+
+class SpatialCandidateService:
+    """Ein Spatial-Join fuer eine ganze Job-Menge."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def for_jobs(
+        self,
+        job_ids: Sequence[UUID],
+        radius_km: float,
+        candidate_conditions: Sequence[ColumnElement] = (),
+        company_fallback: bool = False,
+    ) -> SpatialCandidateIndex:
+        """Kandidaten im Umkreis aller Jobs.
+
+        Args:
+            job_ids: Jobs des Batches
+            radius_km: Umkreis (Hard-Filter)
+            candidate_conditions: Zusaetzliche Filter auf Candidate (fuer alle Jobs gleich)
+            company_fallback: Jobs ohne Koordinaten nutzen den Firmen-Standort
+                              (wie MatchingEngineV2.match_job)
+        """
+        index = SpatialCandidateIndex()
+        ids = list(dict.fromkeys(job_ids))
+        for start in range(0, len(ids), SPATIAL_BATCH_SIZE):
+            await self._load_chunk(
+                ids[start:start + SPATIAL_BATCH_SIZE],
+                radius_km, candidate_conditions, company_fallback, index,
+            )
+
+        logger.info(
+            f"Spatial-Join: {len(index)} Job/Kandidat-Paare fuer "
+            f"{len(index.covered)}/{len(ids)} Jobs mit Koordinaten (<= {radius_km}km)"
+        )
+        return index
+
+    async def _load_chunk(
+        self,
+        job_ids: list[UUID],
+        radius_km: float,
+        candidate_conditions: Sequence[ColumnElement],
+        company_fallback: bool,
+        index: SpatialCandidateIndex,
+    ) -> None:
+        if company_fallback:
+            job_coords = func.coalesce(Job.location_coords, Company.location_coords)
+            jobs_from = Job.__table__.outerjoin(Company, Company.id == Job.company_id)
+        else:
+            job_coords = Job.location_coords
+            jobs_from = Job.__table__
+
+        # LEFT JOIN: Jobs mit Koordinaten aber ohne Kandidaten bleiben sichtbar (covered)
+        on_clause = and_(
+            Candidate.address_coords.isnot(None),
+            func.ST_DWithin(Candidate.address_coords, job_coords, radius_km * 1000),
+            *candidate_conditions,
+        )
+        distance_km = (
+            func.ST_Distance(Candidate.address_coords, job_coords) / literal(1000.0)
+        ).label("distance_km")
+
+        query = (
+            select(Job.id, Candidate.id, distance_km)
+            .select_from(jobs_from.outerjoin(Candidate, on_clause))
+            .where(
+                Job.id.in_(job_ids),
+                job_coords.isnot(None),
+                Job.work_arrangement.is_distinct_from("remote"),
+            )
+            .order_by(Job.id, distance_km)
+        )
+
+        result = await self.db.execute(query)
+        for job_id, cand_id, dist in result.all():
+            index.covered.add(job_id)
+            if cand_id is not None:
+                index.pairs.setdefault(job_id, []).append((cand_id, round(dist, 1)))
@@ -23,6 +23,28 @@ _pending_task_data: dict[str, dict] = {}
 # Telegram Bot API Base URL
 TELEGRAM_API = "https://api.telegram.org/bot{token}"
 
+# Gepoolter Bot-API-Client (Keep-Alive statt TLS-Handshake pro Aufruf)
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Gibt den (lazy erstellten) HTTP-Client fuer die Bot-API zurueck."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Schliesst den Bot-API-Client (App-Shutdown)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
 
 # ── Telegram API Helpers ─────────────────────────────────────────
 
@@ -52,10 +74,9 @@ async def send_message(
         payload["reply_markup"] = reply_markup
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(url, json=payload)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await _get_client().post(url, json=payload)
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
         logger.error(f"Telegram sendMessage fehlgeschlagen: {e}")
         return None
@@ -75,18 +96,18 @@ async def send_document(
     url = f"{TELEGRAM_API.format(token=settings.sincirusbot_token)}/sendDocument"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            data = {"chat_id": target_chat}
-            if caption:
-                data["caption"] = caption
-                data["parse_mode"] = "HTML"
-            resp = await client.post(
-                url,
-                data=data,
-                files={"document": (filename, document, "application/pdf")},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        data = {"chat_id": target_chat}
+        if caption:
+            data["caption"] = caption
+            data["parse_mode"] = "HTML"
+        resp = await _get_client().post(
+            url,
+            data=data,
+            files={"document": (filename, document, "application/pdf")},
+            timeout=30.0,
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
         logger.error(f"Telegram sendDocument fehlgeschlagen: {e}")
         return None
@@ -98,11 +119,10 @@ async def answer_callback_query(callback_query_id: str, text: str = "") -> None:
         return
     url = f"{TELEGRAM_API.format(token=settings.sincirusbot_token)}/answerCallbackQuery"
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            await client.post(url, json={
-                "callback_query_id": callback_query_id,
-                "text": text,
-            })
+        await _get_client().post(url, json={
+            "callback_query_id": callback_query_id,
+            "text": text,
+        }, timeout=5.0)
     except Exception:
         pass
 
@@ -115,17 +135,17 @@ async def _download_file(file_id: str) -> bytes | None:
     base = TELEGRAM_API.format(token=settings.sincirusbot_token)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Schritt 1: File-Info holen
-            info_resp = await client.get(f"{base}/getFile", params={"file_id": file_id})
-            info_resp.raise_for_status()
-            file_path = info_resp.json()["result"]["file_path"]
-
-            # Schritt 2: Datei herunterladen
-            download_url = f"https://api.telegram.org/file/bot{settings.sincirusbot_token}/{file_path}"
-            file_resp = await client.get(download_url)
-            file_resp.raise_for_status()
-            return file_resp.content
+        client = _get_client()
+        # Schritt 1: File-Info holen
+        info_resp = await client.get(f"{base}/getFile", params={"file_id": file_id})
+        info_resp.raise_for_status()
+        file_path = info_resp.json()["result"]["file_path"]
+
+        # Schritt 2: Datei herunterladen
+        download_url = f"https://api.telegram.org/file/bot{settings.sincirusbot_token}/{file_path}"
+        file_resp = await client.get(download_url, timeout=30.0)
+        file_resp.raise_for_status()
+        return file_resp.content
     except Exception as e:
         logger.error(f"Telegram Datei-Download fehlgeschlagen: {e}")
         return None
@@ -133,8 +153,48 @@ async def _download_file(file_id: str) -> bytes | None:
 
 # ── Update Handler ───────────────────────────────────────────────
 
-async def handle_update(update: dict) -> None:
-    """Haupteinstiegspunkt: Verarbeitet ein Telegram Update."""
+async def prepare_update(update: dict) -> dict | None:
+    """Fuehrt die reihenfolge-unabhaengigen Schritte eines Updates vorab aus.
+
+    Voice: Download + Whisper + Intent, Freitext: Intent-Klassifikation.
+    Laeuft im Dispatcher parallel zu anderen Updates; das Ergebnis wird
+    danach in Chat-Reihenfolge an handle_update() uebergeben.
+
+    Returns:
+        {"text": str, "intent": dict} bzw. {"error": str} — oder None fuer
+        Kommandos und Button-Klicks (Fast-Path ohne LLM).
+    """
+    message = update.get("message")
+    if not message:
+        return None
+
+    chat_id = str(message.get("chat", {}).get("id", ""))
+    if settings.telegram_chat_id and chat_id != settings.telegram_chat_id:
+        return None
+
+    from app.services.telegram_intent_service import classify_intent
+
+    if "voice" in message:
+        # Feedback sofort, auch wenn vorherige Nachrichten noch laufen
+        await send_message("Sprachnachricht wird verarbeitet...", chat_id=chat_id)
+        prepared = await _transcribe_voice_message(message)
+        if "text" in prepared:
+            prepared["intent"] = await classify_intent(prepared["text"])
+        return prepared
+
+    text = message.get("text", "").strip()
+    if not text or text.startswith("/"):
+        return None
+    return {"text": text, "intent": await classify_intent(text)}
+
+
+async def handle_update(update: dict, prepared: dict | None = None) -> None:
+    """Haupteinstiegspunkt: Verarbeitet ein Telegram Update.
+
+    Args:
+        update: Telegram Update
+        prepared: Vorab-Ergebnis aus prepare_update() (optional)
+    """
     try:
         # Callback Query (Button-Klick)
         if "callback_query" in update:
@@ -154,7 +214,7 @@ async def handle_update(update: dict) -> None:
 
         # Voice-Nachricht
         if "voice" in message:
-            await _handle_voice_message(chat_id, message)
+            await _handle_voice_message(chat_id, message, prepared)
             return
 
         # Text-Nachricht
@@ -166,7 +226,9 @@ async def handle_update(update: dict) -> None:
         if text.startswith("/"):
             await _handle_command(chat_id, text)
         else:
-            await _handle_free_text(chat_id, text)
+            await _handle_free_text(
+                chat_id, text, prepared.get("intent") if prepared else None,
+            )
 
     except Exception as e:
         logger.error(f"Fehler beim Verarbeiten des Telegram Updates: {e}", exc_info=True)
@@ -654,15 +716,17 @@ async def _dispatch_intent(chat_id: str, intent: str, entities: dict, text: str)
         )
 
 
-async def _handle_free_text(chat_id: str, text: str) -> None:
+async def _handle_free_text(chat_id: str, text: str, result: dict | None = None) -> None:
     """Verarbeitet Freitext-Nachrichten via GPT Intent-Klassifikation.
 
     Unterstuetzt Multi-Intent: bis zu 2 Aufgaben in einer Nachricht.
+    Ist die Klassifikation bereits vorab gelaufen, wird sie uebernommen.
     """
     try:
-        from app.services.telegram_intent_service import classify_intent
+        if result is None:
+            from app.services.telegram_intent_service import classify_intent
+            result = await classify_intent(text)
 
-        result = await classify_intent(text)
         intent = result.get("intent", "unknown")
         entities = result.get("entities", {})
         secondary = result.get("secondary", [])
@@ -697,34 +761,47 @@ async def _handle_free_text(chat_id: str, text: str) -> None:
 
 # ── Voice Handler ────────────────────────────────────────────────
 
-async def _handle_voice_message(chat_id: str, message: dict) -> None:
-    """Verarbeitet Voice-Nachrichten: Whisper -> Intent -> Handler."""
-    try:
-        from app.services.telegram_intent_service import transcribe_voice
+async def _transcribe_voice_message(message: dict) -> dict:
+    """Laedt eine Voice-Nachricht herunter und transkribiert sie via Whisper.
 
-        voice = message["voice"]
-        file_id = voice["file_id"]
+    Returns:
+        {"text": str} oder {"error": "download" | "transcribe"}
+    """
+    from app.services.telegram_intent_service import transcribe_voice
 
-        # Feedback: Verarbeitung laeuft
-        await send_message("Sprachnachricht wird verarbeitet...", chat_id=chat_id)
+    audio_bytes = await _download_file(message["voice"]["file_id"])
+    if not audio_bytes:
+        return {"error": "download"}
+
+    text = await transcribe_voice(audio_bytes)
+    if not text:
+        return {"error": "transcribe"}
+    return {"text": text}
+
+
+async def _handle_voice_message(
+    chat_id: str, message: dict, prepared: dict | None = None,
+) -> None:
+    """Verarbeitet Voice-Nachrichten: Whisper -> Intent -> Handler."""
+    try:
+        if prepared is None:
+            # Feedback: Verarbeitung laeuft
+            await send_message("Sprachnachricht wird verarbeitet...", chat_id=chat_id)
+            prepared = await _transcribe_voice_message(message)
 
-        # Audio herunterladen
-        audio_bytes = await _download_file(file_id)
-        if not audio_bytes:
+        if prepared.get("error") == "download":
             await send_message("Konnte die Sprachnachricht nicht herunterladen.", chat_id=chat_id)
             return
-
-        # Whisper-Transkription
-        text = await transcribe_voice(audio_bytes)
-        if not text:
+        if prepared.get("error") == "transcribe":
             await send_message("Konnte die Sprachnachricht nicht transkribieren.", chat_id=chat_id)
             return
 
         # Transkription anzeigen
+        text = prepared["text"]
         await send_message(f"<i>Transkription:</i>\n{text[:500]}", chat_id=chat_id)
 
         # Als Freitext weiterverarbeiten
-        await _handle_free_text(chat_id, text)
+        await _handle_free_text(chat_id, text, prepared.get("intent"))
 
     except Exception as e:
         logger.error(f"Voice-Handler fehlgeschlagen: {e}", exc_info=True)
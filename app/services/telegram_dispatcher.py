@@ -0,0 +1,122 @@
+"""Telegram Dispatcher — nebenlaeufige Verarbeitung eingehender Updates.
+
+Ablauf pro Update:
+1. Duplikat-Check ueber update_id (Telegram wiederholt Webhooks bei Timeouts)
+2. Vorbereitung (Download, Whisper, Intent-LLM) sofort und parallel,
+   begrenzt durch einen Worker-Pool
+3. Ausfuehrung (DB, Antworten) in Eingangsreihenfolge pro Chat (FIFO)
+
+Kommandos und Button-Klicks ueberspringen Schritt 2 (Fast-Path ohne LLM).
+Mehrere Sprachnachrichten werden so parallel transkribiert, die Antworten
+kommen trotzdem in der Reihenfolge, in der sie gesendet wurden.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+
+from app.services import telegram_bot_service
+
+logger = logging.getLogger(__name__)
+
+# Gleichzeitige Vorbereitungen (Whisper/LLM-Aufrufe)
+PREPARE_CONCURRENCY = 4
+# Gleichzeitig ausgefuehrte Updates (je eine DB-Session)
+HANDLE_CONCURRENCY = 4
+# Anzahl gemerkter update_ids fuer die Duplikat-Erkennung
+SEEN_UPDATES_MAX = 1000
+
+
+def _chat_key(update: dict) -> str:
+    """Chat-ID eines Updates (Nachricht oder Callback Query)."""
+    message = update.get("message") or update.get("callback_query", {}).get("message") or {}
+    return str(message.get("chat", {}).get("id", ""))
+
+
+class TelegramDispatcher:
+    """Verteilt Updates auf einen begrenzten Worker-Pool mit Chat-Reihenfolge."""
+
+    def __init__(
+        self,
+        prepare_concurrency: int = PREPARE_CONCURRENCY,
+        handle_concurrency: int = HANDLE_CONCURRENCY,
+        seen_max: int = SEEN_UPDATES_MAX,
+    ):
+        self._prepare_slots = asyncio.Semaphore(prepare_concurrency)
+        self._handle_slots = asyncio.Semaphore(handle_concurrency)
+        self._seen_max = seen_max
+        self._seen: OrderedDict[int, None] = OrderedDict()
+        self._queues: dict[str, deque[tuple[dict, asyncio.Task | None]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, update: dict) -> bool:
+        """Nimmt ein Update an. False bei bereits gesehener update_id."""
+        update_id = update.get("update_id")
+        if update_id is not None:
+            if update_id in self._seen:
+                logger.info(f"Telegram Update {update_id} doppelt — ignoriert")
+                return False
+            self._seen[update_id] = None
+            while len(self._seen) > self._seen_max:
+                self._seen.popitem(last=False)
+
+        prepare = None
+        if "message" in update:
+            prepare = self._spawn(self._prepare(update))
+
+        chat = _chat_key(update)
+        queue = self._queues.get(chat)
+        if queue is None:
+            # Kein Worker fuer diesen Chat aktiv → neuen starten
+            queue = self._queues[chat] = deque()
+            queue.append((update, prepare))
+            self._spawn(self._drain(chat, queue))
+        else:
+            queue.append((update, prepare))
+        return True
+
+    async def _prepare(self, update: dict) -> dict | None:
+        async with self._prepare_slots:
+            try:
+                return await telegram_bot_service.prepare_update(update)
+            except Exception as e:
+                # handle_update faellt auf die sequentielle Verarbeitung zurueck
+                logger.error(f"Telegram Update-Vorbereitung fehlgeschlagen: {e}", exc_info=True)
+                return None
+
+    async def _drain(self, chat: str, queue: deque) -> None:
+        """Arbeitet die Updates eines Chats nacheinander ab."""
+        try:
+            while queue:
+                update, prepare = queue[0]
+                prepared = await prepare if prepare else None
+                async with self._handle_slots:
+                    try:
+                        await telegram_bot_service.handle_update(update, prepared)
+                    except Exception as e:
+                        logger.error(f"Telegram Update Verarbeitung fehlgeschlagen: {e}", exc_info=True)
+                queue.popleft()
+        finally:
+            if self._queues.get(chat) is queue:
+                del self._queues[chat]
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def join(self) -> None:
+        """Wartet, bis alle angenommenen Updates verarbeitet sind."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Bricht laufende Verarbeitungen ab (App-Shutdown)."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        self._queues.clear()
+
+
+telegram_dispatcher = TelegramDispatcher()
@@ -1,48 +1,113 @@
-"""In-Memory Pipeline Progress Tracking.
+"""Pipeline Progress Tracking.
 
-Railway = Single Instance, daher reicht ein globaler Python-Dict.
 Background-Task schreibt Fortschritt hierher, Polling-Endpoint liest.
 Kein DB-Zugriff noetig waehrend der Pipeline laeuft.
+
+Jeder Worker haelt einen lokalen Dict; Aenderungen (Fortschritt, Cleanup,
+Abbruch) werden ueber app.event_bus an alle anderen Worker gespiegelt —
+Polling und Cancel funktionieren egal welcher Worker die Pipeline ausfuehrt.
+Gespiegelte Eintraege verfallen ohne Aktualisierung nach
+REMOTE_PROGRESS_TTL_SECONDS — ein verlorenes Cleanup hinterlaesst so keinen
+dauerhaften "running"-Status.
 """
 
 import logging
+import time
 from typing import Any
 
+from app.event_bus import event_bus
+
 logger = logging.getLogger(__name__)
 
+TOPIC = "pipeline_state"
+
 # Globaler Dict: import_job_id (str) → pipeline_progress (dict)
 _pipeline_progress: dict[str, dict[str, Any]] = {}
 
 # Set von import_job_ids die abgebrochen werden sollen
 _cancel_requested: set[str] = set()
 
+# Pipelines melden nur pro Stufe — eine Stufe kann lange dauern
+REMOTE_PROGRESS_TTL_SECONDS = 3600
+# import_job_id → letzte Aenderung aus einem anderen Worker (monotonic)
+_remote_updated: dict[str, float] = {}
+
+
+def _apply_set(key: str, data: dict[str, Any]) -> None:
+    _pipeline_progress[key] = data
+
+
+def _apply_cleanup(key: str) -> None:
+    _pipeline_progress.pop(key, None)
+    _cancel_requested.discard(key)
+    _remote_updated.pop(key, None)
+
+
+def _expire_remote(key: str) -> None:
+    """Verwirft gespiegelten Zustand, der zu lange nicht aktualisiert wurde."""
+    updated = _remote_updated.get(key)
+    if updated is not None and time.monotonic() - updated > REMOTE_PROGRESS_TTL_SECONDS:
+        logger.info(f"Pipeline-Progress fuer {key} aus anderem Worker abgelaufen")
+        _apply_cleanup(key)
+
+
+def _apply_cancel(key: str) -> None:
+    _cancel_requested.add(key)
+
 
 def set_progress(import_job_id: str, data: dict[str, Any]) -> None:
-    """Schreibt Pipeline-Fortschritt in Memory."""
-    _pipeline_progress[str(import_job_id)] = data
+    """Schreibt Pipeline-Fortschritt in Memory (und an alle Worker)."""
+    key = str(import_job_id)
+    _apply_set(key, data)
+    # Dieser Worker fuehrt die Pipeline aus — lokaler Stand verfaellt nicht
+    _remote_updated.pop(key, None)
+    event_bus.emit(TOPIC, {"op": "set", "id": key, "data": data})
 
 
 def get_progress(import_job_id: str) -> dict[str, Any] | None:
     """Liest Pipeline-Fortschritt aus Memory. None wenn nicht vorhanden."""
-    return _pipeline_progress.get(str(import_job_id))
+    key = str(import_job_id)
+    _expire_remote(key)
+    return _pipeline_progress.get(key)
 
 
 def cleanup_progress(import_job_id: str) -> None:
     """Entfernt Pipeline-Fortschritt nach Abschluss."""
     key = str(import_job_id)
-    if key in _pipeline_progress:
-        del _pipeline_progress[key]
-    _cancel_requested.discard(key)
+    _apply_cleanup(key)
+    event_bus.emit(TOPIC, {"op": "cleanup", "id": key})
     logger.info(f"Pipeline-Progress fuer {key} aus Memory entfernt")
 
 
 def request_cancel(import_job_id: str) -> None:
     """Fordert den Abbruch einer laufenden Pipeline an."""
     key = str(import_job_id)
-    _cancel_requested.add(key)
+    _apply_cancel(key)
+    event_bus.emit(TOPIC, {"op": "cancel", "id": key})
     logger.info(f"Pipeline-Cancel angefordert fuer {key}")
 
 
 def is_cancelled(import_job_id: str) -> bool:
     """Prueft ob ein Abbruch angefordert wurde."""
-    return str(import_job_id) in _cancel_requested
+    key = str(import_job_id)
+    _expire_remote(key)
+    return key in _cancel_requested
+
+
+def _on_remote_change(payload: dict[str, Any]) -> None:
+    """Aenderung aus einem anderen Worker in den lokalen Spiegel uebernehmen."""
+    key = payload.get("id")
+    if not key:
+        return
+    op = payload.get("op")
+    if op == "set":
+        _apply_set(key, payload.get("data") or {})
+        _remote_updated[key] = time.monotonic()
+    elif op == "cleanup":
+        _apply_cleanup(key)
+    elif op == "cancel":
+        _apply_cancel(key)
+        _remote_updated.setdefault(key, time.monotonic())
+
+
+event_bus.on(TOPIC, _on_remote_change)
@@ -0,0 +1,208 @@
+"""Gemeinsame Jinja2-Umgebung + Fragment-Cache fuer HTMX-Partials.
+
+Bisher hatte jedes Routen-Modul sein eigenes Jinja2Templates-Objekt — jede
+Vorlage wurde pro Modul und pro Worker neu geparst und kompiliert. Jetzt:
+
+- EINE Environment fuer alle Module (ein In-Memory-Template-Cache)
+- Bytecode-Cache auf der Platte: Worker und Neustarts laden kompilierte
+  Templates statt sie neu zu parsen; precompile_templates() waermt beim Start
+- Kein mtime-Check pro Render in Produktion (auto_reload=False)
+- FragmentCache: fertiges HTML teurer Partials, pro Namespace versioniert.
+  Services, die die Daten aendern, rufen fragment_cache.invalidate(...) auf;
+  die Invalidierung wird ueber den Event-Bus an alle Worker verteilt.
+"""
+
+import logging
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+
+from app.config import settings
+from app.event_bus import event_bus
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = "app/templates"
+
+
+# ═══════════════════════════════════════════════════════════════
+# JINJA2-ENVIRONMENT (geteilt, mit Bytecode-Cache)
+# ═══════════════════════════════════════════════════════════════
+
+
+def _bytecode_cache_dir() -> Path:
+    """Verzeichnis fuer kompilierte Templates (Default: System-Temp)."""
+    if settings.template_cache_dir:
+        path = Path(settings.template_cache_dir)
+    else:
+        path = Path(tempfile.gettempdir()) / "pulspoint-jinja"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _create_environment() -> jinja2.Environment:
+    try:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(_bytecode_cache_dir()))
+    except OSError as e:
+        logger.warning(f"Jinja2-Bytecode-Cache nicht verfuegbar: {e}")
+        bytecode_cache = None
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        autoescape=jinja2.select_autoescape(),
+        bytecode_cache=bytecode_cache,
+        # Produktion: Templates aendern sich nur mit einem Deploy
+        auto_reload=not settings.is_production,
+        cache_size=1000,
+    )
+
+
+templates = Jinja2Templates(env=_create_environment())
+
+
+def precompile_templates() -> int:
+    """Kompiliert alle Templates vorab (fuellt Speicher- und Bytecode-Cache).
+
+    Muss NACH dem Import aller Routen-Module laufen, weil Filter zur
+    Compile-Zeit bekannt sein muessen. Blockierend — per to_thread aufrufen.
+    """
+    count = 0
+    for name in templates.env.list_templates(extensions=["html"]):
+        try:
+            templates.env.get_template(name)
+            count += 1
+        except Exception as e:
+            logger.warning(f"Template {name} konnte nicht vorkompiliert werden: {e}")
+    return count
+
+
+def render_fragment(template_name: str, context: dict[str, Any]) -> str:
+    """Rendert ein Template zu einem HTML-String (ohne Response-Objekt)."""
+    return templates.get_template(template_name).render(context)
+
+
+# ═══════════════════════════════════════════════════════════════
+# FRAGMENT-CACHE
+# ═══════════════════════════════════════════════════════════════
+
+TOPIC = "fragment_cache"
+
+FRAGMENT_CACHE_MAX_ENTRIES = 2000
+# Sicherheitsnetz fuer Aenderungen ohne Invalidierungs-Hook (z.B. Roh-SQL)
+FRAGMENT_CACHE_TTL_SECONDS = 300
+# Abweichende TTLs pro Namespace
+FRAGMENT_CACHE_TTLS: dict[str, int] = {
+    # Statistiken haengen an fast allen Tabellen — nur kurz cachen
+    "statistics": 60,
+}
+
+
+class FragmentCache:
+    """LRU-Cache fuer gerendertes HTML, pro Namespace versioniert.
+
+    Ein Eintrag gilt, solange die Namespace-Version unveraendert und die TTL
+    nicht abgelaufen ist. invalidate() erhoeht nur die Version — alte
+    Eintraege fallen beim naechsten Zugriff bzw. per LRU heraus.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = FRAGMENT_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = FRAGMENT_CACHE_TTL_SECONDS,
+        ttls: dict[str, int] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.ttls = ttls if ttls is not None else dict(FRAGMENT_CACHE_TTLS)
+        self._versions: dict[str, int] = {}
+        # (namespace, key) -> (version, gespeichert_um, html)
+        self._entries: OrderedDict[tuple[str, str], tuple[int, float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    def get(self, namespace: str, key: Any) -> str | None:
+        entry_key = (namespace, str(key))
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        version, stored_at, html = entry
+        ttl = self.ttls.get(namespace, self.ttl_seconds)
+        if version != self.version(namespace) or time.monotonic() - stored_at > ttl:
+            del self._entries[entry_key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return html
+
+    def set(self, namespace: str, key: Any, html: str, version: int | None = None) -> None:
+        """Speichert HTML. `version` = Namespace-Version vom Render-Beginn.
+
+        Eine Invalidierung waehrend des Renderns macht den Eintrag so sofort
+        ungueltig, statt veraltetes HTML unter der neuen Version abzulegen.
+        """
+        entry_key = (namespace, str(key))
+        if version is None:
+            version = self.version(namespace)
+        self._entries[entry_key] = (version, time.monotonic(), str(html))
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_render(
+        self,
+        namespace: str,
+        key: Any,
+        render: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Gecachtes HTML oder render() aufrufen (inkl. Datenladen) und speichern."""
+        html = self.get(namespace, key)
+        if html is None:
+            version = self.version(namespace)
+            html = await render()
+            self.set(namespace, key, html, version)
+        return html
+
+    def __call__(self, namespace: str, key: Any, caller: Callable[[], str]) -> Markup:
+        """Template-Variante: {% call fragment_cache("ns", key) %}...{% endcall %}."""
+        html = self.get(namespace, key)
+        if html is None:
+            version = self.version(namespace)
+            html = str(caller())
+            self.set(namespace, key, html, version)
+        return Markup(html)
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Markiert Namespaces als veraltet — lokal und in allen anderen Workern."""
+        self._bump(namespaces)
+        event_bus.emit(TOPIC, {"namespaces": list(namespaces)})
+
+    def _bump(self, namespaces) -> None:
+        for namespace in namespaces:
+            self._versions[namespace] = self.version(namespace) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
+
+
+# Singleton-Instanz
+fragment_cache = FragmentCache()
+templates.env.globals["fragment_cache"] = fragment_cache
+
+
+def _on_remote_invalidate(payload: dict[str, Any]) -> None:
+    fragment_cache._bump(payload.get("namespaces") or [])
+
+
+event_bus.on(TOPIC, _on_remote_invalidate)
@@ -0,0 +1,78 @@
+"""
+PDF-Extraktion mit PyMuPDF — reine Funktionen ohne App-Abhaengigkeiten.
+
+Werden im Prozess-Pool ausgefuehrt (siehe cv_parser_service.get_pdf_pool).
+Deshalb hier KEINE Imports aus app.* — ein Worker-Prozess soll beim
+Entpickeln nur dieses Modul laden, nicht die ganze Service-Schicht.
+"""
+
+import hashlib
+import re
+
+
+def pdf_hash(pdf_bytes: bytes) -> str:
+    """SHA-256 eines PDFs (Cache-Key fuer extrahierten Text)."""
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def extract_pdf_text(pdf_bytes: bytes) -> str:
+    """Extrahiert Text aus einem PDF.
+
+    Raises:
+        ValueError: Bei Extraktions-Fehler oder wenn kein Text enthalten ist
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        raise ValueError("PyMuPDF (fitz) nicht installiert")
+
+    try:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        text_parts = []
+
+        for page in doc:
+            text = page.get_text(sort=True)  # sort=True: Textbloecke visuell sortieren (oben→unten, links→rechts) — verhindert falsche Zuordnung von Bullets zu Firmen
+            if text:
+                text_parts.append(text)
+
+        doc.close()
+
+        full_text = "\n\n".join(text_parts)
+
+        # Null-Bytes und andere Kontrollzeichen entfernen (PostgreSQL-kompatibel)
+        full_text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", full_text)
+
+        if not full_text.strip():
+            raise ValueError("PDF enthält keinen extrahierbaren Text")
+
+        return full_text
+
+    except Exception as e:
+        if "PDF" in str(e) or "fitz" in str(e):
+            raise ValueError(f"PDF-Verarbeitung fehlgeschlagen: {e}")
+        raise
+
+
+def render_pdf_pages(pdf_bytes: bytes, max_pages: int = 3) -> list[bytes]:
+    """Rendert PDF-Seiten als PNG-Bilder (für Vision-Fallback).
+
+    Raises:
+        ValueError: Wenn PyMuPDF nicht installiert ist
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        raise ValueError("PyMuPDF (fitz) nicht installiert")
+
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    images = []
+
+    for i, page in enumerate(doc):
+        if i >= max_pages:
+            break
+        # Seite als Bild rendern (150 DPI für gute Qualität bei kleiner Größe)
+        pix = page.get_pixmap(dpi=150)
+        images.append(pix.tobytes("png"))
+
+    doc.close()
+    return images
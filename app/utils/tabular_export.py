@@ -0,0 +1,189 @@
+"""Inkrementelle CSV-/XLSX-Writer fuer Streaming-Exporte.
+
+Beide Writer haben dieselbe Schnittstelle: start(fields), rows(rows) und
+finish() geben jeweils die bis dahin fertigen Bytes zurueck. Nichts wird
+ueber einen Block hinaus gepuffert — der Aufrufer reicht die Bytes direkt an
+eine StreamingResponse weiter.
+
+XLSX wird ohne Zusatzpaket geschrieben: ein minimales SpreadsheetML-Paket
+(Inline-Strings, keine Styles), gezippt ueber einen nicht-seekbaren Sink.
+zipfile schreibt dann Data-Descriptors statt nachtraeglich zu seeken.
+"""
+
+import csv
+import io
+import json
+import re
+import zipfile
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
+from xml.sax.saxutils import escape
+
+CSV_DELIMITER = ";"  # Excel (deutsch) erwartet Semikolon
+XLSX_MAX_CELL_CHARS = 32767
+
+# In XML 1.0 verbotene Steuerzeichen
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def export_value(value: Any) -> Any:
+    """Normalisiert einen Wert fuer eine Tabellenzelle."""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+        return ", ".join(value)
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    if hasattr(value, "value") and not isinstance(value, (int, float, str)):
+        return value.value  # Enums
+    return value
+
+
+class CsvStreamWriter:
+    """CSV mit UTF-8-BOM (Umlaute in Excel) und Semikolon."""
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self, delimiter: str = CSV_DELIMITER):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, delimiter=delimiter, lineterminator="\r\n")
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data.encode("utf-8")
+
+    def start(self, fields: Sequence[str]) -> bytes:
+        self._writer.writerow(fields)
+        return "\ufeff".encode("utf-8") + self._drain()
+
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        self._writer.writerows([export_value(v) for v in row] for row in rows)
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+# ── XLSX ──
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+class _StreamSink:
+    """Schreibziel fuer zipfile: merkt sich nur die Position, kein seek()."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _xlsx_cell(value: Any) -> str:
+    value = export_value(value)
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    text = _ILLEGAL_XML_CHARS.sub("", str(value))[:XLSX_MAX_CELL_CHARS]
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+class XlsxStreamWriter:
+    """Ein Arbeitsblatt, zeilenweise ins ZIP geschrieben."""
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+
+    def __init__(self, sheet_name: str = "Export"):
+        self.sheet_name = sheet_name
+        self._sink = _StreamSink()
+        self._zip: zipfile.ZipFile | None = None
+        self._sheet = None
+
+    def start(self, fields: Sequence[str]) -> bytes:
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(self.sheet_name[:31])))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w")
+        self._sheet.write(_SHEET_START.encode("utf-8"))
+        return self.rows([fields])
+
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        xml = "".join(
+            "<row>" + "".join(_xlsx_cell(v) for v in row) + "</row>" for row in rows
+        )
+        self._sheet.write(xml.encode("utf-8"))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._sheet.write(_SHEET_END.encode("utf-8"))
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.drain()
+
+
+EXPORT_WRITERS = {
+    "csv": CsvStreamWriter,
+    "xlsx": XlsxStreamWriter,
+}
@@ -0,0 +1,241 @@
+"""Hot-Path-Benchmarks: Matching, Pre-Scoring, Keywords, Kategorisierung, CSV-Import.
+
+Aufruf:
+    python -m benchmarks.bench_hotpaths [--size small|medium|large] [--only v3,cosine]
+    python -m benchmarks.bench_hotpaths --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_hotpaths --compare benchmarks/baseline.json [--threshold 0.25]
+
+Alle Faelle laufen auf synthetischen Daten (benchmarks/data.py) ohne DB.
+Der CSV-Import braucht eine lokale Postgres-Instanz (z.B. die Test-DB aus
+docker-compose.test.yml) und laeuft nur mit --database-url; er legt die
+Tabellen bei Bedarf an und entfernt danach seine eigenen Firmen/Jobs.
+
+Mit --compare endet der Lauf mit Exit-Code 1, wenn ein Fall die Baseline
+um mehr als --threshold ueberschreitet (Zeit oder Speicher-Peak).
+Baselines sind maschinenabhaengig — nur gegen Messungen desselben Rechners
+und derselben --size vergleichen.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import app.api  # noqa: F401  — Importreihenfolge wie in app.main (app.api vor app.services)
+from app.services import similarity
+from app.services.categorization_service import CategorizationService
+from app.services.keyword_matcher import keyword_matcher
+from app.services.matching_engine_v2 import MatchingEngineV2
+from app.services.pre_scoring_service import PreScoringService
+from benchmarks import data
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    compare,
+    environment_meta,
+    load_baseline,
+    measure,
+    print_table,
+    save_baseline,
+)
+
+# Datenmengen pro --size
+SIZES = {
+    "small": {"candidates": 200, "texts": 200, "csv_rows": 500},
+    "medium": {"candidates": 2000, "texts": 1000, "csv_rows": 5000},
+    "large": {"candidates": 10000, "texts": 5000, "csv_rows": 20000},
+}
+CASE_GROUPS = ["cosine", "v3", "prescore", "keywords", "category", "csv"]
+
+
+async def _bench_cosine(size: dict, rounds: int) -> list:
+    vectors = data.embeddings(size["candidates"])
+    queries = data.embeddings(50, seed=7)
+    index = similarity.VectorIndex(vectors)
+    return [
+        await measure("cosine.batch", lambda: similarity.cosine_batch(queries[0], vectors), rounds),
+        await measure("cosine.index_top_k", lambda: index.top_k(queries[0], 10), rounds),
+        await measure("cosine.matrix_50", lambda: similarity.cosine_matrix(queries, vectors), rounds),
+    ]
+
+
+async def _bench_v3(size: dict, rounds: int) -> list:
+    candidates = data.match_candidates(size["candidates"])
+    job = data.v3_job()
+    state: dict[str, MatchingEngineV2] = {}
+
+    def fresh_engine() -> None:
+        # Gelernte Regeln kommen sonst aus der DB
+        engine = MatchingEngineV2(None)
+        engine._rules = []
+        state["engine"] = engine
+
+    # Ohne DB-Session haelt jede Engine ihr Score-Memo im Speicher:
+    # frische Engine = kaltes Memo, dieselbe Engine = warmes Memo
+    fresh_engine()
+    warm_engine = state["engine"]
+
+    return [
+        await measure(
+            "v3.score_candidates_cold",
+            lambda: state["engine"]._score_candidates_v3(job, candidates),
+            rounds,
+            setup=fresh_engine,
+        ),
+        await measure(
+            "v3.score_candidates_warm_memo",
+            lambda: warm_engine._score_candidates_v3(job, candidates),
+            rounds,
+        ),
+    ]
+
+
+async def _bench_prescore(size: dict, rounds: int) -> list:
+    triples = data.pre_score_triples(size["texts"])
+    service = PreScoringService(None)
+    # Match-Objekte ohne Keywords bekommen sie beim Scoring gesetzt → zuruecksetzen
+    without_keywords = [m for _, _, m in triples if not m.matched_keywords]
+
+    def reset() -> None:
+        for m in without_keywords:
+            m.matched_keywords = None
+
+    def run() -> None:
+        for candidate, job, match in triples:
+            service.calculate_pre_score(candidate, job, match)
+
+    return [await measure("prescore.calculate_pre_score", run, rounds, setup=reset)]
+
+
+async def _bench_keywords(size: dict, rounds: int) -> list:
+    texts = data.job_texts(size["texts"])
+    pairs = list(zip(data.skill_lists(size["texts"], seed=9), texts))
+    return [
+        await measure("keywords.match", lambda: [keyword_matcher.match(s, t) for s, t in pairs], rounds),
+        await measure(
+            "keywords.extract_from_text",
+            lambda: [keyword_matcher.extract_keywords_from_text(t) for t in texts],
+            rounds,
+        ),
+    ]
+
+
+async def _bench_category(size: dict, rounds: int) -> list:
+    texts = data.job_texts(size["texts"])
+    service = CategorizationService(None)
+    return [
+        await measure("category.detect_category", lambda: [service.detect_category(t) for t in texts], rounds),
+    ]
+
+
+async def _bench_csv(size: dict, rounds: int, database_url: str | None) -> list:
+    if not database_url:
+        print("csv: uebersprungen (nur mit --database-url auf eine lokale Postgres-Instanz)")
+        return []
+
+    from sqlalchemy import delete, text
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.database import Base
+    from app.models.company import Company
+    from app.models.import_job import ImportJob
+    from app.models.job import Job
+    from app.services.csv_import_service import CSVImportService
+
+    filename = "benchmark.csv"
+    content = data.csv_export(size["csv_rows"])
+    engine = create_async_engine(database_url, echo=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    state: dict = {}
+
+    async def cleanup() -> None:
+        async with session_maker() as db:
+            await db.execute(delete(Job).where(Job.job_url.startswith(data.CSV_URL_PREFIX)))
+            await db.execute(delete(Company).where(Company.name.startswith(data.CSV_COMPANY_PREFIX)))
+            await db.execute(delete(ImportJob).where(ImportJob.filename == filename))
+            await db.commit()
+
+    async def setup() -> None:
+        if "db" in state:
+            await state["db"].close()
+        await cleanup()
+        db = session_maker()
+        service = CSVImportService(db)
+        state.update(db=db, service=service, job=await service.create_import_job(filename, content))
+
+    async def run() -> None:
+        await state["service"].process_csv_content(state["job"], content)
+
+    try:
+        return [await measure("csv.process_csv_content", run, rounds, warmup=0, setup=setup)]
+    finally:
+        if "db" in state:
+            await state["db"].close()
+        await cleanup()
+        await engine.dispose()
+
+
+async def run(args) -> int:
+    size = SIZES[args.size]
+    groups = args.only.split(",") if args.only else CASE_GROUPS
+    unknown = set(groups) - set(CASE_GROUPS)
+    if unknown:
+        print(f"Unbekannte Faelle: {', '.join(sorted(unknown))} (verfuegbar: {', '.join(CASE_GROUPS)})")
+        return 2
+
+    meta = environment_meta(size=args.size, numpy=similarity.HAS_NUMPY)
+    baseline = load_baseline(args.compare) if args.compare else None
+    if baseline and baseline.get("meta", {}).get("size") != args.size:
+        print(f"Baseline wurde mit --size {baseline['meta'].get('size')} erstellt, nicht {args.size}")
+        return 2
+
+    results = []
+    for group in groups:
+        if group == "cosine":
+            results += await _bench_cosine(size, args.rounds)
+        elif group == "v3":
+            results += await _bench_v3(size, args.rounds)
+        elif group == "prescore":
+            results += await _bench_prescore(size, args.rounds)
+        elif group == "keywords":
+            results += await _bench_keywords(size, args.rounds)
+        elif group == "category":
+            results += await _bench_category(size, args.rounds)
+        elif group == "csv":
+            results += await _bench_csv(size, args.rounds, args.database_url)
+
+    backend = "numpy" if similarity.HAS_NUMPY else "python"
+    print(f"Groesse: {args.size} {size}, Backend: {backend}, Runden: {args.rounds}")
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, meta)
+        print(f"Baseline gespeichert: {args.save_baseline}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r.name} {r.metric}: {r.baseline:.2f} → {r.current:.2f} ({r.ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"Keine Regression ueber {args.threshold:.0%}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--only", help=f"Kommagetrennt: {','.join(CASE_GROUPS)}")
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--database-url", help="postgresql+asyncpg://... (nur fuer den CSV-Import)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
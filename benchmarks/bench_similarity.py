@@ -0,0 +1,74 @@
+"""Micro-Benchmark: Kosinus-Aehnlichkeit alt (Python-Schleife) vs. app.services.similarity.
+
+Aufruf:
+    python -m benchmarks.bench_similarity [--candidates 2000] [--dim 384] [--repeat 5]
+
+Misst eine Query gegen N Kandidaten (find_similar_candidates, MT-Learning)
+sowie 50 Queries gegen N Kandidaten (Matrix) — jeweils bestes von `repeat`.
+"""
+
+import argparse
+import math
+import random
+import time
+
+import app.api  # noqa: F401  — Importreihenfolge wie in app.main (app.api vor app.services)
+from app.services import similarity
+
+
+def _legacy_cosine(a, b):
+    """Die bisherige Implementierung (pro Paar, Normen jedes Mal neu)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    candidates = [[rng.uniform(-1, 1) for _ in range(args.dim)] for _ in range(args.candidates)]
+    queries = [[rng.uniform(-1, 1) for _ in range(args.dim)] for _ in range(args.queries)]
+    query = queries[0]
+
+    legacy_batch = _best_of(args.repeat, lambda: [_legacy_cosine(query, c) for c in candidates])
+    new_batch = _best_of(args.repeat, lambda: similarity.cosine_batch(query, candidates))
+    index = similarity.VectorIndex(candidates)
+    indexed = _best_of(args.repeat, lambda: index.scores(query))
+    top = _best_of(args.repeat, lambda: index.top_k(query, 10))
+
+    legacy_matrix = _best_of(1, lambda: [[_legacy_cosine(q, c) for c in candidates] for q in queries])
+    new_matrix = _best_of(args.repeat, lambda: similarity.cosine_matrix(queries, candidates))
+
+    backend = "numpy" if similarity.HAS_NUMPY else "python"
+    print(f"Backend: {backend}, {args.candidates} Kandidaten x {args.dim} Dimensionen")
+    print(f"{'Fall':<36}{'alt ms':>10}{'neu ms':>10}{'Faktor':>10}")
+    rows = [
+        ("1 Query (inkl. Index-Aufbau)", legacy_batch, new_batch),
+        ("1 Query (Index vorhanden)", legacy_batch, indexed),
+        ("Top-10 (Index vorhanden)", legacy_batch, top),
+        (f"{args.queries} Queries (Matrix)", legacy_matrix, new_matrix),
+    ]
+    for label, old, new in rows:
+        print(f"{label:<36}{old:>10.2f}{new:>10.2f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Synthetische Testdaten fuer die Hot-Path-Benchmarks (deterministisch per Seed).
+
+Skills stammen aus app/config/skill_weights.json, damit Gates, Skill-Gewichte
+und Hierarchie-Expansion dieselben Pfade nehmen wie mit echten Profilen.
+Alle ORM-Objekte sind transient (nie an eine Session gebunden).
+"""
+
+import json
+import random
+import uuid
+from pathlib import Path
+
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.match import Match
+from app.services.matching_engine_v2 import MatchCandidate
+
+SKILL_WEIGHTS_PATH = Path(__file__).resolve().parents[1] / "app" / "config" / "skill_weights.json"
+
+PRIMARY_ROLES = [
+    "Finanzbuchhalter/in",
+    "Bilanzbuchhalter/in",
+    "Kreditorenbuchhalter/in",
+    "Debitorenbuchhalter/in",
+    "Lohnbuchhalter/in",
+    "Steuerfachangestellte/r",
+]
+CITIES = [
+    ("Hamburg", "20095"), ("München", "80331"), ("Berlin", "10115"),
+    ("Frankfurt am Main", "60311"), ("Köln", "50667"), ("Stuttgart", "70173"),
+    ("Düsseldorf", "40213"), ("Norderstedt", "22846"), ("Leipzig", "04109"),
+]
+INDUSTRIES = ["Maschinenbau", "Pharma", "Handel", "Logistik", "Steuerberatung", "Automotive", "IT"]
+ERP = ["DATEV", "SAP", "SAP FI", "Lexware", "Navision", "Addison"]
+TRAJECTORIES = ["aufsteigend", "lateral", "absteigend"]
+PROFICIENCIES = ["grundlagen", "fortgeschritten", "experte"]
+RECENCIES = ["aktuell", "kuerzlich", "veraltet"]
+IMPORTANCES = ["essential", "preferred"]
+FILLER = (
+    "Wir sind ein wachsendes Unternehmen mit flachen Hierarchien und bieten "
+    "flexible Arbeitszeiten, Homeoffice und ein attraktives Gehalt."
+)
+
+
+def _skill_pool() -> list[tuple[str, str]]:
+    """(skill, kategorie) aus skill_weights.json, dedupliziert."""
+    data = json.loads(SKILL_WEIGHTS_PATH.read_text(encoding="utf-8"))
+    pool: dict[str, str] = {}
+    for role in data.values():
+        for category, spec in role.items():
+            if isinstance(spec, dict):
+                for skill in spec.get("skills", []):
+                    pool.setdefault(skill, category)
+    return sorted(pool.items())
+
+
+SKILL_POOL = _skill_pool()
+
+
+def embedding(rng: random.Random, dim: int) -> list[float]:
+    return [rng.uniform(-1, 1) for _ in range(dim)]
+
+
+def embeddings(count: int, dim: int = 384, seed: int = 42) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [embedding(rng, dim) for _ in range(count)]
+
+
+def match_candidates(count: int, dim: int = 384, seed: int = 42) -> list[MatchCandidate]:
+    """Kandidaten nach Hard-Filter mit Structured Skills und Embeddings."""
+    rng = random.Random(seed)
+    candidates = []
+    for _ in range(count):
+        role = rng.choice(PRIMARY_ROLES)
+        city, plz = rng.choice(CITIES)
+        skills = [
+            {
+                "skill": skill,
+                "category": category,
+                "proficiency": rng.choice(PROFICIENCIES),
+                "recency": rng.choice(RECENCIES),
+            }
+            for skill, category in rng.sample(SKILL_POOL, rng.randint(2, 14))
+        ]
+        candidates.append(MatchCandidate(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            seniority_level=rng.randint(1, 6),
+            career_trajectory=rng.choice(TRAJECTORIES),
+            years_experience=rng.randint(0, 30),
+            structured_skills=skills,
+            current_role_summary=f"{role} mit Schwerpunkt {skills[0]['skill']}",
+            embedding_current=embedding(rng, dim),
+            embedding_full=embedding(rng, dim),
+            city=city,
+            hotlist_category="FINANCE",
+            distance_km=round(rng.uniform(0, 60), 1),
+            certifications=rng.sample(["Bilanzbuchhalter", "Lohnbuchhalter", "Steuerfachwirt"], rng.randint(0, 1)),
+            industries=rng.sample(INDUSTRIES, rng.randint(0, 3)),
+            erp=rng.sample(ERP, rng.randint(0, 3)),
+            job_titles=[role],
+            primary_role=role,
+            classification_data={"primary_role": role, "roles": [role]},
+            drive_time_car_min=rng.choice([None, rng.randint(5, 90)]),
+            drive_time_transit_min=rng.choice([None, rng.randint(10, 120)]),
+            postal_code=plz,
+        ))
+    return candidates
+
+
+def v3_job(dim: int = 384, seed: int = 7, role: str = "Finanzbuchhalter/in") -> Job:
+    """Job mit V2-Profil (Skills, Level, Embedding) fuer das V3-Scoring."""
+    rng = random.Random(seed)
+    city, plz = rng.choice(CITIES)
+    return Job(
+        id=uuid.UUID(int=rng.getrandbits(128)),
+        company_name="Bench GmbH",
+        position=role,
+        city=city,
+        postal_code=plz,
+        industry=rng.choice(INDUSTRIES),
+        hotlist_job_title=role,
+        hotlist_category="FINANCE",
+        v2_seniority_level=rng.randint(2, 4),
+        v2_required_skills=[
+            {"skill": skill, "importance": rng.choice(IMPORTANCES), "category": category}
+            for skill, category in rng.sample(SKILL_POOL, 8)
+        ],
+        v2_embedding=embedding(rng, dim),
+        classification_data={"primary_role": role, "quality_score": "high", "is_leadership": False},
+    )
+
+
+def job_texts(count: int, seed: int = 42) -> list[str]:
+    """Stellenanzeigen-Texte mit gemischten Finance- und Fremd-Begriffen."""
+    rng = random.Random(seed)
+    noise = ["Lagerlogistik", "Vertrieb", "Schichtarbeit", "Kundenservice", "CNC", "Elektrotechnik"]
+    texts = []
+    for _ in range(count):
+        role = rng.choice(PRIMARY_ROLES)
+        terms = [s for s, _ in rng.sample(SKILL_POOL, rng.randint(4, 12))]
+        terms += rng.sample(noise, rng.randint(0, 3))
+        rng.shuffle(terms)
+        texts.append(
+            f"Wir suchen eine/n {role} (m/w/d). Ihre Aufgaben: {', '.join(terms)}. {FILLER}"
+        )
+    return texts
+
+
+def skill_lists(count: int, seed: int = 42) -> list[list[str]]:
+    """Freitext-Skills von Kandidaten (Candidate.skills)."""
+    rng = random.Random(seed)
+    return [[s for s, _ in rng.sample(SKILL_POOL, rng.randint(3, 12))] for _ in range(count)]
+
+
+def pre_score_triples(count: int, seed: int = 42) -> list[tuple[Candidate, Job, Match]]:
+    """(Kandidat, Job, Match) mit Hotlist-Feldern fuer den Pre-Score.
+
+    Jedes dritte Match hat keine matched_keywords, damit der KeywordMatcher-
+    Fallback im Pre-Score mitgemessen wird.
+    """
+    rng = random.Random(seed)
+    texts = job_texts(count, seed)
+    triples = []
+    for i in range(count):
+        cand_role, job_role = rng.choice(PRIMARY_ROLES), rng.choice(PRIMARY_ROLES)
+        cand_city = rng.choice(CITIES)[0]
+        job_city = cand_city if rng.random() < 0.4 else rng.choice(CITIES)[0]
+        skills = [s for s, _ in rng.sample(SKILL_POOL, rng.randint(3, 12))]
+        candidate = Candidate(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            skills=skills,
+            hotlist_job_title=cand_role,
+            hotlist_job_titles=[cand_role] + rng.sample(PRIMARY_ROLES, rng.randint(0, 2)),
+            hotlist_category=rng.choice(["FINANCE", "FINANCE", "FINANCE", "SONSTIGE"]),
+            hotlist_city=cand_city,
+        )
+        job = Job(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            company_name="Bench GmbH",
+            position=job_role,
+            job_text=texts[i],
+            hotlist_job_title=job_role,
+            hotlist_category="FINANCE",
+            hotlist_city=job_city,
+        )
+        match = Match(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            job_id=job.id,
+            candidate_id=candidate.id,
+            distance_km=rng.choice([None, round(rng.uniform(0, 80), 1)]),
+            matched_keywords=None if i % 3 == 0 else skills[:3],
+        )
+        triples.append((candidate, job, match))
+    return triples
+
+
+CSV_COLUMNS = [
+    "Unternehmen", "Position", "Straße", "PLZ", "Stadt", "Branche",
+    "Unternehmensgröße", "Beschäftigungsart", "Anzeigenlink", "Beschreibung",
+]
+# Erkennungsmerkmal fuer das Aufraeumen nach einem Import-Lauf
+CSV_COMPANY_PREFIX = "Bench "
+CSV_URL_PREFIX = "https://bench.invalid/"
+
+
+def csv_export(rows: int, seed: int = 42, companies: int = 0) -> bytes:
+    """Tab-getrennter Export im Format der Stellenanzeigen-CSV (UTF-8).
+
+    `companies` begrenzt die Anzahl verschiedener Firmen (0 = rows // 10).
+    """
+    rng = random.Random(seed)
+    texts = job_texts(rows, seed)
+    company_count = companies or max(1, rows // 10)
+    lines = ["\t".join(CSV_COLUMNS)]
+    for i in range(rows):
+        city, plz = rng.choice(CITIES)
+        values = [
+            f"{CSV_COMPANY_PREFIX}{rng.randrange(company_count):05d} GmbH",
+            rng.choice(PRIMARY_ROLES),
+            f"Musterstraße {rng.randint(1, 200)}",
+            plz,
+            city,
+            rng.choice(INDUSTRIES),
+            rng.choice(["11-50", "51-200", "201-500", "501-1000"]),
+            rng.choice(["Vollzeit", "Teilzeit"]),
+            f"{CSV_URL_PREFIX}{seed}/{i}",
+            texts[i],
+        ]
+        lines.append("\t".join(values))
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,159 @@
+"""Mess-Harness fuer die Hot-Path-Benchmarks (Zeit, Speicher, Baseline).
+
+Zeitmessung wie pytest-benchmark: Warmup-Runden, danach `rounds` Messungen,
+berichtet werden bestes und medianes Ergebnis. Der Speicher-Peak wird in
+einem separaten Lauf mit tracemalloc gemessen, damit das Tracing die
+Zeitmessung nicht verfaelscht.
+
+Baselines sind JSON-Dateien ({"meta": ..., "results": {name: {...}}}).
+Verglichen werden best_ms (stabiler als der Median) und peak_kib; kleine
+absolute Unterschiede unterhalb des Rauschbodens zaehlen nicht als Regression.
+"""
+
+import inspect
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+# Relativer Anstieg, ab dem ein Hot Path als Regression gilt (0.25 = +25%)
+DEFAULT_THRESHOLD = 0.25
+# Absolute Rauschgrenzen: darunter keine Regression, egal wie hoch der Faktor
+NOISE_FLOOR_MS = 0.05
+NOISE_FLOOR_KIB = 16.0
+
+BenchFunc = Callable[[], object | Awaitable[object]]
+
+
+@dataclass
+class BenchResult:
+    """Messergebnis eines Benchmark-Falls."""
+    name: str
+    rounds: int
+    best_ms: float
+    median_ms: float
+    peak_kib: float
+
+
+@dataclass
+class Regression:
+    """Ein Messwert, der die Baseline ueber die Schwelle hinaus ueberschreitet."""
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+async def _call(func: BenchFunc) -> None:
+    result = func()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def measure(
+    name: str,
+    func: BenchFunc,
+    rounds: int = 5,
+    warmup: int = 1,
+    setup: BenchFunc | None = None,
+) -> BenchResult:
+    """Misst `func` (sync oder async) nach pytest-benchmark-Art.
+
+    `setup` (sync oder async) laeuft vor jeder Runde ausserhalb der Messung,
+    z.B. um Caches zu leeren oder einen Import-Job anzulegen.
+    """
+    for _ in range(warmup):
+        if setup:
+            await _call(setup)
+        await _call(func)
+
+    timings = []
+    for _ in range(rounds):
+        if setup:
+            await _call(setup)
+        start = time.perf_counter()
+        await _call(func)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if setup:
+        await _call(setup)
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        await _call(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        rounds=rounds,
+        best_ms=min(timings),
+        median_ms=statistics.median(timings),
+        peak_kib=max(0, peak - base) / 1024,
+    )
+
+
+def environment_meta(**extra) -> dict:
+    """Rahmendaten einer Messung (Vergleiche nur bei gleicher Groesse sinnvoll)."""
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **extra,
+    }
+
+
+def save_baseline(path: Path, results: list[BenchResult], meta: dict) -> None:
+    data = {
+        "meta": meta,
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Regressionen gegenueber der Baseline (nur Faelle, die in beiden vorkommen)."""
+    stored = baseline.get("results", {})
+    regressions = []
+    for result in results:
+        old = stored.get(result.name)
+        if not old:
+            continue
+        for metric, floor in (("best_ms", NOISE_FLOOR_MS), ("peak_kib", NOISE_FLOOR_KIB)):
+            before = old.get(metric)
+            after = getattr(result, metric)
+            if before is None:
+                continue
+            if after > before * (1 + threshold) and after - before > floor:
+                regressions.append(Regression(result.name, metric, before, after))
+    return regressions
+
+
+def print_table(results: list[BenchResult], baseline: dict | None = None) -> None:
+    stored = (baseline or {}).get("results", {})
+    header = f"{'Fall':<40}{'best ms':>10}{'median ms':>11}{'peak KiB':>11}"
+    if stored:
+        header += f"{'vs. Base':>10}"
+    print(header)
+    for r in results:
+        line = f"{r.name:<40}{r.best_ms:>10.2f}{r.median_ms:>11.2f}{r.peak_kib:>11.1f}"
+        old = stored.get(r.name)
+        if old and old.get("best_ms"):
+            line += f"{r.best_ms / old['best_ms']:>9.2f}x"
+        print(line)
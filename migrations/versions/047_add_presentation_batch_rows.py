@@ -0,0 +1,55 @@
+"""Add presentation_batch_rows (append-only Zeilen-Log fuer CSV-Bulk).
+
+Bisher wurden processed_rows / error_details auf presentation_batches pro
+Zeile komplett neu geschrieben (quadratisch in der Batch-Groesse). Jede
+Zeile bekommt jetzt einen eigenen Eintrag; die Zaehler auf dem Batch werden
+atomar hochgezaehlt.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "047"
+down_revision = "046"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "presentation_batch_rows",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "batch_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("presentation_batches.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("row_index", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(40), nullable=False),
+        sa.Column(
+            "presentation_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("client_presentations.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("company_name", sa.String(255), nullable=True),
+        sa.Column("mailbox", sa.String(255), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_presentation_batch_rows_batch",
+        "presentation_batch_rows",
+        ["batch_id", "row_index"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_presentation_batch_rows_batch", table_name="presentation_batch_rows")
+    op.drop_table("presentation_batch_rows")
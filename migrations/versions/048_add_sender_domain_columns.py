@@ -0,0 +1,46 @@
+"""Add generated sender_domain columns for domain send limits.
+
+get_daily_send_count hat client_presentations und acquisition_emails mit
+email_from LIKE '%@domain' gescannt (kein Index moeglich). Die generierte
+Spalte sender_domain + Index (sender_domain, Zeitstempel) erlaubt einen
+gruppierten Tages-Count ueber alle Domains.
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "048"
+down_revision = "047"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE client_presentations
+        ADD COLUMN IF NOT EXISTS sender_domain VARCHAR(255)
+        GENERATED ALWAYS AS (lower(split_part(email_from, '@', 2))) STORED
+    """)
+    op.execute("""
+        ALTER TABLE acquisition_emails
+        ADD COLUMN IF NOT EXISTS sender_domain VARCHAR(255)
+        GENERATED ALWAYS AS (lower(split_part(from_email, '@', 2))) STORED
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_client_presentations_sender_domain
+        ON client_presentations (sender_domain, created_at)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_acq_emails_sender_domain
+        ON acquisition_emails (sender_domain, sent_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_acq_emails_sender_domain")
+    op.execute("DROP INDEX IF EXISTS ix_client_presentations_sender_domain")
+    op.execute("ALTER TABLE acquisition_emails DROP COLUMN IF EXISTS sender_domain")
+    op.execute("ALTER TABLE client_presentations DROP COLUMN IF EXISTS sender_domain")
@@ -0,0 +1,32 @@
+"""Add (alert_type, match_id) / (alert_type, job_id) indexes on alerts.
+
+Die Alert-Checks erzeugen Alerts per INSERT ... SELECT und ueberspringen
+bestehende Alerts per Anti-Join auf diese Schluessel.
+
+Revision ID: 049
+Revises: 048
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "049"
+down_revision = "048"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alerts_type_match "
+        "ON alerts (alert_type, match_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alerts_type_job "
+        "ON alerts (alert_type, job_id, created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_alerts_type_job")
+    op.execute("DROP INDEX IF EXISTS ix_alerts_type_match")
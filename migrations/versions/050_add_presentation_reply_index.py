@@ -0,0 +1,64 @@
+"""Add reply-correlation columns + indexes on client_presentations.
+
+match_reply_to_presentation hat nach func.lower(email_to) und per
+email_subject ILIKE '%...%' gesucht (beides ohne Index). Generierte Spalten
+recipient_email / recipient_domain / subject_key plus die beim Versand
+gespeicherte message_id erlauben einen einzigen indizierten Lookup.
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "050"
+down_revision = "049"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE client_presentations
+        ADD COLUMN IF NOT EXISTS recipient_email VARCHAR(500)
+        GENERATED ALWAYS AS (lower(btrim(email_to))) STORED
+    """)
+    op.execute("""
+        ALTER TABLE client_presentations
+        ADD COLUMN IF NOT EXISTS recipient_domain VARCHAR(255)
+        GENERATED ALWAYS AS (lower(split_part(btrim(email_to), '@', 2))) STORED
+    """)
+    op.execute(r"""
+        ALTER TABLE client_presentations
+        ADD COLUMN IF NOT EXISTS subject_key VARCHAR(500)
+        GENERATED ALWAYS AS (
+            lower(regexp_replace(email_subject, '^\s*((re|aw|fwd|wg|fw):\s*)*|\s+$', '', 'gi'))
+        ) STORED
+    """)
+    op.execute("""
+        ALTER TABLE client_presentations
+        ADD COLUMN IF NOT EXISTS message_id VARCHAR(500)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_client_presentations_recipient_email
+        ON client_presentations (recipient_email, created_at)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_client_presentations_subject_key
+        ON client_presentations (subject_key)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_client_presentations_message_id
+        ON client_presentations (message_id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_client_presentations_message_id")
+    op.execute("DROP INDEX IF EXISTS ix_client_presentations_subject_key")
+    op.execute("DROP INDEX IF EXISTS ix_client_presentations_recipient_email")
+    op.execute("ALTER TABLE client_presentations DROP COLUMN IF EXISTS message_id")
+    op.execute("ALTER TABLE client_presentations DROP COLUMN IF EXISTS subject_key")
+    op.execute("ALTER TABLE client_presentations DROP COLUMN IF EXISTS recipient_domain")
+    op.execute("ALTER TABLE client_presentations DROP COLUMN IF EXISTS recipient_email")
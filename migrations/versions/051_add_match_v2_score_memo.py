@@ -0,0 +1,42 @@
+"""Add match_v2_score_memo for persisted V3 pair scores.
+
+Das Score-Memo lag bisher als LRU im Prozess jedes Workers: nach Deploy
+oder Neustart leer, und eine Voll-Neuberechnung mit mehr Paaren als
+Eintraegen verdraengte alles vor der Wiederverwendung. Eine Zeile pro
+(Job, Kandidat)-Paar, Versionen als sha1-Fingerprints.
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "051"
+down_revision = "050"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS match_v2_score_memo (
+            job_id UUID NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+            candidate_id UUID NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+            job_version CHAR(40) NOT NULL,
+            candidate_version CHAR(40) NOT NULL,
+            config_version CHAR(40) NOT NULL,
+            scores JSONB NOT NULL,
+            updated_at TIMESTAMPTZ DEFAULT now(),
+            PRIMARY KEY (job_id, candidate_id)
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_v2_score_memo_candidate_id
+        ON match_v2_score_memo (candidate_id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_v2_score_memo_candidate_id")
+    op.execute("DROP TABLE IF EXISTS match_v2_score_memo")
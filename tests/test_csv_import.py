@@ -360,3 +360,39 @@ class TestEdgeCases:
 
         assert result.is_valid is True
         assert result.total_rows == 2
+
+
+class TestAcquisitionImportChunking:
+    """Tests für die Chunk-Helfer des Akquise-Imports."""
+
+    def test_count_data_rows_ignores_blank_lines(self):
+        """Zeilenzählung entspricht DictReader (ohne Header und Leerzeilen)."""
+        from app.services.acquisition_import_service import _count_data_rows
+
+        text = "Unternehmen\tPosition\nA GmbH\tBuchhalter\n\nB AG\tEntwickler\n"
+        assert _count_data_rows(text) == 2
+        assert _count_data_rows("") == 0
+
+    def test_chunked_keeps_order_and_remainder(self):
+        """Chunks behalten die Reihenfolge, der letzte Chunk ist kürzer."""
+        from app.services.acquisition_import_service import _chunked
+
+        assert list(_chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_contact_index_matches_email_before_name(self):
+        """Kontakt-Index: E-Mail-Match vor Namens-Match, pro Firma getrennt."""
+        import uuid
+
+        from app.models.company_contact import CompanyContact
+        from app.services.acquisition_import_service import _ContactIndex
+
+        company_id = uuid.uuid4()
+        by_name = CompanyContact(company_id=company_id, first_name="Anna", last_name="Meier")
+        by_mail = CompanyContact(
+            company_id=company_id, first_name="Bernd", last_name="Kurz", email="a@x.de",
+        )
+        index = _ContactIndex([by_name, by_mail])
+
+        assert index.find(company_id, "Anna", "Meier", "A@X.de") == (by_mail, True)
+        assert index.find(company_id, "anna", None, None) == (by_name, False)
+        assert index.find(uuid.uuid4(), "Anna", "Meier", None) == (None, False)
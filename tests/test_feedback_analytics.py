@@ -0,0 +1,172 @@
+"""Tests fuer den spaltenbasierten Feedback-Analyse-Kern (ohne Datenbank)."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.services.feedback_analytics import (
+    FeatureMatrix,
+    SeparationAccumulator,
+    Vocabulary,
+    role_pair_stats,
+    term_counts,
+)
+
+
+COMPONENTS = ["skill_overlap", "distance_km"]
+
+
+class TestSeparationAccumulator:
+    """Tests fuer die Trennkraft-Berechnung."""
+
+    def test_separation_matches_python_average(self):
+        """Trennkraft = Durchschnitt good - Durchschnitt bad, fehlende Werte ignoriert."""
+        rows = [
+            ({"skill_overlap": 0.9, "distance_km": 10}, "good"),
+            ({"skill_overlap": 0.7}, "good"),
+            ({"skill_overlap": 0.2, "distance_km": 40}, "bad"),
+            ({"skill_overlap": None, "distance_km": 30}, "bad"),
+            (None, "good"),
+            ({"skill_overlap": 1.0}, "neutral"),
+        ]
+        acc = SeparationAccumulator(COMPONENTS)
+        acc.update(FeatureMatrix.from_rows(rows, COMPONENTS))
+
+        power = acc.separation_power()
+        assert acc.rows_seen == 4
+        assert power["skill_overlap"] == pytest.approx(0.8 - 0.2)
+        assert power["distance_km"] == pytest.approx(10 - 35)
+
+    def test_min_samples_zeroes_component(self):
+        """Zu wenige Werte → Trennkraft 0.0."""
+        rows = [({"skill_overlap": 0.9}, "good"), ({"skill_overlap": 0.1}, "bad")]
+        acc = SeparationAccumulator(COMPONENTS)
+        acc.update(FeatureMatrix.from_rows(rows, COMPONENTS))
+        assert acc.separation_power(min_samples=2)["skill_overlap"] == 0.0
+
+    def test_incremental_update_equals_full_run(self):
+        """Inkrementelles Einrechnen ergibt dasselbe wie ein Voll-Lauf."""
+        rng = np.random.default_rng(42)
+        rows = [
+            ({"skill_overlap": float(v), "distance_km": float(d)}, "good" if v > 0.5 else "bad")
+            for v, d in zip(rng.random(200), rng.random(200) * 50)
+        ]
+        full = SeparationAccumulator(COMPONENTS)
+        full.update(FeatureMatrix.from_rows(rows, COMPONENTS))
+
+        now = datetime.now(timezone.utc)
+        inc = SeparationAccumulator(COMPONENTS)
+        inc.update(FeatureMatrix.from_rows(rows[:120], COMPONENTS), watermark=now)
+        later = now + timedelta(seconds=1)
+        inc.update(FeatureMatrix.from_rows(rows[120:], COMPONENTS), watermark=later)
+
+        assert inc.rows_seen == full.rows_seen
+        assert inc.watermark == later
+        for comp, value in full.separation_power().items():
+            assert inc.separation_power()[comp] == pytest.approx(value)
+
+
+class TestRolePairAndTermStats:
+    """Tests fuer Rollen-Paar- und Term-Aggregation."""
+
+    def test_role_pair_stats(self):
+        """Gruppiert nach (job_role, candidate_role), sortiert, leere Rollen ignoriert."""
+        stats = role_pair_stats(
+            ["B", "A", "A", "", "A"],
+            ["X", "Y", "Y", "Y", "Z"],
+            np.array([0.5, 0.2, 0.6, 0.9, 0.1]),
+        )
+        assert [s.key for s in stats] == [("A", "Y"), ("A", "Z"), ("B", "X")]
+        ay = stats[0]
+        assert ay.count == 2
+        assert ay.mean == pytest.approx(0.4)
+        assert (ay.min, ay.max) == (0.2, 0.6)
+
+    def test_term_counts_with_shared_vocabulary(self):
+        """Zaehlt jedes Vorkommen; ein gemeinsames Vokabular vergibt stabile IDs."""
+        vocab = Vocabulary()
+        counts = term_counts(
+            [["datev", "sap"], ["datev"], []],
+            np.array([True, False, False]),
+            np.array([False, True, False]),
+            vocab=vocab,
+        )
+        assert counts.terms == ["datev", "sap"]
+        assert counts.total.tolist() == [2, 1]
+        assert counts.good.tolist() == [1, 1]
+        assert counts.bad.tolist() == [1, 0]
+        assert len(vocab) == 2
+
+
+class TestSeparationCache:
+    """Tests fuer den Trennkraft-Cache des MatchingLearningService."""
+
+    @staticmethod
+    def _fake_db(rows):
+        """Fake-Session: liefert `rows` (gefiltert nach Watermark) bzw. deren Anzahl."""
+
+        class Result:
+            def __init__(self, data):
+                self._data = data
+
+            def all(self):
+                return self._data
+
+            def scalar(self):
+                return self._data
+
+        class FakeDB:
+            async def execute(self, query):
+                params = query.compile().params
+                cutoffs = [v for v in params.values() if isinstance(v, datetime)]
+                if "count(" in str(query):
+                    return Result(sum(1 for r in rows if r[2] <= cutoffs[0]))
+                return Result([r for r in rows if not cutoffs or r[2] > cutoffs[0]])
+
+        return FakeDB()
+
+    async def test_deleted_training_data_triggers_rebuild(self):
+        """Weniger Zeilen bis zum Watermark als gezaehlt → Summen neu aufbauen."""
+        from app.services import matching_learning_service as mls
+
+        mls.clear_separation_cache()
+        t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            ({"skill_overlap": 0.9}, "good", t0),
+            ({"skill_overlap": 0.1}, "bad", t0 + timedelta(minutes=1)),
+        ]
+        service = mls.MatchingLearningService(self._fake_db(rows))
+
+        acc = await service._load_separation()
+        assert acc.rows_seen == 2
+
+        # Admin-Reset in einem anderen Worker: Historie weg, ein neues Feedback
+        rows[:] = [({"skill_overlap": 0.5}, "good", t0 + timedelta(minutes=5))]
+        acc = await service._load_separation()
+        assert acc.rows_seen == 1
+
+        mls.clear_separation_cache()
+        assert mls._separation_cache == {}
+
+    async def test_rows_without_features_keep_cache_valid(self):
+        """Zeilen ohne Features zaehlen im Abgleich mit → kein Rebuild pro Aufruf."""
+        from app.services import matching_learning_service as mls
+
+        mls.clear_separation_cache()
+        t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            ({"skill_overlap": 0.9}, "good", t0),
+            ({}, "bad", t0 + timedelta(minutes=1)),
+        ]
+        service = mls.MatchingLearningService(self._fake_db(rows))
+
+        first = await service._load_separation()
+        assert (first.rows_seen, first.rows_skipped) == (1, 1)
+
+        rows.append(({"skill_overlap": 0.2}, "bad", t0 + timedelta(minutes=2)))
+        second = await service._load_separation()
+        assert second is first  # inkrementell weitergefuehrt, nicht neu aufgebaut
+        assert second.rows_seen == 2
+
+        mls.clear_separation_cache()
@@ -345,3 +345,110 @@ class TestFilteringAndSorting:
         )
         new_matches = result.scalars().all()
         assert len(new_matches) == 1
+
+
+class TestAlertChecks:
+    """Integration Tests für die set-basierten Alert-Checks."""
+
+    @pytest.mark.asyncio
+    async def test_run_all_checks_creates_each_alert_once(self, db_session: AsyncSession):
+        """Alle exzellenten Matches (ohne 20er-Limit) und ablaufende Jobs, keine Duplikate."""
+        from datetime import timedelta
+
+        from app.models.alert import Alert, AlertType
+        from app.services.alert_service import AlertService
+
+        job = JobFactory.create(
+            position="Bilanzbuchhalter",
+            company_name="Nord GmbH",
+            expires_at=datetime.now(timezone.utc) + timedelta(days=3, hours=2),
+        )
+        candidates = create_multiple_candidates(count=25)
+        db_session.add(job)
+        db_session.add_all(candidates)
+        await db_session.commit()
+
+        matches = [
+            MatchFactory.create(
+                job_id=job.id,
+                candidate_id=c.id,
+                distance_km=2.345,
+                matched_keywords=["SAP", "DATEV", "HGB", "IFRS", "Excel", "Lohn"],
+                status=MatchStatus.NEW,
+            )
+            for c in candidates
+        ]
+        db_session.add_all(matches)
+        await db_session.commit()
+
+        service = AlertService(db_session)
+        first = await service.run_all_checks()
+        second = await service.run_all_checks()
+
+        assert first["excellent_matches"] == 25
+        assert first["expiring_jobs"] == 1
+        assert second["excellent_matches"] == 0
+        assert second["expiring_jobs"] == 0
+
+        result = await db_session.execute(
+            select(Alert).where(Alert.match_id == matches[0].id)
+        )
+        alert = result.scalar_one()
+        assert alert.alert_type == AlertType.EXCELLENT_MATCH
+        assert alert.message == (
+            f"{candidates[0].full_name} passt hervorragend zu Bilanzbuchhalter bei Nord GmbH. "
+            "Distanz: 2.3 km, Keywords: SAP, DATEV, HGB, IFRS, Excel"
+        )
+
+        result = await db_session.execute(
+            select(Alert).where(Alert.alert_type == AlertType.EXPIRING_JOB)
+        )
+        assert result.scalar_one().message == (
+            "Der Job 'Bilanzbuchhalter' bei Nord GmbH läuft in 3 Tagen ab. "
+            "Es gibt 25 potenzielle Kandidaten."
+        )
+
+
+class TestReplyMatching:
+    """Integration Tests für den Reply-Index (match_reply_to_presentation)."""
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_ranks_thread_sender_and_domain(self, db_session: AsyncSession):
+        """Thread-ID vor Absender, Kollegen-Antwort über Betreff + Domain."""
+        from app.models.client_presentation import ClientPresentation
+        from app.services.presentation_reply_service import PresentationReplyService
+
+        older = ClientPresentation(
+            email_to="HR@Nord.de ",
+            email_from="hamdard@sincirus-karriere.de",
+            email_subject="Vorstellung Bilanzbuchhalter (m/w/d)",
+            status="sent",
+            message_id="abc123@sincirus-karriere.de",
+        )
+        newer = ClientPresentation(
+            email_to="hr@nord.de",
+            email_from="hamdard@sincirus-karriere.de",
+            email_subject="Vorstellung Lohnbuchhalter (m/w/d)",
+            status="followup_1",
+        )
+        # Getrennte Commits → unterschiedliche created_at (now() pro Transaktion)
+        db_session.add(older)
+        await db_session.commit()
+        db_session.add(newer)
+        await db_session.commit()
+
+        match = PresentationReplyService.match_reply_to_presentation
+        by_thread = await match(
+            db_session, "hr@nord.de", "AW: Erinnerung",
+            thread_ids=["<abc123@sincirus-karriere.de>"],
+        )
+        by_sender = await match(db_session, "hr@nord.de", "AW: Erinnerung")
+        by_colleague = await match(
+            db_session, "chef@nord.de", "Re: AW: Vorstellung Bilanzbuchhalter (m/w/d)",
+        )
+        unknown = await match(db_session, "info@sued.de", "AW: Hallo")
+
+        assert by_thread["id"] == str(older.id)
+        assert by_sender["id"] == str(newer.id)
+        assert by_colleague["id"] == str(older.id)
+        assert unknown is None
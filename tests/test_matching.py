@@ -289,6 +289,454 @@ class TestDistanceMatching:
         match = MatchFactory.create(distance_km=30.0)
         assert match.distance_km > 25
 
+    def test_batch_hard_filter_uses_spatial_pairs(self):
+        """Batch-Modus filtert vorgeladene Umkreis-Kandidaten wie der SQL-Pfad."""
+        import uuid
+        from types import SimpleNamespace
+
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        def row(level, category, embedding, created):
+            cand_id = uuid.uuid4()
+            values = [None] * 22
+            values[0], values[1], values[6], values[9], values[21] = (
+                cand_id, level, embedding, category, created,
+            )
+            return tuple(values)
+
+        old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        new = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        no_embedding = row(3, "FINANCE", None, new)
+        old_profile = row(3, None, [0.1], old)
+        new_profile = row(4, "FINANCE", [0.2], new)
+        too_senior = row(6, "FINANCE", [0.3], new)
+        wrong_category = row(3, "ENGINEERING", [0.4], new)
+
+        engine = MatchingEngineV2.__new__(MatchingEngineV2)
+        engine._batch_candidate_rows = {
+            r[0]: r for r in (no_embedding, old_profile, new_profile, too_senior, wrong_category)
+        }
+        pairs = [(r[0], float(i)) for i, r in enumerate(engine._batch_candidate_rows.values())]
+        job = SimpleNamespace(hotlist_category="FINANCE")
+
+        result = engine._filter_preloaded_candidates(job, pairs, min_level=1, max_level=5)
+
+        assert [c.id for c in result] == [new_profile[0], old_profile[0], no_embedding[0]]
+        assert [c.distance_km for c in result] == [2.0, 1.0, 0.0]
+
+
+class TestSkillVocabulary:
+    """Tests für das kompilierte Skill-Vokabular (V3 Skill-Tiefe)."""
+
+    @staticmethod
+    def _engine():
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        engine = MatchingEngineV2.__new__(MatchingEngineV2)
+        engine._skill_profiles = {}
+        return engine
+
+    def test_interning_normalizes_once(self):
+        """Synonyme und Groß-/Kleinschreibung landen auf derselben ID."""
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        vocabulary = MatchingEngineV2._get_skill_vocabulary()
+        assert vocabulary.intern("Finanzbuchhaltung") == vocabulary.intern("  finanzbuchhaltung ")
+        assert vocabulary.intern("") is None
+        english = vocabulary.intern("Englisch (gut)")
+        assert vocabulary.is_core_match(english, vocabulary.intern("Englisch"))
+        assert vocabulary.is_irrelevant(english, None)
+
+    def test_skill_depth_exact_contains_and_recency(self):
+        """Exakte Treffer, Teilstring-Treffer und Recency wie im bisherigen Scoring."""
+        engine = self._engine()
+        job_skills = [
+            {"skill": "Kreditorenbuchhaltung", "category": "fachlich"},
+            {"skill": "Jahresabschluss", "category": "fachlich"},
+            {"skill": "Teamarbeit", "category": "soft_skill"},
+        ]
+        cand_skills = [
+            {"skill": "kreditorenbuchhaltung", "recency": "aktuell"},
+            {"skill": "Jahresabschlusserstellung", "recency": "veraltet"},
+            {"skill": "Teamarbeit", "recency": "aktuell"},
+        ]
+
+        # exakt 1.5 × 1.0 + Teilstring 0.5 × 0.4 (ohne Rolle: Gewicht 5)
+        assert engine._score_skill_depth_v3(cand_skills, job_skills, None, []) == (2, 0)
+        assert engine._score_skill_depth_v3([], job_skills, None, []) == (0, 0)
+        assert engine._score_skill_depth_v3(cand_skills, [], None, []) == (10, 1)
+
+    def test_candidate_profile_cached_per_engine(self):
+        """Kandidaten-Profile werden pro Engine-Lauf nur einmal kompiliert."""
+        import uuid
+        from types import SimpleNamespace
+
+        engine = self._engine()
+        cand = SimpleNamespace(
+            id=uuid.uuid4(),
+            structured_skills=[{"skill": "DATEV", "category": "software"}],
+            certifications=["Bilanzbuchhalter IHK"],
+        )
+
+        profile = engine._candidate_skill_profile(cand)
+        assert engine._candidate_skill_profile(cand) is profile
+        assert len(profile.order) == 2
+        assert all(profile.mask >> skill_id & 1 for skill_id in profile.order)
+
+    def test_candidate_profile_rebuilt_after_vocabulary_reload(self, monkeypatch):
+        """Nach einem Config-Reload (neues Vokabular) keine Profile mit alten IDs."""
+        import uuid
+        from types import SimpleNamespace
+
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        engine = self._engine()
+        cand = SimpleNamespace(
+            id=uuid.uuid4(),
+            structured_skills=[{"skill": "DATEV", "category": "software"}],
+            certifications=[],
+        )
+        profile = engine._candidate_skill_profile(cand)
+
+        # Wie _sync_file_config bei geaenderter Datei-Konfiguration
+        monkeypatch.setattr(MatchingEngineV2, "_skill_vocabulary", None)
+        vocabulary = MatchingEngineV2._get_skill_vocabulary()
+        rebuilt = engine._candidate_skill_profile(cand)
+
+        assert rebuilt is not profile
+        assert engine._candidate_skill_profile(cand, vocabulary) is rebuilt
+
+
+class TestScoreMemo:
+    """Tests für das Score-Memo im V3-Scoring (ortsunabhängige Komponenten pro Paar)."""
+
+    class _FakeResult:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def all(self):
+            return self._rows
+
+    class _FakeDb:
+        """Liefert gespeicherte Memo-Zeilen, zählt Upserts (ohne echte DB)."""
+
+        def __init__(self, rows=()):
+            self.rows = list(rows)
+            self.upserts = 0
+
+        async def execute(self, query):
+            if getattr(query, "is_insert", False):
+                self.upserts += 1
+                return TestScoreMemo._FakeResult([])
+            return TestScoreMemo._FakeResult(
+                [(r["candidate_id"], r["candidate_version"], r["scores"]) for r in self.rows]
+            )
+
+        def begin_nested(self):
+            from contextlib import asynccontextmanager
+
+            @asynccontextmanager
+            async def savepoint():
+                yield
+
+            return savepoint()
+
+    @staticmethod
+    def _engine(memo):
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        engine = MatchingEngineV2.__new__(MatchingEngineV2)
+        engine._skill_profiles = {}
+        engine._candidate_versions = {}
+        engine._rules = []
+        engine._score_memo = memo
+        return engine
+
+    @staticmethod
+    def _job():
+        import uuid
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            v2_seniority_level=3,
+            v2_required_skills=[{"skill": "Kreditorenbuchhaltung", "category": "fachlich"}],
+            v2_embedding=[0.1, 0.2, 0.3],
+            industry="Maschinenbau",
+            hotlist_job_title="Finanzbuchhalter/in",
+            position="Finanzbuchhalter (m/w/d)",
+            classification_data={},
+        )
+
+    @staticmethod
+    def _candidate(**overrides):
+        import uuid
+
+        from app.services.matching_engine_v2 import MatchCandidate
+
+        values = dict(
+            id=uuid.uuid4(),
+            seniority_level=3,
+            career_trajectory="lateral",
+            years_experience=8,
+            structured_skills=[
+                {"skill": "Kreditorenbuchhaltung", "category": "fachlich", "recency": "aktuell"},
+                {"skill": "Debitorenbuchhaltung", "category": "fachlich", "recency": "aktuell"},
+                {"skill": "DATEV", "category": "software", "recency": "aktuell"},
+            ],
+            current_role_summary="Finanzbuchhalterin",
+            embedding_current=[0.1, 0.2, 0.25],
+            embedding_full=None,
+            city="München",
+            hotlist_category="FINANCE",
+            distance_km=8.0,
+            erp=["DATEV"],
+            primary_role="Finanzbuchhalter/in",
+        )
+        values.update(overrides)
+        return MatchCandidate(**values)
+
+    @pytest.fixture
+    def memo(self):
+        from app.services.score_memo import ScoreMemo
+
+        return ScoreMemo()
+
+    async def test_rerun_uses_memo_with_identical_result(self, memo):
+        """Zweiter Lauf mit unveränderten Profilen kommt komplett aus dem Memo."""
+        job, cand = self._job(), self._candidate()
+        first = await self._engine(memo)._score_candidates_v3(job, [cand])
+        second = await self._engine(memo)._score_candidates_v3(job, [cand])
+
+        assert (memo.misses, memo.hits) == (1, 1)
+        assert len(first) == 1
+        assert [(m.total_score, m.breakdown) for m in first] == [
+            (m.total_score, m.breakdown) for m in second
+        ]
+
+    async def test_location_recomputed_on_memo_hit(self, memo):
+        """Neue Fahrzeit ändert nur die Standort-Punkte, das Paar bleibt ein Memo-Treffer."""
+        job, cand = self._job(), self._candidate()
+        before = (await self._engine(memo)._score_candidates_v3(job, [cand]))[0]
+
+        cand.drive_time_car_min = 40
+        after = (await self._engine(memo)._score_candidates_v3(job, [cand]))[0]
+
+        assert memo.hits == 1
+        assert before.breakdown["v3_location_pts"] == 5
+        assert after.breakdown["v3_location_pts"] == 3
+        assert after.breakdown["drive_time_car_min"] == 40
+        assert after.total_score == before.total_score - 2
+
+    async def test_profile_or_config_change_misses(self, memo):
+        """Geänderte Kandidaten-Skills, Gewichte oder Regeln erzwingen Neuberechnung."""
+        job, cand = self._job(), self._candidate()
+        await self._engine(memo)._score_candidates_v3(job, [cand])
+
+        changed = self._candidate(id=cand.id, structured_skills=cand.structured_skills[:2])
+        await self._engine(memo)._score_candidates_v3(job, [changed])
+        await self._engine(memo)._score_candidates_v3(job, [cand], weights={"skill_overlap": 20.0})
+        engine = self._engine(memo)
+        engine._rules = [{"rule_type": "association", "rule_json": {}, "confidence": 0.5}]
+        await engine._score_candidates_v3(job, [cand])
+
+        assert (memo.misses, memo.hits) == (4, 0)
+
+    async def test_memo_survives_restart_via_table(self, memo):
+        """Gespeicherte Zeilen machen den Lauf einer frischen Engine (neuer Worker) zum Treffer."""
+        from app.services.score_memo import ScoreMemo
+
+        job, cand = self._job(), self._candidate()
+        other = self._candidate(erp=[], embedding_current=[0.3, 0.1, 0.0])
+        first = await self._engine(memo)._score_candidates_v3(job, [cand, other])
+        # Ohne DB-Session ist pending_rows() nach dem Lauf geleert → Zeilen selbst bauen
+        rows = [
+            {
+                "candidate_id": candidate_id,
+                "candidate_version": key[1],
+                "scores": pair.to_json(),
+            }
+            for (_, candidate_id), (key, pair) in memo._entries.items()
+        ]
+
+        db = self._FakeDb(rows)
+        restarted = ScoreMemo(db)
+        second = await self._engine(restarted)._score_candidates_v3(job, [cand, other])
+
+        assert (restarted.misses, restarted.hits) == (0, 2)
+        assert db.upserts == 0  # nichts Neues zu schreiben
+        assert [(m.total_score, m.breakdown) for m in first] == [
+            (m.total_score, m.breakdown) for m in second
+        ]
+
+    async def test_misses_are_upserted_once_per_run(self):
+        """Neu bewertete Paare werden gesammelt in einem Upsert geschrieben."""
+        from app.services.score_memo import ScoreMemo
+
+        db = self._FakeDb()
+        memo = ScoreMemo(db)
+        candidates = [self._candidate() for _ in range(3)]
+        await self._engine(memo)._score_candidates_v3(self._job(), candidates)
+
+        assert (memo.misses, db.upserts) == (3, 1)
+        assert memo.pending_rows() == []
+
+    def test_pair_score_json_roundtrip(self):
+        """Gate-Rejects speichern nur den Grund; alle Felder überstehen JSON."""
+        from app.services.score_memo import PairScore
+
+        assert PairScore(reject_reason="zero_fachkenntnisse").to_json() == {
+            "reject_reason": "zero_fachkenntnisse"
+        }
+        pair = PairScore(role_depth=15, skill_depth=10, cert_match=5, emb_raw=0.8, career_note="x")
+        assert PairScore.from_json(pair.to_json()) == pair
+        assert PairScore.from_json(pair.to_json()).layer1 == 30
+
+
+class TestMatchingConfigRegistry:
+    """Tests für die zentrale, hot-reloadbare Matching-Konfiguration."""
+
+    class _FakeResult:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def all(self):
+            return self._rows
+
+    class _FakeDb:
+        """Beantwortet das Settings- und das Gewichte-Query, zählt Aufrufe."""
+
+        def __init__(self, version="1", threshold="70", weights=None):
+            self.version = version
+            self.threshold = threshold
+            self.weights = weights or [(None, "skill_overlap", 15.0), ("Bilanzbuchhalter/in", "skill_overlap", 22.0)]
+            self.queries = 0
+
+        async def execute(self, query):
+            self.queries += 1
+            if "system_settings" in str(query):
+                return TestMatchingConfigRegistry._FakeResult([
+                    ("matching_config_version", self.version),
+                    ("drive_time_score_threshold", self.threshold),
+                ])
+            return TestMatchingConfigRegistry._FakeResult(self.weights)
+
+    @staticmethod
+    def _write_config(path, weight=9, compat=None):
+        import json
+
+        (path / "skill_weights.json").write_text(json.dumps({
+            "finanzbuchhalter": {"kern": {"weight": weight, "skills": ["Kreditorenbuchhaltung"]}},
+        }))
+        (path / "skill_hierarchy.json").write_text(json.dumps({
+            "finanzbuchhalter": {"Finanzbuchhaltung": {"children": ["Kreditorenbuchhaltung"]}},
+        }))
+        (path / "role_compatibility.json").write_text(json.dumps(compat or {
+            "_comment": "wird ignoriert",
+            "bilanzbuchhalter": {"allowed_job_roles": ["bilanzbuchhalter", "finanzbuchhalter"]},
+            "finanzbuchhalter": {"allowed_job_roles": ["finanzbuchhalter"]},
+        }))
+
+    def test_compile_builds_lookups(self, tmp_path):
+        """Skill-Gewichte und Rollen-Matrix werden zu Lookups kompiliert."""
+        from app.services.matching_config import compile_file_config
+
+        self._write_config(tmp_path)
+        files = compile_file_config(tmp_path)
+
+        assert files.skill_to_category["finanzbuchhalter::kreditorenbuchhaltung"] == ("kern", 9)
+        assert files.role_compatibility["bilanzbuchhalter"] == ("bilanzbuchhalter", "finanzbuchhalter")
+        assert files.allowed_candidate_roles["finanzbuchhalter"] == {"bilanzbuchhalter", "finanzbuchhalter"}
+        assert "_comment" not in files.role_compatibility
+        with pytest.raises(TypeError):
+            files.skill_weights["neu"] = {}
+
+    def test_file_change_reloads(self, tmp_path, monkeypatch):
+        """Geänderte Datei → neue Version, Engine verwirft abgeleitete Caches."""
+        from app.services import matching_config, matching_engine_v2
+        from app.services.matching_engine_v2 import MatchingEngineV2
+
+        monkeypatch.setattr(matching_config, "FILE_CHECK_SECONDS", 0.0)
+        registry = matching_config.MatchingConfigRegistry(tmp_path)
+        monkeypatch.setattr(matching_engine_v2, "matching_config_registry", registry)
+        monkeypatch.setattr(MatchingEngineV2, "_file_config", None)
+        monkeypatch.setattr(MatchingEngineV2, "_hierarchy_lookup", {})
+        monkeypatch.setattr(MatchingEngineV2, "_skill_vocabulary", None)
+
+        self._write_config(tmp_path, weight=9)
+        first = registry.files()
+        assert registry.files() is first  # unverändert → derselbe Snapshot
+        assert MatchingEngineV2._get_skill_weight("finanzbuchhalter", "Kreditorenbuchhaltung") == 9
+        vocabulary = MatchingEngineV2._get_skill_vocabulary()
+
+        self._write_config(tmp_path, weight=10)
+        second = registry.files()
+        assert second.version != first.version
+        assert MatchingEngineV2._get_skill_weight("finanzbuchhalter", "Kreditorenbuchhaltung") == 10
+        assert MatchingEngineV2._get_skill_vocabulary() is not vocabulary
+
+        (tmp_path / "skill_weights.json").write_text("{kaputt")
+        assert registry.files() is second  # Parse-Fehler → letzter gültiger Stand
+
+    async def test_db_part_checked_by_version(self, monkeypatch):
+        """Gewichte werden nur bei geänderter DB-Version neu geladen."""
+        from app.services import matching_config
+
+        registry = matching_config.MatchingConfigRegistry()
+        db = self._FakeDb()
+
+        config = await registry.get(db)
+        assert db.queries == 2
+        assert config.drive_time_threshold == 70
+        assert config.weights_for("Bilanzbuchhalter/in") == {"skill_overlap": 22.0}
+        assert config.weights_for("Lohnbuchhalter/in") == {"skill_overlap": 15.0}
+        assert registry.version == config.version
+
+        assert await registry.get(db) is config  # innerhalb DB_CHECK_SECONDS
+        assert db.queries == 2
+
+        registry.invalidate()
+        await registry.get(db)
+        assert db.queries == 3  # nur Versions-Check, Gewichte unverändert
+
+        db.version = "2"
+        db.weights = [(None, "skill_overlap", 30.0)]
+        registry.invalidate()
+        config = await registry.get(db)
+        assert db.queries == 5
+        assert config.weights_for("Bilanzbuchhalter/in") == {"skill_overlap": 30.0}
+
+    async def test_engine_weights_from_snapshot(self, monkeypatch):
+        """_load_weights fragt nur einmal pro Engine-Instanz; ohne DB-Gewichte → Defaults."""
+        from app.services import matching_config, matching_engine_v2
+        from app.services.matching_engine_v2 import DEFAULT_WEIGHTS, MatchingEngineV2
+
+        registry = matching_config.MatchingConfigRegistry()
+        monkeypatch.setattr(matching_engine_v2, "matching_config_registry", registry)
+        db = self._FakeDb()
+        engine = MatchingEngineV2.__new__(MatchingEngineV2)
+        engine.db = db
+        engine._config = None
+
+        assert await engine._load_weights("Bilanzbuchhalter/in") == {"skill_overlap": 22.0}
+        assert await engine._load_weights(None) == {"skill_overlap": 15.0}
+        assert db.queries == 2
+
+        db.weights = []
+        db.version = "leer"
+        registry.invalidate()
+        engine._config = None
+        assert await engine._load_weights("Bilanzbuchhalter/in") == DEFAULT_WEIGHTS
+
+    def test_pipeline_uses_registry_role_matrix(self):
+        """matching_pipeline_v3 nutzt dieselbe Rollen-Matrix wie die Engine."""
+        from app.services.matching_pipeline_v3 import get_allowed_candidate_roles
+
+        assert get_allowed_candidate_roles("finanzbuchhalter") == {
+            "finanzbuchhalter", "bilanzbuchhalter", "steuerfachangestellte",
+        }
+        assert get_allowed_candidate_roles("unbekannt") == set()
+
 
 class TestKeywordConstants:
     """Tests für Keyword-Konstanten."""
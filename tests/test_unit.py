@@ -289,6 +289,1329 @@ class TestLimits:
         assert Limits.PAGE_SIZE_DEFAULT > 0
 
 
+# ==================== PHONE LOOKUP TESTS ====================
+
+class TestPhoneLookupKeys:
+    """Tests für die Telefon-Keys des PhoneLookupService."""
+
+    def test_e164_formats(self):
+        """Nationale und internationale Formate ergeben dieselbe E.164-Nummer."""
+        from app.services.phone_lookup_service import normalize_e164
+
+        assert normalize_e164("0170 / 123 45 67") == "+491701234567"
+        assert normalize_e164("0049 170 1234567") == "+491701234567"
+        assert normalize_e164("+49 (170) 1234567") == "+491701234567"
+        assert normalize_e164("  ") is None
+
+    def test_suffix_key_matches_across_formats(self):
+        """Suffix-Key ist formatunabhängig (letzte 8 Ziffern)."""
+        from app.services.phone_lookup_service import phone_suffix_key
+
+        assert phone_suffix_key("0170 1234567") == phone_suffix_key("+49-170-123 45 67")
+        assert phone_suffix_key("0170 1234567") == "01234567"
+        assert phone_suffix_key("12-34") == "1234"
+        assert phone_suffix_key(None) == ""
+
+    def test_suffix_sql_matches_index_expression(self):
+        """SQL-Ausdruck entspricht dem Expression-Index in init_db."""
+        from app.services.phone_lookup_service import phone_suffix_sql
+
+        assert phone_suffix_sql("phone") == (
+            "right(regexp_replace(COALESCE(phone, ''), '[^0-9]', '', 'g'), 8)"
+        )
+
+    async def test_lookup_orders_before_limit_and_keeps_partial_search(self):
+        """ORDER BY exact/Priorität vor dem LIMIT; kurze Eingaben suchen per Endung."""
+        from app.services.phone_lookup_service import PhoneLookupService
+
+        class FakeResult:
+            def fetchall(self):
+                return [("contact", "id-1", "Anna", "Muster", None, None, "0170 1234567", None, True, 1)]
+
+        class FakeDB:
+            calls = []
+
+            async def execute(self, stmt, params):
+                FakeDB.calls.append((str(stmt), params))
+                return FakeResult()
+
+        service = PhoneLookupService(FakeDB())
+        matches = await service.lookup("+49 170 1234567")
+        sql, params = FakeDB.calls[-1]
+        assert sql.index("ORDER BY exact DESC, priority") < sql.index("LIMIT :limit")
+        assert params["suffix"] == "01234567"
+        assert "LIKE :suffix" not in sql
+        assert matches[0].exact and matches[0].name == "Anna Muster"
+
+        await service.lookup("12-34")
+        sql, params = FakeDB.calls[-1]
+        assert params["suffix"] == "%1234"
+        assert "LIKE :suffix" in sql
+
+
+# ==================== SCHEMA FINGERPRINT TESTS ====================
+
+class _FakeEngine:
+    """Engine-Attrappe: nur der Verbindungstest in init_db."""
+
+    def begin(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run_sync(self, fn):
+        return None
+
+
+class TestSchemaFingerprint:
+    """Tests für den schnellen Start ohne DDL-Phase."""
+
+    def test_fingerprint_is_stable_sha256(self):
+        """Fingerprint ist deterministisch (SHA-256 Hex)."""
+        from app.database import _schema_fingerprint
+
+        fp = _schema_fingerprint()
+        assert len(fp) == 64
+        assert fp == _schema_fingerprint()
+
+    async def test_init_db_skips_ddl_when_current(self, monkeypatch):
+        """Unverändertes Schema → keine DDL, kein erneutes Speichern."""
+        import app.database as database
+
+        async def is_current(fp):
+            return True
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("DDL-Phase darf nicht laufen")
+
+        monkeypatch.setattr(database, "engine", _FakeEngine())
+        monkeypatch.setattr(database, "_schema_is_current", is_current)
+        monkeypatch.setattr(database, "_apply_schema", fail)
+        monkeypatch.setattr(database, "_store_schema_state", fail)
+        monkeypatch.setattr(database.settings, "force_schema_migration", False)
+
+        await database.init_db()
+
+    async def test_failed_migration_does_not_store_state(self, monkeypatch):
+        """Übersprungene Migration → Fingerprint wird nicht gespeichert."""
+        import app.database as database
+
+        stored = []
+
+        async def is_current(fp):
+            return False
+
+        async def apply_schema():
+            database.logger.warning("Migration für 'x.y' übersprungen: lock timeout")
+
+        async def store(fp):
+            stored.append(fp)
+
+        monkeypatch.setattr(database, "engine", _FakeEngine())
+        monkeypatch.setattr(database, "_schema_is_current", is_current)
+        monkeypatch.setattr(database, "_apply_schema", apply_schema)
+        monkeypatch.setattr(database, "_store_schema_state", store)
+
+        await database.init_db()
+        assert stored == []
+
+
+# ==================== AUTH MIDDLEWARE TESTS ====================
+
+class TestSecurityMiddleware:
+    """Tests für die ASGI-Auth-Middleware."""
+
+    def test_public_path_trie_matches_startswith_semantics(self):
+        """Trie entspricht 'in PUBLIC_PATHS or startswith(PUBLIC_PREFIXES)'."""
+        from app.auth import PUBLIC_PATH_TRIE, PUBLIC_PATHS, PUBLIC_PREFIXES
+
+        paths = [
+            "/health", "/health/", "/healthz", "/login", "/static/css/app.css",
+            "/static", "/static/", "/api/n8n/call", "/api/n8n", "/api/n8nx/a",
+            "/api/telegram/webhook", "/api/akquise/unsubscribe/abc", "/", "",
+            "/api/candidates", "/favicon.ico", "/debug/pymupdf",
+        ]
+        for path in paths:
+            expected = path in PUBLIC_PATHS or any(path.startswith(p) for p in PUBLIC_PREFIXES)
+            assert PUBLIC_PATH_TRIE.matches(path) is expected, path
+
+    def test_claims_cache_returns_same_payload(self):
+        """Gültiger Token wird nur einmal dekodiert."""
+        from app import auth
+
+        token = auth.create_access_token("test@example.com", role="admin")
+        auth._claims_cache.clear()
+        first = auth.decode_token_cached(token)
+        assert first["sub"] == "test@example.com"
+        assert token in auth._claims_cache
+        assert auth.decode_token_cached(token) is first
+        assert auth.decode_token_cached("kein.gueltiger.token") is None
+
+    async def test_middleware_auth_and_headers(self):
+        """401 für API ohne Auth, Security-Header + Request-ID auf jeder Antwort."""
+        from httpx import ASGITransport, AsyncClient
+        from starlette.responses import PlainTextResponse
+
+        from app.auth import JWT_COOKIE_NAME, SecurityMiddleware, create_access_token
+
+        seen = {}
+
+        async def inner(scope, receive, send):
+            seen.update(scope.get("state", {}))
+            await PlainTextResponse("ok", headers={"server": "uvicorn"})(scope, receive, send)
+
+        transport = ASGITransport(app=SecurityMiddleware(inner))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            health = await client.get("/health")
+            assert health.status_code == 200
+            assert health.headers["x-frame-options"] == "SAMEORIGIN"
+            assert "server" not in health.headers
+            assert health.headers["x-request-id"] == seen["request_id"]
+
+            denied = await client.get("/api/candidates")
+            assert denied.status_code == 401
+            assert denied.headers["x-content-type-options"] == "nosniff"
+
+            redirect = await client.get("/candidates")
+            assert redirect.status_code == 302
+
+            client.cookies.set(JWT_COOKIE_NAME, create_access_token("max@example.com"))
+            ok = await client.get("/api/candidates")
+            assert ok.status_code == 200
+            assert seen["user_email"] == "max@example.com"
+
+
+# ==================== RATE LIMITER TESTS ====================
+
+class TestRateLimiter:
+    """Tests für den Sliding-Window Rate-Limiter."""
+
+    def test_sliding_window_weights_previous_window(self):
+        """Vorheriges Fenster zählt anteilig."""
+        from app.api.rate_limiter import sliding_window_decision
+
+        # 10 im alten Fenster, Hälfte vergangen → 5 + 4 = 9 < 10
+        assert sliding_window_decision(10, 4, 0.5, 10, 60) == (True, 0)
+        # 5 + 6 = 11 → blockiert, nach weiteren 10% des Fensters wieder frei
+        allowed, retry_after = sliding_window_decision(10, 6, 0.5, 10, 60)
+        assert allowed is False
+        assert retry_after == 6
+
+    def test_full_current_window_waits_for_next(self):
+        """Volles aktuelles Fenster → Wartezeit reicht ins nächste Fenster."""
+        from app.api.rate_limiter import sliding_window_decision
+
+        allowed, retry_after = sliding_window_decision(0, 10, 0.25, 10, 60)
+        assert allowed is False
+        assert retry_after >= 45
+
+    async def test_in_memory_backend_limit_and_lru(self):
+        """Limit greift pro Key, inaktive Clients werden per LRU verdrängt."""
+        from app.api.rate_limiter import InMemoryRateLimitBackend
+
+        backend = InMemoryRateLimitBackend(max_keys=2)
+        results = [await backend.hit("a", 3, 3600) for _ in range(4)]
+        assert [allowed for allowed, _ in results] == [True, True, True, False]
+        assert results[-1][1] >= 1
+        assert await backend.remaining("a", 3, 3600) == 0
+
+        await backend.hit("b", 3, 3600)
+        await backend.hit("c", 3, 3600)
+        assert len(backend) == 2
+        # "a" war am längsten inaktiv → verdrängt, startet neu
+        assert await backend.remaining("a", 3, 3600) == 3
+
+    async def test_login_rate_limit_per_ip(self, monkeypatch):
+        """Login: 5 Versuche pro IP, danach geblockt."""
+        import importlib
+
+        from app import auth
+
+        rl = importlib.import_module("app.api.rate_limiter")
+
+        monkeypatch.setattr(rl, "rate_limiter", rl.InMemoryRateLimiter())
+        results = [await auth.check_login_rate_limit("10.0.0.1") for _ in range(6)]
+        assert results == [True] * 5 + [False]
+        assert await auth.check_login_rate_limit("10.0.0.2") is True
+
+
+# ==================== EVENT BUS TESTS ====================
+
+class TestEventBus:
+    """Tests für die Verteilung von Events/Fortschritt zwischen Workern."""
+
+    def test_remote_progress_and_cancel_are_mirrored(self):
+        """Nachricht eines anderen Workers landet im lokalen Spiegel."""
+        import json
+
+        from app import state
+        from app.event_bus import event_bus
+
+        def remote(payload):
+            return json.dumps({"topic": state.TOPIC, "origin": "anderer-worker", "payload": payload})
+
+        event_bus._dispatch(remote({"op": "set", "id": "job-1", "data": {"pipeline_status": "running"}}))
+        assert state.get_progress("job-1") == {"pipeline_status": "running"}
+
+        event_bus._dispatch(remote({"op": "cancel", "id": "job-1"}))
+        assert state.is_cancelled("job-1") is True
+
+        event_bus._dispatch(remote({"op": "cleanup", "id": "job-1"}))
+        assert state.get_progress("job-1") is None
+        assert state.is_cancelled("job-1") is False
+
+    def test_own_messages_are_ignored(self):
+        """Eigene Nachrichten werden nicht doppelt angewendet."""
+        import json
+
+        from app import state
+        from app.event_bus import WORKER_ID, event_bus
+
+        event_bus._dispatch(json.dumps({
+            "topic": state.TOPIC, "origin": WORKER_ID,
+            "payload": {"op": "set", "id": "job-2", "data": {"x": 1}},
+        }))
+        assert state.get_progress("job-2") is None
+
+    async def test_remote_sse_event_reaches_local_clients(self):
+        """Akquise-Event aus anderem Worker erreicht lokale SSE-Queues."""
+        import json
+
+        from app.event_bus import event_bus
+        from app.services import acquisition_event_bus as bus
+
+        queue = bus.subscribe()
+        try:
+            event_bus._dispatch(json.dumps({
+                "topic": bus.TOPIC, "origin": "anderer-worker",
+                "payload": {"event": "callback", "data": {"phone": "+49170"}},
+            }))
+            assert queue.get_nowait() == {"event": "callback", "data": {"phone": "+49170"}}
+        finally:
+            bus.unsubscribe(queue)
+
+    async def test_publishes_in_order_and_splits_large_payloads(self, monkeypatch):
+        """Ein Sender in Reihenfolge; grosse Nachrichten kommen zerlegt und vollständig an."""
+        from app import event_bus as bus_module
+        from app.event_bus import MAX_PAYLOAD_BYTES, EventBus, PubSubBackend
+
+        class RecordingBackend(PubSubBackend):
+            def __init__(self):
+                self.sent = []
+
+            async def start(self, on_message):
+                return None
+
+            async def stop(self):
+                return None
+
+            async def publish(self, message):
+                assert len(message.encode("utf-8")) <= MAX_PAYLOAD_BYTES
+                self.sent.append(message)
+
+        backend = RecordingBackend()
+        sender = EventBus(backend)
+        sender.emit("pipeline_state", {"op": "set", "id": "job-3", "data": {"log": "ä" * 20000}})
+        sender.emit("pipeline_state", {"op": "cleanup", "id": "job-3"})
+        await sender.stop()
+
+        assert len(backend.sent) > 2
+        received = []
+        receiver = EventBus(backend)
+        receiver.on("pipeline_state", received.append)
+        # Empfänger als anderer Worker (eigene Nachrichten würden ignoriert)
+        monkeypatch.setattr(bus_module, "WORKER_ID", "anderer-worker")
+        for raw in backend.sent:
+            receiver._dispatch(raw)
+
+        assert [p["op"] for p in received] == ["set", "cleanup"]
+        assert received[0]["data"]["log"] == "ä" * 20000
+
+    def test_rejects_oversized_payload(self):
+        """Was auch zerlegt nicht passt, wird laut abgelehnt."""
+        from app.event_bus import EventBus, PostgresPubSub
+
+        bus = EventBus(PostgresPubSub(dsn="postgresql://localhost/test"))
+        with pytest.raises(ValueError):
+            bus.emit("pipeline_state", {"data": "x" * 200_000})
+
+    def test_remote_progress_expires(self, monkeypatch):
+        """Gespiegelter Fortschritt ohne Aktualisierung verfällt nach der TTL."""
+        import json
+
+        from app import state
+        from app.event_bus import event_bus
+
+        now = [1000.0]
+        monkeypatch.setattr(state.time, "monotonic", lambda: now[0])
+        event_bus._dispatch(json.dumps({
+            "topic": state.TOPIC, "origin": "anderer-worker",
+            "payload": {"op": "set", "id": "job-4", "data": {"pipeline_status": "running"}},
+        }))
+        assert state.get_progress("job-4") is not None
+
+        now[0] += state.REMOTE_PROGRESS_TTL_SECONDS + 1
+        assert state.get_progress("job-4") is None
+
+        # Lokal ausgeführte Pipelines verfallen nicht
+        state.set_progress("job-5", {"pipeline_status": "running"})
+        now[0] += state.REMOTE_PROGRESS_TTL_SECONDS + 1
+        assert state.get_progress("job-5") is not None
+        state.cleanup_progress("job-5")
+
+
+# ==================== CV TEXT CACHE TESTS ====================
+
+class TestCVTextReuse:
+    """Tests für die Wiederverwendung extrahierter CV-Texte."""
+
+    async def test_known_text_reused_for_same_hash(self):
+        """Unverändertes PDF (gleicher Hash) braucht keine Extraktion."""
+        from app.services.cv_parser_service import CVParserService
+        from app.utils.pdf_extract import pdf_hash
+
+        pdf = b"%PDF-1.4 kein echtes PDF"
+        digest = pdf_hash(pdf)
+        parser = CVParserService(db=None)
+
+        text = await parser.extract_cv_text(pdf, digest, digest, "Lebenslauf Max Mustermann")
+        assert text == "Lebenslauf Max Mustermann"
+
+    async def test_cached_text_skips_pool(self):
+        """Bereits extrahierter Text kommt aus dem Prozess-Cache."""
+        from app.services import cv_parser_service
+        from app.utils.pdf_extract import pdf_hash
+
+        pdf = b"%PDF-1.4 gecachtes PDF"
+        digest = pdf_hash(pdf)
+        cv_parser_service._cache_pdf_text(digest, "Text aus dem Cache")
+        parser = cv_parser_service.CVParserService(db=None)
+
+        assert await parser.extract_cv_text(pdf, digest) == "Text aus dem Cache"
+        # Vision-Platzhalter wird nie wiederverwendet
+        assert await parser.extract_cv_text(pdf, digest, digest, "[Vision-Parse: 2 Seite(n)]") == "Text aus dem Cache"
+
+    async def test_pipeline_without_text_fails_without_vision(self):
+        """Bild-PDFs werden im Massenlauf ohne Vision als fehlgeschlagen gemeldet."""
+        import asyncio
+
+        from app.services.cv_ingestion_pipeline import CVIngestionPipeline, CVJob
+        from app.utils.pdf_extract import pdf_hash
+
+        class FakeParser:
+            async def download_cv(self, url):
+                return b"%PDF bild"
+
+            async def extract_cv_text(self, pdf_bytes, digest, known_hash=None, known_text=None):
+                return None
+
+        job = CVJob(candidate_id=uuid.uuid4(), cv_url="https://x/cv.pdf", name="Max Mustermann")
+        pipeline = CVIngestionPipeline()
+        res = await pipeline._process(FakeParser(), job, asyncio.Semaphore(1), asyncio.Semaphore(1))
+
+        assert res.success is False
+        assert res.digest == pdf_hash(b"%PDF bild")
+        assert "extrahierbaren Text" in res.error
+
+
+# ==================== PAGE DATA TESTS ====================
+
+class TestPageDataService:
+    """Tests für das Laden der Detailseiten."""
+
+    async def test_candidate_loaded_once_per_request(self):
+        """Der Kandidat wird pro Request-Session nur einmal geladen."""
+        from app.services.page_data_service import PageDataService
+
+        class FakeSession:
+            def __init__(self):
+                self.info = {}
+                self.gets = 0
+
+            async def get(self, model, ident):
+                self.gets += 1
+                return {"id": ident}
+
+        db = FakeSession()
+        candidate_id = uuid.uuid4()
+
+        first = await PageDataService(db).candidate(candidate_id)
+        second = await PageDataService(db).candidate(candidate_id)
+
+        assert first is second
+        assert db.gets == 1
+        # Neue Session (neuer Request) → neuer Cache
+        other = FakeSession()
+        await PageDataService(other).candidate(candidate_id)
+        assert other.gets == 1
+
+    async def test_missing_candidate_returns_none(self):
+        """Unbekannter Kandidat → None, keine Listen-Queries."""
+        from app.services.page_data_service import PageDataService
+
+        class FakeSession:
+            info: dict = {}
+
+            async def get(self, model, ident):
+                return None
+
+        assert await PageDataService(FakeSession()).candidate_page(uuid.uuid4()) is None
+
+
+# ==================== FRAGMENT CACHE TESTS ====================
+
+class TestFragmentCache:
+    """Tests für den HTML-Fragment-Cache der HTMX-Partials."""
+
+    async def test_render_only_once_until_invalidated(self):
+        """Zweiter Aufruf kommt aus dem Cache, invalidate() erzwingt Neu-Rendern."""
+        from app.templating import FragmentCache
+
+        cache = FragmentCache()
+        renders = []
+
+        async def render():
+            renders.append(1)
+            return f"<ul>{len(renders)}</ul>"
+
+        assert await cache.get_or_render("priority_cities", "all", render) == "<ul>1</ul>"
+        assert await cache.get_or_render("priority_cities", "all", render) == "<ul>1</ul>"
+        assert len(renders) == 1
+
+        cache.invalidate("priority_cities")
+        assert await cache.get_or_render("priority_cities", "all", render) == "<ul>2</ul>"
+
+    async def test_invalidate_during_render_is_not_cached(self):
+        """Invalidierung während render() → Ergebnis gilt nicht als aktuell."""
+        from app.templating import FragmentCache
+
+        cache = FragmentCache()
+
+        async def stale_render():
+            cache.invalidate("filter_options")
+            return "<form>alt</form>"
+
+        async def fresh_render():
+            return "<form>neu</form>"
+
+        assert await cache.get_or_render("filter_options", "job-list", stale_render) == "<form>alt</form>"
+        assert await cache.get_or_render("filter_options", "job-list", fresh_render) == "<form>neu</form>"
+
+    def test_ttl_and_lru(self, monkeypatch):
+        """Abgelaufene und verdrängte Einträge werden nicht mehr geliefert."""
+        from app import templating
+
+        now = [1000.0]
+        monkeypatch.setattr(templating.time, "monotonic", lambda: now[0])
+        cache = templating.FragmentCache(max_entries=2, ttl_seconds=300, ttls={"statistics": 60})
+
+        cache.set("statistics", 30, "<div>Stats</div>")
+        cache.set("filter_options", "job-list", "<form></form>")
+        now[0] += 61
+        assert cache.get("statistics", 30) is None
+        assert cache.get("filter_options", "job-list") == "<form></form>"
+
+        cache.set("a", 1, "x")
+        cache.set("b", 1, "y")
+        assert cache.get("filter_options", "job-list") is None
+
+    def test_template_call_block(self):
+        """{% call fragment_cache(...) %} rendert den Block nur beim ersten Mal."""
+        import jinja2
+
+        from app.templating import FragmentCache
+
+        env = jinja2.Environment(autoescape=True)
+        env.globals["fragment_cache"] = FragmentCache()
+        tpl = env.from_string(
+            '{% call fragment_cache("match_rows", key) %}<b>{{ name }}</b>{% endcall %}'
+        )
+
+        assert tpl.render(key="m1|t1", name="Müller & Söhne") == "<b>Müller &amp; Söhne</b>"
+        # Gleicher Datenstand → gecachtes HTML, auch wenn sich der Kontext ändert
+        assert tpl.render(key="m1|t1", name="anders") == "<b>Müller &amp; Söhne</b>"
+        assert tpl.render(key="m1|t2", name="anders") == "<b>anders</b>"
+
+    def test_remote_invalidation_bumps_version(self):
+        """Invalidierung aus anderem Worker erhöht die lokale Version."""
+        from app import templating
+
+        before = templating.fragment_cache.version("filter_presets")
+        templating._on_remote_invalidate({"namespaces": ["filter_presets"]})
+        assert templating.fragment_cache.version("filter_presets") == before + 1
+
+
+# ==================== COMPRESSION / ETAG TESTS ====================
+
+class TestCompression:
+    """Tests für die Brotli/Gzip-Middleware."""
+
+    @staticmethod
+    def _client():
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse, StreamingResponse
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+
+        from app.compression import CompressionMiddleware
+
+        async def big(request):
+            return PlainTextResponse("Kandidat " * 500)
+
+        async def small(request):
+            return PlainTextResponse("ok")
+
+        async def sse(request):
+            async def events():
+                yield "data: " + "x" * 2000 + "\n\n"
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        async def export(request):
+            async def rows():
+                for i in range(50):
+                    yield f"{i};Kandidat;Hamburg\n"
+            return StreamingResponse(rows(), media_type="text/csv")
+
+        app = Starlette(routes=[
+            Route("/big", big), Route("/small", small), Route("/sse", sse), Route("/export", export),
+        ])
+        app.add_middleware(CompressionMiddleware)
+        return TestClient(app)
+
+    def test_negotiates_encoding(self):
+        """Brotli bevorzugt, sonst Gzip, q=0 wird respektiert."""
+        client = self._client()
+
+        assert client.get("/big", headers={"Accept-Encoding": "gzip, br"}).headers["content-encoding"] == "br"
+        assert client.get("/big", headers={"Accept-Encoding": "gzip, br;q=0"}).headers["content-encoding"] == "gzip"
+        response = client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == "Kandidat " * 500
+
+    def test_skips_small_and_sse(self):
+        """Kleine Antworten und SSE bleiben unkomprimiert."""
+        client = self._client()
+
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "br"}).headers
+        assert "content-encoding" not in client.get("/sse", headers={"Accept-Encoding": "br"}).headers
+
+    def test_streams_gzip_chunks(self):
+        """Streaming-Antworten werden chunkweise komprimiert (ohne Content-Length)."""
+        client = self._client()
+
+        response = client.get("/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.text == "".join(f"{i};Kandidat;Hamburg\n" for i in range(50))
+
+
+class TestConditionalEtag:
+    """Tests für ETag/If-None-Match auf Listen- und Status-Endpunkten."""
+
+    def test_etag_matching(self):
+        """Schwache ETags, Listen und * werden erkannt."""
+        from app.api.etag import etag_matches
+
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('"xyz", W/"abc"', 'W/"abc"')
+        assert etag_matches("*", 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+        assert not etag_matches(None, 'W/"abc"')
+
+    def test_not_modified_skips_endpoint(self, monkeypatch):
+        """Unveränderter Datenstand → 304, der Endpunkt läuft nicht."""
+        from fastapi import Depends, FastAPI, Request
+        from fastapi.testclient import TestClient
+
+        from app.api import etag
+
+        version = ["v1"]
+
+        async def fake_version(db, *models):
+            return version[0]
+
+        monkeypatch.setattr(etag, "data_version", fake_version)
+        calls = []
+
+        app = FastAPI()
+
+        @app.get("/status/matches/query")
+        @etag.conditional_etag(object)
+        async def query(request: Request, page: int = 1, db=Depends(lambda: object())):
+            calls.append(page)
+            return {"page": page}
+
+        client = TestClient(app)
+        first = client.get("/status/matches/query?page=2")
+        assert first.status_code == 200
+        assert first.json() == {"page": 2}
+        tag = first.headers["etag"]
+
+        again = client.get("/status/matches/query?page=2", headers={"If-None-Match": tag})
+        assert again.status_code == 304
+        assert calls == [2]
+
+        # Andere Seite oder neuer Datenstand → neuer ETag
+        assert client.get("/status/matches/query?page=3", headers={"If-None-Match": tag}).status_code == 200
+        version[0] = "v2"
+        assert client.get("/status/matches/query?page=2", headers={"If-None-Match": tag}).status_code == 200
+
+
+# ==================== EXPORT TESTS ====================
+
+class TestTabularExport:
+    """Tests für die Streaming-CSV/XLSX-Writer."""
+
+    def test_csv_writer(self):
+        """CSV mit BOM, Semikolon und Listen als Komma-Text."""
+        from app.utils.tabular_export import CsvStreamWriter
+
+        writer = CsvStreamWriter()
+        data = writer.start(["Name", "Skills"])
+        data += writer.rows([["Müller; Max", ["SAP", "DATEV"]], [None, []]])
+        data += writer.finish()
+
+        assert data.startswith(b"\xef\xbb\xbf")
+        lines = data.decode("utf-8-sig").split("\r\n")
+        assert lines[0] == "Name;Skills"
+        assert lines[1] == '"Müller; Max";SAP, DATEV'
+        assert lines[2] == ";"
+
+    def test_xlsx_writer(self):
+        """XLSX ist ein gültiges ZIP, Zellen sind typisiert und escaped."""
+        import io
+        import zipfile
+
+        from app.utils.tabular_export import XlsxStreamWriter
+
+        writer = XlsxStreamWriter()
+        chunks = [writer.start(["Name", "Score"])]
+        chunks.append(writer.rows([["A & <B>\x01", 87.5], ["C", True]]))
+        chunks.append(writer.finish())
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.testzip() is None
+        assert "xl/workbook.xml" in archive.namelist()
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        assert sheet.count("<row>") == 3
+        assert "A &amp; &lt;B&gt;</t>" in sheet
+        assert "<c><v>87.5</v></c>" in sheet
+        assert '<c t="b"><v>1</v></c>' in sheet
+
+    async def test_stream_export_rows(self, monkeypatch):
+        """Kopfzeile kommt vor dem ersten DB-Zugriff, danach ein Chunk pro Block."""
+        from app.services import export_service
+
+        events = []
+
+        class FakeResult:
+            async def partitions(self):
+                events.append("query")
+                yield [(1,), (2,)]
+                yield [(3,)]
+
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def stream(self, query):
+                return FakeResult()
+
+        class FakeQuery:
+            def execution_options(self, **options):
+                assert options["yield_per"] == export_service.EXPORT_BATCH_ROWS
+                return self
+
+        monkeypatch.setattr(export_service, "async_session_maker", FakeSession)
+
+        stream = export_service.stream_export_rows(
+            FakeQuery(), [("n", "Nummer")], lambda row: {"n": row[0]}, "csv",
+        )
+        header = await stream.__anext__()
+        assert events == []
+        assert header.decode("utf-8-sig") == "Nummer\r\n"
+
+        rest = [chunk async for chunk in stream]
+        assert rest == [b"1\r\n2\r\n", b"3\r\n", b""]
+
+    async def test_stream_export_rows_aborts_on_db_error(self, monkeypatch):
+        """DB-Fehler mitten im Export → Abbruch ohne Abschluss-Chunk."""
+        from app.services import export_service
+
+        class FailingResult:
+            async def partitions(self):
+                yield [(1,)]
+                raise RuntimeError("statement timeout")
+
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def stream(self, query):
+                return FailingResult()
+
+        class FakeQuery:
+            def execution_options(self, **options):
+                return self
+
+        monkeypatch.setattr(export_service, "async_session_maker", FakeSession)
+
+        chunks = []
+        with pytest.raises(RuntimeError):
+            async for chunk in export_service.stream_export_rows(
+                FakeQuery(), [("n", "Nummer")], lambda row: {"n": row[0]}, "csv",
+            ):
+                chunks.append(chunk)
+        assert chunks[1:] == [b"1\r\n"]
+
+
+# ==================== EMBEDDING BATCHING TESTS ====================
+
+class TestEmbeddingBatching:
+    """Tests für Batch-Aufteilung und Cache des EmbeddingService."""
+
+    @staticmethod
+    def _service(monkeypatch):
+        from app.services.local_embedding_service import EmbeddingService
+
+        service = EmbeddingService()
+        service.api_key = "test"
+        service.cache.clear()
+        requests = []
+
+        async def fake_request(texts):
+            requests.append(list(texts))
+            vectors = [[float(len(t))] for t in texts]
+            for text, vector in zip(texts, vectors):
+                service.cache.set(service._cache_key(text), vector)
+            return vectors
+
+        monkeypatch.setattr(service, "_request_embeddings", fake_request)
+        return service, requests
+
+    async def test_embed_uses_cache(self, monkeypatch):
+        """embed() kürzt wie embed_batch, zweiter Aufruf kommt aus dem Cache."""
+        service, requests = self._service(monkeypatch)
+
+        assert await service.embed(" DATEV ") == [5.0]
+        assert await service.embed("DATEV") == [5.0]
+        assert await service.embed("  ") is None
+        assert requests == [["DATEV"]]
+        service.cache.clear()
+
+    async def test_embed_batch_uses_cache_and_token_limit(self, monkeypatch):
+        """embed_batch teilt nach Token-Budget und überspringt Cache-Treffer."""
+        service, requests = self._service(monkeypatch)
+        monkeypatch.setattr(service, "MAX_BATCH_TOKENS", 10)
+
+        service.cache.set(service._cache_key("cached"), [1.0])
+        results = await service.embed_batch(["a" * 15, "b" * 15, "cached", "", "a" * 15])
+
+        assert results == [[15.0], [15.0], [1.0], None, [15.0]]
+        assert requests == [["a" * 15], ["b" * 15]]
+        service.cache.clear()
+
+    def test_chunk_texts(self):
+        """Batches respektieren Anzahl- und Token-Grenze."""
+        from app.services.local_embedding_service import chunk_texts
+
+        assert chunk_texts(["x"] * 5, max_items=2, max_tokens=100) == [["x", "x"], ["x", "x"], ["x"]]
+        assert len(chunk_texts(["y" * 30, "y" * 30], max_items=10, max_tokens=15)) == 2
+
+
+# ==================== SIMILARITY TESTS ====================
+
+class TestSimilarity:
+    """Tests für die vektorisierte Kosinus-Ähnlichkeit (NumPy und Fallback)."""
+
+    CANDIDATES = [[1.0, 0.0], [0.0, 0.0], [1.0, 1.0], [1.0, 2.0, 3.0], None, [-1.0, 0.0], []]
+
+    @pytest.fixture(params=[True, False], ids=["numpy", "python"])
+    def backend(self, request, monkeypatch):
+        from app.services import similarity
+
+        monkeypatch.setattr(similarity, "HAS_NUMPY", request.param)
+        return similarity
+
+    def test_batch_keeps_positions(self, backend):
+        """Ungültige Vektoren (leer, Null, falsche Länge) ergeben 0.0 an ihrer Position."""
+        scores = backend.cosine_batch([2.0, 0.0], self.CANDIDATES)
+
+        assert scores == pytest.approx([1.0, 0.0, 0.70710678, 0.0, 0.0, -1.0, 0.0], abs=1e-6)
+        assert backend.cosine([1.0, 0.0], [0.0, 1.0]) == 0.0
+        assert backend.cosine([1.0, 0.0], [1.0, 0.0, 0.0]) == 0.0
+
+    def test_top_k_and_matrix(self, backend):
+        """top_k sortiert absteigend, Matrix entspricht Einzel-Abfragen."""
+        best = backend.top_k([1.0, 0.1], self.CANDIDATES, k=2)
+        assert [index for index, _ in best] == [0, 2]
+        assert best[0][1] > best[1][1]
+
+        queries = [[1.0, 0.0], None, [0.0, 3.0]]
+        matrix = backend.cosine_matrix(queries, self.CANDIDATES)
+        assert matrix[1] == [0.0] * len(self.CANDIDATES)
+        for query, row in zip(queries, matrix):
+            if query:
+                assert row == pytest.approx(backend.cosine_batch(query, self.CANDIDATES), abs=1e-6)
+
+
+# ==================== BULK PRESENTATION TESTS ====================
+
+class TestBulkPresentationEngine:
+    """Tests für Vorprüfung und Postfach-Taktung des CSV-Bulk-Versands."""
+
+    MAILBOXES = [
+        {"email": "a@one.de"},
+        {"email": "b@one.de"},
+        {"email": "a@two.de"},
+    ]
+
+    def test_scheduler_respects_domain_capacity(self):
+        """Round-Robin innerhalb der Domain, erschöpfte Domains fallen raus."""
+        from app.services.bulk_presentation_service import MailboxScheduler
+
+        scheduler = MailboxScheduler(self.MAILBOXES, {"one.de": 2, "two.de": 1})
+        picked = [scheduler.assign("one.de") for _ in range(4)]
+
+        assert [mb["email"] if mb else None for mb in picked] == [
+            "a@one.de", "b@one.de", "a@two.de", None,
+        ]
+        scheduler.release(picked[0])
+        assert scheduler.assign()["email"] == "a@one.de"
+
+    def test_scheduler_paces_per_mailbox(self):
+        """Gleiches Postfach wartet das Intervall ab, andere Postfächer nicht."""
+        from app.services.bulk_presentation_service import MailboxScheduler
+
+        now = [100.0]
+        scheduler = MailboxScheduler(self.MAILBOXES, {}, interval=6.0, clock=lambda: now[0])
+
+        assert scheduler.next_delay("a@one.de") == 0.0
+        assert scheduler.next_delay("b@one.de") == 0.0
+        assert scheduler.next_delay("a@one.de") == 6.0
+        assert scheduler.next_delay("a@one.de") == 12.0
+        now[0] = 130.0
+        assert scheduler.next_delay("a@one.de") == 0.0
+
+    def test_evaluate_rows_uses_prefetched_checks(self):
+        """Duplikat, Blocklist, Spam, bereits vorgestellt und Blacklist ohne DB."""
+        from types import SimpleNamespace
+        from app.services.bulk_presentation_service import RowChecks, evaluate_rows
+
+        replied, presented, black, fresh = (uuid.uuid4() for _ in range(4))
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        checks = RowChecks(
+            companies_by_name={
+                "replied gmbh": [(replied, "berlin", "active")],
+                "presented ag": [(presented, None, "active")],
+                "black kg": [(black, None, "blacklist")],
+                "fresh se": [(fresh, "köln", "active")],
+            },
+            last_by_company={
+                replied: SimpleNamespace(created_at=old, status="sent", response_type="genuine_reply", email_from="x@two.de"),
+                fresh: SimpleNamespace(created_at=old, status="sent", response_type=None, email_from="x@two.de"),
+            },
+            presented_at_by_company={presented: old},
+            blocked_domains={"blocked.de"},
+        )
+        rows = [
+            {"company_name": "Fresh SE", "city": "Köln"},
+            {"company_name": "fresh se", "city": "köln "},
+            {"company_name": "Neu GmbH", "city": "", "contact_email": "hr@Blocked.de"},
+            {"company_name": "Replied GmbH", "city": "Berlin"},
+            {"company_name": "Presented AG", "city": ""},
+            {"company_name": "Black KG", "city": "Hamburg"},
+            {"company_name": "Neu GmbH", "city": "München"},
+        ]
+
+        verdicts = evaluate_rows(rows, checks)
+
+        assert [v["status"] for v in verdicts] == [
+            None,
+            "skipped_csv_duplicate",
+            "skipped_domain_blocked",
+            "skipped",
+            "skipped_already_presented",
+            "skipped_blacklist",
+            None,
+        ]
+        assert verdicts[0]["level"] == "green"
+        assert checks.preferred_domain(rows[0]) == "two.de"
+        assert checks.preferred_domain(rows[6]) is None
+
+
+# ==================== DOMAIN SEND COUNTER TESTS ====================
+
+class TestDomainSendCounter:
+    """Tests für den In-Process-Tageszähler der Domain-Limits."""
+
+    @staticmethod
+    def _counter(monkeypatch, db_counts):
+        from app.services import domain_protection_service as dps
+
+        loads = []
+
+        async def fake_counts(db, domain=None):
+            loads.append(domain)
+            return dict(db_counts)
+
+        async def fake_limits(db):
+            return {"one.de": 10}
+
+        monkeypatch.setattr(dps, "get_daily_send_counts", fake_counts)
+        monkeypatch.setattr(dps, "get_domain_limits", fake_limits)
+        now = [0.0]
+        counter = dps.DomainSendCounter(reconcile_seconds=60, clock=lambda: now[0])
+        return counter, loads, now
+
+    async def test_counts_locally_between_reconciles(self, monkeypatch):
+        """Ein Query pro Abgleich, record_send zählt ohne DB hoch."""
+        counter, loads, now = self._counter(monkeypatch, {"one.de": 3})
+
+        await counter.ensure_fresh(db=None)
+        counter.record_send("a@One.de")
+        counter.record_send("two.de", count=2)
+        await counter.ensure_fresh(db=None)
+
+        assert loads == [None]
+        assert counter.sent_today("one.de") == 4
+        assert counter.sent_today("two.de") == 2
+        assert counter.base_limit("one.de") == 10
+        assert counter.base_limit("unbekannt.de") == 30
+
+        # Abgleich nach Ablauf ersetzt den lokalen Stand durch die DB
+        now[0] = 61.0
+        await counter.ensure_fresh(db=None)
+        assert loads == [None, None]
+        assert counter.sent_today("one.de") == 3
+        assert counter.sent_today("two.de") == 0
+
+    async def test_invalidate_forces_reload(self, monkeypatch):
+        """invalidate() (z.B. nach Limit-Änderung) lädt beim nächsten Zugriff neu."""
+        counter, loads, _ = self._counter(monkeypatch, {})
+
+        await counter.ensure_fresh(db=None)
+        counter.invalidate()
+        await counter.ensure_fresh(db=None)
+
+        assert len(loads) == 2
+
+
+# ==================== TELEGRAM DISPATCHER TESTS ====================
+
+class TestTelegramDispatcher:
+    """Tests für den Telegram-Dispatcher (Parallelität, Reihenfolge, Duplikate)."""
+
+    @staticmethod
+    def _voice(update_id, chat=1):
+        return {"update_id": update_id, "message": {"chat": {"id": chat}, "voice": {"file_id": str(update_id)}}}
+
+    async def test_parallel_prepare_ordered_handling(self, monkeypatch):
+        """Sprachnachrichten werden parallel vorbereitet, aber in Reihenfolge beantwortet."""
+        import asyncio
+
+        from app.services import telegram_bot_service as bot
+        from app.services.telegram_dispatcher import TelegramDispatcher
+
+        running = {"now": 0, "max": 0}
+        handled = []
+
+        async def fake_prepare(update):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            # Erste Nachricht braucht am längsten
+            await asyncio.sleep(0.03 if update["update_id"] == 1 else 0.01)
+            running["now"] -= 1
+            return {"text": str(update["update_id"])}
+
+        async def fake_handle(update, prepared=None):
+            handled.append((update["update_id"], prepared and prepared["text"]))
+
+        monkeypatch.setattr(bot, "prepare_update", fake_prepare)
+        monkeypatch.setattr(bot, "handle_update", fake_handle)
+
+        dispatcher = TelegramDispatcher(prepare_concurrency=3)
+        for update_id in (1, 2, 3):
+            assert dispatcher.submit(self._voice(update_id))
+        await dispatcher.join()
+
+        assert running["max"] == 3
+        assert handled == [(1, "1"), (2, "2"), (3, "3")]
+
+    async def test_duplicates_and_fast_path(self, monkeypatch):
+        """Wiederholte update_ids werden verworfen, Callbacks ohne Vorbereitung."""
+        from app.services import telegram_bot_service as bot
+        from app.services.telegram_dispatcher import TelegramDispatcher
+
+        prepared_ids = []
+        handled = []
+
+        async def fake_prepare(update):
+            prepared_ids.append(update["update_id"])
+            return None
+
+        async def fake_handle(update, prepared=None):
+            handled.append(update["update_id"])
+
+        monkeypatch.setattr(bot, "prepare_update", fake_prepare)
+        monkeypatch.setattr(bot, "handle_update", fake_handle)
+
+        dispatcher = TelegramDispatcher(seen_max=2)
+        callback = {"update_id": 7, "callback_query": {"message": {"chat": {"id": 1}}, "data": "tasks_today"}}
+        assert dispatcher.submit(callback)
+        assert not dispatcher.submit(callback)
+        assert dispatcher.submit(self._voice(8))
+        await dispatcher.join()
+
+        assert handled == [7, 8]
+        assert prepared_ids == [8]
+
+
+# ==================== CALL TRANSCRIPTION TESTS ====================
+
+class TestCallTranscriptionPipeline:
+    """Tests für Chunking und parallele Analyse der Call-Transkription."""
+
+    # MPEG-1 Layer III, 128 kbit/s, 44.1 kHz
+    FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+
+    def test_mp3_chunks_start_at_frame_headers(self, tmp_path):
+        """Chunks beginnen an Frame-Grenzen und decken die ganze Datei ab."""
+        from app.services.call_transcription_service import _mp3_chunk_ranges
+
+        path = tmp_path / "call.mp3"
+        data = b"ID3\x03\x00\x00\x00\x00\x00\x00" + self.FRAME * 100
+        path.write_bytes(data)
+
+        ranges = _mp3_chunk_ranges(path, chunk_bytes=5000)
+
+        assert len(ranges) > 1
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[start:start + 2] == b"\xff\xfb"
+
+    def test_non_mp3_stays_single_chunk(self, tmp_path):
+        """Unbekannte Formate werden nicht zerschnitten."""
+        from app.services.call_transcription_service import _mp3_chunk_ranges
+
+        path = tmp_path / "call.wav"
+        path.write_bytes(b"RIFF" + b"\x00" * 20000)
+
+        assert _mp3_chunk_ranges(path, chunk_bytes=5000) == [(0, 20004)]
+
+    async def test_long_transcript_extracts_in_parallel(self, monkeypatch):
+        """Lange Transkripte: Klassifizierung + Extraktion laufen gleichzeitig."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from app.services import call_transcription_service as cts
+
+        service = cts.CallTranscriptionService(db=None)
+        running = {"now": 0, "max": 0}
+        calls = []
+
+        async def fake_gpt(system_prompt, user_message, max_tokens=800):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            calls.append(system_prompt)
+            if system_prompt == cts.CLASSIFY_SYSTEM_PROMPT:
+                return {"call_type": "kunde"}, 0.001
+            return {"summary": system_prompt[:10]}, 0.002
+
+        monkeypatch.setattr(service, "_call_gpt", fake_gpt)
+        candidate = SimpleNamespace(full_name="Anna Schmidt", current_position=None, current_company=None)
+        transcript = "wort " * (cts.SPECULATIVE_EXTRACT_MIN_CHARS // 5 + 1)
+
+        call_type, extracted, cost = await service._analyze_transcript(transcript, candidate)
+
+        assert running["max"] == 2
+        assert call_type == "kunde"
+        # Spekulative Quali-Extraktion verworfen, Kunden-Extraktion nachgeholt
+        assert calls[-1] == cts.CUSTOMER_CALL_SYSTEM_PROMPT
+        assert extracted == {"summary": cts.CUSTOMER_CALL_SYSTEM_PROMPT[:10]}
+        assert cost == pytest.approx(0.005)
+
+
+# ==================== REPLY INDEX TESTS ====================
+
+class TestReplyIndex:
+    """Tests für Thread-IDs, Betreff-Schlüssel und Blocklist-Cache."""
+
+    def test_extract_thread_ids(self):
+        """In-Reply-To zuerst, References ohne Duplikate, ohne spitze Klammern."""
+        from app.services.presentation_reply_service import extract_thread_ids
+
+        headers = [
+            {"name": "Subject", "value": "AW: Vorstellung"},
+            {"name": "References", "value": "<a@x.de> <b@x.de>"},
+            {"name": "In-Reply-To", "value": "<b@x.de>"},
+        ]
+
+        assert extract_thread_ids(headers) == ["b@x.de", "a@x.de"]
+        assert extract_thread_ids(None) == []
+
+    def test_subject_key_strips_prefixes(self):
+        """Schlüssel entspricht der generierten Spalte subject_key."""
+        from app.services.presentation_reply_service import _subject_key
+
+        assert _subject_key("AW: Re:  Vorstellung Bilanzbuchhalter ") == "vorstellung bilanzbuchhalter"
+        assert _subject_key("") == ""
+
+    async def test_blocklist_cache_loads_once(self):
+        """Ein Query pro Abgleich, add() wirkt sofort, invalidate() lädt neu."""
+        from app.services.presentation_reply_service import BlocklistCache
+
+        class FakeResult:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return ["Spam.de"]
+
+        class FakeDB:
+            queries = 0
+
+            async def execute(self, stmt):
+                FakeDB.queries += 1
+                return FakeResult()
+
+        now = [0.0]
+        cache = BlocklistCache(refresh_seconds=60, clock=lambda: now[0])
+        db = FakeDB()
+
+        await cache.ensure_fresh(db)
+        await cache.ensure_fresh(db)
+        assert FakeDB.queries == 1
+        assert cache.contains("spam.de")
+        assert not cache.contains("nord.de")
+
+        cache.add("Nord.de")
+        assert cache.contains("nord.de")
+
+        cache.invalidate()
+        await cache.ensure_fresh(db)
+        assert FakeDB.queries == 2
+        assert not cache.contains("nord.de")
+
+    async def test_blocklist_confirm_checks_db_on_miss(self):
+        """Versandpfad: Cache-Miss wird per DB bestätigt (Block aus anderem Worker)."""
+        from app.services.presentation_reply_service import BlocklistCache
+
+        class FakeResult:
+            def __init__(self, rows):
+                self.rows = rows
+
+            def scalars(self):
+                return self
+
+            def all(self):
+                return self.rows
+
+            def scalar_one_or_none(self):
+                return self.rows[0] if self.rows else None
+
+        class FakeDB:
+            blocked: list[str] = []
+            lookups = 0
+
+            async def execute(self, stmt):
+                if "LIMIT" in str(stmt).upper():
+                    FakeDB.lookups += 1
+                    # Gebundene :domain aus dem WHERE lesen
+                    bound = set(stmt.compile().params.values())
+                    return FakeResult([1] if bound & set(FakeDB.blocked) else [])
+                return FakeResult([])
+
+        cache = BlocklistCache(refresh_seconds=60, clock=lambda: 0.0)
+        db = FakeDB()
+        await cache.ensure_fresh(db)
+
+        # Anderer Worker blockiert fern.de, das Event kommt hier nicht an
+        FakeDB.blocked.append("fern.de")
+        assert not await cache.is_blocked(db, "fern.de")
+        assert await cache.is_blocked(db, "Fern.de", confirm=True)
+        assert cache.contains("fern.de")
+        assert not await cache.is_blocked(db, "nord.de", confirm=True)
+        assert FakeDB.lookups == 2
+
+
+# ==================== BENCHMARK HARNESS TESTS ====================
+
+class TestBenchmarkHarness:
+    """Tests für Messung und Baseline-Vergleich der Hot-Path-Benchmarks."""
+
+    async def test_measure_sync_and_async(self):
+        """Sync- und Async-Funktionen werden gemessen, setup läuft vor jeder Runde."""
+        from benchmarks.harness import measure
+
+        calls = []
+
+        async def work():
+            calls.append("run")
+
+        result = await measure("fall", work, rounds=3, warmup=1, setup=lambda: calls.append("setup"))
+
+        # Warmup + 3 Runden + Speicher-Lauf
+        assert calls.count("run") == 5
+        assert calls.count("setup") == 5
+        assert result.rounds == 3
+        assert 0 <= result.best_ms <= result.median_ms
+
+        result = await measure("sync", lambda: [0] * 100_000, rounds=2)
+        assert result.peak_kib > 100
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        """Nur Anstiege über Schwelle und Rauschboden zählen als Regression."""
+        from benchmarks.harness import BenchResult, compare
+
+        baseline = {"results": {
+            "langsam": {"best_ms": 10.0, "peak_kib": 100.0},
+            "stabil": {"best_ms": 10.0, "peak_kib": 100.0},
+            "winzig": {"best_ms": 0.01, "peak_kib": 1.0},
+        }}
+        results = [
+            BenchResult("langsam", 5, best_ms=13.0, median_ms=14.0, peak_kib=200.0),
+            BenchResult("stabil", 5, best_ms=12.0, median_ms=12.0, peak_kib=110.0),
+            BenchResult("winzig", 5, best_ms=0.03, median_ms=0.03, peak_kib=4.0),
+            BenchResult("neu", 5, best_ms=99.0, median_ms=99.0, peak_kib=999.0),
+        ]
+
+        regressions = compare(results, baseline, threshold=0.25)
+
+        assert [(r.name, r.metric) for r in regressions] == [
+            ("langsam", "best_ms"), ("langsam", "peak_kib"),
+        ]
+        assert regressions[0].ratio == pytest.approx(1.3)
+
+    def test_baseline_roundtrip(self, tmp_path):
+        """Gespeicherte Baseline enthält Meta-Daten und alle Fälle."""
+        from benchmarks.harness import BenchResult, compare, load_baseline, save_baseline
+
+        results = [BenchResult("fall", 5, best_ms=1.0, median_ms=1.2, peak_kib=8.0)]
+        path = tmp_path / "baseline.json"
+
+        save_baseline(path, results, {"size": "small"})
+        baseline = load_baseline(path)
+
+        assert baseline["meta"]["size"] == "small"
+        assert baseline["results"]["fall"]["median_ms"] == 1.2
+        assert compare(results, baseline) == []
+
+
 # ==================== MOCK MODEL TESTS ====================
 
 class TestMockModels: